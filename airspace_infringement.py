@@ -0,0 +1,269 @@
+"""
+Yasaklı/kısıtlı saha ihlal tespiti
+
+Trajectory'ler ve çizilen rotalar restricted_areas (LTD/LTP) sahalarına ve
+TMA sınırına karşı kontrol edilir; giriş/çıkış noktaları segment-kenar
+kesişimlerinden bulunur. InfringementMonitor sonuçları geometri imzasına
+göre önbellekler.
+"""
+
+import math
+
+import numpy as np
+
+from geodesy import NM_PER_DEG_LAT
+
+# Segment x kenar matrisinde parça başına segment sayısı (bellek sınırı)
+_SEGMENT_CHUNK = 65536
+
+
+def points_in_polygon(lats, lons, poly_lats, poly_lons):
+    """Vectorized ray casting; returns a boolean array (point inside polygon).
+
+    Çokgen kapalı (ilk nokta = son nokta) ya da açık verilebilir.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    y0 = np.asarray(poly_lats, dtype=np.float64)
+    x0 = np.asarray(poly_lons, dtype=np.float64)
+    y1 = np.roll(y0, -1)
+    x1 = np.roll(x0, -1)
+    inside = np.zeros(len(lats), dtype=bool)
+    for start in range(0, len(lats), _SEGMENT_CHUNK):
+        py = lats[start:start + _SEGMENT_CHUNK, None]
+        px = lons[start:start + _SEGMENT_CHUNK, None]
+        # Noktanın enleminden geçen yatay ışını kesen kenarlar (doğuya doğru)
+        straddles = (y0 > py) != (y1 > py)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_cross = x0 + (py - y0) * (x1 - x0) / (y1 - y0)
+        crossings = np.count_nonzero(straddles & (px < x_cross), axis=1)
+        inside[start:start + _SEGMENT_CHUNK] = (crossings % 2) == 1
+    return inside
+
+
+def _segment_edge_crossings(lats, lons, poly_lats, poly_lons, segment_indices):
+    """Crossing positions of track segments with polygon edges.
+
+    Returns sorted fractional point positions (segment index + t) where the
+    track crosses the polygon boundary. t aralığı (0, 1]; bir köşeden geçen
+    kesişim, o noktada biten segmente aittir.
+    """
+    ex0 = np.asarray(poly_lons, dtype=np.float64)
+    ey0 = np.asarray(poly_lats, dtype=np.float64)
+    ex1 = np.roll(ex0, -1)
+    ey1 = np.roll(ey0, -1)
+    edx, edy = ex1 - ex0, ey1 - ey0
+    positions = []
+    for start in range(0, len(segment_indices), _SEGMENT_CHUNK):
+        seg = segment_indices[start:start + _SEGMENT_CHUNK]
+        sx0, sy0 = lons[seg][:, None], lats[seg][:, None]
+        sdx = (lons[seg + 1] - lons[seg])[:, None]
+        sdy = (lats[seg + 1] - lats[seg])[:, None]
+        denominator = sdx * edy - sdy * edx
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = ((ex0 - sx0) * edy - (ey0 - sy0) * edx) / denominator
+            u = ((ex0 - sx0) * sdy - (ey0 - sy0) * sdx) / denominator
+        hits = (denominator != 0) & (t > 0) & (t <= 1) & (u >= 0) & (u < 1)
+        rows, cols = np.nonzero(hits)
+        positions.append(seg[rows] + t[rows, cols])
+    if not positions:
+        return np.zeros(0)
+    return np.sort(np.concatenate(positions))
+
+
+def _point_at(position, lats, lons):
+    index = min(int(math.floor(position)), len(lats) - 2)
+    t = position - index
+    return (float(lats[index] + (lats[index + 1] - lats[index]) * t),
+            float(lons[index] + (lons[index + 1] - lons[index]) * t))
+
+
+class AreaPolygon:
+    """A restricted area (or the TMA boundary) prepared for infringement checks"""
+
+    def __init__(self, name, points, kind=None):
+        array = np.asarray([(p[0], p[1]) for p in points], dtype=np.float64)
+        if len(array) > 1 and np.array_equal(array[0], array[-1]):
+            array = array[:-1]
+        if len(array) < 3:
+            raise ValueError(f"Saha '{name}' için en az 3 köşe gerekli")
+        self.name = name
+        # LTD = tehlikeli, LTP = yasak saha; isim önekinden çıkarılır
+        self.kind = kind or (name[:3].upper() if name[:3].upper() in ('LTD', 'LTP', 'LTR') else 'AREA')
+        self.lats = array[:, 0]
+        self.lons = array[:, 1]
+        self.bounds = (float(self.lons.min()), float(self.lats.min()),
+                       float(self.lons.max()), float(self.lats.max()))
+
+    def contains(self, lats, lons):
+        return points_in_polygon(lats, lons, self.lats, self.lons)
+
+
+def area_polygons(restricted_areas):
+    """AreaPolygon list from DataManager.restricted_areas; invalid areas are skipped."""
+    areas = []
+    for area in restricted_areas or []:
+        try:
+            areas.append(AreaPolygon(area.get('name', 'AREA'), area.get('points', [])))
+        except ValueError as e:
+            print(f"Uyarı: {e}")
+    return areas
+
+
+def points_in_areas(lats, lons, areas):
+    """Boolean (points, areas) membership with a bounding-box prefilter per area."""
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    hits = np.zeros((len(lats), len(areas)), dtype=bool)
+    for column, area in enumerate(areas):
+        min_lon, min_lat, max_lon, max_lat = area.bounds
+        candidates = np.flatnonzero((lats >= min_lat) & (lats <= max_lat) & (lons >= min_lon) & (lons <= max_lon))
+        if len(candidates):
+            hits[candidates, column] = area.contains(lats[candidates], lons[candidates])
+    return hits
+
+
+def _track_distances_nm(lats, lons):
+    """Cumulative along-track distance (NM) at each point, equirectangular"""
+    mean_lat = math.radians(float(np.mean(lats))) if len(lats) else 0.0
+    steps = np.hypot(np.diff(lats) * NM_PER_DEG_LAT, np.diff(lons) * NM_PER_DEG_LAT * math.cos(mean_lat))
+    return np.concatenate([[0.0], np.cumsum(steps)])
+
+
+def find_area_intervals(lats, lons, area, times=None, outside=False):
+    """Intervals in which a polyline is inside (or, with outside=True, outside) an area.
+
+    Returns a list of dicts with 'entry'/'exit' (lat, lon) or None when the
+    track starts/ends in the interval, 'start_index'/'end_index' fractional
+    point positions, 'distance_nm', and 'duration_s' (None without times).
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    if len(lats) < 2:
+        return []
+    min_lon, min_lat, max_lon, max_lat = area.bounds
+    # Kutuya giren (veya kutuyu kesen) segmentler
+    seg_min_lon = np.minimum(lons[:-1], lons[1:])
+    seg_max_lon = np.maximum(lons[:-1], lons[1:])
+    seg_min_lat = np.minimum(lats[:-1], lats[1:])
+    seg_max_lat = np.maximum(lats[:-1], lats[1:])
+    candidates = np.flatnonzero((seg_max_lon >= min_lon) & (seg_min_lon <= max_lon) &
+                                (seg_max_lat >= min_lat) & (seg_min_lat <= max_lat))
+    start_inside = bool(area.contains(lats[:1], lons[:1])[0])
+    if len(candidates) == 0 and not start_inside and not outside:
+        return []
+    crossings = _segment_edge_crossings(lats, lons, area.lats, area.lons, candidates) if len(candidates) else np.zeros(0)
+
+    # Her kesişim içeride/dışarıda durumunu değiştirir
+    boundaries = np.concatenate([[0.0], crossings, [len(lats) - 1.0]])
+    state = start_inside != outside
+    intervals = []
+    for i in range(len(boundaries) - 1):
+        if state and boundaries[i + 1] > boundaries[i]:
+            intervals.append((boundaries[i], boundaries[i + 1], i > 0, i + 1 < len(boundaries) - 1))
+        state = not state
+
+    if not intervals:
+        return []
+    cumulative = _track_distances_nm(lats, lons)
+    point_index = np.arange(len(lats), dtype=np.float64)
+    times = np.asarray(times, dtype=np.float64) if times is not None and len(times) == len(lats) else None
+    results = []
+    for start, end, has_entry, has_exit in intervals:
+        distance = float(np.interp(end, point_index, cumulative) - np.interp(start, point_index, cumulative))
+        duration = None
+        if times is not None:
+            duration = float(np.interp(end, point_index, times) - np.interp(start, point_index, times))
+        results.append({
+            'area': area.name,
+            'kind': area.kind,
+            'entry': _point_at(start, lats, lons) if has_entry else None,
+            'exit': _point_at(end, lats, lons) if has_exit else None,
+            'start_index': float(start),
+            'end_index': float(end),
+            'distance_nm': distance,
+            'duration_s': duration,
+        })
+    return results
+
+
+class InfringementChecker:
+    """Check tracks against all restricted areas (and optionally TMA exits)."""
+
+    def __init__(self, restricted_areas, tma_boundary=None):
+        self.areas = area_polygons(restricted_areas)
+        self.tma = None
+        if tma_boundary is not None and len(tma_boundary) >= 3:
+            self.tma = AreaPolygon("TMA", tma_boundary, kind='TMA')
+        self.area_boxes = np.array([a.bounds for a in self.areas]).reshape(-1, 4)
+
+    def check(self, lats, lons, times=None):
+        """Return all infringement intervals for one polyline (restricted areas, then TMA exits)."""
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        if len(lats) < 2:
+            return []
+        results = []
+        if len(self.areas):
+            boxes = self.area_boxes
+            hits = np.flatnonzero((boxes[:, 0] <= lons.max()) & (boxes[:, 2] >= lons.min()) &
+                                  (boxes[:, 1] <= lats.max()) & (boxes[:, 3] >= lats.min()))
+            for area_index in hits:
+                results.extend(find_area_intervals(lats, lons, self.areas[area_index], times))
+        if self.tma is not None:
+            for interval in find_area_intervals(lats, lons, self.tma, times, outside=True):
+                interval['kind'] = 'TMA_EXIT'
+                results.append(interval)
+        return results
+
+
+def _route_signature(route):
+    return tuple((float(p[0]), float(p[1])) for p in route.get('points', []))
+
+
+class InfringementMonitor:
+    """Keeps infringement results for drawn routes and trajectories, re-checking only what changed.
+
+    Rotalar nokta listelerinin imzasıyla, trajectory'ler id(points) ile
+    önbelleklenir (trajectory noktaları içe aktarıldıktan sonra değişmez).
+    """
+
+    def __init__(self, checker):
+        self.checker = checker
+        self._route_cache = {}  # route id -> (imza, sonuçlar)
+        self._trajectory_cache = {}  # trajectory id -> (id(points), sonuçlar)
+        self.checks_run = 0
+
+    def update(self, routes, trajectories):
+        """Refresh results; returns {'routes': {id: [...]}, 'trajectories': {id: [...]}}."""
+        route_results = {}
+        for index, route in enumerate(routes):
+            route_id = route.get('id', index)
+            signature = _route_signature(route)
+            cached = self._route_cache.get(route_id)
+            if cached is None or cached[0] != signature:
+                points = np.asarray(signature, dtype=np.float64).reshape(-1, 2)
+                cached = (signature, self.checker.check(points[:, 0], points[:, 1]))
+                self._route_cache[route_id] = cached
+                self.checks_run += 1
+            route_results[route_id] = cached[1]
+
+        trajectory_results = {}
+        for trajectory in trajectories:
+            points = trajectory.get('points')
+            cached = self._trajectory_cache.get(trajectory['id'])
+            if cached is None or cached[0] != id(points):
+                if hasattr(points, 'lats'):
+                    lats, lons = points.lats, points.lons
+                else:
+                    array = np.asarray(points, dtype=np.float64).reshape(len(points), -1)
+                    lats, lons = array[:, 0], array[:, 1]
+                cached = (id(points), self.checker.check(lats, lons, trajectory.get('times')))
+                self._trajectory_cache[trajectory['id']] = cached
+                self.checks_run += 1
+            trajectory_results[trajectory['id']] = cached[1]
+
+        # Silinen öğelerin önbellek kayıtlarını at
+        self._route_cache = {k: v for k, v in self._route_cache.items() if k in route_results}
+        self._trajectory_cache = {k: v for k, v in self._trajectory_cache.items() if k in trajectory_results}
+        return {'routes': route_results, 'trajectories': trajectory_results}
@@ -0,0 +1,55 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+import tracing
+from models import DataManager, AIRSPACE_PART_ATTRIBUTES, country_arrays_from_geojson
+
+
+class AirspaceLoadWorker(QThread):
+    """Başlangıç verisini GUI thread'i dışında yükleyen worker.
+
+    Önce GeoJSON altlık haritası (ülke dizileri hazırlanmış olarak), sonra
+    DataManager.iter_airspace_data sırasıyla TMA/yasaklı sahalar,
+    prosedürler ve pistler yüklenir; her parça bittiğinde sinyalle
+    yayınlanır. Worker kendi DataManager'ını kullanır, GUI thread'i gelen
+    nesneleri kendi DataManager'ına atar.
+    """
+
+    # (geo_data veya None, country_arrays_from_geojson sonucu veya None)
+    baseMapLoaded = pyqtSignal(object, object)
+    # (parça adı, {DataManager özelliği: değer})
+    partLoaded = pyqtSignal(str, object)
+    # (başarılı mı, iptal edildi mi, hava sahası klasörü)
+    loadFinished = pyqtSignal(bool, bool, str)
+
+    def __init__(self, airspace_folder, geojson_path=None, parent=None):
+        super().__init__(parent)
+        self.airspace_folder = airspace_folder
+        self.geojson_path = geojson_path
+        self._cancelled = False
+
+    def cancel(self):
+        """Yüklemeyi iptal et (sürmekte olan parça bitince durur)"""
+        self._cancelled = True
+
+    def run(self):
+        loader = DataManager()
+        success = True
+        try:
+            geo_data, country_arrays = None, None
+            if self.geojson_path:
+                geo_data = loader.load_geo_data(self.geojson_path)
+                if geo_data:
+                    country_arrays = country_arrays_from_geojson(geo_data)
+            self.baseMapLoaded.emit(geo_data, country_arrays)
+
+            for part, ok in loader.iter_airspace_data(self.airspace_folder):
+                if self._cancelled:
+                    break
+                success = success and ok
+                self.partLoaded.emit(part, {name: getattr(loader, name) for name in AIRSPACE_PART_ATTRIBUTES[part]})
+        except Exception as e:
+            tracing.error("Error during airspace data loading: %s", e)
+            import traceback
+            traceback.print_exc()
+            success = False
+        self.loadFinished.emit(success and not self._cancelled, self._cancelled, self.airspace_folder)
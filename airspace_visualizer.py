@@ -2,20 +2,25 @@ import sys
 import os
 import json
 import csv
+import time
 import webbrowser
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                           QToolBar, QAction, QSplitter, QMenuBar, QMenu, QDialog, QMessageBox, QLabel, 
-                          QInputDialog, QFileDialog)
-from PyQt5.QtCore import Qt
+                          QInputDialog, QFileDialog, QProgressDialog, QDockWidget)
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QColor
 
+import startup_timer
+import tracing
 from map_widget import MapWidget
 from left_sidebar import LeftSidebar
-from path_extension import PathExtensionDialog
 from models import DataManager
-from runway_options_dialog import RunwayOptionsDialog
 from startup_options_dialog import StartupOptionsDialog
-from gradient_calculator_dialog import GradientCalculatorDialog
+# Seyrek kullanılan dialoglar (path extension, runway options, gradient,
+# trajectory import/store/playback, conformance, assignment, infringement,
+# separation, point merge sweep) ilk kullanımda içe aktarılır
+
+AUTOSAVE_DELAY_MS = 2000  # Düzenlemeden sonra otomatik kayda kadar bekleme
 
 class AirspaceVisualizer(QMainWindow):
     """Main application window for Airspace Procedure Visualizer"""
@@ -86,6 +91,9 @@ class AirspaceVisualizer(QMainWindow):
             }
         """)
         
+        # Veri seçim penceresi kenar çubuğu, harita ve menüler kurulmadan gösterilir
+        startup_selection = self.prompt_startup_options()
+        
         # Create menu bar
         self.menubar = self.menuBar()
         
@@ -134,13 +142,12 @@ class AirspaceVisualizer(QMainWindow):
         self.addToolBar(self.toolbar)
         self.create_toolbar_actions()
 
-        # --- Prompt for Options, Load Data, and Populate --- 
-        data_loaded_successfully = self.prompt_and_load_data()
-
-        if data_loaded_successfully:
-            self.populate_ui_with_data()
-            self.statusBar().showMessage("Ready")
+        # --- Load Selected Data in Background and Populate Progressively --- 
+        self.airspace_load_worker = None
+        if startup_selection is not None:
+            self.start_data_loading(*startup_selection)
         else:
+             startup_timer.mark('data_loaded')
              self.statusBar().showMessage("Data loading failed or cancelled.")
              # Consider closing or disabling features
              # QMessageBox.critical(self, "Error", "Failed to load required data. Exiting.")
@@ -176,49 +183,109 @@ class AirspaceVisualizer(QMainWindow):
         
         # Connect signals
         self.connect_signals()
+        startup_timer.mark('window_built')
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        startup_timer.mark('first_window')
 
-    def prompt_and_load_data(self):
-        """Show startup dialog, load selected data, return True on success."""
+    def prompt_startup_options(self):
+        """Show startup dialog; return (airspace folder, geojson file) or None if cancelled."""
         airspace_folders = self.data_manager.find_airspace_folders()
         geojson_files = self.data_manager.find_geojson_files()
 
         if not airspace_folders:
             QMessageBox.critical(self, "Error", f"No airspace folders found in '{self.data_manager.data_dir}'. Required to run.")
-            return False
+            return None
         # GeoJSON might be optional, but we need at least one option if the list isn't empty
         # if not geojson_files: 
         #     QMessageBox.warning(self, "Warning", f"No GeoJSON files found in '{self.data_manager.data_dir}'. Map background will be empty.")
 
         dialog = StartupOptionsDialog(airspace_folders, geojson_files, self)
-        if dialog.exec_() == QDialog.Accepted:
+        startup_timer.mark('options_shown')
+        accepted = dialog.exec_() == QDialog.Accepted
+        startup_timer.mark('options_closed')
+        if accepted:
             folder_name, geojson_name = dialog.get_selected_paths()
             
             if not folder_name:
                 QMessageBox.critical(self, "Error", "No airspace folder selected. Cannot continue.")
-                return False
-                
-            # Load Airspace Data
-            airspace_folder_path = os.path.join(self.data_manager.data_dir, folder_name)
-            if not self.data_manager.load_airspace_data(airspace_folder_path):
-                 QMessageBox.critical(self, "Error", f"Failed to load airspace data from \n{airspace_folder_path}")
-                 return False
-                 
-            # Load GeoJSON Data (if selected)
-            if geojson_name:
-                geojson_path = os.path.join(self.data_manager.data_dir, geojson_name)
-                if not self.map_widget.load_and_compute_geojson(geojson_path):
-                     QMessageBox.warning(self, "Map Warning", f"Could not load selected GeoJSON map background from \n{geojson_path}")
-                     # Continue anyway, map will be blank
-            else:
-                 print("No GeoJSON file selected or found.")
-                 # Ensure map is empty if no file selected/loaded
-                 self.map_widget.load_and_compute_geojson(None) 
-
-            return True # Data loaded (even if GeoJSON failed non-critically)
+                return None
+            return folder_name, geojson_name
         else:
             print("Startup options dialog cancelled.")
-            return False # User cancelled
-        
+            return None # User cancelled
+
+    def start_data_loading(self, folder_name, geojson_name):
+        """Load the selected data on a worker thread; map and sidebar fill in as parts arrive."""
+        from airspace_load_worker import AirspaceLoadWorker
+        airspace_folder_path = os.path.join(self.data_manager.data_dir, folder_name)
+        geojson_path = os.path.join(self.data_manager.data_dir, geojson_name) if geojson_name else None
+        if not geojson_path:
+            print("No GeoJSON file selected or found.")
+
+        # Harita DataManager'ı baştan tanır; TMA, sahalar ve waypoint'ler geldikçe çizilir
+        self.map_widget.set_data_manager(self.data_manager)
+
+        self.airspace_load_worker = AirspaceLoadWorker(airspace_folder_path, geojson_path, parent=self)
+        self.airspace_load_worker.baseMapLoaded.connect(self.on_base_map_loaded)
+        self.airspace_load_worker.partLoaded.connect(self.on_airspace_part_loaded)
+        self.airspace_load_worker.loadFinished.connect(self.on_data_load_finished)
+        self.statusBar().showMessage("Loading map and airspace data...")
+        self.airspace_load_worker.start()
+
+    def on_base_map_loaded(self, geo_data, country_arrays):
+        """Show the GeoJSON base map computed by the background loader"""
+        startup_timer.mark('base_map_loaded')
+        if geo_data:
+            self.map_widget.set_geo_data(geo_data, country_arrays)
+            print("GeoJSON loaded and paths computed.")
+        elif self.airspace_load_worker.geojson_path:
+            self.map_widget.set_geo_data({"type": "FeatureCollection", "features": []})
+            QMessageBox.warning(self, "Map Warning",
+                                f"Could not load selected GeoJSON map background from \n{self.airspace_load_worker.geojson_path}")
+            # Continue anyway, map will be blank
+
+    def on_airspace_part_loaded(self, part, attributes):
+        """Publish one loaded airspace part (areas, procedures, runways) to the UI"""
+        startup_timer.mark(f'{part}_loaded')
+        for name, value in attributes.items():
+            setattr(self.data_manager, name, value)
+
+        if part == 'procedures':
+            self.left_sidebar.populate_procedures(self.data_manager.procedures)
+        elif part == 'runways':
+            self.left_sidebar.populate_runways(self.data_manager.runways)
+            self.map_widget.set_runways(self.data_manager.runways)
+            # Başlangıçta tüm runway ID'lerini seçili listeye ekle
+            self.map_widget.set_selected_runways(
+                [runway.get('id') for runway in self.data_manager.runways if runway.get('id')])
+        self.statusBar().showMessage(f"Loaded {part}...")
+        # Saha/TMA verisi geldikçe rotalar yeniden kontrol edilir
+        self.map_widget.schedule_infringement_check()
+        self.map_widget.update()
+
+    def on_data_load_finished(self, success, cancelled, airspace_folder_path):
+        self.airspace_load_worker = None
+        if cancelled:
+            # Pencere kapanırken iptal edildi; hata değil
+            print("Airspace data loading cancelled.")
+            self.statusBar().showMessage("Data loading cancelled.")
+            return
+        if success:
+            print("Airspace data loading process completed.")
+            self.statusBar().showMessage("Ready")
+        else:
+            # Eksik veriyle çalışılmasın: kritik parçalardan biri yüklenemediyse prosedür ve pistler boşaltılır
+            print("Airspace data loading process completed with errors.")
+            empty = DataManager()
+            for name in ('procedures', 'runways', 'waypoint_coords'):
+                setattr(self.data_manager, name, getattr(empty, name))
+            self.populate_ui_with_data()
+            self.statusBar().showMessage("Data loading failed.")
+            QMessageBox.critical(self, "Error", f"Failed to load airspace data from \n{airspace_folder_path}")
+        startup_timer.finish('data_loaded')
+
     def populate_ui_with_data(self):
         """Populate UI elements after data has been successfully loaded."""
         # Populate left sidebar
@@ -254,6 +321,16 @@ class AirspaceVisualizer(QMainWindow):
         self.action_import_trajectory = QAction("Import Trajectory...", self)
         file_menu.addAction(self.action_import_trajectory)
         
+        # Klasördeki tüm CSV/KML trajectory'leri paralel içe aktar
+        self.action_import_trajectory_folder = QAction("Import Trajectory Folder...", self)
+        file_menu.addAction(self.action_import_trajectory_folder)
+        
+        # Sütun tabanlı, bellek eşlemeli trajectory deposu (anlık yeniden açılış)
+        self.action_open_trajectory_store = QAction("Open Trajectory Store...", self)
+        file_menu.addAction(self.action_open_trajectory_store)
+        self.action_save_trajectory_store = QAction("Save Trajectories as Store...", self)
+        file_menu.addAction(self.action_save_trajectory_store)
+        
         file_menu.addSeparator()
         
         # Add Reset View action
@@ -293,6 +370,49 @@ class AirspaceVisualizer(QMainWindow):
         self.action_gradient_calculator.setToolTip("İrtifa gradyan hesaplamalarını göster (Ctrl+G)")
         tools_menu.addAction(self.action_gradient_calculator)
         
+        # Zamanlı trajectory'leri zaman çizelgesiyle oynat
+        self.action_trajectory_playback = QAction("Trajectory Playback", self)
+        self.action_trajectory_playback.setShortcut("Ctrl+Shift+P")
+        self.action_trajectory_playback.setCheckable(True)
+        tools_menu.addAction(self.action_trajectory_playback)
+        
+        # Trajectory'lerin SID/STAR'a uygunluk analizi
+        self.action_procedure_conformance = QAction("Procedure Conformance...", self)
+        tools_menu.addAction(self.action_procedure_conformance)
+        
+        # Trajectory'leri en olası SID/STAR ile otomatik eşleştir
+        self.action_assign_procedures = QAction("Assign Procedures...", self)
+        tools_menu.addAction(self.action_assign_procedures)
+        
+        # Rota ve trajectory'lerin LTD/LTP sahaları ve TMA sınırına karşı kontrolü
+        self.action_airspace_infringements = QAction("Airspace Infringements...", self)
+        tools_menu.addAction(self.action_airspace_infringements)
+        
+        # Zamanlı trajectory'ler arasında ayırma kaybı taraması
+        self.action_separation_conflicts = QAction("Separation Conflicts...", self)
+        tools_menu.addAction(self.action_separation_conflicts)
+        
+        # Point merge parametre aralıklarının toplu taranması
+        self.action_pointmerge_sweep = QAction("Point Merge Sweep...", self)
+        tools_menu.addAction(self.action_pointmerge_sweep)
+        
+        # Harita çiziminin katman bazlı kare süresi ölçümü
+        tools_menu.addSeparator()
+        self.action_frame_profiler_hud = QAction("Frame Profiler HUD", self)
+        self.action_frame_profiler_hud.setShortcut("Ctrl+Shift+F")
+        self.action_frame_profiler_hud.setCheckable(True)
+        self.action_frame_profiler_hud.setToolTip("Katman bazlı çizim sürelerini harita üzerinde göster")
+        tools_menu.addAction(self.action_frame_profiler_hud)
+        self.action_export_frame_profile = QAction("Export Frame Profile CSV...", self)
+        tools_menu.addAction(self.action_export_frame_profile)
+        
+        # Yükleyici, geometri ve olay işleyici span'lerini Chrome trace olarak kaydet
+        self.action_record_trace = QAction("Record Trace", self)
+        self.action_record_trace.setCheckable(True)
+        self.action_record_trace.setChecked(tracing.is_recording())
+        self.action_record_trace.setToolTip("Kapatıldığında kayıt Chrome trace-event JSON olarak kaydedilir")
+        tools_menu.addAction(self.action_record_trace)
+        
         # Connect actions
         self.action_open.triggered.connect(self.on_open)
         self.action_save.triggered.connect(self.on_save)
@@ -300,6 +420,15 @@ class AirspaceVisualizer(QMainWindow):
         self.action_clear_workspace.triggered.connect(self.clear_workspace)
         self.action_exit.triggered.connect(self.close)
         self.action_gradient_calculator.triggered.connect(self.show_gradient_calculator)
+        self.action_trajectory_playback.toggled.connect(self.toggle_trajectory_playback)
+        self.action_procedure_conformance.triggered.connect(self.show_conformance_dialog)
+        self.action_assign_procedures.triggered.connect(self.show_assignment_dialog)
+        self.action_airspace_infringements.triggered.connect(self.show_infringement_dialog)
+        self.action_separation_conflicts.triggered.connect(self.show_separation_dialog)
+        self.action_pointmerge_sweep.triggered.connect(self.show_pointmerge_sweep_dialog)
+        self.action_frame_profiler_hud.toggled.connect(self.map_widget.set_frame_profiler_hud)
+        self.action_export_frame_profile.triggered.connect(self.export_frame_profile)
+        self.action_record_trace.toggled.connect(self.toggle_trace_recording)
 
     def create_toolbar_actions(self):
         """Create toolbar buttons and actions"""
@@ -341,6 +470,17 @@ class AirspaceVisualizer(QMainWindow):
         self.action_delete_routes.setEnabled(False)  # Başlangıçta devre dışı
         self.action_delete_routes.triggered.connect(self.delete_selected_routes)
         
+        # Seçili rotaları birlikte taşıma ve döndürme aksiyonları
+        self.action_move_routes = QAction("Move Routes", self)
+        self.action_move_routes.setToolTip("Move selected routes together")
+        self.action_move_routes.setEnabled(False)  # Başlangıçta devre dışı
+        self.action_move_routes.triggered.connect(self.move_selected_routes)
+        
+        self.action_rotate_routes = QAction("Rotate Routes", self)
+        self.action_rotate_routes.setToolTip("Rotate selected routes together around their center")
+        self.action_rotate_routes.setEnabled(False)  # Başlangıçta devre dışı
+        self.action_rotate_routes.triggered.connect(self.rotate_selected_routes)
+        
         # Add actions to toolbar with separators
         self.toolbar.addAction(self.action_toggle_left_sidebar)
         self.toolbar.addSeparator()
@@ -350,6 +490,8 @@ class AirspaceVisualizer(QMainWindow):
         self.toolbar.addAction(self.action_multi_select)
         self.toolbar.addAction(self.action_merge_routes)
         self.toolbar.addAction(self.action_delete_routes)
+        self.toolbar.addAction(self.action_move_routes)
+        self.toolbar.addAction(self.action_rotate_routes)
 
     def connect_signals(self):
         """Connect signals between widgets"""
@@ -359,6 +501,7 @@ class AirspaceVisualizer(QMainWindow):
         self.map_widget.routeDrawingStarted.connect(self.on_route_drawing_started)
         self.map_widget.routeDrawingFinished.connect(self.on_route_drawing_finished)
         self.map_widget.routePointAdded.connect(self.on_route_point_added)
+        self.map_widget.routeInfringementsChanged.connect(self.on_route_infringements_changed)
         
         # Left sidebar signals
         self.left_sidebar.procedureToggled.connect(self.on_procedure_toggled)
@@ -367,6 +510,7 @@ class AirspaceVisualizer(QMainWindow):
         self.left_sidebar.runwayDisplayOptionsRequested.connect(self.show_runway_options_dialog)
         self.left_sidebar.showWaypointsToggled.connect(self.on_show_waypoints_toggled)
         self.left_sidebar.showTmaBoundaryToggled.connect(self.on_show_tma_boundary_toggled)
+        self.left_sidebar.trajectoryGroupToggled.connect(self.map_widget.set_trajectories_visible)
         
         # Harita görünürlük kontrolleri için sinyal bağlantıları
         # SID ve STAR görünürlük kontrolleri şu an için devre dışı
@@ -376,6 +520,7 @@ class AirspaceVisualizer(QMainWindow):
         self.left_sidebar.showTmaBoundaryToggled.connect(self.on_show_tma_boundary_toggled)
         self.left_sidebar.showRestrictedAreasToggled.connect(self.on_show_restricted_areas_toggled)
         self.left_sidebar.showSegmentDistancesToggled.connect(self.on_show_segment_distances_toggled)
+        self.left_sidebar.showTrafficDensityToggled.connect(self.on_show_traffic_density_toggled)
         
         # Line Settings artık popup'larda yönetiliyor
         
@@ -391,6 +536,9 @@ class AirspaceVisualizer(QMainWindow):
 
         # Import action
         self.action_import_trajectory.triggered.connect(self.on_import_trajectory)
+        self.action_import_trajectory_folder.triggered.connect(self.on_import_trajectory_folder)
+        self.action_open_trajectory_store.triggered.connect(self.on_open_trajectory_store)
+        self.action_save_trajectory_store.triggered.connect(self.on_save_trajectory_store)
         
         # Sol kenar çubuğunun post init işlemlerini çağır
         # (Waypoint görünürlüğü ile snap ayarlarını senkronize etmek için)
@@ -474,6 +622,7 @@ class AirspaceVisualizer(QMainWindow):
     def show_path_extension_dialog(self):
         """Show dialog to configure path extension"""
         # Create dialog but keep it non-modal
+        from path_extension import PathExtensionDialog
         self.path_extension_dialog = PathExtensionDialog(self.data_manager.runways, self)
         
         # Connect coordinate picking signals
@@ -598,6 +747,8 @@ class AirspaceVisualizer(QMainWindow):
         # Düğmeleri etkinleştir veya devre dışı bırak
         self.action_merge_routes.setEnabled(checked)
         self.action_delete_routes.setEnabled(checked)
+        self.action_move_routes.setEnabled(checked)
+        self.action_rotate_routes.setEnabled(checked)
         
         if checked:
             self.statusBar().showMessage("Çoklu seçim modu aktif. Rotaları seçmek için tıklayın.")
@@ -618,6 +769,16 @@ class AirspaceVisualizer(QMainWindow):
         else:
             self.statusBar().showMessage("Silmek için en az bir rota seçin.", 3000)
 
+    def move_selected_routes(self):
+        """Move selected routes together"""
+        if not self.map_widget.start_selected_routes_move():
+            self.statusBar().showMessage("Taşımak için en az bir rota seçin.", 3000)
+    
+    def rotate_selected_routes(self):
+        """Rotate selected routes together"""
+        if not self.map_widget.start_selected_routes_rotate():
+            self.statusBar().showMessage("Döndürmek için en az bir rota seçin.", 3000)
+
     def on_open(self):
         """Open a saved project"""
         print("on_open fonksiyonu çağrıldı")
@@ -625,7 +786,7 @@ class AirspaceVisualizer(QMainWindow):
         options |= QFileDialog.DontUseNativeDialog
         filePath, fileFilter = QFileDialog.getOpenFileName(
             self, "Çizimleri Yükle", "", 
-            "Tüm Desteklenen Dosyalar (*.json *.csv);;JSON Dosyaları (*.json);;CSV Rotaları (*.csv);;Tüm Dosyalar (*)", 
+            "Tüm Desteklenen Dosyalar (*.procdb *.json *.csv);;Proje Deposu (*.procdb);;JSON Dosyaları (*.json);;CSV Rotaları (*.csv);;Tüm Dosyalar (*)", 
             options=options
         )
         
@@ -636,7 +797,21 @@ class AirspaceVisualizer(QMainWindow):
         print(f"Seçilen dosya: {filePath}")
         
         # Dosya uzantısına göre işlem yap
-        if filePath.lower().endswith('.json'):
+        if filePath.lower().endswith('.procdb'):
+            success, message, trajectories = self.data_manager.load_drawings_from_store(filePath)
+            if success:
+                # Rotalar DataManager listesinden, trajectory'ler mevcutların sonuna eklenir
+                self.map_widget.drawn_elements['routes'] = self.data_manager.drawn_elements['routes']
+                self.map_widget.drawn_elements['trajectories'].extend(trajectories)
+                self.map_widget.update()
+                self.refresh_trajectory_playback()
+                self.schedule_autosave()
+                self.map_widget.schedule_infringement_check()
+                self.statusBar().showMessage(message, 5000)
+            else:
+                QMessageBox.warning(self, "Yükleme Hatası", message)
+
+        elif filePath.lower().endswith('.json'):
             success, message = self.data_manager.load_drawings_from_json(filePath)
             print(f"JSON yükleme sonucu: başarı={success}, mesaj={message}")
         
@@ -654,6 +829,8 @@ class AirspaceVisualizer(QMainWindow):
                 self.map_widget.drawn_elements['waypoints'] = waypoints
                 
                 self.map_widget.update()
+                self.schedule_autosave()
+                self.map_widget.schedule_infringement_check()
                 self.statusBar().showMessage(message, 5000)
                 print("Çizimler başarıyla yüklendi ve map_widget güncellendi")
             else:
@@ -683,6 +860,8 @@ class AirspaceVisualizer(QMainWindow):
                 
                 # Haritayı güncelle
                 self.map_widget.update()
+                self.schedule_autosave()
+                self.map_widget.schedule_infringement_check()
                 self.statusBar().showMessage(f"CSV Rotası Yüklendi: {message}", 5000)
                 print(f"CSV rotası başarıyla yüklendi: {loaded_route['name']}")
             else:
@@ -697,8 +876,8 @@ class AirspaceVisualizer(QMainWindow):
         options = QFileDialog.Options()
         options |= QFileDialog.DontUseNativeDialog
         
-        # Hem JSON hem CSV formatı seçeneği sun
-        fileFormats = "JSON Dosyası (*.json);;CSV Dosyaları (*.csv);;Tüm Dosyalar (*)"
+        # Proje deposu (artımlı kayıt), JSON ve CSV formatı seçeneği sun
+        fileFormats = "Proje Deposu (*.procdb);;JSON Dosyası (*.json);;CSV Dosyaları (*.csv);;Tüm Dosyalar (*)"
         filePath, selectedFilter = QFileDialog.getSaveFileName(
             self, "Çizimleri Kaydet", "", 
             fileFormats, 
@@ -712,7 +891,19 @@ class AirspaceVisualizer(QMainWindow):
         self.data_manager.drawn_elements = self.map_widget.drawn_elements
         
         # Seçilen formatı kontrol et
-        if "JSON" in selectedFilter or filePath.lower().endswith('.json'):
+        if filePath.lower().endswith('.procdb') or ("Proje" in selectedFilter and not filePath.lower().endswith(('.json', '.csv'))):
+            if not filePath.lower().endswith('.procdb'):
+                filePath += '.procdb'
+            
+            # Aynı dosyaya tekrar kayıtta yalnızca değişen rotalar yazılır
+            success, message = self.data_manager.save_drawings_to_store(filePath)
+            
+            if success:
+                self.statusBar().showMessage(message, 5000)
+            else:
+                QMessageBox.warning(self, "Kaydetme Hatası", message)
+                
+        elif "JSON" in selectedFilter or filePath.lower().endswith('.json'):
             # JSON uzantısını kontrol et
             if not filePath.lower().endswith('.json'):
                 filePath += '.json'
@@ -810,6 +1001,18 @@ class AirspaceVisualizer(QMainWindow):
 
     def closeEvent(self, event):
         """Handle application close event"""
+        # Arka planda süren trajectory içe aktarmayı ve veri yüklemeyi durdur
+        for worker in (getattr(self, 'trajectory_import_worker', None), getattr(self, 'airspace_load_worker', None),
+                       getattr(self, 'autosave_worker', None)):
+            if worker is not None and worker.isRunning():
+                worker.cancel()
+                worker.wait()
+        # Düzgün kapanışta otomatik kayıt oturumu silinir (kurtarma yalnızca çökmeden sonra önerilir)
+        if getattr(self, 'autosave_journal', None) is not None:
+            self.autosave_journal.discard()
+            self.autosave_journal = None
+        if self.data_manager.project_store is not None:
+            self.data_manager.project_store.close()
         # Cleanup temporary files
         if hasattr(self, 'temp_file') and os.path.exists(self.temp_file):
             os.remove(self.temp_file)
@@ -847,6 +1050,7 @@ class AirspaceVisualizer(QMainWindow):
             QMessageBox.information(self, "No Runways", "No runway data loaded to configure.")
             return
             
+        from runway_options_dialog import RunwayOptionsDialog
         dialog = RunwayOptionsDialog(self.data_manager.runways, self)
         if dialog.exec_() == QDialog.Accepted:
             updated_options = dialog.get_updated_runway_options()
@@ -902,8 +1106,9 @@ class AirspaceVisualizer(QMainWindow):
             self.statusBar().showMessage(f"Importing trajectory from {os.path.basename(file_path)}...")
             trajectory_id, trajectory_data = None, None
             try:
+                trajectory_times = None
                 if file_path.lower().endswith('.csv'):
-                    trajectory_id, trajectory_data = self.data_manager.parse_csv_trajectory(file_path)
+                    trajectory_id, trajectory_data, trajectory_times = self.data_manager.parse_csv_trajectory_with_times(file_path)
                 elif file_path.lower().endswith('.kml'):
                     trajectory_id, trajectory_data = self.data_manager.parse_kml_trajectory(file_path)
                 else:
@@ -911,9 +1116,10 @@ class AirspaceVisualizer(QMainWindow):
                     self.statusBar().showMessage("Import failed.", 2000)
                     return
                     
-                if trajectory_data:
+                if trajectory_data is not None and len(trajectory_data) > 0:
                     print(f"Successfully parsed {len(trajectory_data)} points for trajectory ID: {trajectory_id}")
-                    self.map_widget.add_trajectory(trajectory_id, trajectory_data)
+                    self.map_widget.add_trajectory(trajectory_id, trajectory_data, trajectory_times)
+                    self.refresh_trajectory_playback()
                     self.statusBar().showMessage(f"Trajectory '{trajectory_id}' imported successfully.", 5000)
                 else:
                     QMessageBox.warning(self, "Import Failed", f"Could not parse trajectory data from {os.path.basename(file_path)}.")
@@ -924,6 +1130,324 @@ class AirspaceVisualizer(QMainWindow):
                 QMessageBox.critical(self, "Import Error", f"An error occurred while importing {os.path.basename(file_path)}:\n{str(e)}")
                 self.statusBar().showMessage("Import error.", 2000)
 
+    def on_import_trajectory_folder(self):
+        """Import every CSV/KML trajectory in a folder (or glob pattern) in parallel"""
+        if getattr(self, 'trajectory_import_worker', None) and self.trajectory_import_worker.isRunning():
+            QMessageBox.information(self, "Import Running", "A trajectory import is already in progress.")
+            return
+
+        options = QFileDialog.Options()
+        options |= QFileDialog.DontUseNativeDialog
+        folder = QFileDialog.getExistingDirectory(self, "Import Trajectory Folder", "", options=options)
+        if not folder:
+            return
+        self.start_bulk_trajectory_import(folder)
+
+    def start_bulk_trajectory_import(self, source):
+        """Start a background import for a directory, glob pattern or single file"""
+        from trajectory_import import find_trajectory_files
+        from trajectory_import_worker import TrajectoryImportWorker
+        filepaths = find_trajectory_files(source)
+        if not filepaths:
+            QMessageBox.warning(self, "No Trajectories", f"No CSV or KML trajectory files found in:\n{source}")
+            return
+
+        self.trajectory_import_progress = QProgressDialog(
+            f"Importing {len(filepaths)} trajectory files...", "Cancel", 0, len(filepaths), self)
+        self.trajectory_import_progress.setWindowTitle("Import Trajectories")
+        self.trajectory_import_progress.setMinimumDuration(0)
+        self.trajectory_import_progress.setValue(0)
+
+        self.trajectory_import_worker = TrajectoryImportWorker(filepaths, parent=self)
+        self.trajectory_import_worker.trajectoryParsed.connect(self.on_bulk_trajectory_parsed)
+        self.trajectory_import_worker.progressChanged.connect(self.on_bulk_trajectory_progress)
+        self.trajectory_import_worker.importFinished.connect(self.on_bulk_trajectory_import_finished)
+        self.trajectory_import_progress.canceled.connect(self.trajectory_import_worker.cancel)
+
+        self.statusBar().showMessage(f"Importing {len(filepaths)} trajectory files...")
+        self.trajectory_import_worker.start()
+
+    def on_bulk_trajectory_parsed(self, trajectory_id, points, times):
+        """Add a trajectory parsed by the background worker to the map"""
+        self.map_widget.add_trajectory(trajectory_id, points, times)
+
+    def on_bulk_trajectory_progress(self, done, total, filepath):
+        if self.trajectory_import_progress is not None:
+            self.trajectory_import_progress.setValue(done)
+            self.trajectory_import_progress.setLabelText(
+                f"Imported {done}/{total}: {os.path.basename(filepath)}")
+
+    def toggle_trajectory_playback(self, visible):
+        """Show or hide the trajectory playback timeline dock"""
+        if getattr(self, 'playback_dock', None) is None:
+            if not visible:
+                return
+            from playback_widget import TrajectoryPlaybackWidget
+            self.playback_widget = TrajectoryPlaybackWidget(self.map_widget, parent=self)
+            self.playback_dock = QDockWidget("Trajectory Playback", self)
+            self.playback_dock.setWidget(self.playback_widget)
+            self.playback_dock.setAllowedAreas(Qt.BottomDockWidgetArea | Qt.TopDockWidgetArea)
+            self.addDockWidget(Qt.BottomDockWidgetArea, self.playback_dock)
+            # Dock kapatma düğmesi menü işaretini de güncellesin
+            self.playback_dock.visibilityChanged.connect(self.on_playback_dock_visibility_changed)
+        if visible:
+            self.playback_dock.show()
+            self.playback_widget.refresh_index()
+        else:
+            self.playback_dock.hide()
+            self.playback_widget.stop()
+
+    def on_playback_dock_visibility_changed(self, visible):
+        if not visible and not self.playback_dock.isVisible():
+            self.playback_widget.stop()
+            self.action_trajectory_playback.setChecked(False)
+
+    def show_conformance_dialog(self):
+        """Show the procedure conformance analysis dialog"""
+        if getattr(self, 'conformance_dialog', None) is None:
+            from conformance_dialog import ConformanceDialog
+            self.conformance_dialog = ConformanceDialog(self.data_manager, self.map_widget, self)
+        self.conformance_dialog.show()
+        self.conformance_dialog.raise_()
+
+    def show_assignment_dialog(self):
+        """Show the automatic procedure assignment dialog"""
+        if getattr(self, 'assignment_dialog', None) is None:
+            from assignment_dialog import ProcedureAssignmentDialog
+            self.assignment_dialog = ProcedureAssignmentDialog(self.data_manager, self.map_widget, self)
+            self.assignment_dialog.assignmentsReady.connect(self.on_procedures_assigned)
+        self.assignment_dialog.show()
+        self.assignment_dialog.raise_()
+
+    def on_procedures_assigned(self, assignments):
+        """Group trajectories by assigned procedure in the sidebar"""
+        self.map_widget.hidden_trajectory_ids = set()
+        self.map_widget.update()
+        self.left_sidebar.populate_trajectory_groups(assignments)
+        assigned = sum(1 for a in assignments if a['procedure'] is not None)
+        self.statusBar().showMessage(f"{assigned}/{len(assignments)} trajectory prosedürle eşleştirildi", 3000)
+
+    def show_infringement_dialog(self):
+        """Show the restricted-area / TMA infringement report"""
+        if getattr(self, 'infringement_dialog', None) is None:
+            from infringement_dialog import InfringementDialog
+            self.infringement_dialog = InfringementDialog(self.map_widget, self)
+        self.infringement_dialog.show()
+        self.infringement_dialog.raise_()
+        self.infringement_dialog.run_check()
+
+    def show_separation_dialog(self):
+        """Show the loss-of-separation probe dialog"""
+        if getattr(self, 'separation_dialog', None) is None:
+            from separation_dialog import SeparationDialog
+            self.separation_dialog = SeparationDialog(self.map_widget, self)
+            self.separation_dialog.conflictSelected.connect(self.on_separation_conflict_selected)
+        self.separation_dialog.show()
+        self.separation_dialog.raise_()
+
+    def show_pointmerge_sweep_dialog(self):
+        """Show the point merge design-space sweep dialog"""
+        if getattr(self, 'pointmerge_sweep_dialog', None) is None:
+            from pointmerge_sweep_dialog import PointMergeSweepDialog
+            self.pointmerge_sweep_dialog = PointMergeSweepDialog(self.data_manager, self.map_widget, self)
+        self.pointmerge_sweep_dialog.show()
+        self.pointmerge_sweep_dialog.raise_()
+
+    def export_frame_profile(self):
+        """Export the buffered per-layer map frame timings to CSV"""
+        filePath, _ = QFileDialog.getSaveFileName(
+            self, "Frame Profile CSV Kaydet", "frame_profile.csv", "CSV Dosyaları (*.csv);;Tüm Dosyalar (*)")
+        if not filePath:
+            return
+        if not filePath.lower().endswith('.csv'):
+            filePath += '.csv'
+        try:
+            frame_count = self.map_widget.frame_profiler.export_csv(filePath)
+        except OSError as e:
+            QMessageBox.critical(self, "Kaydetme Hatası", f"Frame profile kaydedilemedi: {str(e)}")
+            return
+        self.statusBar().showMessage(f"{frame_count} karelik çizim profili kaydedildi: {filePath}", 5000)
+
+    def toggle_trace_recording(self, checked):
+        """Start span recording, or stop it and save the trace as Chrome trace-event JSON"""
+        if checked:
+            tracing.clear()
+            tracing.start_recording()
+            self.statusBar().showMessage("Trace kaydı başladı", 3000)
+            return
+        tracing.stop_recording()
+        filePath, _ = QFileDialog.getSaveFileName(
+            self, "Trace Kaydet", "procedure_trace.json", "Chrome Trace (*.json);;Tüm Dosyalar (*)")
+        if not filePath:
+            return
+        try:
+            event_count = tracing.export_chrome_trace(filePath)
+        except OSError as e:
+            QMessageBox.critical(self, "Kaydetme Hatası", f"Trace kaydedilemedi: {str(e)}")
+            return
+        self.statusBar().showMessage(f"{event_count} olaylık trace kaydedildi: {filePath}", 5000)
+
+    def on_separation_conflict_selected(self, conflict_time):
+        """Move trajectory playback (if open) to the conflict's closest approach"""
+        if getattr(self, 'playback_dock', None) is not None and self.playback_dock.isVisible():
+            self.playback_widget.refresh_index()
+            self.playback_widget.set_time(conflict_time)
+
+    def on_route_infringements_changed(self, infringements):
+        """Warn immediately when an edited route clips a restricted area or leaves the TMA"""
+        if not infringements:
+            self.statusBar().showMessage("Rotalar yasaklı sahalara girmiyor", 2000)
+            return
+        routes_by_id = {route.get('id', index): route for index, route in enumerate(self.map_widget.drawn_elements['routes'])}
+        messages = []
+        for route_id, intervals in infringements.items():
+            name = routes_by_id.get(route_id, {}).get('name', route_id)
+            areas = sorted({"TMA dışı" if i['kind'] == 'TMA_EXIT' else i['area'] for i in intervals})
+            messages.append(f"{name}: {', '.join(areas)}")
+        self.statusBar().showMessage("UYARI - saha ihlali: " + "; ".join(messages), 8000)
+
+    def refresh_trajectory_playback(self):
+        """Trajectory listesi değiştiğinde açık oynatma zaman çizelgesini güncelle"""
+        if getattr(self, 'playback_dock', None) is not None and self.playback_dock.isVisible():
+            self.playback_widget.refresh_index()
+        # Trajectory değişiklikleri geri alma yığınından geçmez
+        self.schedule_autosave()
+
+    def start_autosave(self):
+        """Offer recovery of crashed sessions, then start the background autosave journal.
+
+        main.py pencere gösterildikten sonra çağırır; pencereyi kuran testler
+        kurtarma sorusuyla karşılaşmaz.
+        """
+        from autosave_journal import (AutosaveJournal, discard_session, find_recoverable_sessions,
+                                      new_session_directory, recover_session)
+        from autosave_worker import AutosaveWorker
+
+        recovered = False
+        try:
+            sessions = find_recoverable_sessions()
+        except OSError as e:
+            tracing.warning("Otomatik kayıt dizini okunamadı: %s", e)
+            sessions = []
+        for session in sessions:
+            try:
+                routes, trajectories = recover_session(session['directory'])
+            except Exception as e:
+                tracing.error("Otomatik kayıt oturumu okunamadı (%s): %s", session['directory'], e)
+                continue
+            if routes or trajectories:
+                saved_at = time.strftime('%d.%m.%Y %H:%M', time.localtime(session['modified']))
+                answer = QMessageBox.question(
+                    self, "Oturum Kurtarma",
+                    f"Beklenmedik şekilde kapanan bir oturumdan kaydedilmemiş çizimler bulundu "
+                    f"({saved_at}: {len(routes)} rota, {len(trajectories)} trajectory).\n\n"
+                    f"Kurtarılıp haritaya eklensin mi? Hayır seçilirse bu kayıt silinir.",
+                    QMessageBox.Yes | QMessageBox.No)
+                if answer == QMessageBox.Yes:
+                    self.map_widget.drawn_elements['routes'].extend(routes)
+                    self.map_widget.drawn_elements['trajectories'].extend(trajectories)
+                    recovered = True
+            discard_session(session['directory'])
+        if recovered:
+            self.map_widget.schedule_infringement_check()
+            self.map_widget.update()
+            self.refresh_trajectory_playback()
+            self.statusBar().showMessage("Kaydedilmemiş çizimler kurtarıldı", 5000)
+
+        try:
+            journal = AutosaveJournal(new_session_directory())
+            journal.acquire()
+        except OSError as e:
+            tracing.warning("Otomatik kayıt başlatılamadı: %s", e)
+            return
+        self.autosave_journal = journal
+        self.autosave_worker = AutosaveWorker(journal, self)
+        self.autosave_worker.autosaveFailed.connect(
+            lambda message: self.statusBar().showMessage(f"Otomatik kayıt hatası: {message}", 5000))
+        self.autosave_worker.start()
+        # Tek atımlık ve yeniden başlatılmayan zamanlayıcı: sürekli düzenlemede de en geç
+        # AUTOSAVE_DELAY_MS sonra kayıt alınır
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.setInterval(AUTOSAVE_DELAY_MS)
+        self.autosave_timer.timeout.connect(self.autosave_now)
+        self.map_widget.drawingsChanged.connect(self.schedule_autosave)
+        self.schedule_autosave()
+
+    def schedule_autosave(self):
+        """Autosave the drawings after a short delay (ardışık düzenlemeler tek kayıtta birleşir)"""
+        timer = getattr(self, 'autosave_timer', None)
+        if timer is not None and not timer.isActive():
+            timer.start()
+
+    def autosave_now(self):
+        """Hand a copy of the drawings to the autosave worker (yazma arka planda yapılır)"""
+        if getattr(self, 'autosave_worker', None) is not None:
+            self.autosave_worker.submit(self.map_widget._snapshot_drawn_elements())
+
+    def on_bulk_trajectory_import_finished(self, imported, failed, cancelled):
+        if self.trajectory_import_progress is not None:
+            self.trajectory_import_progress.close()
+            self.trajectory_import_progress = None
+
+        message = f"Imported {imported} trajectories"
+        if failed:
+            message += f", {failed} files failed"
+        if cancelled:
+            message += " (cancelled)"
+        self.statusBar().showMessage(message + ".", 5000)
+        self.trajectory_import_worker = None
+        self.refresh_trajectory_playback()
+
+    def on_open_trajectory_store(self):
+        """Open a memory-mapped trajectory store and add its flights to the map"""
+        options = QFileDialog.Options()
+        options |= QFileDialog.DontUseNativeDialog
+        folder = QFileDialog.getExistingDirectory(self, "Open Trajectory Store", "", options=options)
+        if not folder:
+            return
+        from trajectory_store import TrajectoryStore, is_trajectory_store
+        if not is_trajectory_store(folder):
+            QMessageBox.warning(self, "Not a Trajectory Store", f"No trajectory store found in:\n{folder}")
+            return
+        try:
+            store = TrajectoryStore.open(folder)
+        except Exception as e:
+            QMessageBox.critical(self, "Open Error", f"Could not open trajectory store:\n{str(e)}")
+            return
+
+        # Görünümler kopyasızdır; noktalar yalnızca çizilirken diskten okunur
+        before = len(self.map_widget.drawn_elements['trajectories'])
+        for view in store:
+            self.map_widget.add_trajectory(view.trajectory_id, view)
+        added = len(self.map_widget.drawn_elements['trajectories']) - before
+        self.refresh_trajectory_playback()
+        self.statusBar().showMessage(
+            f"Opened trajectory store with {len(store)} flights ({store.point_count} points), {added} shown.", 5000)
+
+    def on_save_trajectory_store(self):
+        """Write the trajectories on the map to a new trajectory store folder"""
+        trajectories = self.map_widget.drawn_elements.get('trajectories', [])
+        if not trajectories:
+            QMessageBox.information(self, "No Trajectories", "There are no trajectories to save.")
+            return
+        options = QFileDialog.Options()
+        options |= QFileDialog.DontUseNativeDialog
+        folder = QFileDialog.getExistingDirectory(self, "Save Trajectories as Store", "", options=options)
+        if not folder:
+            return
+        if os.listdir(folder):
+            QMessageBox.warning(self, "Folder Not Empty", "Please choose an empty folder for the trajectory store.")
+            return
+        try:
+            from trajectory_store import write_trajectory_store
+            count = write_trajectory_store(folder, ((t['id'], t['points'], t.get('times')) for t in trajectories))
+            self.statusBar().showMessage(f"Saved {count} trajectories to {folder}.", 5000)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            QMessageBox.critical(self, "Save Error", f"Could not save trajectory store:\n{str(e)}")
+
     def show_gradient_calculator(self):
         """Show the gradient calculator dialog"""
         # Rotaları bir sözlük olarak hazırla
@@ -943,6 +1467,7 @@ class AirspaceVisualizer(QMainWindow):
                 }
         
         # Create and show the gradient calculator dialog
+        from gradient_calculator_dialog import GradientCalculatorDialog
         self.gradient_calculator = GradientCalculatorDialog(routes_dict, self)
         
         # Set dialog properties to keep it on top but non-modal
@@ -1139,6 +1664,11 @@ class AirspaceVisualizer(QMainWindow):
         self.map_widget.update() # Haritayı güncelle
         self.statusBar().showMessage(f"Yasaklı saha görünürlüğü: {'Açık' if checked else 'Kapalı'}", 2000)
         
+    def on_show_traffic_density_toggled(self, checked):
+        """Handle traffic density heatmap toggle"""
+        self.map_widget.set_traffic_density_visible(checked)
+        self.statusBar().showMessage(f"Trafik yoğunluk haritası: {'Açık' if checked else 'Kapalı'}", 2000)
+
     def on_show_segment_distances_toggled(self, checked):
         """Handle segment distance labels visibility toggle"""
         self.map_widget.show_segment_distances = checked
@@ -1198,6 +1728,8 @@ class AirspaceVisualizer(QMainWindow):
         if confirmation == QMessageBox.Yes:
             # MapWidget'ın clear metodu tüm çizimleri temizleyecek
             self.map_widget.clear_all_drawings()
+            self.refresh_trajectory_playback()
+            self.left_sidebar.populate_trajectory_groups([])
             self.statusBar().showMessage("Çalışma alanı temizlendi", 3000)
         else:
             self.statusBar().showMessage("İşlem iptal edildi", 2000)
\ No newline at end of file
@@ -0,0 +1,115 @@
+import time
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QDoubleSpinBox,
+    QPushButton, QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox
+)
+from PyQt5.QtCore import Qt, pyqtSignal
+
+from conformance_dialog import NumericTableItem
+from procedure_assignment import assign_procedures
+
+
+class ProcedureAssignmentDialog(QDialog):
+    """Yüklü trajectory'leri en olası SID/STAR ile otomatik eşleştiren dialog"""
+
+    assignmentsReady = pyqtSignal(object)  # assign_procedures sonucu (liste)
+
+    COLUMNS = ["Flight", "Type", "Runway", "Procedure", "Distance (NM)", "Coverage %", "Candidates"]
+
+    def __init__(self, data_manager, map_widget, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Procedure Assignment")
+        self.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
+        self.data_manager = data_manager
+        self.map_widget = map_widget
+        self.assignments = []
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(7)
+        layout.setContentsMargins(10, 10, 10, 10)
+
+        params_layout = QHBoxLayout()
+        params_layout.addWidget(QLabel("Yöntem:"))
+        self.method_combo = QComboBox()
+        self.method_combo.addItem("Fréchet", "frechet")
+        self.method_combo.addItem("DTW", "dtw")
+        params_layout.addWidget(self.method_combo)
+        params_layout.addWidget(QLabel("Max mesafe:"))
+        self.max_distance_spin = self._make_spin(0.5, 20.0, 3.0, " NM")
+        params_layout.addWidget(self.max_distance_spin)
+        params_layout.addWidget(QLabel("Pencere:"))
+        self.window_spin = self._make_spin(0.5, 20.0, 5.0, " NM")
+        params_layout.addWidget(self.window_spin)
+        params_layout.addStretch()
+        layout.addLayout(params_layout)
+
+        buttons_layout = QHBoxLayout()
+        self.assign_button = QPushButton("Eşleştir")
+        self.assign_button.clicked.connect(self.run_assignment)
+        buttons_layout.addWidget(self.assign_button)
+        buttons_layout.addStretch()
+        layout.addLayout(buttons_layout)
+
+        self.summary_label = QLabel("")
+        layout.addWidget(self.summary_label)
+
+        self.results_table = QTableWidget()
+        self.results_table.setColumnCount(len(self.COLUMNS))
+        self.results_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.results_table.verticalHeader().setVisible(False)
+        self.results_table.setAlternatingRowColors(True)
+        self.results_table.verticalHeader().setDefaultSectionSize(20)
+        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.results_table)
+
+        self.resize(760, 480)
+
+    def _make_spin(self, minimum, maximum, value, suffix):
+        spin = QDoubleSpinBox()
+        spin.setRange(minimum, maximum)
+        spin.setDecimals(1)
+        spin.setSingleStep(0.5)
+        spin.setValue(value)
+        spin.setSuffix(suffix)
+        return spin
+
+    def run_assignment(self):
+        """Tüm yüklü trajectory'leri prosedürlerle eşleştir"""
+        trajectories = self.map_widget.drawn_elements.get('trajectories', [])
+        if not trajectories:
+            QMessageBox.information(self, "Procedure Assignment", "Eşleştirme için yüklü trajectory gerekli.")
+            return
+        start = time.perf_counter()
+        self.assignments, stats = assign_procedures(
+            ((t['id'], t['points']) for t in trajectories),
+            self.data_manager.procedures, self.data_manager.runways,
+            method=self.method_combo.currentData(),
+            max_distance_nm=self.max_distance_spin.value(),
+            window_nm=self.window_spin.value())
+        elapsed = time.perf_counter() - start
+
+        self.populate_table(self.assignments)
+        assigned = sum(1 for a in self.assignments if a['procedure'] is not None)
+        self.summary_label.setText(
+            f"{assigned}/{stats['flights']} uçuş eşleşti; "
+            f"{stats['pairs_compared']}/{stats['pairs_total']} çift karşılaştırıldı, {elapsed:.2f} sn")
+        self.assignmentsReady.emit(self.assignments)
+
+    def populate_table(self, assignments):
+        self.results_table.setSortingEnabled(False)
+        self.results_table.setRowCount(len(assignments))
+        for row, assignment in enumerate(assignments):
+            runway = assignment['runway'] or assignment['detected_runway'] or "-"
+            coverage = assignment['coverage'] * 100.0 if assignment['coverage'] is not None else None
+            self.results_table.setItem(row, 0, QTableWidgetItem(str(assignment['id'])))
+            self.results_table.setItem(row, 1, QTableWidgetItem(assignment['proc_type'] or "-"))
+            self.results_table.setItem(row, 2, QTableWidgetItem(str(runway)))
+            self.results_table.setItem(row, 3, QTableWidgetItem(assignment['procedure'] or "-"))
+            self.results_table.setItem(row, 4, NumericTableItem(assignment['distance_nm']))
+            self.results_table.setItem(row, 5, NumericTableItem(coverage, "{:.0f}"))
+            self.results_table.setItem(row, 6, NumericTableItem(assignment['candidates'], "{:d}"))
+        self.results_table.setSortingEnabled(True)
@@ -0,0 +1,268 @@
+"""
+Çökme kurtarma için yalnızca eklemeli otomatik kayıt günlüğü
+
+Her oturum kendi dizininde session.lock, snapshot.procdb (ProjectStore) ve
+snapshot'tan sonraki rota değişikliklerini satır satır tutan journal.jsonl
+kullanır. Program çökerse find_recoverable_sessions() kilidi bırakılmış
+dizinleri bulur, recover_session() snapshot'ı yükleyip günlüğü oynatır.
+"""
+
+import os
+import shutil
+import time
+
+import tracing
+from project_store import ProjectStore, decode_json, element_keys, encode_json, route_digest
+from trajectory_store import TrajectoryView
+
+LOCK_FILE = 'session.lock'
+SNAPSHOT_FILE = 'snapshot.procdb'
+JOURNAL_FILE = 'journal.jsonl'
+
+COMPACT_BYTES = 4 * 1024 * 1024  # Günlük bu boyutu aşınca snapshot'a katlanır
+MAX_BATCH_ROUTES = 200  # Tek kayıtta bundan fazla rota değiştiyse doğrudan snapshot yazılır
+
+
+def default_autosave_root():
+    return os.environ.get('PROCEDURE_AUTOSAVE_DIR') or os.path.join(os.path.expanduser('~'), '.procedure', 'autosave')
+
+
+def new_session_directory(root=None):
+    """Create and return a fresh session directory under root"""
+    root = root or default_autosave_root()
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+    directory = os.path.join(root, name)
+    suffix = 1
+    while os.path.exists(directory):
+        suffix += 1
+        directory = os.path.join(root, f"{name}-{suffix}")
+    os.makedirs(directory)
+    return directory
+
+
+def _try_lock(handle):
+    """Non-blocking exclusive lock on an open file; False if another process holds it"""
+    try:
+        if os.name == 'nt':
+            import msvcrt
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _has_data(directory):
+    journal_path = os.path.join(directory, JOURNAL_FILE)
+    return (os.path.exists(os.path.join(directory, SNAPSHOT_FILE)) or
+            (os.path.exists(journal_path) and os.path.getsize(journal_path) > 0))
+
+
+class AutosaveJournal:
+    """Append-only autosave of the drawn routes and trajectories of one session.
+
+    Kullanım:
+        journal = AutosaveJournal(new_session_directory())
+        journal.acquire()
+        journal.record(map_widget._snapshot_drawn_elements())   # arka plan thread'inde
+        journal.discard()                                      # düzgün kapanışta
+    """
+
+    def __init__(self, directory, compact_bytes=COMPACT_BYTES, max_batch_routes=MAX_BATCH_ROUTES):
+        self.directory = os.path.abspath(directory)
+        self.snapshot_path = os.path.join(self.directory, SNAPSHOT_FILE)
+        self.journal_path = os.path.join(self.directory, JOURNAL_FILE)
+        self.compact_bytes = compact_bytes
+        self.max_batch_routes = max_batch_routes
+        self._lock_handle = None
+        self._store = None
+        self._journal = None
+        self._sequence = 0
+        self._generation = 0
+        # Son yazılan hal: anahtar -> rota özeti, rota sırası ve trajectory kimlikleri
+        self._route_digests = {}
+        self._route_order = []
+        self._trajectory_identity = None
+
+    def acquire(self):
+        """Lock the session directory; raises OSError if another process owns it"""
+        os.makedirs(self.directory, exist_ok=True)
+        handle = open(os.path.join(self.directory, LOCK_FILE), 'a+')
+        if not _try_lock(handle):
+            handle.close()
+            raise OSError(f"Otomatik kayıt oturumu başka bir süreç tarafından kullanılıyor: {self.directory}")
+        self._lock_handle = handle
+
+    def _open_journal(self):
+        """Start an empty journal for the current snapshot generation"""
+        if self._journal is not None:
+            self._journal.close()
+        self._journal = open(self.journal_path, 'w', encoding='utf-8')
+        self._sequence = 0
+        self._append([{'op': 'begin', 'time': time.time(), 'generation': self._generation}])
+
+    def _append(self, records):
+        lines = []
+        for record in records:
+            self._sequence += 1
+            record['seq'] = self._sequence
+            lines.append(encode_json(record) + '\n')
+        self._journal.write(''.join(lines))
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    @tracing.traced()
+    def record(self, drawn_elements):
+        """Persist drawn_elements ({'routes', 'trajectories'}) as journal records or a new snapshot.
+
+        Returns {'records', 'compacted', 'seconds'}.
+        """
+        start = time.perf_counter()
+        routes = drawn_elements.get('routes', [])
+        # Bellek eşlemli depodan açılan uçuşlar zaten diskte; yeniden yazılmaz
+        trajectories = [trajectory for trajectory in drawn_elements.get('trajectories', [])
+                        if not isinstance(trajectory.get('points'), TrajectoryView)]
+        keys = element_keys(routes)
+        digests = {}
+        changed = []
+        for key, route in zip(keys, routes):
+            digest = route_digest(route)
+            digests[key] = digest
+            if self._route_digests.get(key) != digest:
+                changed.append((key, route))
+        removed = [key for key in self._route_digests if key not in digests]
+        # Trajectory'ler içe aktarıldıktan sonra değişmez; nesne kimliği yeterli
+        identity = [(trajectory, trajectory.get('points')) for trajectory in trajectories]
+        trajectories_changed = (self._trajectory_identity is None and bool(trajectories)) or (
+            self._trajectory_identity is not None and (
+                len(identity) != len(self._trajectory_identity) or
+                any(a is not b or c is not d for (a, c), (b, d) in zip(identity, self._trajectory_identity))))
+
+        journal_size = self._journal.tell() if self._journal is not None else 0
+        if trajectories_changed or len(changed) > self.max_batch_routes or journal_size > self.compact_bytes:
+            self.compact(routes, trajectories)
+            records = 0
+            compacted = True
+        else:
+            now = time.time()
+            entries = [{'op': 'put', 'time': now, 'key': key, 'route': route} for key, route in changed]
+            entries.extend({'op': 'delete', 'time': now, 'key': key} for key in removed)
+            if keys != self._route_order:
+                entries.append({'op': 'order', 'time': now, 'keys': keys})
+            if entries:
+                if self._journal is None:
+                    self._open_journal()
+                self._append(entries)
+            records = len(entries)
+            compacted = False
+        self._route_digests = digests
+        self._route_order = keys
+        self._trajectory_identity = identity
+        tracing.count('autosave.records', records)
+        return {'records': records, 'compacted': compacted, 'seconds': time.perf_counter() - start}
+
+    def compact(self, routes, trajectories):
+        """Fold the current state into the snapshot and start an empty journal"""
+        if self._store is None:
+            self._store = ProjectStore(self.snapshot_path)
+        self._generation += 1
+        self._store.save(routes, trajectories, meta={'autosave_generation': self._generation})
+        self._open_journal()
+        tracing.count('autosave.compactions')
+
+    def close(self):
+        """Close the journal and snapshot files (kilit discard()'a kadar tutulur)"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def discard(self):
+        """Close and delete the session directory (düzgün kapanışta kurtarılacak bir şey kalmaz)"""
+        self.close()
+        if self._lock_handle is not None:
+            self._lock_handle.close()
+            self._lock_handle = None
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def find_recoverable_sessions(root=None):
+    """Session directories left by processes that exited without discarding them, newest first.
+
+    Returns [{'directory', 'modified'}]; veri içermeyen terk edilmiş dizinler silinir.
+    """
+    root = root or default_autosave_root()
+    if not os.path.isdir(root):
+        return []
+    sessions = []
+    for name in os.listdir(root):
+        directory = os.path.join(root, name)
+        lock_path = os.path.join(directory, LOCK_FILE)
+        if not os.path.isfile(lock_path):
+            continue
+        with open(lock_path, 'a+') as handle:
+            if not _try_lock(handle):
+                continue  # Oturum hâlâ çalışıyor
+        if not _has_data(directory):
+            shutil.rmtree(directory, ignore_errors=True)
+            continue
+        modified = max(os.path.getmtime(os.path.join(directory, entry)) for entry in os.listdir(directory))
+        sessions.append({'directory': directory, 'modified': modified})
+    sessions.sort(key=lambda session: -session['modified'])
+    return sessions
+
+
+@tracing.traced()
+def recover_session(directory):
+    """Rebuild (routes, trajectories) from a session's snapshot and journal.
+
+    Yarım yazılmış son satır (çökme anında) ve sonrası yok sayılır; kuşağı
+    snapshot'ınkinden farklı olan günlük zaten snapshot'a katlanmıştır.
+    """
+    routes = {}
+    order = None
+    trajectories = []
+    generation = 0
+    snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+    if os.path.exists(snapshot_path):
+        with ProjectStore(snapshot_path) as store:
+            keys = [summary['key'] for summary in store.route_summaries()]
+            routes = dict(zip(keys, store.load_routes()))
+            trajectories = store.load_trajectories()
+            generation = int(store.meta_value('autosave_generation', 0))
+    journal_path = os.path.join(directory, JOURNAL_FILE)
+    if os.path.exists(journal_path):
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = decode_json(line)
+                except ValueError:
+                    tracing.warning("Otomatik kayıt günlüğünde bozuk satır, kurtarma burada duruyor: %s", journal_path)
+                    break
+                if entry['op'] == 'begin':
+                    if entry['generation'] != generation:
+                        break
+                elif entry['op'] == 'put':
+                    route = entry['route']
+                    if route.get('points') and isinstance(route['points'][0], list):
+                        route['points'] = [tuple(point) for point in route['points']]
+                    routes[entry['key']] = route
+                elif entry['op'] == 'delete':
+                    routes.pop(entry['key'], None)
+                elif entry['op'] == 'order':
+                    order = entry['keys']
+    if order is not None:
+        listed = set(order)
+        ordered = [routes[key] for key in order if key in routes]
+        ordered.extend(route for key, route in routes.items() if key not in listed)
+        return ordered, trajectories
+    return list(routes.values()), trajectories
+
+
+def discard_session(directory):
+    shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,57 @@
+import sqlite3
+import threading
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+import tracing
+
+
+class AutosaveWorker(QThread):
+    """Otomatik kayıt günlüğünü GUI thread'i dışında yazan worker.
+
+    GUI thread'i submit() ile yalnızca çizimlerin bir kopyasını bırakır;
+    yazma sürerken gelen kopyalardan yalnızca en sonuncusu yazılır.
+    """
+
+    # journal.record istatistikleri ({'records', 'compacted', 'seconds'})
+    autosaved = pyqtSignal(object)
+    # (hata mesajı)
+    autosaveFailed = pyqtSignal(str)
+
+    def __init__(self, journal, parent=None):
+        super().__init__(parent)
+        self.journal = journal
+        self._condition = threading.Condition()
+        self._pending = None
+        self._cancelled = False
+
+    def submit(self, drawn_elements):
+        """Queue a copy of drawn_elements for writing (önceki bekleyen kopyanın yerine geçer)"""
+        with self._condition:
+            self._pending = drawn_elements
+            self._condition.notify()
+
+    def cancel(self):
+        """Stop after the write in progress (bekleyen kopya yazılmaz)"""
+        with self._condition:
+            self._cancelled = True
+            self._condition.notify()
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._cancelled:
+                    self._condition.wait()
+                if self._cancelled:
+                    break
+                drawn_elements, self._pending = self._pending, None
+            try:
+                self.autosaved.emit(self.journal.record(drawn_elements))
+            except (OSError, ValueError, TypeError, sqlite3.Error) as e:
+                tracing.error("Otomatik kayıt yazılamadı: %s", e)
+                self.autosaveFailed.emit(str(e))
+        # Snapshot bağlantısı bu thread'de açıldı; burada kapatılmalı
+        self.journal.close()
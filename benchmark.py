@@ -0,0 +1,389 @@
+"""
+Başsız (offscreen) performans ölçüm takımı
+
+Yükleme, çizim ve etkileşim sıcak yollarını ölçeklenebilir sentetik veriyle
+zamanlar ve sonuçları commit'ler arasında karşılaştırılabilir JSON olarak
+yazar. QT_QPA_PLATFORM verilmemişse 'offscreen' kullanılır. Büyük hava
+sahası ölçümleri için synthetic_data.py ile üretilen klasör --airspace
+ile verilebilir.
+
+Kullanım:
+    python benchmark.py -o results.json
+    python benchmark.py --routes 500 --route-points 40 --trajectories 2000 -o big.json
+    python benchmark.py --only paint snap --repeat 10
+    python benchmark.py -o new.json --compare results.json --threshold 1.2
+
+Ölçümler (BENCHMARKS):
+    load_airspace_data     DataManager.load_airspace_data (--airspace)
+    load_geojson           MapWidget.load_and_compute_geojson (--geojson)
+    compute_country_paths  Pan/zoom/resize'da ülke yollarının yeniden kurulması
+    paint                  Tüm MapWidget.paintEvent'in QImage'a çizimi
+    snap                   SnapManager.update_mouse_position, --queries fare konumu
+    find_path_at_point     MapWidget.find_path_at_point, --queries tıklama
+    undo_snapshot          MapWidget._save_state_for_undo
+    trajectory_import      --trajectories CSV dosyasının paralel ayrıştırılması
+
+JSON biçimi:
+    {"meta": {"commit", "python", "numpy", "qt", "platform", "timestamp", "params"},
+     "results": {ad: {"times_s": [...], "min_s", "median_s", "mean_s", "items", "per_item_us"}}}
+
+--compare ile önceki bir sonuç dosyasına göre median oranları yazılır;
+--threshold'u aşan yavaşlama varsa çıkış kodu 1 olur. Hava sahası veya
+GeoJSON yüklenemezse sonuç yazılmaz ve çıkış kodu 2 olur.
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+
+from synthetic_data import flight_track, write_trajectory_csv
+
+# Varsayılan veri yolları çalışma dizininden bağımsız olarak depo kökünden çözülür
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# Sentetik rota ve trajectory'lerin yerleştirildiği bölge (İstanbul TMA civarı)
+REGION = (40.0, 42.5, 27.0, 31.5)  # (min_lat, max_lat, min_lon, max_lon)
+
+
+def make_routes(count, points_per_route, seed=0):
+    """Random user_route dicts in REGION with cached segment metrics"""
+    import geodesy
+    rng = np.random.default_rng(seed)
+    min_lat, max_lat, min_lon, max_lon = REGION
+    routes = []
+    for index in range(count):
+        start = rng.uniform((min_lat, min_lon), (max_lat, max_lon))
+        steps = rng.normal(0.0, 0.05, (points_per_route, 2))
+        coords = np.clip(start + np.cumsum(steps, axis=0), (min_lat, min_lon), (max_lat, max_lon))
+        points = [(float(lat), float(lon)) for lat, lon in coords]
+        routes.append({
+            'type': 'user_route',
+            'id': f"route_{index}",
+            'name': f"Route {index}",
+            'points': points,
+            'waypoint_names': [f"R{index}P{i}" for i in range(len(points))],
+            'segment_distances': geodesy.segment_distances_nm(coords[:, 0], coords[:, 1]).tolist(),
+            'segment_angles': geodesy.segment_bearings_deg(coords[:, 0], coords[:, 1]).tolist(),
+        })
+    return routes
+
+
+def synthetic_flights(count, points_count, seed=0):
+    """Yield (callsign, points, times) for count flights between random positions in REGION"""
+    rng = np.random.default_rng(seed)
+    min_lat, max_lat, min_lon, max_lon = REGION
+    for index in range(count):
+        origin, destination = rng.uniform((min_lat, min_lon), (max_lat, max_lon), (2, 2))
+        points, times = flight_track(origin, destination, points_count, rng)
+        yield f"BNC{index:04d}", points, times
+
+
+def write_trajectory_csvs(folder, count, points_count, seed=0):
+    """Write synthetic trajectory CSV files in the importer's format; returns paths"""
+    paths = []
+    for callsign, points, times in synthetic_flights(count, points_count, seed):
+        path = os.path.join(folder, f"{callsign}.csv")
+        write_trajectory_csv(path, callsign, points, times)
+        paths.append(path)
+    return paths
+
+
+class BenchmarkError(RuntimeError):
+    """Ölçüm verisi yüklenemedi; geçersiz süreler sonuç dosyasına yazılmaz"""
+
+
+def load_airspace(data_manager, folder):
+    with contextlib.redirect_stdout(io.StringIO()):
+        success = data_manager.load_airspace_data(folder)
+    if not success:
+        raise BenchmarkError(f"Hava sahası verisi yüklenemedi: {folder}")
+
+
+def load_geojson(widget, filepath):
+    with contextlib.redirect_stdout(io.StringIO()):
+        success = widget.load_and_compute_geojson(filepath)
+    if not success:
+        raise BenchmarkError(f"GeoJSON yüklenemedi: {filepath}")
+
+
+def time_calls(function, repeat, setup=None):
+    """Run function repeat times (after optional untimed setup each time); returns seconds list"""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+class BenchmarkContext:
+    """Shared, lazily built objects (QApplication, loaded MapWidget) for one run"""
+
+    def __init__(self, args):
+        self.args = args
+        self._app = None
+        self._widget = None
+        self._data_manager = None
+
+    def app(self):
+        if self._app is None:
+            from PyQt5.QtWidgets import QApplication
+            self._app = QApplication.instance() or QApplication([])
+        return self._app
+
+    def data_manager(self):
+        if self._data_manager is None:
+            from models import DataManager
+            data_manager = DataManager()
+            load_airspace(data_manager, self.args.airspace)
+            self._data_manager = data_manager
+        return self._data_manager
+
+    def widget(self):
+        """MapWidget with GeoJSON, airspace, routes and trajectories loaded"""
+        if self._widget is None:
+            self.app()
+            from map_widget import MapWidget
+            args = self.args
+            data_manager = self.data_manager()
+            widget = MapWidget()
+            widget.resize(args.width, args.height)
+            load_geojson(widget, args.geojson)
+            with contextlib.redirect_stdout(io.StringIO()):
+                widget.set_data_manager(data_manager)
+                widget.set_runways(data_manager.runways)
+                widget.set_selected_runways([runway['id'] for runway in data_manager.runways])
+                widget.drawn_elements['routes'] = make_routes(args.routes, args.route_points, args.seed)
+                for callsign, points, times in synthetic_flights(args.trajectories, args.trajectory_points, args.seed):
+                    widget.add_trajectory(callsign, points, times)
+            self._widget = widget
+        return self._widget
+
+    def query_points(self):
+        """Deterministic screen positions for snap / hit-test queries"""
+        from PyQt5.QtCore import QPointF
+        rng = np.random.default_rng(self.args.seed + 1)
+        return [QPointF(x, y) for x, y in rng.uniform((0, 0), (self.args.width, self.args.height),
+                                                      (self.args.queries, 2))]
+
+
+def bench_load_airspace_data(context):
+    from models import DataManager
+
+    def run():
+        load_airspace(DataManager(), context.args.airspace)
+    return time_calls(run, context.args.repeat), 1
+
+
+def bench_load_geojson(context):
+    context.app()
+    from map_widget import MapWidget
+    widget = MapWidget()
+    widget.resize(context.args.width, context.args.height)
+
+    def run():
+        load_geojson(widget, context.args.geojson)
+    return time_calls(run, context.args.repeat), 1
+
+
+def bench_compute_country_paths(context):
+    widget = context.widget()
+    zooms = iter(np.linspace(1.0, 3.0, context.args.repeat))
+
+    def zoom():
+        widget.zoom = float(next(zooms))
+    return time_calls(widget.compute_country_paths, context.args.repeat, setup=zoom), len(widget.country_arrays)
+
+
+def bench_paint(context):
+    from PyQt5.QtGui import QImage
+    widget = context.widget()
+    image = QImage(context.args.width, context.args.height, QImage.Format_ARGB32_Premultiplied)
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            widget.render(image)
+    run()  # İlk çizimdeki tek seferlik önbellek kurulumu ölçüme girmesin
+    return time_calls(run, context.args.repeat), 1
+
+
+def bench_snap(context):
+    widget = context.widget()
+    snap_manager = widget.route_drawer.snap_manager
+    points = context.query_points()
+
+    def run():
+        for point in points:
+            snap_manager.update_mouse_position(point)
+    return time_calls(run, context.args.repeat), len(points)
+
+
+def bench_find_path_at_point(context):
+    widget = context.widget()
+    points = context.query_points()
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for point in points:
+                widget.find_path_at_point(point)
+    return time_calls(run, context.args.repeat), len(points)
+
+
+def bench_undo_snapshot(context):
+    widget = context.widget()
+
+    def run():
+        widget._save_state_for_undo()
+    times = time_calls(run, context.args.repeat)
+    widget._undo_stack.clear()
+    return times, len(widget.drawn_elements['routes'])
+
+
+def bench_trajectory_import(context):
+    from trajectory_import import iter_parsed_trajectories
+    args = context.args
+    with tempfile.TemporaryDirectory() as folder:
+        paths = write_trajectory_csvs(folder, args.trajectories, args.trajectory_points, args.seed)
+
+        def run():
+            parsed = [points for _, _, points, _ in iter_parsed_trajectories(paths, args.workers)]
+            if any(points is None for points in parsed):
+                raise RuntimeError("Sentetik trajectory dosyası ayrıştırılamadı")
+        return time_calls(run, args.repeat), len(paths)
+
+
+BENCHMARKS = {
+    'load_airspace_data': bench_load_airspace_data,
+    'load_geojson': bench_load_geojson,
+    'compute_country_paths': bench_compute_country_paths,
+    'paint': bench_paint,
+    'snap': bench_snap,
+    'find_path_at_point': bench_find_path_at_point,
+    'undo_snapshot': bench_undo_snapshot,
+    'trajectory_import': bench_trajectory_import,
+}
+
+
+def summarize(times, items):
+    median = statistics.median(times)
+    return {'times_s': times, 'min_s': min(times), 'median_s': median, 'mean_s': statistics.fmean(times),
+            'items': items, 'per_item_us': median / items * 1e6 if items else None}
+
+
+def _git_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_benchmarks(args, names=None):
+    """Run the selected benchmarks; returns the JSON-serializable results document"""
+    from PyQt5.QtCore import QT_VERSION_STR
+    context = BenchmarkContext(args)
+    results = {}
+    for name in names or BENCHMARKS:
+        times, items = BENCHMARKS[name](context)
+        results[name] = summarize(times, items)
+        if not args.quiet:
+            result = results[name]
+            per_item = f", {result['per_item_us']:.1f} us/öğe ({items})" if items > 1 else ""
+            print(f"{name:<22} median {result['median_s'] * 1000:9.2f} ms, min {result['min_s'] * 1000:9.2f} ms{per_item}")
+    params = {key: value for key, value in vars(args).items() if key not in ('output', 'compare', 'only', 'quiet')}
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'qt': QT_VERSION_STR,
+            'platform': platform.platform(),
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'params': params,
+        },
+        'results': results,
+    }
+
+
+def compare_results(current, baseline, threshold=1.2):
+    """Median ratios current/baseline per benchmark; returns (lines, regressed names)"""
+    lines, regressed = [], []
+    if current['meta']['params'] != baseline.get('meta', {}).get('params'):
+        lines.append("Uyarı: ölçek parametreleri farklı, oranlar doğrudan karşılaştırılamayabilir")
+    for name, result in current['results'].items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            lines.append(f"{name:<22} (karşılaştırma yok)")
+            continue
+        ratio = result['median_s'] / base['median_s'] if base['median_s'] else float('inf')
+        flag = ''
+        if ratio > threshold:
+            flag = '  YAVAŞLAMA'
+            regressed.append(name)
+        elif ratio < 1 / threshold:
+            flag = '  hızlanma'
+        lines.append(f"{name:<22} {base['median_s'] * 1000:9.2f} -> {result['median_s'] * 1000:9.2f} ms  x{ratio:.2f}{flag}")
+    return lines, regressed
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Başsız performans ölçüm takımı")
+    parser.add_argument('-o', '--output', help="Sonuç JSON dosyası")
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help="Yalnızca bu ölçümler")
+    parser.add_argument('--repeat', type=int, default=5, help="Her ölçümün tekrar sayısı")
+    parser.add_argument('--airspace', default=os.path.join(DATA_DIR, 'Airspace_01.01.2025'), help="Hava sahası klasörü")
+    parser.add_argument('--geojson', default=os.path.join(DATA_DIR, 'World.geojson'), help="Altlık harita GeoJSON")
+    parser.add_argument('--routes', type=int, default=100, help="Sentetik rota sayısı")
+    parser.add_argument('--route-points', type=int, default=20, help="Rota başına nokta")
+    parser.add_argument('--trajectories', type=int, default=200, help="Sentetik trajectory sayısı")
+    parser.add_argument('--trajectory-points', type=int, default=300, help="Trajectory başına nokta")
+    parser.add_argument('--queries', type=int, default=200, help="Snap / tıklama sorgu sayısı")
+    parser.add_argument('--width', type=int, default=1600, help="Harita genişliği (piksel)")
+    parser.add_argument('--height', type=int, default=1000, help="Harita yüksekliği (piksel)")
+    parser.add_argument('--workers', type=int, default=None, help="Trajectory içe aktarma işçi sayısı")
+    parser.add_argument('--seed', type=int, default=0, help="Sentetik veri tohumu")
+    parser.add_argument('--compare', help="Karşılaştırılacak önceki sonuç JSON dosyası")
+    parser.add_argument('--threshold', type=float, default=1.2, help="Yavaşlama sayılan median oranı")
+    parser.add_argument('-q', '--quiet', action='store_true', help="Ölçüm satırlarını yazma")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        document = run_benchmarks(args, args.only)
+    except (BenchmarkError, OSError) as e:
+        print(f"HATA: {e}", file=sys.stderr)
+        return 2
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2)
+        print(f"Sonuçlar yazıldı: {args.output}")
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        lines, regressed = compare_results(document, baseline, args.threshold)
+        print("\n".join(lines))
+        if regressed:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
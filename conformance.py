@@ -0,0 +1,284 @@
+"""
+Prosedür uygunluk (conformance) analizi
+
+Uçulan trajectory'lerin SID/STAR hattına göre cross-track hatasını,
+along-track mesafesini ve ekstra uçuş mesafesini (NM) topluca hesaplar.
+"""
+
+import numpy as np
+
+from geodesy import NM_PER_DEG_LAT
+
+# Nokta x segment matrisinin parça başına azami eleman sayısı
+_PROJECTION_CHUNK_ELEMENTS = 2000000
+
+
+def to_local_nm(lats, lons, ref_lat, ref_lon):
+    """Project lat/lon arrays to a local east/north plane in NM around (ref_lat, ref_lon)."""
+    cos_ref = np.cos(np.radians(ref_lat))
+    xs = (np.asarray(lons, dtype=np.float64) - ref_lon) * cos_ref * NM_PER_DEG_LAT
+    ys = (np.asarray(lats, dtype=np.float64) - ref_lat) * NM_PER_DEG_LAT
+    return xs, ys
+
+
+def from_local_nm(xs, ys, ref_lat, ref_lon):
+    """Inverse of to_local_nm; returns (lats, lons)."""
+    cos_ref = np.cos(np.radians(ref_lat))
+    lats = ref_lat + np.asarray(ys, dtype=np.float64) / NM_PER_DEG_LAT
+    lons = ref_lon + np.asarray(xs, dtype=np.float64) / (NM_PER_DEG_LAT * cos_ref)
+    return lats, lons
+
+
+def iter_procedures(procedures):
+    """Yield (proc_type, airport, runway, name, waypoints) from data_manager.procedures."""
+    for proc_type in sorted(procedures):
+        for airport in sorted(procedures[proc_type]):
+            for runway in sorted(procedures[proc_type][airport]):
+                for name in sorted(procedures[proc_type][airport][runway]):
+                    waypoints = procedures[proc_type][airport][runway][name]
+                    if waypoints:
+                        yield proc_type, airport, runway, name, waypoints
+
+
+def trajectory_columns(points):
+    """Return (lats, lons, alts) float arrays for a trajectory's points.
+
+    points bir (N, 3) dizi, (lat, lon, alt) demet listesi veya TrajectoryView olabilir.
+    """
+    if hasattr(points, 'lats'):
+        return points.lats, points.lons, points.alts
+    array = np.asarray(points, dtype=np.float64)
+    if array.ndim != 2 or array.shape[1] < 3:
+        array = np.column_stack([array.reshape(-1, 2), np.zeros(len(array))]) if array.size else np.zeros((0, 3))
+    return array[:, 0], array[:, 1], array[:, 2]
+
+
+class ProcedurePolyline:
+    """A procedure's waypoint sequence as a polyline in a local NM plane."""
+
+    def __init__(self, waypoints):
+        """waypoints: list of dicts with 'lat'/'lon' (data_manager.procedures) or (lat, lon) tuples."""
+        if waypoints and isinstance(waypoints[0], dict):
+            coords = [(wp['lat'], wp['lon']) for wp in waypoints]
+        else:
+            coords = [(p[0], p[1]) for p in waypoints]
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        if len(coords) >= 2:
+            # Art arda aynı waypoint'ler sıfır uzunluklu segment oluşturmasın
+            keep = np.ones(len(coords), dtype=bool)
+            keep[1:] = np.any(coords[1:] != coords[:-1], axis=1)
+            coords = coords[keep]
+        if len(coords) < 2:
+            raise ValueError("A procedure needs at least two distinct waypoints")
+
+        self.lats = coords[:, 0]
+        self.lons = coords[:, 1]
+        self.ref_lat = float(self.lats.mean())
+        self.ref_lon = float(self.lons.mean())
+        self.xs, self.ys = to_local_nm(self.lats, self.lons, self.ref_lat, self.ref_lon)
+        self.dx = np.diff(self.xs)
+        self.dy = np.diff(self.ys)
+        self.lengths = np.hypot(self.dx, self.dy)
+        self.cumulative = np.concatenate([[0.0], np.cumsum(self.lengths)])
+        self.length = float(self.cumulative[-1])
+
+    @property
+    def bounds(self):
+        """(min_lon, min_lat, max_lon, max_lat) of the waypoints"""
+        return (float(self.lons.min()), float(self.lats.min()), float(self.lons.max()), float(self.lats.max()))
+
+    def project(self, lats, lons):
+        """Project points onto the polyline.
+
+        Returns (cross_track_nm, along_track_nm, segment_indices). Cross-track
+        is signed: positive right of the direction of flight along the procedure.
+        """
+        px, py = to_local_nm(lats, lons, self.ref_lat, self.ref_lon)
+        count = len(px)
+        cross_track = np.empty(count)
+        along_track = np.empty(count)
+        segment_indices = np.empty(count, dtype=np.int64)
+        if count == 0:
+            return cross_track, along_track, segment_indices
+
+        x0, y0 = self.xs[:-1], self.ys[:-1]
+        dx, dy = self.dx, self.dy
+        length_sq = self.lengths ** 2
+        chunk = max(1, _PROJECTION_CHUNK_ELEMENTS // len(dx))
+        for start in range(0, count, chunk):
+            end = min(count, start + chunk)
+            rx = px[start:end, None] - x0[None, :]
+            ry = py[start:end, None] - y0[None, :]
+            t = np.clip((rx * dx + ry * dy) / length_sq, 0.0, 1.0)
+            qx = rx - t * dx
+            qy = ry - t * dy
+            dist_sq = qx * qx + qy * qy
+            seg = np.argmin(dist_sq, axis=1)
+            rows = np.arange(end - start)
+            # Çapraz çarpım > 0 ise nokta hattın solundadır
+            cross = dx[seg] * ry[rows, seg] - dy[seg] * rx[rows, seg]
+            cross_track[start:end] = np.where(cross > 0, -1.0, 1.0) * np.sqrt(dist_sq[rows, seg])
+            along_track[start:end] = self.cumulative[seg] + t[rows, seg] * self.lengths[seg]
+            segment_indices[start:end] = seg
+        return cross_track, along_track, segment_indices
+
+    def point_at(self, along_track_nm, offset_nm=0.0):
+        """Lat/lon of points at along-track distances, offset to the right by offset_nm."""
+        along = np.clip(np.asarray(along_track_nm, dtype=np.float64), 0.0, self.length)
+        seg = np.clip(np.searchsorted(self.cumulative, along, side='right') - 1, 0, len(self.lengths) - 1)
+        t = (along - self.cumulative[seg]) / self.lengths[seg]
+        unit_x = self.dx[seg] / self.lengths[seg]
+        unit_y = self.dy[seg] / self.lengths[seg]
+        # Sağ normal: (uy, -ux)
+        xs = self.xs[seg] + t * self.dx[seg] + unit_y * offset_nm
+        ys = self.ys[seg] + t * self.dy[seg] - unit_x * offset_nm
+        return from_local_nm(xs, ys, self.ref_lat, self.ref_lon)
+
+
+def analyze_conformance(trajectories, waypoints, max_cross_track_nm=10.0, tolerance_nm=1.0,
+                        percentiles=(5, 25, 50, 75, 95), station_spacing_nm=1.0, min_station_samples=5):
+    """Measure how a batch of flights conforms to a procedure.
+
+    Args:
+        trajectories: iterable of (trajectory_id, points) pairs
+        waypoints: Prosedürün waypoint listesi (data_manager.procedures girdisi)
+        max_cross_track_nm: Bundan uzak noktalar prosedürle ilişkilendirilmez
+        tolerance_nm: Uygunluk yüzdesi için cross-track toleransı
+        percentiles: Koridor yüzdelikleri
+        station_spacing_nm: Koridor istasyonları arası along-track mesafe
+        min_station_samples: Koridor noktası için istasyon başına en az örnek
+
+    Bir uçuşun prosedürle ilişkili bölümü, ilk ve son ilişkili noktası
+    arasındaki kısmıdır; özetler ve koridorlar yalnızca bu bölümden hesaplanır.
+
+    Returns a dict with 'procedure_length_nm', 'flights' (summary dicts),
+    'point_data' (per-point arrays), 'stations_nm' and 'corridors'
+    ({percentile: {'offsets_nm', 'lats', 'lons'}}).
+    """
+    polyline = waypoints if isinstance(waypoints, ProcedurePolyline) else ProcedurePolyline(waypoints)
+
+    ids, lat_chunks, lon_chunks = [], [], []
+    for trajectory_id, points in trajectories:
+        lats, lons, _alts = trajectory_columns(points)
+        ids.append(trajectory_id)
+        lat_chunks.append(np.asarray(lats, dtype=np.float64))
+        lon_chunks.append(np.asarray(lons, dtype=np.float64))
+    n_flights = len(ids)
+    counts = np.array([len(chunk) for chunk in lat_chunks], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+    all_lats = np.concatenate(lat_chunks) if n_flights else np.zeros(0)
+    all_lons = np.concatenate(lon_chunks) if n_flights else np.zeros(0)
+    flight_of_point = np.repeat(np.arange(n_flights, dtype=np.int64), counts)
+    point_index = np.arange(len(all_lats), dtype=np.int64)
+
+    cross_track, along_track, _segments = polyline.project(all_lats, all_lons)
+
+    # Uçuş içi adım uzunlukları (her uçuşun ilk noktasında 0)
+    xs, ys = to_local_nm(all_lats, all_lons, polyline.ref_lat, polyline.ref_lon)
+    steps = np.zeros(len(xs))
+    if len(xs) > 1:
+        steps[1:] = np.hypot(np.diff(xs), np.diff(ys))
+        steps[offsets[1:-1]] = 0.0
+
+    # Her uçuşun ilk ve son ilişkili noktası
+    associated = np.abs(cross_track) <= max_cross_track_nm
+    first = np.full(n_flights, np.iinfo(np.int64).max)
+    last = np.full(n_flights, -1, dtype=np.int64)
+    np.minimum.at(first, flight_of_point[associated], point_index[associated])
+    np.maximum.at(last, flight_of_point[associated], point_index[associated])
+    has_window = last >= 0
+    window = np.zeros(len(all_lats), dtype=bool)
+    window_flights = has_window[flight_of_point]
+    window[window_flights] = ((point_index[window_flights] >= first[flight_of_point[window_flights]]) &
+                              (point_index[window_flights] <= last[flight_of_point[window_flights]]))
+
+    # Nokta başına ekstra mesafe: pencere başından uçulan - kat edilen prosedür mesafesi
+    window_steps = np.where(window, steps, 0.0)
+    window_steps[first[has_window]] = 0.0
+    cumulative_flown = np.cumsum(window_steps)
+    extra_track = np.full(len(all_lats), np.nan)
+    start_of_point = np.where(has_window, first, 0)[flight_of_point]
+    extra_track[window] = ((cumulative_flown[window] - cumulative_flown[start_of_point[window]]) -
+                           (along_track[window] - along_track[start_of_point[window]]))
+
+    # Uçuş başına özetler
+    wf = flight_of_point[window]
+    abs_xte = np.abs(cross_track[window])
+    window_counts = np.bincount(wf, minlength=n_flights)
+    sum_abs = np.bincount(wf, weights=abs_xte, minlength=n_flights)
+    sum_sq = np.bincount(wf, weights=abs_xte ** 2, minlength=n_flights)
+    within = np.bincount(wf, weights=(abs_xte <= tolerance_nm).astype(np.float64), minlength=n_flights)
+    flown = np.bincount(wf, weights=window_steps[window], minlength=n_flights)
+    max_abs = np.zeros(n_flights)
+    np.maximum.at(max_abs, wf, abs_xte)
+
+    flights = []
+    for i, trajectory_id in enumerate(ids):
+        summary = {'id': trajectory_id, 'points': int(counts[i]), 'associated_points': int(window_counts[i])}
+        if has_window[i]:
+            along_start = float(along_track[first[i]])
+            along_end = float(along_track[last[i]])
+            summary.update({
+                'mean_abs_xte_nm': float(sum_abs[i] / window_counts[i]),
+                'max_abs_xte_nm': float(max_abs[i]),
+                'rms_xte_nm': float(np.sqrt(sum_sq[i] / window_counts[i])),
+                'within_tolerance_pct': float(100.0 * within[i] / window_counts[i]),
+                'along_start_nm': along_start,
+                'along_end_nm': along_end,
+                'flown_nm': float(flown[i]),
+                'extra_track_miles_nm': float(flown[i] - (along_end - along_start)),
+            })
+        else:
+            summary.update({key: float('nan') for key in (
+                'mean_abs_xte_nm', 'max_abs_xte_nm', 'rms_xte_nm', 'within_tolerance_pct',
+                'along_start_nm', 'along_end_nm', 'flown_nm', 'extra_track_miles_nm')})
+        flights.append(summary)
+
+    stations, corridors = _percentile_corridors(
+        polyline, along_track[window], cross_track[window], percentiles, station_spacing_nm, min_station_samples)
+
+    return {
+        'procedure_length_nm': polyline.length,
+        'tolerance_nm': tolerance_nm,
+        'flights': flights,
+        'point_data': {
+            'offsets': offsets,
+            'flight_indices': flight_of_point,
+            'cross_track_nm': cross_track,
+            'along_track_nm': along_track,
+            'extra_track_nm': extra_track,
+            'in_window': window,
+        },
+        'stations_nm': stations,
+        'percentiles': tuple(percentiles),
+        'corridors': corridors,
+    }
+
+
+def _percentile_corridors(polyline, along, cross, percentiles, spacing, min_samples):
+    """Cross-track percentiles per along-track station, as lat/lon polylines."""
+    if len(along) == 0:
+        return np.zeros(0), {}
+    n_stations = max(1, int(np.ceil(polyline.length / spacing)))
+    station = np.clip((along / spacing).astype(np.int64), 0, n_stations - 1)
+
+    # İstasyon, sonra cross-track sırasına göre sırala; yüzdelikler sıralı dilimlerde enterpole edilir
+    order = np.lexsort((cross, station))
+    sorted_cross = cross[order]
+    station_counts = np.bincount(station, minlength=n_stations)
+    station_starts = np.concatenate([[0], np.cumsum(station_counts)[:-1]])
+    valid = np.flatnonzero(station_counts >= max(1, min_samples))
+    if len(valid) == 0:
+        return np.zeros(0), {}
+    centers = np.minimum((valid + 0.5) * spacing, polyline.length)
+
+    corridors = {}
+    for percentile in percentiles:
+        position = station_starts[valid] + (percentile / 100.0) * (station_counts[valid] - 1)
+        low = np.floor(position).astype(np.int64)
+        high = np.minimum(low + 1, station_starts[valid] + station_counts[valid] - 1)
+        fraction = position - low
+        offsets_nm = sorted_cross[low] + (sorted_cross[high] - sorted_cross[low]) * fraction
+        lats, lons = polyline.point_at(centers, offsets_nm)
+        corridors[percentile] = {'offsets_nm': offsets_nm, 'lats': lats, 'lons': lons}
+    return centers, corridors
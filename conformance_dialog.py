@@ -0,0 +1,157 @@
+import math
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QDoubleSpinBox,
+    QPushButton, QCheckBox, QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox
+)
+from PyQt5.QtCore import Qt
+
+from conformance import analyze_conformance, iter_procedures
+
+
+class NumericTableItem(QTableWidgetItem):
+    """Tablo sıralamasında sayısal karşılaştırma yapan hücre"""
+
+    def __init__(self, value, fmt="{:.2f}"):
+        super().__init__("-" if value is None or (isinstance(value, float) and math.isnan(value)) else fmt.format(value))
+        self.value = value if value is not None and not (isinstance(value, float) and math.isnan(value)) else float('inf')
+        self.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+
+    def __lt__(self, other):
+        if isinstance(other, NumericTableItem):
+            return self.value < other.value
+        return super().__lt__(other)
+
+
+class ConformanceDialog(QDialog):
+    """Yüklü trajectory'lerin seçilen SID/STAR'a uygunluğunu analiz eden dialog"""
+
+    COLUMNS = ["Flight", "Points", "Mean |XTE|", "Max |XTE|", "RMS XTE", "Within Tol %", "Flown (NM)", "Extra (NM)"]
+
+    def __init__(self, data_manager, map_widget, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Procedure Conformance")
+        self.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
+        self.data_manager = data_manager
+        self.map_widget = map_widget
+        self.result = None
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(7)
+        layout.setContentsMargins(10, 10, 10, 10)
+
+        # Prosedür seçimi
+        proc_layout = QHBoxLayout()
+        proc_layout.addWidget(QLabel("Prosedür:"), 0)
+        self.procedure_combo = QComboBox()
+        self.procedure_combo.setSizeAdjustPolicy(QComboBox.AdjustToContents)
+        for proc_type, airport, runway, name, waypoints in iter_procedures(self.data_manager.procedures):
+            self.procedure_combo.addItem(f"{proc_type} {airport} RWY{runway} {name} ({len(waypoints)} wp)",
+                                         (proc_type, airport, runway, name))
+        proc_layout.addWidget(self.procedure_combo, 1)
+        layout.addLayout(proc_layout)
+
+        # Parametreler
+        params_layout = QHBoxLayout()
+        params_layout.addWidget(QLabel("Max XTE:"))
+        self.max_xte_spin = self._make_spin(0.5, 50.0, 10.0, " NM")
+        params_layout.addWidget(self.max_xte_spin)
+        params_layout.addWidget(QLabel("Tolerans:"))
+        self.tolerance_spin = self._make_spin(0.1, 10.0, 1.0, " NM")
+        params_layout.addWidget(self.tolerance_spin)
+        params_layout.addWidget(QLabel("İstasyon:"))
+        self.spacing_spin = self._make_spin(0.1, 10.0, 1.0, " NM")
+        params_layout.addWidget(self.spacing_spin)
+        params_layout.addStretch()
+        layout.addLayout(params_layout)
+
+        buttons_layout = QHBoxLayout()
+        self.analyze_button = QPushButton("Analiz Et")
+        self.analyze_button.clicked.connect(self.run_analysis)
+        buttons_layout.addWidget(self.analyze_button)
+        self.show_corridor_check = QCheckBox("Koridoru haritada göster")
+        self.show_corridor_check.setChecked(True)
+        self.show_corridor_check.toggled.connect(self.update_map_overlay)
+        buttons_layout.addWidget(self.show_corridor_check)
+        buttons_layout.addStretch()
+        layout.addLayout(buttons_layout)
+
+        self.summary_label = QLabel("")
+        layout.addWidget(self.summary_label)
+
+        self.results_table = QTableWidget()
+        self.results_table.setColumnCount(len(self.COLUMNS))
+        self.results_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.results_table.verticalHeader().setVisible(False)
+        self.results_table.setAlternatingRowColors(True)
+        self.results_table.verticalHeader().setDefaultSectionSize(20)
+        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.results_table)
+
+        self.analyze_button.setEnabled(self.procedure_combo.count() > 0)
+        self.resize(720, 480)
+
+    def _make_spin(self, minimum, maximum, value, suffix):
+        spin = QDoubleSpinBox()
+        spin.setRange(minimum, maximum)
+        spin.setDecimals(1)
+        spin.setSingleStep(0.5)
+        spin.setValue(value)
+        spin.setSuffix(suffix)
+        return spin
+
+    def run_analysis(self):
+        """Seçili prosedür için tüm yüklü trajectory'leri analiz et"""
+        key = self.procedure_combo.currentData()
+        trajectories = self.map_widget.drawn_elements.get('trajectories', [])
+        if key is None or not trajectories:
+            QMessageBox.information(self, "Conformance", "Analiz için bir prosedür ve yüklü trajectory gerekli.")
+            return
+        proc_type, airport, runway, name = key
+        waypoints = self.data_manager.procedures[proc_type][airport][runway][name]
+        try:
+            self.result = analyze_conformance(
+                ((t['id'], t['points']) for t in trajectories), waypoints,
+                max_cross_track_nm=self.max_xte_spin.value(),
+                tolerance_nm=self.tolerance_spin.value(),
+                station_spacing_nm=self.spacing_spin.value())
+        except ValueError as e:
+            QMessageBox.warning(self, "Conformance", str(e))
+            return
+
+        self.populate_table(self.result['flights'])
+        matched = [f for f in self.result['flights'] if f['associated_points'] > 0]
+        extra = sorted(f['extra_track_miles_nm'] for f in matched)
+        median_extra = extra[len(extra) // 2] if extra else float('nan')
+        self.summary_label.setText(
+            f"{name}: {self.result['procedure_length_nm']:.1f} NM, "
+            f"{len(matched)}/{len(self.result['flights'])} uçuş ilişkili, medyan ekstra mesafe {median_extra:.1f} NM")
+        self.update_map_overlay()
+
+    def populate_table(self, flights):
+        self.results_table.setSortingEnabled(False)
+        self.results_table.setRowCount(len(flights))
+        for row, flight in enumerate(flights):
+            self.results_table.setItem(row, 0, QTableWidgetItem(str(flight['id'])))
+            self.results_table.setItem(row, 1, NumericTableItem(flight['associated_points'], "{:d}"))
+            self.results_table.setItem(row, 2, NumericTableItem(flight['mean_abs_xte_nm']))
+            self.results_table.setItem(row, 3, NumericTableItem(flight['max_abs_xte_nm']))
+            self.results_table.setItem(row, 4, NumericTableItem(flight['rms_xte_nm']))
+            self.results_table.setItem(row, 5, NumericTableItem(flight['within_tolerance_pct'], "{:.0f}"))
+            self.results_table.setItem(row, 6, NumericTableItem(flight['flown_nm'], "{:.1f}"))
+            self.results_table.setItem(row, 7, NumericTableItem(flight['extra_track_miles_nm'], "{:.1f}"))
+        self.results_table.setSortingEnabled(True)
+
+    def update_map_overlay(self):
+        if self.result is not None and self.show_corridor_check.isChecked():
+            self.map_widget.set_conformance_overlay(self.result)
+        else:
+            self.map_widget.set_conformance_overlay(None)
+
+    def closeEvent(self, event):
+        # Dialog kapanınca koridoru haritadan kaldır
+        self.map_widget.set_conformance_overlay(None)
+        super().closeEvent(event)
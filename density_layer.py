@@ -0,0 +1,134 @@
+"""
+Trafik yoğunluk (heatmap) katmanı
+
+- TrafficDensityGrid: yüklü trajectory noktalarını coğrafi bir ızgarada 2B
+  histograma biriktirir; noktalar parça parça, vektörel olarak eklenir, bu
+  yüzden on milyonlarca nokta ve uçuş eklendikçe artımlı güncelleme desteklenir
+- DensityColorRamp: hücre sayılarını (logaritmik ölçekte) yarı saydam renklere
+  çeviren 256 girdili ARGB tablosu
+- Izgara, renk tablosu üzerinden tek seferde QImage'a dönüştürülür; görüntü
+  eşdikdörtgen (equirectangular) projeksiyonda doğrusal olduğu için haritaya
+  iki köşesinin ekran koordinatlarıyla yerleştirilir
+"""
+
+import numpy as np
+from PyQt5.QtGui import QColor, QImage
+
+# add_points'in bir seferde işlediği nokta sayısı (geçici dizilerin bellek sınırı)
+_ADD_CHUNK = 4_000_000
+
+
+class TrafficDensityGrid:
+    """2D histogram of trajectory points on a regular lat/lon grid.
+
+    Hücre (0, 0) güneybatı köşesidir; satırlar kuzeye doğru artar. Izgara
+    dışındaki noktalar sayılmaz (dropped).
+    """
+
+    def __init__(self, bounds, cell_size_deg=0.02, max_cells=4_000_000):
+        min_lon, min_lat, max_lon, max_lat = (float(v) for v in bounds)
+        cell_size = float(cell_size_deg)
+        # Çok geniş bir alan çok büyük bir ızgara üretmesin diye hücreyi büyüt
+        while ((max_lon - min_lon) / cell_size) * ((max_lat - min_lat) / cell_size) > max_cells:
+            cell_size *= 2.0
+        self.min_lon, self.min_lat = min_lon, min_lat
+        self.cell_size = cell_size
+        self.nx = max(1, int(np.ceil((max_lon - min_lon) / cell_size)))
+        self.ny = max(1, int(np.ceil((max_lat - min_lat) / cell_size)))
+        self.max_lon = min_lon + self.nx * cell_size
+        self.max_lat = min_lat + self.ny * cell_size
+        self.counts = np.zeros(self.ny * self.nx, dtype=np.uint32)
+        self.total = 0
+        self.dropped = 0
+        self.version = 0  # Her değişiklikte artar (görüntü önbelleği için)
+
+    @property
+    def bounds(self):
+        return (self.min_lon, self.min_lat, self.max_lon, self.max_lat)
+
+    def contains_bounds(self, bounds):
+        min_lon, min_lat, max_lon, max_lat = bounds
+        return (min_lon >= self.min_lon and min_lat >= self.min_lat and
+                max_lon <= self.max_lon and max_lat <= self.max_lat)
+
+    def clear(self):
+        self.counts[:] = 0
+        self.total = 0
+        self.dropped = 0
+        self.version += 1
+
+    def add_points(self, lats, lons):
+        """Accumulate points into the grid; returns the number of points counted."""
+        lats = np.asarray(lats)
+        lons = np.asarray(lons)
+        counted = 0
+        inverse_cell = 1.0 / self.cell_size
+        for start in range(0, len(lats), _ADD_CHUNK):
+            chunk_lats = lats[start:start + _ADD_CHUNK]
+            chunk_lons = lons[start:start + _ADD_CHUNK]
+            ix = np.floor((chunk_lons - self.min_lon) * inverse_cell)
+            iy = np.floor((chunk_lats - self.min_lat) * inverse_cell)
+            inside = (ix >= 0) & (ix < self.nx) & (iy >= 0) & (iy < self.ny)
+            flat = iy[inside].astype(np.int64) * self.nx + ix[inside].astype(np.int64)
+            if len(flat) * 8 < len(self.counts):
+                # Küçük parçalarda tüm ızgara boyunda bincount yerine yerinde artır
+                np.add.at(self.counts, flat, 1)
+            else:
+                self.counts += np.bincount(flat, minlength=len(self.counts)).astype(np.uint32)
+            counted += len(flat)
+            self.dropped += len(chunk_lats) - len(flat)
+        self.total += counted
+        if counted:
+            self.version += 1
+        return counted
+
+    def to_grid(self):
+        """Counts as a (ny, nx) array, row 0 = south"""
+        return self.counts.reshape(self.ny, self.nx)
+
+
+class DensityColorRamp:
+    """256-entry premultiplied ARGB lookup table for density colouring.
+
+    Renk durakları 0-1 aralığında konum ve QColor çiftleridir; QColor alfa
+    değeri de enterpole edilir, böylece seyrek hücreler daha saydam olur.
+    """
+
+    DEFAULT_STOPS = [
+        (0.0, QColor(0, 0, 255, 40)),     # Seyrek: saydam mavi
+        (0.35, QColor(0, 200, 255, 120)),
+        (0.6, QColor(255, 255, 0, 170)),
+        (0.85, QColor(255, 128, 0, 210)),
+        (1.0, QColor(255, 0, 0, 240)),     # Yoğun: kırmızı
+    ]
+
+    def __init__(self, stops=None):
+        self.stops = list(stops) if stops else list(self.DEFAULT_STOPS)
+        positions = np.array([position for position, _color in self.stops])
+        channels = np.array([[c.red(), c.green(), c.blue(), c.alpha()] for _p, c in self.stops], dtype=np.float64)
+        fractions = np.linspace(0.0, 1.0, 256)
+        red, green, blue, alpha = (np.interp(fractions, positions, channels[:, k]) for k in range(4))
+        scale = alpha / 255.0
+        self.lut = ((alpha.round().astype(np.uint32) << 24) |
+                    ((red * scale).round().astype(np.uint32) << 16) |
+                    ((green * scale).round().astype(np.uint32) << 8) |
+                    (blue * scale).round().astype(np.uint32))
+
+
+def density_to_qimage(grid, ramp):
+    """Render grid counts to a QImage (north up) using log scaling; empty cells are transparent.
+
+    Dönen QImage, numpy tamponuna referans tutan bir kopyadır; tampon serbest
+    bırakılabilir.
+    """
+    counts = grid.to_grid()
+    peak = int(counts.max()) if counts.size else 0
+    pixels = np.zeros((grid.ny, grid.nx), dtype=np.uint32)
+    if peak > 0:
+        occupied = counts > 0
+        levels = np.log1p(counts[occupied]) / np.log1p(peak)
+        pixels[occupied] = ramp.lut[np.clip((levels * 255.0).astype(np.int64), 0, 255)]
+    # Görüntüde satır 0 kuzeydir
+    pixels = np.ascontiguousarray(pixels[::-1])
+    image = QImage(pixels.data, grid.nx, grid.ny, grid.nx * 4, QImage.Format_ARGB32_Premultiplied)
+    return image.copy()
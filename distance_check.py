@@ -1,4 +1,4 @@
-import math
+import geodesy
 
 def dms_to_decimal(dms_str):
     # Convert coordinate string like '410029N' or '0304944E' to decimal degrees
@@ -23,23 +23,7 @@ def dms_to_decimal(dms_str):
     return decimal
 
 def calculate_distance(lat1, lon1, lat2, lon2):
-    # Earth radius in nautical miles
-    R = 3440.065
-    
-    # Convert to radians
-    lat1 = math.radians(lat1)
-    lon1 = math.radians(lon1)
-    lat2 = math.radians(lat2)
-    lon2 = math.radians(lon2)
-    
-    # Haversine formula
-    dlon = lon2 - lon1
-    dlat = lat2 - lat1
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-    distance = R * c
-    
-    return distance
+    return geodesy.distance(lat1, lon1, lat2, lon2)
 
 # Convert coordinates
 o_lat = dms_to_decimal('410029N')
@@ -0,0 +1,135 @@
+"""
+Harita çizimi için katman bazlı kare süresi profilleyici
+
+MapWidget.paintEvent her katmandan sonra lap(katman, ilkel sayısı) çağırır;
+son `window` kare HUD ve CSV dışa aktarımı için halka tamponda tutulur.
+"""
+
+import csv
+import time
+from collections import deque
+
+
+class FrameProfiler:
+    """Rolling per-layer frame timings, primitive counts and projection counts"""
+
+    def __init__(self, window=240, enabled=True):
+        self.enabled = enabled
+        self.frames = deque(maxlen=window)
+        self.frame_index = 0
+        self._layers = None
+        self._frame_start = 0.0
+        self._last = 0.0
+        self._summary = None
+        self._summary_frame = -1
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._frame_start = self._last = time.perf_counter()
+        self._layers = {}
+
+    def lap(self, layer, primitives=0):
+        """Charge the time since the previous lap to layer and add its primitive count."""
+        if self._layers is None:
+            return
+        now = time.perf_counter()
+        entry = self._layers.get(layer)
+        if entry is None:
+            self._layers[layer] = [now - self._last, primitives]
+        else:
+            entry[0] += now - self._last
+            entry[1] += primitives
+        self._last = now
+
+    def end_frame(self, projected_calls=0, projected_points=0):
+        """Close the frame; projected_* are the geo_to_screen scalar calls / array points of the frame."""
+        if self._layers is None:
+            return
+        total = time.perf_counter() - self._frame_start
+        self.frames.append({
+            'frame': self.frame_index,
+            'time': time.time(),
+            'total_ms': total * 1000.0,
+            'layers': {layer: (seconds * 1000.0, primitives) for layer, (seconds, primitives) in self._layers.items()},
+            'geo_to_screen_calls': projected_calls,
+            'projected_points': projected_points,
+        })
+        self.frame_index += 1
+        self._layers = None
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        if not enabled:
+            self._layers = None
+
+    def clear(self):
+        self.frames.clear()
+        self._summary = None
+
+    @staticmethod
+    def _percentile(sorted_values, fraction):
+        return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+    def summary(self):
+        """Rolling statistics over the buffered frames (cached until a new frame arrives).
+
+        Returns {'frames', 'mean_ms', 'p95_ms', 'max_ms', 'fps', 'geo_to_screen_calls',
+        'projected_points', 'layers': {layer: {'mean_ms', 'p95_ms', 'max_ms', 'share',
+        'primitives'}}} with layers ordered by first appearance in the frame.
+        """
+        if self._summary is not None and self._summary_frame == self.frame_index:
+            return self._summary
+        frames = list(self.frames)
+        count = len(frames)
+        result = {'frames': count, 'mean_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0, 'fps': 0.0,
+                  'geo_to_screen_calls': 0.0, 'projected_points': 0.0, 'layers': {}}
+        if count:
+            totals = sorted(frame['total_ms'] for frame in frames)
+            mean_total = sum(totals) / count
+            span = frames[-1]['time'] - frames[0]['time']
+            result.update(mean_ms=mean_total, p95_ms=self._percentile(totals, 0.95), max_ms=totals[-1],
+                          fps=(count - 1) / span if count > 1 and span > 0 else 0.0,
+                          geo_to_screen_calls=sum(frame['geo_to_screen_calls'] for frame in frames) / count,
+                          projected_points=sum(frame['projected_points'] for frame in frames) / count)
+            names = []
+            for frame in frames:
+                names.extend(name for name in frame['layers'] if name not in names)
+            for name in names:
+                # Katmanın çizilmediği karelerde süresi 0 sayılır
+                values = [frame['layers'].get(name, (0.0, 0)) for frame in frames]
+                times = sorted(ms for ms, _ in values)
+                mean_ms = sum(times) / count
+                result['layers'][name] = {
+                    'mean_ms': mean_ms,
+                    'p95_ms': self._percentile(times, 0.95),
+                    'max_ms': times[-1],
+                    'share': mean_ms / mean_total if mean_total else 0.0,
+                    'primitives': sum(primitives for _, primitives in values) / count,
+                }
+        self._summary, self._summary_frame = result, self.frame_index
+        return result
+
+    def summary_lines(self, limit=None):
+        """Short text lines for the on-map HUD"""
+        data = self.summary()
+        lines = [f"Frame {data['mean_ms']:.1f} ms (p95 {data['p95_ms']:.1f}, max {data['max_ms']:.1f})  "
+                 f"{data['fps']:.0f} fps  [{data['frames']} kare]",
+                 f"geo_to_screen {data['geo_to_screen_calls']:.0f} çağrı, {data['projected_points']:.0f} dizi noktası / kare"]
+        layers = sorted(data['layers'].items(), key=lambda item: -item[1]['mean_ms'])
+        for name, stats in layers[:limit]:
+            lines.append(f"{name:<20} {stats['mean_ms']:6.2f} ms  p95 {stats['p95_ms']:6.2f}  "
+                         f"{stats['share'] * 100:3.0f}%  n={stats['primitives']:.0f}")
+        return lines
+
+    def export_csv(self, filepath):
+        """Write buffered frames, one row per (frame, layer) plus a 'frame' total row"""
+        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['frame', 'time', 'layer', 'ms', 'primitives', 'geo_to_screen_calls', 'projected_points'])
+            for frame in self.frames:
+                writer.writerow([frame['frame'], f"{frame['time']:.3f}", 'frame', f"{frame['total_ms']:.3f}", '',
+                                 frame['geo_to_screen_calls'], frame['projected_points']])
+                for layer, (ms, primitives) in frame['layers'].items():
+                    writer.writerow([frame['frame'], f"{frame['time']:.3f}", layer, f"{ms:.3f}", primitives, '', ''])
+        return len(self.frames)
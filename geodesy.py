@@ -0,0 +1,127 @@
+"""
+Küresel dünya modeli üzerinde büyük daire hesapları
+
+Vektörel fonksiyonlar NumPy dizileri alır; tek nokta çağıranlar için math
+tabanlı skaler sürümler de vardır (distance, bearing, destination_point).
+Açılar derece, mesafeler deniz mili (NM) cinsindendir.
+"""
+
+import math
+
+import numpy as np
+
+# Ortalama dünya yarıçapı (deniz mili)
+EARTH_RADIUS_NM = 3440.065
+
+# Yerel düzlem (equirectangular) yaklaşımlarında enlem derecesi başına NM
+NM_PER_DEG_LAT = 60.0
+
+
+def _radians(*values):
+    return [np.radians(np.asarray(value, dtype=np.float64)) for value in values]
+
+
+def distance_nm(lat1, lon1, lat2, lon2):
+    """Great-circle (haversine) distance in NM between point arrays."""
+    lat1, lon1, lat2, lon2 = _radians(lat1, lon1, lat2, lon2)
+    a = (np.sin((lat2 - lat1) / 2.0) ** 2 +
+         np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2.0) ** 2)
+    a = np.clip(a, 0.0, 1.0)
+    return EARTH_RADIUS_NM * 2.0 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+
+
+def bearing_deg(lat1, lon1, lat2, lon2):
+    """Initial great-circle bearing in degrees [0, 360) from point 1 to point 2."""
+    lat1, lon1, lat2, lon2 = _radians(lat1, lon1, lat2, lon2)
+    d_lon = lon2 - lon1
+    y = np.sin(d_lon) * np.cos(lat2)
+    x = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(d_lon)
+    return np.degrees(np.arctan2(y, x)) % 360.0
+
+
+def destination(lat, lon, distance, bearing):
+    """Points at the given distance (NM) and bearing (deg) from the start points.
+
+    Returns (lats, lons) arrays.
+    """
+    lat1, lon1, theta = _radians(lat, lon, bearing)
+    delta = np.asarray(distance, dtype=np.float64) / EARTH_RADIUS_NM
+    sin_lat1, cos_lat1 = np.sin(lat1), np.cos(lat1)
+    sin_delta, cos_delta = np.sin(delta), np.cos(delta)
+    sin_lat2 = np.clip(sin_lat1 * cos_delta + cos_lat1 * sin_delta * np.cos(theta), -1.0, 1.0)
+    lat2 = np.arcsin(sin_lat2)
+    lon2 = lon1 + np.arctan2(np.sin(theta) * sin_delta * cos_lat1, cos_delta - sin_lat1 * sin_lat2)
+    return np.degrees(lat2), np.degrees(lon2)
+
+
+def cross_track_nm(lat, lon, start_lat, start_lon, end_lat, end_lon):
+    """Signed distance (NM) of points from the great circle start -> end.
+
+    Pozitif değer hattın sağını, negatif değer solunu gösterir.
+    """
+    angular_13 = distance_nm(start_lat, start_lon, lat, lon) / EARTH_RADIUS_NM
+    theta_13 = np.radians(bearing_deg(start_lat, start_lon, lat, lon))
+    theta_12 = np.radians(bearing_deg(start_lat, start_lon, end_lat, end_lon))
+    return EARTH_RADIUS_NM * np.arcsin(np.clip(np.sin(angular_13) * np.sin(theta_13 - theta_12), -1.0, 1.0))
+
+
+def along_track_nm(lat, lon, start_lat, start_lon, end_lat, end_lon):
+    """Distance (NM) from the start point to the foot of each point on the great circle start -> end.
+
+    Başlangıcın gerisindeki noktalar için negatif değer döner.
+    """
+    angular_13 = distance_nm(start_lat, start_lon, lat, lon) / EARTH_RADIUS_NM
+    theta_13 = np.radians(bearing_deg(start_lat, start_lon, lat, lon))
+    theta_12 = np.radians(bearing_deg(start_lat, start_lon, end_lat, end_lon))
+    angular_xt = np.arcsin(np.clip(np.sin(angular_13) * np.sin(theta_13 - theta_12), -1.0, 1.0))
+    cos_xt = np.maximum(np.cos(angular_xt), 1e-15)
+    along = np.arccos(np.clip(np.cos(angular_13) / cos_xt, -1.0, 1.0))
+    return EARTH_RADIUS_NM * along * np.sign(np.cos(theta_13 - theta_12))
+
+
+def segment_distances_nm(lats, lons):
+    """Lengths (NM) of the consecutive legs of a polyline."""
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    return distance_nm(lats[:-1], lons[:-1], lats[1:], lons[1:])
+
+
+def segment_bearings_deg(lats, lons):
+    """Initial bearings (deg) of the consecutive legs of a polyline."""
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    return bearing_deg(lats[:-1], lons[:-1], lats[1:], lons[1:])
+
+
+# ---------------------------------------------------------------------------
+# Skaler sürümler (tek nokta çağrıları için; vektörel formüllerle aynı sonuçlar)
+# ---------------------------------------------------------------------------
+
+def distance(lat1, lon1, lat2, lon2):
+    """Great-circle distance in NM between two points."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2.0) ** 2 +
+         math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2.0) ** 2)
+    a = min(max(a, 0.0), 1.0)
+    return EARTH_RADIUS_NM * 2.0 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
+
+
+def bearing(lat1, lon1, lat2, lon2):
+    """Initial great-circle bearing in degrees [0, 360) between two points."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    d_lon = lon2 - lon1
+    y = math.sin(d_lon) * math.cos(lat2)
+    x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(d_lon)
+    return math.degrees(math.atan2(y, x)) % 360.0
+
+
+def destination_point(lat, lon, distance_nm, bearing_deg):
+    """(lat, lon) at the given distance (NM) and bearing (deg) from a point."""
+    lat1, lon1, theta = map(math.radians, (lat, lon, bearing_deg))
+    delta = distance_nm / EARTH_RADIUS_NM
+    sin_lat2 = math.sin(lat1) * math.cos(delta) + math.cos(lat1) * math.sin(delta) * math.cos(theta)
+    sin_lat2 = min(max(sin_lat2, -1.0), 1.0)
+    lat2 = math.asin(sin_lat2)
+    lon2 = lon1 + math.atan2(math.sin(theta) * math.sin(delta) * math.cos(lat1),
+                             math.cos(delta) - math.sin(lat1) * sin_lat2)
+    return math.degrees(lat2), math.degrees(lon2)
@@ -0,0 +1,105 @@
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QCheckBox,
+    QTableWidget, QTableWidgetItem, QHeaderView
+)
+from PyQt5.QtCore import Qt
+
+from conformance_dialog import NumericTableItem
+
+
+def format_position(position):
+    if position is None:
+        return "-"
+    return f"{position[0]:.4f}, {position[1]:.4f}"
+
+
+class InfringementDialog(QDialog):
+    """Rotaların ve trajectory'lerin LTD/LTP sahalarına girişlerini ve TMA dışına çıkışlarını listeler"""
+
+    COLUMNS = ["Item", "Kind", "Area", "Type", "Entry", "Exit", "Distance (NM)", "Duration (s)"]
+
+    def __init__(self, map_widget, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Airspace Infringements")
+        self.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
+        self.map_widget = map_widget
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(7)
+        layout.setContentsMargins(10, 10, 10, 10)
+
+        buttons_layout = QHBoxLayout()
+        self.check_button = QPushButton("Kontrol Et")
+        self.check_button.clicked.connect(self.run_check)
+        buttons_layout.addWidget(self.check_button)
+        self.live_check = QCheckBox("Rotaları haritada anlık kontrol et")
+        self.live_check.setChecked(self.map_widget.show_infringements)
+        self.live_check.toggled.connect(self.on_live_check_toggled)
+        buttons_layout.addWidget(self.live_check)
+        buttons_layout.addStretch()
+        layout.addLayout(buttons_layout)
+
+        self.summary_label = QLabel("")
+        layout.addWidget(self.summary_label)
+
+        self.results_table = QTableWidget()
+        self.results_table.setColumnCount(len(self.COLUMNS))
+        self.results_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.results_table.verticalHeader().setVisible(False)
+        self.results_table.setAlternatingRowColors(True)
+        self.results_table.verticalHeader().setDefaultSectionSize(20)
+        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.results_table)
+
+        self.resize(820, 420)
+
+    def on_live_check_toggled(self, checked):
+        self.map_widget.show_infringements = checked
+        if checked:
+            self.map_widget.schedule_infringement_check()
+        else:
+            self.map_widget.route_infringements = {}
+        self.map_widget.update()
+
+    def run_check(self):
+        """Tüm rotaları ve görünür trajectory'leri kontrol et"""
+        monitor = self.map_widget.get_infringement_monitor()
+        if monitor is None:
+            return
+        routes = self.map_widget.drawn_elements['routes']
+        trajectories = [t for t in self.map_widget.drawn_elements['trajectories']
+                        if t.get('id') not in self.map_widget.hidden_trajectory_ids]
+        results = monitor.update(routes, trajectories)
+
+        route_names = {route.get('id', index): route.get('name') or str(route.get('id', index))
+                       for index, route in enumerate(routes)}
+        route_types = {route.get('id', index): route.get('type', 'route') for index, route in enumerate(routes)}
+        rows = []
+        for route_id, intervals in results['routes'].items():
+            rows.extend((route_names[route_id], route_types[route_id], interval) for interval in intervals)
+        for trajectory_id, intervals in results['trajectories'].items():
+            rows.extend((str(trajectory_id), 'trajectory', interval) for interval in intervals)
+        self.populate_table(rows)
+
+        infringing_routes = sum(1 for intervals in results['routes'].values() if intervals)
+        infringing_flights = sum(1 for intervals in results['trajectories'].values() if intervals)
+        self.summary_label.setText(
+            f"{infringing_routes}/{len(results['routes'])} rota, "
+            f"{infringing_flights}/{len(results['trajectories'])} trajectory ihlal içeriyor ({len(rows)} kayıt)")
+
+    def populate_table(self, rows):
+        self.results_table.setSortingEnabled(False)
+        self.results_table.setRowCount(len(rows))
+        for row, (name, item_kind, interval) in enumerate(rows):
+            self.results_table.setItem(row, 0, QTableWidgetItem(name))
+            self.results_table.setItem(row, 1, QTableWidgetItem(item_kind))
+            self.results_table.setItem(row, 2, QTableWidgetItem(interval['area']))
+            self.results_table.setItem(row, 3, QTableWidgetItem(interval['kind']))
+            self.results_table.setItem(row, 4, QTableWidgetItem(format_position(interval['entry'])))
+            self.results_table.setItem(row, 5, QTableWidgetItem(format_position(interval['exit'])))
+            self.results_table.setItem(row, 6, NumericTableItem(interval['distance_nm']))
+            self.results_table.setItem(row, 7, NumericTableItem(interval['duration_s'], "{:.0f}"))
+        self.results_table.setSortingEnabled(True)
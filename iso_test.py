@@ -1,26 +1,10 @@
-import math
+import geodesy
 import folium
-from pointmerge import calculate_leg_points, calculate_point_from_bearing, format_dms_output
+from procedure_geometry import calculate_leg_points, calculate_point_from_bearing, format_dms_output
 
 def calculate_distance(lat1, lon1, lat2, lon2):
     """Calculate great-circle distance between two points in nautical miles"""
-    # Convert to radians
-    lat1 = math.radians(lat1)
-    lon1 = math.radians(lon1)
-    lat2 = math.radians(lat2)
-    lon2 = math.radians(lon2)
-    
-    # Earth radius in nautical miles
-    R = 3440.065
-    
-    # Haversine formula
-    dlon = lon2 - lon1
-    dlat = lat2 - lat1
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-    distance = R * c
-    
-    return distance
+    return geodesy.distance(lat1, lon1, lat2, lon2)
 
 def visualize_point_merge(merge_lat, merge_lon, leg_distance, track_angle, segment_distances, clockwise=True):
     """Visualize a point merge system with isodistance circle"""
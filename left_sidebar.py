@@ -13,6 +13,7 @@ class LeftSidebar(QWidget):
     # Define signals
     procedureToggled = pyqtSignal(bool, str, str, str, str)  # checked, proc_type, airport, runway, procedure
     runwayToggled = pyqtSignal(bool, str)  # checked, runway_id
+    trajectoryGroupToggled = pyqtSignal(bool, object)  # checked, trajectory id listesi
     resetViewRequested = pyqtSignal()
     # Signal for the new dialog
     runwayDisplayOptionsRequested = pyqtSignal()
@@ -23,6 +24,7 @@ class LeftSidebar(QWidget):
     showTmaBoundaryToggled = pyqtSignal(bool)  # TMA sınırları için sinyal
     showRestrictedAreasToggled = pyqtSignal(bool)  # LTD_P_R sahaları için sinyal
     showSegmentDistancesToggled = pyqtSignal(bool)  # Segment mesafelerini gösterme/gizleme sinyali
+    showTrafficDensityToggled = pyqtSignal(bool)  # Trafik yoğunluk ısı haritası sinyali
     # Snap ayarları için sinyaller
     snapEnabledToggled = pyqtSignal(bool)
     snapModeChanged = pyqtSignal(int)
@@ -87,6 +89,7 @@ class LeftSidebar(QWidget):
         # Setup sidebar sections
         self.setup_procedure_section()
         self.setup_runway_section()
+        self.setup_trajectory_section()
         self.setup_map_controls_section()
         
         # Add stretch to push content to top
@@ -228,6 +231,72 @@ class LeftSidebar(QWidget):
         # Add section to sidebar
         self.scroll_layout.addWidget(self.runways_section)
     
+    def setup_trajectory_section(self):
+        """Setup trajectory section (flights grouped by assigned procedure)"""
+        self.trajectories_section = CollapsibleSection("Trajectories")
+        self.trajectories_section.setStyleSheet("""
+            QFrame {
+                border: 1px solid #e0e0e0;
+                border-radius: 4px;
+                background-color: white;
+                margin: 2px;
+            }
+            QToolButton {
+                border: none;
+                background: transparent;
+            }
+            QLabel {
+                color: #444444;
+            }
+        """)
+        self.trajectories_layout = QVBoxLayout()
+        self.trajectories_layout.setSpacing(3)
+        self.trajectories_layout.setContentsMargins(8, 8, 8, 8)
+        self.trajectories_layout.addWidget(QLabel("Tools > Assign Procedures ile gruplayın"))
+
+        self.trajectories_section.setContentLayout(self.trajectories_layout)
+        self.scroll_layout.addWidget(self.trajectories_section)
+
+    def populate_trajectory_groups(self, assignments):
+        """Group flights by their assigned procedure; each group checkbox toggles visibility.
+
+        assignments: procedure_assignment.assign_procedures sonucu
+        """
+        for i in reversed(range(self.trajectories_layout.count())):
+            item = self.trajectories_layout.itemAt(i)
+            if item.widget():
+                item.widget().deleteLater()
+
+        groups = defaultdict(list)
+        for assignment in assignments:
+            if assignment['procedure'] is None:
+                key = ("Eşleşmeyen", "")
+            else:
+                key = (assignment['proc_type'], f"{assignment['procedure']} ({assignment['runway']})")
+            groups[key].append(assignment['id'])
+
+        for proc_type in ["STAR", "SID", "Eşleşmeyen"]:
+            names = sorted(name for t, name in groups if t == proc_type)
+            if not names:
+                continue
+            group_box = QGroupBox(proc_type)
+            group_layout = QVBoxLayout()
+            group_layout.setSpacing(1)
+            group_layout.setContentsMargins(5, 5, 5, 5)
+            for name in names:
+                ids = groups[(proc_type, name)]
+                cb = QCheckBox(f"{name or 'Uçuşlar'} [{len(ids)}]")
+                cb.setChecked(True)
+                cb.toggled.connect(lambda checked, ids=ids: self.trajectoryGroupToggled.emit(checked, ids))
+                group_layout.addWidget(cb)
+            group_box.setLayout(group_layout)
+            self.trajectories_layout.addWidget(group_box)
+
+        if not assignments:
+            self.trajectories_layout.addWidget(QLabel("Tools > Assign Procedures ile gruplayın"))
+        elif self.trajectories_section.collapsed:
+            self.trajectories_section.toggle_content()
+
     def setup_map_controls_section(self):
         """Setup map controls section with visibility toggles"""
         # Create map controls section header
@@ -281,6 +350,12 @@ class LeftSidebar(QWidget):
         self.cb_show_segment_distances.toggled.connect(self.on_show_segment_distances_toggled)
         controls_layout.addWidget(self.cb_show_segment_distances)
         
+        # Trajectory'ler için trafik yoğunluk ısı haritası
+        self.cb_show_traffic_density = QCheckBox("Show Traffic Density")
+        self.cb_show_traffic_density.setChecked(False)
+        self.cb_show_traffic_density.toggled.connect(self.on_show_traffic_density_toggled)
+        controls_layout.addWidget(self.cb_show_traffic_density)
+        
         # Set layout for section
         self.map_controls_section.setContentLayout(controls_layout)
         
@@ -900,6 +975,10 @@ class LeftSidebar(QWidget):
         """Handle LTD_P_R restricted areas visibility toggle"""
         self.showRestrictedAreasToggled.emit(checked)
 
+    def on_show_traffic_density_toggled(self, checked):
+        """Handle traffic density heatmap toggle"""
+        self.showTrafficDensityToggled.emit(checked)
+
     def on_show_segment_distances_toggled(self, checked):
         """Handle segment distance labels visibility toggle"""
         self.showSegmentDistancesToggled.emit(checked)
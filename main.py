@@ -1,6 +1,8 @@
+import startup_timer  # Başlangıç süresi sayacı ilk içe aktarımla başlar
 import sys
 from PyQt5.QtWidgets import QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox
 from airspace_visualizer import AirspaceVisualizer
+startup_timer.mark('imports')
 
 if __name__ == "__main__":
     # Geliştirme sırasında hataları daha net görmek için
@@ -13,4 +15,6 @@ if __name__ == "__main__":
     print("AirspaceVisualizer yüklendi")
 
     window.show()
+    # Çökme kurtarma sorusu pencere göründükten sonra sorulur
+    window.start_autosave()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -2,17 +2,30 @@ import math
 import json
 import os
 import csv
+import time
+import numpy as np
 from PyQt5.QtWidgets import QWidget, QApplication, QFileDialog, QMessageBox, QDialog
-from PyQt5.QtCore import Qt, QRectF, QPointF, pyqtSignal
-from PyQt5.QtGui import QPainter, QPainterPath, QPen, QColor, QBrush
-from pointmerge import calculate_point_from_bearing
+from PyQt5.QtCore import Qt, QRectF, QPointF, QTimer, pyqtSignal
+from PyQt5.QtGui import QPainter, QPainterPath, QPen, QColor, QBrush, QPolygonF, QTransform
+from procedure_geometry import calculate_point_from_bearing
 from utils import calculate_distance, calculate_bearing, decimal_to_dms
-from models import DataManager
+import geodesy
+import startup_timer
+import tracing
+from frame_profiler import FrameProfiler
+from models import DataManager, country_arrays_from_geojson
 from route_drawer import RouteDrawer
-from trombone_popup import TrombonePopupDialog
-from pointmerge_popup import PointMergePopupDialog  # Popup for point merge
-from route_popup import RoutePopupDialog  # Popup for user routes
+# Trombone, point merge ve rota popup'ları ilk kullanımda içe aktarılır
 from rotation_center_dialog import RotationCenterDialog  # Döndürme merkezi seçimi için eklendi
+from trajectory_layer import (DEFAULT_ALTITUDE_RAMP, TrajectoryRenderData, TrajectoryPathBatch,
+                              visible_segments, array_to_qpolygonf, array_to_qpainterpath)
+from trajectory_store import TrajectoryView
+from density_layer import TrafficDensityGrid, DensityColorRamp, density_to_qimage
+from airspace_infringement import InfringementChecker, InfringementMonitor
+from route_transform import RouteTransform, rotate_pointmerge
+
+# Bu süreden (sn) kısa aralıklı Ctrl+tekerlek döndürmeleri tek geri alma adımıdır
+WHEEL_ROTATION_UNDO_GAP = 1.0
 
 class MapWidget(QWidget):
     """Interactive map widget for displaying airspace data"""
@@ -24,12 +37,16 @@ class MapWidget(QWidget):
     routeDrawingStarted = pyqtSignal()  # Rota çizimi başladığında
     routeDrawingFinished = pyqtSignal(str, list)  # Rota ID ve noktalar
     routePointAdded = pyqtSignal(list)  # Yeni bir rota noktası eklendiğinde
+    routeInfringementsChanged = pyqtSignal(object)  # {route_id: [ihlal aralıkları]} (yalnızca ihlal edenler)
+    drawingsChanged = pyqtSignal()  # Geri alınabilir her düzenlemede (otomatik kayıt için)
     
     # Define tolerance constants for different interactions
     # Bunlar başlangıç değerleri, __init__ metodu içinde scale_factor ile çarpılıp güncellenecek
     WAYPOINT_SELECTION_TOLERANCE = 7  # pixels
     PATTERN_SELECTION_TOLERANCE = 15  # pixels
     WAYPOINT_DRAG_TOLERANCE = 10  # pixels
+    # Bu mesafenin (NM) altındaki segmentler çizilmez; merge_selected_routes ile aynı değer
+    SEGMENT_MERGE_TOLERANCE = 0.0001  # Yaklaşık 10-15 metre
     
     # QColor dönüşüm yardımcısı
     def _parse_color(self, color_value, default_color=QColor(0, 128, 128)):
@@ -70,6 +87,38 @@ class MapWidget(QWidget):
         self.show_segment_distances = True  # Segment mesafe etiketlerini gösterme/gizleme
         self.segment_distance_font_size = 8  # Segment mesafe etiketlerinin font boyutu (pt)
         self.trajectory_altitude_coloring = True # Add flag for trajectory coloring mode
+        self.altitude_color_ramp = DEFAULT_ALTITUDE_RAMP  # Paylaşılan irtifa renk skalası
+        self._trajectory_render_cache = {}  # id(points) -> TrajectoryRenderData
+        self.trajectory_lod_pixel_tolerance = 1.0  # Trajectory sadeleştirme toleransı (piksel)
+        # Bu sayıdan fazla trajectory görünürken 1 piksellik (hızlı) çizgiler kullanılır
+        self.trajectory_thin_line_threshold = 200
+        self.playback_aircraft = None  # TrajectoryPlaybackIndex.positions_at sonucu (oynatma sırasında)
+        self.conformance_overlay = None  # conformance.analyze_conformance sonucu (koridor çizimi için)
+        self.hidden_trajectory_ids = set()  # Sidebar'dan gizlenen trajectory id'leri
+        # Trafik yoğunluk katmanı: açıkken trajectory çizgileri yerine ısı haritası çizilir
+        self.show_traffic_density = False
+        self.density_cell_size_deg = 0.02
+        self.density_color_ramp = DensityColorRamp()
+        self._density_grid = None
+        self._density_sources = set()  # Izgaraya eklenmiş id(points) değerleri
+        self._density_settings = None  # Izgaranın oluşturulduğu (map_bounds, hücre boyu)
+        self._density_image = None
+        self._density_image_version = -1
+        # Rotaların LTD/LTP sahaları ve TMA sınırına karşı anlık kontrolü
+        self.show_infringements = True
+        self.route_infringements = {}  # route_id -> ihlal aralıkları (yalnızca ihlal edenler)
+        self._infringement_monitor = None
+        self._infringement_sources = None  # Monitörün kurulduğu (restricted_areas, tma) nesneleri
+        self._infringement_check_pending = False
+        # Kontrol çizimde değil, düzenleme noktalarında yapılır
+        self.drawingsChanged.connect(self.schedule_infringement_check)
+        # Son Ctrl+tekerlek döndürmesinin rotası ve zamanı (geri alma kaydını birleştirmek için)
+        self._wheel_rotation_route = None
+        self._wheel_rotation_time = 0.0
+        self.separation_conflicts = None  # separation.detect_conflicts sonucu (liste)
+        self.separation_lateral_nm = 5.0
+        self.selected_conflict_index = None
+        self.sweep_preview = None  # Point merge taramasındaki aday tasarımların önizlemesi
         
         # Store drawn path extensions
         self.drawn_elements = {
@@ -123,6 +172,7 @@ class MapWidget(QWidget):
         self.multi_select_mode = False
         self.selected_route_indices = []  # Seçilen rotaların indeksleri
         self.route_being_moved = None  # Taşınan rotanın ID'si
+        self.route_transform = None  # Taşınan/döndürülen rotaların RouteTransform oturumu
         self.move_reference_point = None  # Taşıma için referans noktası (ekran koordinatları)
         self.move_start_lat_lon = None  # Taşıma başlangıcındaki harita koordinatları
         
@@ -204,6 +254,16 @@ class MapWidget(QWidget):
         
         # Store transformed paths
         self.country_paths = {}
+        self._first_paint_done = False  # Başlangıç raporu için ilk çizim
+        
+        # Katman bazlı kare süresi profilleyici (HUD ve CSV dışa aktarımı için)
+        self.frame_profiler = FrameProfiler()
+        self.show_frame_profiler_hud = False
+        self._geo_to_screen_calls = 0  # Kare başına skaler projeksiyon çağrısı
+        self._projected_points = 0  # Kare başına dizi ile projekte edilen nokta
+        # GeoJSON halkalarının numpy dizileri (bkz. prepare_country_arrays)
+        self.country_arrays = []
+        self._country_arrays_source = None
         self.procedures = []
         self.runways = []
         self.selected_runways = set()  # Store selected runway IDs
@@ -241,19 +301,29 @@ class MapWidget(QWidget):
         self._redo_stack = []
         self._undo_stack_limit = 10 # Limit the number of undo steps
 
+    def _snapshot_drawn_elements(self):
+        """Deep copy drawn_elements for undo/redo, sharing trajectory entries.
+
+        Trajectory'ler içe aktarıldıktan sonra değişmez; büyük nokta dizilerini
+        her düzenlemede kopyalamamak için memo ile aynı nesneler paylaşılır.
+        """
+        import copy
+        memo = {id(trajectory): trajectory for trajectory in self.drawn_elements.get('trajectories', [])}
+        return copy.deepcopy(self.drawn_elements, memo)
+
     def _save_state_for_undo(self):
         """Saves the current state of drawn_elements for undo functionality."""
         # Clear the redo stack whenever a new action is performed
         self._redo_stack.clear()
         
         # Create a deep copy of the current state
-        import copy
-        current_state = copy.deepcopy(self.drawn_elements)
+        current_state = self._snapshot_drawn_elements()
         self._undo_stack.append(current_state)
         
         # Enforce the stack limit
         if len(self._undo_stack) > self._undo_stack_limit:
             self._undo_stack.pop(0)
+        self.drawingsChanged.emit()
 
     def undo(self):
         """Reverts to the previous state."""
@@ -262,8 +332,7 @@ class MapWidget(QWidget):
             return
 
         # Save current state for redo
-        import copy
-        current_state = copy.deepcopy(self.drawn_elements)
+        current_state = self._snapshot_drawn_elements()
         self._redo_stack.append(current_state)
 
         # Pop the last state from the undo stack and apply it
@@ -275,6 +344,7 @@ class MapWidget(QWidget):
 
         self.update()
         self.update_status_message("Undo successful.")
+        self.drawingsChanged.emit()
 
     def redo(self):
         """Re-applies the last undone action."""
@@ -283,8 +353,7 @@ class MapWidget(QWidget):
             return
 
         # Save current state for undo
-        import copy
-        current_state = copy.deepcopy(self.drawn_elements)
+        current_state = self._snapshot_drawn_elements()
         self._undo_stack.append(current_state)
         
         # Pop from redo stack and apply
@@ -296,6 +365,7 @@ class MapWidget(QWidget):
 
         self.update()
         self.update_status_message("Redo successful.")
+        self.drawingsChanged.emit()
 
     def update_status_message(self, message):
         """Update the status message and emit it to the status bar"""
@@ -307,33 +377,24 @@ class MapWidget(QWidget):
         """Get current scale based on zoom level"""
         return self.base_scale * pow(2, self.zoom - 1)
 
+    @tracing.traced()
     def compute_country_paths(self):
         """Compute QPainterPaths for countries from GeoJSON data"""
-        for feature in self.geo_data['features']:
-            path = QPainterPath()
-            if feature['geometry']['type'] == 'Polygon':
-                for ring in feature['geometry']['coordinates']:
-                    self.add_ring_to_path(path, ring)
-            elif feature['geometry']['type'] == 'MultiPolygon':
-                for polygon in feature['geometry']['coordinates']:
-                    for ring in polygon:
-                        self.add_ring_to_path(path, ring)
-            self.country_paths[feature['properties']['name']] = path
-
-    def add_ring_to_path(self, path, ring):
-        """Add a ring of coordinates to a QPainterPath"""
-        first = True
-        for coord in ring:
-            point = self.geo_to_screen(coord[1], coord[0])
-            if first:
-                path.moveTo(point)
-                first = False
-            else:
-                path.lineTo(point)
-        path.closeSubpath()
+        if self._country_arrays_source is not self.geo_data:
+            self.prepare_country_arrays()
+        # Pan/zoom/resize'da her ülke tek vektörel dönüşüm ve tek QPainterPath ile kurulur
+        for name, lats, lons, connect in self.country_arrays:
+            xs, ys = self.geo_to_screen_array(lats, lons)
+            self.country_paths[name] = array_to_qpainterpath(xs, ys, connect)
+
+    def prepare_country_arrays(self):
+        """Flatten GeoJSON rings into (name, lats, lons, connect) arrays once per loaded file"""
+        self.country_arrays = country_arrays_from_geojson(self.geo_data)
+        self._country_arrays_source = self.geo_data
 
     def geo_to_screen(self, lat, lon):
         """Convert geographic coordinates to screen coordinates using Mercator projection with rotation and tilt"""
+        self._geo_to_screen_calls += 1
         scale = self.get_scale()
         
         # Apply rotation transformation
@@ -351,6 +412,355 @@ class MapWidget(QWidget):
         
         return QPointF(x, y)
 
+    def geo_to_screen_array(self, lats, lons):
+        """Vectorized geo_to_screen for numpy arrays; returns (xs, ys) arrays"""
+        self._projected_points += np.size(lats)
+        scale = self.get_scale()
+        rotation_rad = math.radians(self.rotation)
+        cos_r = math.cos(rotation_rad)
+        sin_r = math.sin(rotation_rad)
+        
+        d_lon = lons - self.center_lon
+        d_lat = lats - self.center_lat
+        rotated_lon = d_lon * cos_r - d_lat * sin_r
+        rotated_lat = d_lon * sin_r + d_lat * cos_r
+        
+        tilt_factor = 1.0 - (self.tilt / 120.0) * (1.0 - rotated_lat / 90.0)
+        
+        xs = rotated_lon * scale * tilt_factor + self.width() / 2
+        ys = -rotated_lat * scale * tilt_factor + self.height() / 2
+        return xs, ys
+
+    def set_altitude_color_ramp(self, ramp):
+        """Trajectory irtifa renklendirmesinde kullanılacak renk skalasını ayarla"""
+        self.altitude_color_ramp = ramp
+        self.update()
+
+    def set_playback_aircraft(self, positions):
+        """Oynatma sırasında çizilecek uçak konumlarını ayarla (None = gizle)"""
+        self.playback_aircraft = positions
+        self.update()
+
+    def draw_playback_aircraft(self, painter):
+        """Draw playback aircraft symbols rotated to their heading, with callsign and flight level"""
+        positions = self.playback_aircraft
+        if not positions or len(positions['lats']) == 0:
+            return
+        lats, lons = positions['lats'], positions['lons']
+        xs, ys = self.geo_to_screen_array(lats, lons)
+        
+        # Ekrandaki baş açısı: baş yönünde kısa bir mesafe ilerideki noktanın projeksiyonundan
+        headings = np.radians(positions['headings'])
+        step = 0.01
+        ahead_xs, ahead_ys = self.geo_to_screen_array(
+            lats + np.cos(headings) * step,
+            lons + np.sin(headings) * step / np.maximum(np.cos(np.radians(lats)), 0.01))
+        screen_headings = np.degrees(np.arctan2(ahead_xs - xs, -(ahead_ys - ys)))
+        
+        visible = np.flatnonzero((xs >= -20) & (xs <= self.width() + 20) &
+                                 (ys >= -20) & (ys <= self.height() + 20))
+        if len(visible) == 0:
+            return
+        
+        symbol = QPolygonF([QPointF(0, -7), QPointF(5, 6), QPointF(0, 3), QPointF(-5, 6)])
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        font = painter.font()
+        font.setPointSize(7)
+        painter.setFont(font)
+        symbol_pen = QPen(QColor(255, 255, 255), 1)
+        symbol_brush = QBrush(QColor(20, 20, 20))
+        label_pen = QPen(QColor(20, 20, 20))
+        ids, alts = positions['ids'], positions['alts']
+        for i in visible:
+            x, y = float(xs[i]), float(ys[i])
+            painter.save()
+            painter.translate(x, y)
+            painter.rotate(float(screen_headings[i]))
+            painter.setPen(symbol_pen)
+            painter.setBrush(symbol_brush)
+            painter.drawPolygon(symbol)
+            painter.restore()
+            painter.setPen(label_pen)
+            painter.drawText(QPointF(x + 8, y - 2), str(ids[i]))
+            painter.drawText(QPointF(x + 8, y + 8), f"FL{int(round(alts[i] / 100.0)):03d}")
+        painter.restore()
+
+    def set_traffic_density_visible(self, visible):
+        """Toggle the traffic density heatmap (trajectory lines are hidden while it is shown)"""
+        self.show_traffic_density = visible
+        self.update()
+
+    def _rebuild_density_grid(self, trajectories):
+        """Create a new density grid covering the map bounds (or all trajectories) and fill it"""
+        self._density_grid = None
+        self._density_sources = set()
+        self._density_settings = (self.map_bounds, self.density_cell_size_deg)
+        bounds = self.map_bounds
+        if bounds is None:
+            boxes = [self._get_trajectory_render_data(t).bounds for t in trajectories]
+            boxes = np.array([b for b in boxes if b is not None])
+            if len(boxes) == 0:
+                return
+            bounds = (boxes[:, 0].min(), boxes[:, 1].min(), boxes[:, 2].max(), boxes[:, 3].max())
+        self._density_grid = TrafficDensityGrid(bounds, self.density_cell_size_deg)
+
+    def _sync_density_grid(self):
+        """Bring the density grid up to date with the visible trajectories.
+
+        Yeni eklenen uçuşlar ızgaraya artımlı eklenir; bir uçuş kaldırıldıysa
+        (silme, geri alma, gizleme) ızgara baştan oluşturulur.
+        """
+        trajectories = [t for t in self.drawn_elements['trajectories']
+                        if len(t.get('points', ())) >= 2 and t.get('id') not in self.hidden_trajectory_ids]
+        keys = {id(t['points']) for t in trajectories}
+        grid = self._density_grid
+        new = [t for t in trajectories if id(t['points']) not in self._density_sources]
+        outside = self.map_bounds is None and grid is not None and not all(
+            grid.contains_bounds(self._get_trajectory_render_data(t).bounds) for t in new)
+        if (grid is None or outside or self._density_sources - keys or
+                self._density_settings != (self.map_bounds, self.density_cell_size_deg)):
+            self._rebuild_density_grid(trajectories)
+            new = trajectories
+        if self._density_grid is None:
+            return
+        for trajectory in new:
+            render_data = self._get_trajectory_render_data(trajectory)
+            self._density_grid.add_points(render_data.lats, render_data.lons)
+            self._density_sources.add(id(trajectory['points']))
+
+    def draw_traffic_density(self, painter):
+        """Draw the density heatmap image under the vector layers"""
+        self._sync_density_grid()
+        grid = self._density_grid
+        if grid is None or grid.total == 0:
+            return
+        if self._density_image is None or self._density_image_version != grid.version:
+            self._density_image = density_to_qimage(grid, self.density_color_ramp)
+            self._density_image_version = grid.version
+        # Görüntü köşelerini projekte et; döndürme/eğim olsa da dörtgenden dörtgene eşle
+        min_lon, min_lat, max_lon, max_lat = grid.bounds
+        xs, ys = self.geo_to_screen_array(np.array([max_lat, max_lat, min_lat, min_lat]),
+                                          np.array([min_lon, max_lon, max_lon, min_lon]))
+        source = QPolygonF([QPointF(0, 0), QPointF(grid.nx, 0), QPointF(grid.nx, grid.ny), QPointF(0, grid.ny)])
+        target = QPolygonF([QPointF(x, y) for x, y in zip(xs, ys)])
+        transform = QTransform()
+        if not QTransform.quadToQuad(source, target, transform):
+            return
+        painter.save()
+        painter.setTransform(transform, True)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.drawImage(QPointF(0, 0), self._density_image)
+        painter.restore()
+
+    def get_infringement_monitor(self):
+        """Return the infringement monitor, rebuilding it when the airspace data changed"""
+        data_manager = getattr(self, 'data_manager', None)
+        if data_manager is None:
+            return None
+        sources = (data_manager.restricted_areas, data_manager.tma_boundary_points)
+        if self._infringement_monitor is None or self._infringement_sources is None or any(
+                a is not b for a, b in zip(sources, self._infringement_sources)):
+            checker = InfringementChecker(data_manager.restricted_areas, data_manager.tma_boundary_points)
+            self._infringement_monitor = InfringementMonitor(checker)
+            self._infringement_sources = sources
+        return self._infringement_monitor
+
+    def schedule_infringement_check(self):
+        """Re-check routes once the current event is handled (ardışık bildirimler tek kontrolde birleşir).
+
+        drawingsChanged düzenlemeden önce (geri alma kaydıyla) yayınlandığı için
+        kontrol olay döngüsüne ertelenir ve düzenlenmiş hali görür.
+        """
+        if not self._infringement_check_pending:
+            self._infringement_check_pending = True
+            QTimer.singleShot(0, self._run_infringement_check)
+
+    def _run_infringement_check(self):
+        self._infringement_check_pending = False
+        if self.show_infringements:
+            self.update_route_infringements()
+            self.update()
+
+    @tracing.traced()
+    def update_route_infringements(self):
+        """Re-check drawn routes; only routes whose points changed are checked again.
+
+        Düzenleme noktalarından (drawingsChanged, popup uygulama, yükleme, veri
+        gelişi) schedule_infringement_check ile çağrılır; değişmeyen rotalar
+        önbellekten gelir.
+        """
+        monitor = self.get_infringement_monitor()
+        if monitor is None:
+            return
+        results = monitor.update(self.drawn_elements['routes'], ())['routes']
+        infringing = {route_id: intervals for route_id, intervals in results.items() if intervals}
+        # Sonuç listeleri önbellekten geldiği için kimlik karşılaştırması yeterli
+        changed = (infringing.keys() != self.route_infringements.keys() or
+                   any(intervals is not self.route_infringements[route_id] for route_id, intervals in infringing.items()))
+        self.route_infringements = infringing
+        if changed:
+            self.routeInfringementsChanged.emit(infringing)
+
+    def draw_route_infringements(self, painter):
+        """Highlight route legs inside restricted areas (red) or outside the TMA (magenta)"""
+        if not self.route_infringements:
+            return
+        routes_by_id = {route.get('id', index): route for index, route in enumerate(self.drawn_elements['routes'])}
+        painter.save()
+        painter.setBrush(Qt.NoBrush)
+        for route_id, intervals in self.route_infringements.items():
+            route = routes_by_id.get(route_id)
+            if route is None:
+                continue
+            points = np.asarray([(p[0], p[1]) for p in route['points']], dtype=np.float64)
+            xs, ys = self.geo_to_screen_array(points[:, 0], points[:, 1])
+            index = np.arange(len(points), dtype=np.float64)
+            for interval in intervals:
+                tma_exit = interval['kind'] == 'TMA_EXIT'
+                color = QColor(200, 0, 200, 170) if tma_exit else QColor(230, 0, 0, 170)
+                # Aralığın başı/sonu ile aradaki tam noktalar
+                inner = index[(index > interval['start_index']) & (index < interval['end_index'])].astype(int)
+                positions = np.concatenate([[interval['start_index']], inner, [interval['end_index']]])
+                path_xs = np.interp(positions, index, xs)
+                path_ys = np.interp(positions, index, ys)
+                # TMA dışı bölümler kesikli ve ince, saha ihlalleri kalın çizilir
+                painter.setPen(QPen(color, 3 if tma_exit else 6, Qt.DashLine if tma_exit else Qt.SolidLine, Qt.RoundCap))
+                painter.drawPolyline(array_to_qpolygonf(path_xs, path_ys))
+                # Giriş/çıkış noktalarında çarpı işareti
+                painter.setPen(QPen(color.darker(150), 2))
+                for marker in (interval['entry'], interval['exit']):
+                    if marker is None:
+                        continue
+                    center = self.geo_to_screen(*marker)
+                    x, y = center.x(), center.y()
+                    painter.drawLine(QPointF(x - 5, y - 5), QPointF(x + 5, y + 5))
+                    painter.drawLine(QPointF(x - 5, y + 5), QPointF(x + 5, y - 5))
+        painter.restore()
+
+    def set_separation_conflicts(self, conflicts, lateral_nm=5.0):
+        """Ayırma ihlallerini haritada göster (None = gizle)"""
+        self.separation_conflicts = conflicts
+        self.separation_lateral_nm = lateral_nm
+        self.selected_conflict_index = None
+        self.update()
+
+    def select_separation_conflict(self, conflict_index):
+        """Highlight one conflict and center the map on its closest point"""
+        self.selected_conflict_index = conflict_index
+        if self.separation_conflicts and conflict_index is not None:
+            conflict = self.separation_conflicts[conflict_index]
+            self.center_lat = (conflict['position_a'][0] + conflict['position_b'][0]) / 2.0
+            self.center_lon = (conflict['position_a'][1] + conflict['position_b'][1]) / 2.0
+        self.update()
+
+    def draw_separation_conflicts(self, painter):
+        """Draw each conflict's closest approach; the selected one with its lateral minimum circles"""
+        if not self.separation_conflicts:
+            return
+        painter.save()
+        painter.setBrush(Qt.NoBrush)
+        radius_px = self.separation_lateral_nm / geodesy.NM_PER_DEG_LAT * self.get_scale()
+        for i, conflict in enumerate(self.separation_conflicts):
+            selected = i == self.selected_conflict_index
+            point_a = self.geo_to_screen(*conflict['position_a'])
+            point_b = self.geo_to_screen(*conflict['position_b'])
+            if not selected and not (self.rect().contains(point_a.toPoint()) or self.rect().contains(point_b.toPoint())):
+                continue
+            color = QColor(255, 0, 0) if selected else QColor(255, 80, 0, 200)
+            painter.setPen(QPen(color, 3 if selected else 2))
+            painter.drawLine(point_a, point_b)
+            painter.drawEllipse(point_a, 4, 4)
+            painter.drawEllipse(point_b, 4, 4)
+            if selected:
+                # Yarım minimum yarıçaplı daireler birbirine değiyorsa ayırma kaybı vardır
+                painter.setPen(QPen(color, 1, Qt.DashLine))
+                painter.drawEllipse(point_a, radius_px / 2.0, radius_px / 2.0)
+                painter.drawEllipse(point_b, radius_px / 2.0, radius_px / 2.0)
+                painter.setPen(QPen(Qt.black))
+                painter.drawText(QPointF(point_a.x() + 8, point_a.y() - 8),
+                                 f"{conflict['flight_a']} / {conflict['flight_b']}: "
+                                 f"{conflict['min_distance_nm']:.1f} NM, {conflict['vertical_ft']:.0f} ft")
+        painter.restore()
+
+    def set_sweep_preview(self, previews):
+        """Point merge tarama adaylarını önizle (None = gizle).
+
+        previews: [{'polylines': [[(lat, lon), ...], ...], 'highlight': bool, 'conflict': bool}]
+        """
+        self.sweep_preview = previews
+        self.update()
+
+    def draw_sweep_preview(self, painter):
+        """Draw candidate point merge designs; highlighted ones solid, the rest dashed"""
+        if not self.sweep_preview:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        # Vurgulananlar en üstte kalsın
+        for preview in sorted(self.sweep_preview, key=lambda p: p.get('highlight', False)):
+            color = QColor(220, 30, 30) if preview.get('conflict') else QColor(0, 150, 200)
+            if preview.get('highlight'):
+                painter.setPen(QPen(color, 3, Qt.SolidLine, Qt.RoundCap))
+            else:
+                color.setAlpha(150)
+                painter.setPen(QPen(color, 2, Qt.DashLine, Qt.RoundCap))
+            for polyline in preview['polylines']:
+                lats, lons = np.asarray(polyline, dtype=np.float64).T
+                xs, ys = self.geo_to_screen_array(lats, lons)
+                painter.drawPolyline(array_to_qpolygonf(xs, ys))
+        painter.restore()
+
+    def set_trajectories_visible(self, visible, trajectory_ids):
+        """Show or hide trajectories by id (ör. prosedür grubuna göre)"""
+        if visible:
+            self.hidden_trajectory_ids.difference_update(trajectory_ids)
+        else:
+            self.hidden_trajectory_ids.update(trajectory_ids)
+        self.update()
+
+    def set_conformance_overlay(self, result):
+        """Prosedür uygunluk koridorlarını haritada göster (None = gizle)"""
+        self.conformance_overlay = result
+        self.update()
+
+    def draw_conformance_corridors(self, painter):
+        """Draw percentile corridors as nested bands around the median line"""
+        result = self.conformance_overlay
+        if not result or not result.get('corridors'):
+            return
+        corridors = result['corridors']
+        percentiles = sorted(corridors)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+        
+        # Simetrik yüzdelik çiftleri (ör. 5-95, 25-75) dıştan içe bant olarak doldurulur
+        band_pairs = [(low, 100 - low) for low in percentiles if low < 50 and (100 - low) in corridors]
+        for depth, (low, high) in enumerate(band_pairs):
+            low_xs, low_ys = self.geo_to_screen_array(corridors[low]['lats'], corridors[low]['lons'])
+            high_xs, high_ys = self.geo_to_screen_array(corridors[high]['lats'], corridors[high]['lons'])
+            band = array_to_qpolygonf(np.concatenate([low_xs, high_xs[::-1]]),
+                                      np.concatenate([low_ys, high_ys[::-1]]))
+            painter.setBrush(QBrush(QColor(255, 140, 0, 50 + 40 * depth)))
+            painter.drawPolygon(band)
+        
+        if 50 in corridors:
+            xs, ys = self.geo_to_screen_array(corridors[50]['lats'], corridors[50]['lons'])
+            painter.setBrush(Qt.NoBrush)
+            painter.setPen(QPen(QColor(200, 80, 0), 1.5, Qt.DashLine))
+            painter.drawPolyline(array_to_qpolygonf(xs, ys))
+        painter.restore()
+
+    def _get_trajectory_render_data(self, trajectory):
+        """Return cached arrays/altitude stats for a trajectory, rebuilding if its points changed"""
+        points = trajectory['points']
+        render_data = self._trajectory_render_cache.get(id(points))
+        if render_data is None or render_data.source is not points:
+            render_data = TrajectoryRenderData(points)
+            self._trajectory_render_cache[id(points)] = render_data
+        return render_data
+
     def screen_to_geo(self, x, y):
         """Convert screen coordinates to geographic coordinates"""
         scale = self.get_scale()
@@ -401,6 +811,7 @@ class MapWidget(QWidget):
             # Snap modunu güncelle
             snap_manager.set_snap_mode(current_mode)
 
+    @tracing.traced()
     def wheelEvent(self, event):
         """Handle mouse wheel events for zoom and rotation"""
         # Check for Ctrl + Scroll Wheel for rotation
@@ -417,37 +828,24 @@ class MapWidget(QWidget):
                 
                 # Define rotation amount (e.g., 5 degrees per step)
                 rotation_delta = 5.0 if event.angleDelta().y() > 0 else -5.0
-                print(f"Rotating selected Point Merge by {rotation_delta} degrees")
+                tracing.debug("Rotating selected Point Merge by %s degrees", rotation_delta)
+                tracing.count('map.pointmerge_wheel_rotations')
                 
-                # Rotate all points except the merge point
-                new_points = []
-                for i, point in enumerate(route['points']):
-                    if i == len(route['points']) - 1: continue # Skip merge point itself
-                    
-                    lat, lon = point[0], point[1]
-                    
-                    # Calculate current distance and bearing from merge point
-                    current_distance = calculate_distance(merge_lat, merge_lon, lat, lon)
-                    current_bearing = calculate_bearing(merge_lat, merge_lon, lat, lon)
-                    
-                    # Calculate new bearing
-                    new_bearing = (current_bearing + rotation_delta + 360) % 360
-                    
-                    # Calculate new point coordinates
-                    new_point = calculate_point_from_bearing(merge_lat, merge_lon, current_distance, new_bearing)
-                    new_points.append(new_point)
-                
-                # Add the merge point back at the end
-                new_points.append(merge_point)
+                # Ardışık tekerlek adımları tek geri alma kaydında birleşir
+                now = time.monotonic()
+                if self._wheel_rotation_route is not route or now - self._wheel_rotation_time > WHEEL_ROTATION_UNDO_GAP:
+                    self._save_state_for_undo()
+                    self._wheel_rotation_route = route
+                self._wheel_rotation_time = now
                 
-                # Update route data
-                route['points'] = new_points
-                route['segment_distances'] = self.calculate_segment_distances(new_points)
-                route['segment_angles'] = self.calculate_track_angles(new_points)
+                # Merge noktası dışındaki tüm noktaları büyük daire mesafelerini koruyarak tek seferde döndür
+                rotate_pointmerge(route, rotation_delta)
+                self.update_segment_metrics(route)
                 
                 # Notify sidebar and update map
                 self.pathSelected.emit(route)
                 self.update()
+                self.drawingsChanged.emit()
                 
                 # Prevent default zoom behavior
                 return
@@ -506,6 +904,7 @@ class MapWidget(QWidget):
         
         return False, None, None
 
+    @tracing.traced()
     def mousePressEvent(self, event):
         """Handle mouse press events for panning, rotation, and item selection."""
         if self.route_drawer.route_drawing_mode:
@@ -607,6 +1006,7 @@ class MapWidget(QWidget):
                             self.update_status_message("Route waypoint deleted")
                             return
                         
+    @tracing.traced()
     def mouseMoveEvent(self, event):
         """Handle mouse move events for panning and waypoint dragging."""
         # Update coordinates display
@@ -615,15 +1015,15 @@ class MapWidget(QWidget):
         
         if self.route_drawer.route_drawing_mode:
             self.route_drawer.handle_mouse_move(event)
-        elif self.route_move_mode and self.route_being_moved is not None:
-            # Rotayı taşıma işlemini gerçekleştir
+        elif self.route_move_mode and self.route_transform is not None:
+            # Rotayı (veya çoklu seçimdeki tüm rotaları) taşıma işlemini gerçekleştir
             if self.move_reference_point is None:
                 # İlk kez sürükleniyor, referans noktasını kaydet
                 self.move_reference_point = event.pos()
                 self.move_start_lat_lon = (lat, lon)
                 return
                 
-            # Fare hareketinin oluşturduğu coğrafi farkı hesapla
+            # Sürükleme başlangıcından bu yana fare hareketinin oluşturduğu coğrafi fark
             delta_x = event.pos().x() - self.move_reference_point.x()
             delta_y = event.pos().y() - self.move_reference_point.y()
             
@@ -632,45 +1032,19 @@ class MapWidget(QWidget):
             delta_lat = -delta_y / scale  # Ekran koordinatları ters olduğu için eksi
             delta_lon = delta_x / (scale * math.cos(math.radians(self.center_lat)))
             
-            # İlgili rotayı bul ve tüm noktalarını güncelle
-            for route in self.drawn_elements.get('routes', []):
-                if route.get('id') == self.route_being_moved:
-                    # Tüm noktaları güncelle
-                    new_points = []
-                    for point_lat, point_lon in route['points']:
-                        new_lat = point_lat + delta_lat
-                        new_lon = point_lon + delta_lon
-                        new_points.append((new_lat, new_lon))
-                    route['points'] = new_points
-                    
-                    # Eğer bu bir trombone veya point merge ise, config'deki referans noktalarını da güncelle
-                    if 'config' in route:
-                        if route.get('type') == 'trombone':
-                            # Trombone için başlangıç noktasını güncelle
-                            if 'start_lat' in route['config'] and 'start_lon' in route['config']:
-                                route['config']['start_lat'] += delta_lat
-                                route['config']['start_lon'] += delta_lon
-                        elif route.get('type') == 'pointmerge':
-                            # Point Merge için merge noktasını güncelle
-                            if 'merge_lat' in route['config'] and 'merge_lon' in route['config']:
-                                route['config']['merge_lat'] += delta_lat
-                                route['config']['merge_lon'] += delta_lon
-                    
-                    # Mesafeleri ve açıları güncelle
-                    route['segment_distances'] = self.calculate_segment_distances(route['points'])
-                    route['segment_angles'] = self.calculate_track_angles(route['points'])
-                    
-                    # UI'ı güncelle
-                    self.pathSelected.emit(route)
-                    break
+            # Tüm noktalar ve config referans noktaları başlangıç geometrisinden tek seferde ötelenir;
+            # öteleme segment uzunluklarını ve açılarını (sürükleme ölçeğinde) değiştirmez,
+            # kesin değerler bırakınca hesaplanır
+            self.route_transform.translate(delta_lat, delta_lon)
             
-            # Referans noktasını güncelle
-            self.move_reference_point = event.pos()
+            # UI'ı güncelle
+            if len(self.route_transform) == 1:
+                self.pathSelected.emit(self.route_transform.routes[0])
             
             # Ekranı güncelle
             self.update()
-        elif self.route_rotate_mode and self.route_being_rotated is not None and self.rotate_center_lat_lon is not None:
-            # Rotayı döndürme işlemini gerçekleştir
+        elif self.route_rotate_mode and self.route_transform is not None and self.rotate_center_lat_lon is not None:
+            # Rotayı (veya çoklu seçimdeki tüm rotaları) döndürme işlemini gerçekleştir
             center_lat, center_lon = self.rotate_center_lat_lon
             center_screen = self.geo_to_screen(center_lat, center_lon)
             
@@ -688,66 +1062,15 @@ class MapWidget(QWidget):
             dy2 = event.pos().y() - center_screen.y()
             new_angle = math.degrees(math.atan2(dy2, dx2))
             
-            # Açı değişimini hesapla - kullanıcı deneyimi için yönü tersine çevirelim
+            # Başlangıçtan bu yana açı değişimi - kullanıcı deneyimi için yönü tersine çevirelim
             delta_angle = -(new_angle - self.rotate_start_angle)
             
-            # İlgili rotayı bul ve tüm noktalarını güncelle
-            for route in self.drawn_elements.get('routes', []):
-                if route.get('id') == self.route_being_rotated:
-                    # Tüm noktaları döndür
-                    new_points = []
-                    for point_lat, point_lon in route['points']:
-                        # Noktayı merkez etrafında döndür
-                        if point_lat == center_lat and point_lon == center_lon:
-                            # Bu merkez noktası, döndürmeden direkt ekle
-                            new_points.append((point_lat, point_lon))
-                            continue
-                            
-                        # Coğrafi koordinatları dönüşüm için düzlem koordinatlara çevir
-                        x_diff = (point_lon - center_lon) * math.cos(math.radians(center_lat))
-                        y_diff = point_lat - center_lat
-                        
-                        # Düzlemde döndür
-                        angle_rad = math.radians(delta_angle)
-                        x_new = x_diff * math.cos(angle_rad) - y_diff * math.sin(angle_rad)
-                        y_new = x_diff * math.sin(angle_rad) + y_diff * math.cos(angle_rad)
-                        
-                        # Yeni düzlem koordinatları coğrafi koordinatlara geri çevir
-                        new_lon = center_lon + x_new / math.cos(math.radians(center_lat))
-                        new_lat = center_lat + y_new
-                        
-                        new_points.append((new_lat, new_lon))
-                    
-                    route['points'] = new_points
-                    
-                    # Mesafeleri ve açıları güncelle
-                    route['segment_distances'] = self.calculate_segment_distances(route['points'])
-                    route['segment_angles'] = self.calculate_track_angles(route['points'])
-                    
-                    # Eğer bu bir trombone ise, config'deki base_angle değerini güncelle
-                    if route.get('type') == 'trombone' and 'config' in route:
-                        # Mevcut base_angle değerini al
-                        current_angle = route['config'].get('base_angle', 90.0)
-                        # Yeni açıyı hesapla - delta_angle negatif olduğu için burada da tersine çevrilmiş olacak
-                        new_base_angle = current_angle + delta_angle
-                        # -180 ile 180 arasına normalize et
-                        while new_base_angle > 180:
-                            new_base_angle -= 360
-                        while new_base_angle < -180:
-                            new_base_angle += 360
-                        # Config'i güncelle
-                        route['config']['base_angle'] = new_base_angle
-                        
-                        # Trombone config'indeki runway bilgilerini de korumak için,
-                        # sadece döndürmeyi güncelleyip, başlangıç noktasını değiştirmemek önemli
-                        print(f"Trombone base_angle güncellendi: {new_base_angle} derece")
-                    
-                    # UI'ı güncelle
-                    self.pathSelected.emit(route)
-                    break
+            # Noktalar, trombone base_angle ve point merge merge noktası/track_angle birlikte döner
+            self.route_transform.rotate(center_lat, center_lon, delta_angle)
             
-            # Referans açısını güncelle - döndürme yönünü tutarlı tutmak için aynı şekilde güncelliyoruz
-            self.rotate_start_angle = new_angle
+            # UI'ı güncelle
+            if len(self.route_transform) == 1:
+                self.pathSelected.emit(self.route_transform.routes[0])
             
             # Ekranı güncelle
             self.update()
@@ -780,9 +1103,8 @@ class MapWidget(QWidget):
                     lat, lon
                 )
             
-            # Update segment distances and angles
-            route['segment_distances'] = self.calculate_segment_distances(route['points'])
-            route['segment_angles'] = self.calculate_track_angles(route['points'])
+            # Yalnızca sürüklenen noktaya bağlı iki segmenti güncelle
+            self.update_segment_metrics(route, self.dragged_waypoint_index)
             
             # Emit pathSelected signal to update sidebar
             self.pathSelected.emit(route)
@@ -810,6 +1132,7 @@ class MapWidget(QWidget):
             
             self.update()
             
+    @tracing.traced()
     def mouseReleaseEvent(self, event):
         """Handle mouse release events"""
         if self.route_drawer.route_drawing_mode:
@@ -833,18 +1156,11 @@ class MapWidget(QWidget):
             self.dragged_route_index = None
             self.setCursor(Qt.ArrowCursor)
             self.update_status_message("Route waypoint position updated")
+            # Geri alma kaydı sürükleme başında alındı; son konum için tekrar bildir
+            self.drawingsChanged.emit()
         elif self.route_move_mode:
-            # Taşınan rotayı al ve trombone ise işaretle
-            moved_route_id = self.route_being_moved
-            moved_route = None
-            for route in self.drawn_elements.get('routes', []):
-                if route.get('id') == moved_route_id:
-                    moved_route = route
-                    # Eğer trombone veya point merge ise moved_or_rotated bayrağını ekle
-                    if (route.get('type') == 'trombone' or route.get('type') == 'pointmerge') and 'config' in route:
-                        route['config']['moved_or_rotated'] = True
-                        print(f"{route.get('type')} taşındı. Parametre değişiklikleri kilitlendi. ID: {moved_route_id}")
-                    break
+            # Taşınan rotaları işaretle, ertelenen kesin mesafe/açı hesabını yap
+            self._finish_route_transform("taşındı")
             
             # Rota taşıma modunu sonlandır
             self.route_move_mode = False
@@ -854,20 +1170,11 @@ class MapWidget(QWidget):
             self.setCursor(Qt.ArrowCursor)
             self.update_status_message("Route position updated")
             self._drag_undo_saved = False # Reset drag flag
+            self.drawingsChanged.emit()
         elif self.route_rotate_mode:
-            # Döndürme işleminden önce rota tipini alalım
-            rotated_route_type = None
-            rotated_route = None
-            rotated_route_id = self.route_being_rotated
-            for route in self.drawn_elements.get('routes', []):
-                if route.get('id') == rotated_route_id:
-                    rotated_route_type = route.get('type', '')
-                    rotated_route = route
-                    # Eğer trombone veya point merge ise moved_or_rotated bayrağını ekle
-                    if (route.get('type') == 'trombone' or route.get('type') == 'pointmerge') and 'config' in route:
-                        route['config']['moved_or_rotated'] = True
-                        print(f"{route.get('type')} döndürüldü. Parametre değişiklikleri kilitlendi. ID: {route.get('id')}")
-                    break
+            # Döndürülen rotaları işaretle, ertelenen kesin mesafe/açı hesabını yap
+            rotated_routes = self._finish_route_transform("döndürüldü")
+            rotated_route_type = rotated_routes[0].get('type', '') if len(rotated_routes) == 1 else ''
                     
             # Rota döndürme modunu sonlandır
             self.route_rotate_mode = False
@@ -877,9 +1184,10 @@ class MapWidget(QWidget):
             self.rotate_start_angle = None
             self.setCursor(Qt.ArrowCursor)
             self._drag_undo_saved = False # Reset drag flag
+            self.drawingsChanged.emit()
             
             # Eğer döndürülen rota bir trombone ise, güncellenmiş konfig ile yeniden çiz
-            if rotated_route_type == 'trombone' and rotated_route and 'config' in rotated_route:
+            if rotated_route_type == 'trombone':
                 # Döndürme sonrası mevcut noktaları koruyalım, config üzerinden yeniden hesaplatmak yerine
                 self.update_status_message("Trombone rotation completed")
                 # NOT: Burada artık path_extension fonksiyonu çağrılmıyor, çünkü noktalar zaten doğru rotasyona sahip
@@ -918,7 +1226,7 @@ class MapWidget(QWidget):
                     config = selected_route.get('config', {})
                     # Yüklenen çizimlerde config anahtarı eksik olabilir, bu durumda temel bir config oluştur
                     if not config:
-                        print("Trombone için config bulunamadı, temel bir config oluşturuluyor.")
+                        tracing.debug("Trombone için config bulunamadı, temel bir config oluşturuluyor.")
                         config = {
                             "pattern_type": "trombone",
                             "runway": {
@@ -936,7 +1244,7 @@ class MapWidget(QWidget):
                     config = selected_route.get('config', {})
                     # Yüklenen CSV dosyalarından config eksik olabilir, bu durumda temel bir config oluştur
                     if not config:
-                        print("Point Merge için config bulunamadı, temel bir config oluşturuluyor.")
+                        tracing.debug("Point Merge için config bulunamadı, temel bir config oluşturuluyor.")
                         # Son nokta merge point olacak
                         merge_point = selected_route['points'][-1] if selected_route.get('points') and len(selected_route['points']) > 0 else (0, 0)
                         config = {
@@ -1003,19 +1311,30 @@ class MapWidget(QWidget):
             }
         }
 
+    @tracing.traced()
     def paintEvent(self, event):
         """Paint the map and all elements"""
+        profiler = self.frame_profiler
+        profiler.begin_frame()
+        self._geo_to_screen_calls = self._projected_points = 0
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Draw background
         painter.fillRect(self.rect(), self.background_color)
+        profiler.lap('background')
         
         # Draw countries with visible borders
         painter.setBrush(QBrush(self.country_color))
         painter.setPen(QPen(self.border_color, 1.0))  # Daha kalın ve net sınırlar için
         for path in self.country_paths.values():
             painter.drawPath(path)
+        profiler.lap('countries', len(self.country_paths))
+        
+        # Trafik yoğunluk ısı haritası (vektör katmanların altında)
+        if self.show_traffic_density:
+            self.draw_traffic_density(painter)
+            profiler.lap('traffic_density')
             
         # Draw TMA boundary if visible and points exist
         if self.show_tma_boundary and hasattr(self, 'data_manager') and self.data_manager.tma_boundary_points:
@@ -1040,6 +1359,7 @@ class MapWidget(QWidget):
             
             # TMA sınır çizgisini çiz
             painter.drawPath(tma_path)
+            profiler.lap('tma', 1)
             
         # Yasaklı/kısıtlı sahaları çiz (LTD_P_R)
         if self.show_restricted_areas and hasattr(self, 'data_manager') and self.data_manager.restricted_areas:
@@ -1064,6 +1384,7 @@ class MapWidget(QWidget):
                     painter.setBrush(self.restricted_area_fill_color)
                     painter.setPen(QPen(self.restricted_area_border_color, self.restricted_area_border_width))
                     painter.drawPath(area_path)
+                    profiler.lap('restricted_areas', 1)
                     
                     # Grid desenini çiz (kapalı alan içine sınırlı olarak)
                     if self.restricted_area_grid_enabled and len(screen_points) >= 3:
@@ -1091,6 +1412,7 @@ class MapWidget(QWidget):
                             painter.drawLine(QPointF(x, bbox_min_y), QPointF(x, bbox_max_y))
                             
                         painter.restore()  # Kırpma maskesini kaldır
+                        profiler.lap('restricted_hatching', 1)
         
         # Draw runways
         if self.show_runways and self.runways:
@@ -1157,7 +1479,8 @@ class MapWidget(QWidget):
                                 painter.setPen(QPen(self.runway_color, 2))
                             except Exception as e:
                                 # Runway ID ayrıştırılamadıysa hata raporla ama çizmeye devam et
-                                print(f"Runway merkez hattı çizilemedi {runway_id}: {e}")
+                                tracing.warning("Runway merkez hattı çizilemedi %s: %s", runway_id, e)
+            profiler.lap('runways', len(self.selected_runways))
             
         # Draw procedures
         painter.setPen(QPen(self.procedure_color, 1))
@@ -1200,6 +1523,7 @@ class MapWidget(QWidget):
                 if isinstance(waypoint, dict) and 'lat' in waypoint and 'lon' in waypoint:
                     point = self.geo_to_screen(waypoint['lat'], waypoint['lon'])
                     painter.drawEllipse(point, 2, 2)
+            profiler.lap('procedures', 1)
 
         # Draw routes (path extensions)
         for i, route in enumerate(self.drawn_elements['routes']):
@@ -1310,6 +1634,7 @@ class MapWidget(QWidget):
                 # Burada özellikle dolguyu kapatıyoruz
                 painter.setBrush(Qt.NoBrush)
                 painter.drawPath(path)
+                profiler.lap('routes', 1)
                 
                 # Segment mesafelerini ve açılarını çizgilerin üzerine/altına yaz - göster/gizle seçeneğine bağlı olarak
                 if self.show_segment_distances and 'segment_distances' in route and len(route['segment_distances']) > 0:
@@ -1424,6 +1749,7 @@ class MapWidget(QWidget):
                         
                         # Orijinal font ayarlarını geri yükle
                         painter.setFont(old_font)
+                    profiler.lap('route_labels', len(route['segment_distances']))
 
                 # Draw isodistance circle for selected point merge pattern
                 if pattern_type == 'pointmerge' and i == self.selected_path_index:
@@ -1617,64 +1943,93 @@ class MapWidget(QWidget):
                             # Önceki çizim ayarlarına geri dön
                             painter.setBrush(save_brush)
                             painter.setPen(save_pen)
+                profiler.lap('route_points', len(route['points']))
+
+        # Yasaklı saha / TMA ihlali olan rota bacaklarını vurgula
+        if self.show_infringements:
+            self.draw_route_infringements(painter)
+            profiler.lap('infringements')
 
         # Draw trajectories
-        for trajectory in self.drawn_elements['trajectories']:
-            if trajectory.get('points'):
-                if self.trajectory_altitude_coloring:
-                    # --- Altitude-based Coloring ---
-                    # Find min and max altitude for color scaling
-                    altitudes = [p[2] for p in trajectory['points'] if len(p) > 2]
-                    if altitudes:
-                        min_alt = min(altitudes)
-                        max_alt = max(altitudes)
-                        alt_range = max_alt - min_alt
-                        
-                        # Draw each segment with color based on altitude
-                        for i in range(len(trajectory['points']) - 1):
-                            p1 = trajectory['points'][i]
-                            p2 = trajectory['points'][i + 1]
-                            
-                            # Calculate color based on altitude
-                            if len(p1) > 2 and len(p2) > 2:
-                                alt1, alt2 = p1[2], p2[2]
-                                # Use average altitude for segment color
-                                avg_alt = (alt1 + alt2) / 2
-                                # Normalize altitude to 0-1 range
-                                norm_alt = (avg_alt - min_alt) / alt_range if alt_range > 0 else 0.5
-                                # Create color gradient from blue (low) to red (high)
-                                r = int(255 * norm_alt)
-                                b = int(255 * (1 - norm_alt))
-                                color = QColor(r, 0, b)
-                                
-                                # Draw segment
-                                painter.setPen(QPen(color, 1.5))
-                                p1_screen = self.geo_to_screen(p1[0], p1[1])
-                                p2_screen = self.geo_to_screen(p2[0], p2[1])
-                                painter.drawLine(p1_screen, p2_screen)
-                    else:
-                        # --- Solid Color ---
-                        base_color = trajectory.get('color', QColor(255, 0, 0)) # Use stored color or default red
-                        painter.setPen(QPen(base_color, 1.5))
-                        painter.setBrush(Qt.NoBrush)
-                        
-                        path = QPainterPath()
-                        first_point = True
-                        for lat, lon, alt in trajectory['points']:
-                            # Draw all points, regardless of bounds for solid color
-                            screen_pos = self.geo_to_screen(lat, lon)
-                            if first_point:
-                                path.moveTo(screen_pos)
-                                first_point = False
-                            else:
-                                path.lineTo(screen_pos)
-                        painter.drawPath(path) # Draw the whole path at once
+        # Zoom'a göre sadeleştirilmiş (LOD) noktalar numpy ile toplu projekte edilir,
+        # görünüm dışındaki trajectory ve segmentler atlanır; tüm segmentler renk
+        # kovası (veya trajectory rengi) başına tek bir yol olarak çizilir
+        lod_tolerance_deg = self.trajectory_lod_pixel_tolerance / self.get_scale()
+        view_width, view_height = self.width(), self.height()
+        trajectory_batch = TrajectoryPathBatch()
+        solid_colors = {}
+        for trajectory in self.drawn_elements['trajectories'] if not self.show_traffic_density else ():
+            if len(trajectory.get('points', ())) < 2 or trajectory.get('id') in self.hidden_trajectory_ids:
+                continue
+            render_data = self._get_trajectory_render_data(trajectory)
+            
+            # Sınır kutusunun köşeleri ekran dışındaysa trajectory'i tamamen atla
+            min_lon, min_lat, max_lon, max_lat = render_data.bounds
+            corner_xs, corner_ys = self.geo_to_screen_array(
+                np.array([min_lat, min_lat, max_lat, max_lat]),
+                np.array([min_lon, max_lon, min_lon, max_lon]))
+            if (corner_xs.max() < 0 or corner_xs.min() > view_width or
+                    corner_ys.max() < 0 or corner_ys.min() > view_height):
+                continue
+            
+            lats, lons, buckets = render_data.level_arrays(lod_tolerance_deg, self.altitude_color_ramp)
+            xs, ys = self.geo_to_screen_array(lats, lons)
+            visible = visible_segments(xs, ys, view_width, view_height)
+            if self.trajectory_altitude_coloring:
+                segment_keys = np.where(visible, buckets, -1)
+            else:
+                # Use stored color or default red
+                color = trajectory.get('color', QColor(255, 0, 0))
+                color_key = color.rgba()
+                solid_colors[color_key] = color
+                segment_keys = np.where(visible, color_key, -1)
+            trajectory_batch.add(xs, ys, segment_keys)
+        
+        # Çok sayıda trajectory varken kalın antialiased çizgilerin raster maliyeti baskın olur
+        drawn_trajectories = trajectory_batch.count
+        thin_lines = drawn_trajectories > self.trajectory_thin_line_threshold
+        if self.trajectory_altitude_coloring:
+            line_width = 1.0 if thin_lines else None
+            trajectory_batch.draw(painter, self.altitude_color_ramp.pens(line_width))
+        else:
+            line_width = 1.0 if thin_lines else 1.5
+            trajectory_batch.draw(painter, {key: QPen(color, line_width) for key, color in solid_colors.items()})
+        
+        # Silinen trajectory'lerin önbellek kayıtlarını temizle
+        if len(self._trajectory_render_cache) > len(self.drawn_elements['trajectories']):
+            live_ids = {id(t.get('points')) for t in self.drawn_elements['trajectories']}
+            self._trajectory_render_cache = {key: value for key, value in self._trajectory_render_cache.items()
+                                             if key in live_ids}
+        profiler.lap('trajectories', drawn_trajectories)
+
+        # Draw conformance corridors
+        self.draw_conformance_corridors(painter)
+
+        # Draw separation conflicts
+        self.draw_separation_conflicts(painter)
+
+        # Draw point merge sweep preview
+        self.draw_sweep_preview(painter)
+
+        # Draw playback aircraft
+        self.draw_playback_aircraft(painter)
+        profiler.lap('analysis_overlays')
 
         # Draw current route being drawn
         self.route_drawer.paint_route(painter)
+        profiler.lap('route_drawing')
 
         # Draw waypoints
         self.draw_waypoints(painter)
+        profiler.end_frame(self._geo_to_screen_calls, self._projected_points)
+
+        # HUD ölçülen karenin dışında çizilir
+        if self.show_frame_profiler_hud:
+            self.draw_frame_profiler_hud(painter)
+
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            startup_timer.finish('first_map_paint')
 
     def start_route_drawing(self):
         """Start route drawing mode"""
@@ -1686,6 +2041,7 @@ class MapWidget(QWidget):
         self.route_drawer.cancel_route_drawing()
         self.update_status_message("")
 
+    @tracing.traced()
     def find_path_at_point(self, point):
         """Find if any path is near the clicked point and select it"""
         if not self.drawn_elements['routes']:
@@ -1723,7 +2079,8 @@ class MapWidget(QWidget):
         
         # If closest point is within threshold
         if min_distance < pixel_threshold:
-            print(f"Path selected! Distance: {min_distance} pixels")
+            tracing.debug("Path selected! Distance: %s pixels", min_distance)
+            tracing.count('map.path_hits')
             self.selected_path_index = closest_index
             self.pathSelected.emit(closest_path)
             
@@ -1769,6 +2126,7 @@ class MapWidget(QWidget):
         # Return distance from p to this closest point
         return math.sqrt((x - proj_x)**2 + (y - proj_y)**2)
 
+    @tracing.traced()
     def draw_path_extension(self, config, route_id_to_update=None):
         """Draw a path extension on the map based on configuration, or update an existing one."""
         pattern_type = config.get('pattern_type', 'trombone')
@@ -1778,7 +2136,7 @@ class MapWidget(QWidget):
         
         # --- Handle Update Case --- 
         if route_id_to_update:
-            print(f"MapWidget attempting update for ID: {route_id_to_update}")
+            tracing.debug("MapWidget attempting update for ID: %s", route_id_to_update)
             # Find the index of the route to update
             route_index = -1
             for i, r in enumerate(self.drawn_elements['routes']):
@@ -1787,29 +2145,29 @@ class MapWidget(QWidget):
                     break
             
             if route_index == -1:
-                print(f"Error: Could not find route ID {route_id_to_update} to update.")
+                tracing.error("Error: Could not find route ID %s to update.", route_id_to_update)
                 return None
             
             # Recalculate waypoints using the NEW config
             waypoints_data = []
             if pattern_type == 'pointmerge':
-                 from pointmerge import calculate_point_merge_waypoints
+                 from procedure_geometry import calculate_point_merge_waypoints
                  try:
                      # Var olan rotayı ve config'i al
                      existing_route = self.drawn_elements['routes'][route_index]
                      
                      if 'config' in existing_route:
                          existing_config = existing_route['config'].copy()
-                         print(f"Mevcut point merge config: {existing_config}")
+                         tracing.debug("Mevcut point merge config: %s", existing_config)
                          
                          # Kritik parametreleri doğrula ve güncellenenleri ekle
                          # Önce config'deki önemli yeni değerleri debugle
                          if 'first_point_distance' in config:
-                             print(f"YENİ first_point_distance: {config['first_point_distance']}")
+                             tracing.debug("YENİ first_point_distance: %s", config['first_point_distance'])
                          if 'track_angle' in config:  
-                             print(f"YENİ track_angle: {config['track_angle']}")
+                             tracing.debug("YENİ track_angle: %s", config['track_angle'])
                          if 'segments' in config:
-                             print(f"YENİ segments: {config['segments']}")
+                             tracing.debug("YENİ segments: %s", config['segments'])
                          
                          # Yeni config'den gelen güncellenmiş değerleri, tüm olası anahtarlar için kontrol et
                          # ÖNEMLİ: config'den gelen değerler tercih edilsin, yoksa existing_config'den alsın
@@ -1851,14 +2209,14 @@ class MapWidget(QWidget):
                      missing_keys = [key for key in debug_keys if key not in config or config[key] is None]
                      
                      if missing_keys:
-                         print(f"HATA: Point Merge hesaplaması için kritik alanlar eksik: {missing_keys}")
+                         tracing.error("HATA: Point Merge hesaplaması için kritik alanlar eksik: %s", missing_keys)
                          return None
                      
-                     print(f"Point Merge hesaplaması için kullanılan son config: {config}")       
+                     tracing.debug("Point Merge hesaplaması için kullanılan son config: %s", config)
                      # Waypoint hesaplaması
                      waypoints_data = calculate_point_merge_waypoints(None, config)
                  except Exception as e:
-                      print(f"Error during point merge update calculation: {e}")
+                      tracing.error("Error during point merge update calculation: %s", e)
                       import traceback
                       traceback.print_exc()
                       return None # Indicate failure
@@ -1869,10 +2227,10 @@ class MapWidget(QWidget):
                      existing_route = self.drawn_elements['routes'][route_index]
                      runway_approach_data = existing_route.get('config', {}).get('runway')
                  if not runway_approach_data:
-                     print(f"Error: Runway approach data missing; cannot update trombone {route_id_to_update}")
+                     tracing.error("Error: Runway approach data missing; cannot update trombone %s", route_id_to_update)
                      return None
                  try:
-                      from path_extension import calculate_trombone_waypoints
+                      from procedure_geometry import calculate_trombone_waypoints
                       
                       # Runway verilerini detaylı şekilde kontrol et ve düzenle
                       if runway_approach_data:
@@ -1881,7 +2239,7 @@ class MapWidget(QWidget):
                               # Threshold verilerini start olarak kullanalım
                               runway_approach_data['start_lat'] = runway_approach_data['threshold_lat']
                               runway_approach_data['start_lon'] = runway_approach_data['threshold_lon']
-                              print("CSV trombone için threshold koordinatları start olarak ayarlandı")
+                              tracing.debug("CSV trombone için threshold koordinatları start olarak ayarlandı")
                           
                           # Tüm gerekli koordinatların sayısal değerler olduğundan emin ol
                           for key in ['start_lat', 'start_lon', 'end_lat', 'end_lon', 'threshold_lat', 'threshold_lon']:
@@ -1889,36 +2247,36 @@ class MapWidget(QWidget):
                                   try:
                                       runway_approach_data[key] = float(runway_approach_data[key])
                                   except (ValueError, TypeError):
-                                      print(f"Hata: Geçersiz koordinat değeri: {key}={runway_approach_data[key]}")
+                                      tracing.error("Hata: Geçersiz koordinat değeri: %s=%s", key, runway_approach_data[key])
                                       # Eksik veya geçersiz değer için varsayılan değer ata veya hata ver
                                       # Bu durum, CSV yükleme ve runway verilerinin bütünlüğü ile ilgili sorunları gösterir.
                                       # Şimdilik None bırakmak, calculate_trombone_waypoints'in varsayılanını tetikleyebilir.
                                       runway_approach_data[key] = None 
                       
                       # Detaylı debug bilgisi ekle
-                      print(f"Trombone hesaplaması için kullanılan runway verileri:")
-                      print(f"  ID: {runway_approach_data.get('id', 'N/A') if runway_approach_data else 'N/A'}")
-                      print(f"  Start: {runway_approach_data.get('start_lat', 'N/A') if runway_approach_data else 'N/A'}, {runway_approach_data.get('start_lon', 'N/A') if runway_approach_data else 'N/A'}")
-                      print(f"  End: {runway_approach_data.get('end_lat', 'N/A') if runway_approach_data else 'N/A'}, {runway_approach_data.get('end_lon', 'N/A') if runway_approach_data else 'N/A'}")
-                      print(f"  Threshold: {runway_approach_data.get('threshold_lat', 'N/A') if runway_approach_data else 'N/A'}, {runway_approach_data.get('threshold_lon', 'N/A') if runway_approach_data else 'N/A'}")
+                      tracing.debug("Trombone hesaplaması için kullanılan runway verileri:")
+                      tracing.debug("  ID: %s", runway_approach_data.get('id', 'N/A') if runway_approach_data else 'N/A')
+                      tracing.debug("  Start: %s, %s", runway_approach_data.get('start_lat', 'N/A') if runway_approach_data else 'N/A', runway_approach_data.get('start_lon', 'N/A') if runway_approach_data else 'N/A')
+                      tracing.debug("  End: %s, %s", runway_approach_data.get('end_lat', 'N/A') if runway_approach_data else 'N/A', runway_approach_data.get('end_lon', 'N/A') if runway_approach_data else 'N/A')
+                      tracing.debug("  Threshold: %s, %s", runway_approach_data.get('threshold_lat', 'N/A') if runway_approach_data else 'N/A', runway_approach_data.get('threshold_lon', 'N/A') if runway_approach_data else 'N/A')
                       
                       # Trombone parametreleri hakkında detaylı bilgi
-                      print(f"Trombone parametreleri:")
-                      print(f"  Threshold Distance: {config.get('threshold_distance', 'N/A')} NM")
-                      print(f"  Base Angle: {config.get('base_angle', 'N/A')} derece")
-                      print(f"  Base Distance: {config.get('base_distance', 'N/A')} NM")
-                      print(f"  Extension Length: {config.get('extension_length', 'N/A')} NM")
+                      tracing.debug("Trombone parametreleri:")
+                      tracing.debug("  Threshold Distance: %s NM", config.get('threshold_distance', 'N/A'))
+                      tracing.debug("  Base Angle: %s derece", config.get('base_angle', 'N/A'))
+                      tracing.debug("  Base Distance: %s NM", config.get('base_distance', 'N/A'))
+                      tracing.debug("  Extension Length: %s NM", config.get('extension_length', 'N/A'))
                       
                       # calculate_trombone_waypoints fonksiyonuna runway_approach_data'nın bir kopyasını gönder
                       # Bu, fonksiyonun orijinal sözlüğü değiştirmesini engeller.
                       waypoints_data = calculate_trombone_waypoints(runway_approach_data.copy() if runway_approach_data else None, config)
                       
                       if not waypoints_data or len(waypoints_data) == 0:
-                          print("Error: Trombone waypoint calculation returned empty result")
+                          tracing.error("Error: Trombone waypoint calculation returned empty result")
                           return None
                           
                  except Exception as e:
-                      print(f"Error during trombone update calculation: {e}")
+                      tracing.error("Error during trombone update calculation: %s", e)
                       import traceback
                       traceback.print_exc()
                       
@@ -1929,14 +2287,14 @@ class MapWidget(QWidget):
                                         "Please check the runway coordinates and parameters.")
                       return None # Indicate failure
             else:
-                print(f"Error: Unknown pattern type '{pattern_type}' for update.")
+                tracing.error("Error: Unknown pattern type '%s' for update.", pattern_type)
                 return None
 
             # Check calculation result and extract points
             if waypoints_data and len(waypoints_data) > 0:
                 points_tuples = [(wp['lat'], wp['lon']) for wp in waypoints_data if 'lat' in wp and 'lon' in wp]
                 if not points_tuples:
-                    print("Error: Updated waypoints list is empty or malformed after extraction.")
+                    tracing.error("Error: Updated waypoints list is empty or malformed after extraction.")
                     return None
                     
                 # Get existing route's color and type (shouldn't change on param update)
@@ -1954,8 +2312,8 @@ class MapWidget(QWidget):
                     # Mevcut merge point koordinatını koru, ancak diğer noktaları yeni açıya göre güncelle
                     merge_point = current_points[-1]  # Son nokta merge point
                     
-                    print(f"Point Merge rotası güncelleniyor: Merge point konumu korunarak açılar değiştiriliyor")
-                    print(f"Yeni açı: {config.get('track_angle', config.get('angle', 90.0))}")
+                    tracing.debug("Point Merge rotası güncelleniyor: Merge point konumu korunarak açılar değiştiriliyor")
+                    tracing.debug("Yeni açı: %s", config.get('track_angle', config.get('angle', 90.0)))
                     # Hesaplanan noktaları kullan, böylece track_angle değişikliği etkili olur
                     # Ancak merge point'in konumunu koru
                     if len(points_tuples) > 0:
@@ -1969,18 +2327,18 @@ class MapWidget(QWidget):
                     # doğru koordinatların kullanılmasını sağla
                     if 'runway' in config:
                         # Runway verilerini kesinlikle koru - hesaplamalar runway'den yapılır
-                        print(f"Trombone rotası güncelleniyor: Runway koordinatları korunarak waypoint'ler yeniden konumlandırılacak")
+                        tracing.debug("Trombone rotası güncelleniyor: Runway koordinatları korunarak waypoint'ler yeniden konumlandırılacak")
                         
                         # threshold_distance değişikliğinin doğru uygulanabilmesi için
                         # sadece runway koordinatlarını koruyoruz, noktaları değil
                         # calculate_trombone_waypoints bu koordinatları kullanarak noktaları doğru şekilde oluşturacak
-                        print(f"Runway ve hesaplama temel parametreleri güncellendi: {config.get('threshold_distance')} NM")
+                        tracing.debug("Runway ve hesaplama temel parametreleri güncellendi: %s NM", config.get('threshold_distance'))
                         
                         # Özellikle preserve_position false ise, noktaları tamamen yeniden hesaplamak istiyoruz
                         # böylece threshold_distance değişikliği A noktasını doğru şekilde etkileyecek
                 elif preserve_position and len(current_points) > 0 and len(points_tuples) == len(current_points):
                     # Diğer rota tipleri için mevcut konumu tamamen koru
-                    print(f"Rota pozisyonları korunuyor ({pattern_type} - ID: {route_id_to_update})")
+                    tracing.debug("Rota pozisyonları korunuyor (%s - ID: %s)", pattern_type, route_id_to_update)
                     # Mevcut pozisyonları kullan
                     points_tuples = current_points
                 
@@ -2010,7 +2368,7 @@ class MapWidget(QWidget):
                 
                 return route_id_to_update # Return the ID on success
             else:
-                print("Update waypoint calculation failed or returned empty list.")
+                tracing.error("Update waypoint calculation failed or returned empty list.")
                 return None
         # --- End Handle Update Case ---
         
@@ -2038,7 +2396,7 @@ class MapWidget(QWidget):
         # Calculate waypoints based on pattern type
         waypoints_data = [] # This will be list of dicts {'lat': ..., 'lon': ...}
         if pattern_type == 'pointmerge':
-            from pointmerge import calculate_point_merge_waypoints
+            from procedure_geometry import calculate_point_merge_waypoints
             waypoints_data = calculate_point_merge_waypoints(None, config) # Assumes returns list of dicts
         elif pattern_type == 'trombone':
             # Trombone için route_id kontrol et, güncellenecek rota ID'si varsa o rotanın trombone olduğundan emin ol
@@ -2050,26 +2408,26 @@ class MapWidget(QWidget):
                         break
                 
                 if not is_route_trombone:
-                    print(f"Hata: Güncellenmek istenen rota ({route_id_to_update}) bir trombone değil!")
+                    tracing.error("Hata: Güncellenmek istenen rota (%s) bir trombone değil!", route_id_to_update)
                     return None
             
             runway_approach_data = config.get('runway')
             if not runway_approach_data:
-                print(f"Error: Runway approach data missing in trombone config")
+                tracing.error("Error: Runway approach data missing in trombone config")
                 return None
             try:
-                from path_extension import calculate_trombone_waypoints
+                from procedure_geometry import calculate_trombone_waypoints
                 waypoints_data = calculate_trombone_waypoints(runway_approach_data.copy() if runway_approach_data else None, config) # Returns list of dicts
             except ImportError:
-                 print("Error: Could not import calculate_trombone_waypoints.")
+                 tracing.error("Error: Could not import calculate_trombone_waypoints.")
                  return None
             except Exception as e:
-                 print(f"Error during trombone waypoint calculation: {e}")
+                 tracing.error("Error during trombone waypoint calculation: %s", e)
                  import traceback
                  traceback.print_exc()
                  return None
         else:
-             print(f"Error: Unknown pattern type '{pattern_type}' for path extension.")
+             tracing.error("Error: Unknown pattern type '%s' for path extension.", pattern_type)
              return None
 
         # If waypoints were successfully calculated
@@ -2078,7 +2436,7 @@ class MapWidget(QWidget):
             points_tuples = [(wp['lat'], wp['lon']) for wp in waypoints_data if 'lat' in wp and 'lon' in wp]
             
             if not points_tuples: # Check if extraction resulted in empty list
-                print("Error: Calculated waypoints list is empty or malformed after extraction.")
+                tracing.error("Error: Calculated waypoints list is empty or malformed after extraction.")
                 return None
 
             # Create the route configuration dictionary
@@ -2099,7 +2457,7 @@ class MapWidget(QWidget):
                 'config': config.copy(), # Store the original config used
                 'id': f"{id_prefix}{self.route_id_counter}" # Tipe göre benzersiz ID
             }
-            print(f"Yeni rota oluşturuluyor, tip: {pattern_type}, ID: {route_config['id']}")
+            tracing.debug("Yeni rota oluşturuluyor, tip: %s, ID: %s", pattern_type, route_config['id'])
             # Increment the counter for the next route
             self.route_id_counter += 1
             
@@ -2108,47 +2466,53 @@ class MapWidget(QWidget):
             self.update() # Redraw the map
             return route_config['id'] # Return the ID of the created route
         else:
-             print("Waypoint calculation failed or returned empty list.")
+             tracing.error("Waypoint calculation failed or returned empty list.")
              return None
         
     def calculate_segment_distances(self, points):
         """Calculate distances between consecutive waypoints in NM"""
-        from utils import calculate_distance
-        distances = []
+        if len(points) < 2:
+            return []
         
-        # Birleştirme toleransı - merge_selected_routes ile aynı değere sahip olmalı
-        MERGE_TOLERANCE = 0.0001  # Yaklaşık 10-15 metre
+        lats, lons = np.asarray(points, dtype=np.float64).T[:2]
+        distances = geodesy.segment_distances_nm(lats, lons)
         
-        for i in range(len(points) - 1):
-            lat1, lon1 = points[i]
-            lat2, lon2 = points[i + 1]
-            
-            # Eğer iki nokta arasındaki mesafe belirlenen tolerans değerinden büyükse
-            # bu iki nokta arasında bir segment olmalı
-            distance = calculate_distance(lat1, lon1, lat2, lon2)
-            
-            # Eğer iki nokta arasındaki mesafe çok küçükse (aynı noktalar) 
-            # segment mesafesini NaN veya -1 olarak işaretle
-            # Bu, segment çizilmemesi gerektiğini işaret edecek
-            if distance <= MERGE_TOLERANCE:
-                distances.append(-1)  # -1 değeri, segment çizilmemesi gerektiğini belirtir
-            else:
-                distances.append(distance)
-            
-        return distances
+        # Eğer iki nokta arasındaki mesafe çok küçükse (aynı noktalar) 
+        # segment mesafesini -1 olarak işaretle; bu, segment çizilmemesi gerektiğini belirtir
+        distances[distances <= self.SEGMENT_MERGE_TOLERANCE] = -1
+        return distances.tolist()
         
     def calculate_track_angles(self, points):
         """Calculate true track angles between consecutive waypoints in degrees"""
-        from utils import calculate_bearing
-        angles = []
-        
-        for i in range(len(points) - 1):
-            lat1, lon1 = points[i]
-            lat2, lon2 = points[i + 1]
-            angle = calculate_bearing(lat1, lon1, lat2, lon2)
-            angles.append(angle)
-            
-        return angles
+        if len(points) < 2:
+            return []
+        lats, lons = np.asarray(points, dtype=np.float64).T[:2]
+        return geodesy.segment_bearings_deg(lats, lons).tolist()
+
+    def update_segment_metrics(self, route, vertex_index=None):
+        """Update route['segment_distances'] / route['segment_angles'].
+
+        vertex_index verilirse yalnızca o noktaya bağlı (en fazla iki) segment
+        yeniden hesaplanır; önbellek eksik veya nokta sayısıyla uyumsuzsa tüm
+        rota hesaplanır.
+        """
+        points = route['points']
+        distances = route.get('segment_distances')
+        angles = route.get('segment_angles')
+        segment_count = max(len(points) - 1, 0)
+        if (vertex_index is None or not isinstance(distances, list) or not isinstance(angles, list) or
+                len(distances) != segment_count or len(angles) != segment_count):
+            route['segment_distances'] = self.calculate_segment_distances(points)
+            route['segment_angles'] = self.calculate_track_angles(points)
+            return
+
+        for segment in (vertex_index - 1, vertex_index):
+            if 0 <= segment < segment_count:
+                lat1, lon1 = points[segment][0], points[segment][1]
+                lat2, lon2 = points[segment + 1][0], points[segment + 1][1]
+                distance = calculate_distance(lat1, lon1, lat2, lon2)
+                distances[segment] = -1 if distance <= self.SEGMENT_MERGE_TOLERANCE else distance
+                angles[segment] = calculate_bearing(lat1, lon1, lat2, lon2)
 
     def on_reset_view(self):
         """Reset view parameters to default values"""
@@ -2212,26 +2576,31 @@ class MapWidget(QWidget):
         else:
             return False # Route with the given ID was not found 
 
+    def set_geo_data(self, geo_data, country_arrays=None):
+        """Show already loaded GeoJSON data; country_arrays may be precomputed (background loader)"""
+        self.geo_data = geo_data
+        if country_arrays is not None:
+            self.country_arrays = country_arrays
+            self._country_arrays_source = geo_data
+        self.compute_country_paths()
+        self.calculate_map_bounds()
+        self.update()
+
+    @tracing.traced()
     def load_and_compute_geojson(self, filepath):
         """Loads GeoJSON from the given path and computes country paths."""
-        print(f"MapWidget attempting to load GeoJSON from: {filepath}")
+        tracing.debug("MapWidget attempting to load GeoJSON from: %s", filepath)
         # Create DataManager instance just for loading this file
         # Or potentially pass DataManager instance if needed elsewhere
         temp_data_manager = DataManager()
         loaded_data = temp_data_manager.load_geo_data(filepath)
         
         if loaded_data:
-            self.geo_data = loaded_data
-            self.compute_country_paths() # Recompute paths with new data
-            self.update() # Trigger redraw
-            print("GeoJSON loaded and paths computed.")
-            
-            # Calculate bounding box
-            self.calculate_map_bounds()
-            
+            self.set_geo_data(loaded_data)
+            tracing.info("GeoJSON loaded and paths computed.")
             return True
         else:
-            print("Failed to load GeoJSON in MapWidget.")
+            tracing.error("Failed to load GeoJSON in MapWidget.")
             self.geo_data = {"type": "FeatureCollection", "features": []} # Reset to empty
             self.country_paths = {}
             self.map_bounds = None # Reset bounds if load failed
@@ -2243,61 +2612,80 @@ class MapWidget(QWidget):
         if not self.geo_data or not self.geo_data.get('features'):
             self.map_bounds = None
             return
-            
+        if self._country_arrays_source is not self.geo_data:
+            self.prepare_country_arrays()
+
+        # İç halkalar dış halkanın içinde kaldığından tüm halkalar aynı sınırı verir
         min_lon, min_lat = 180, 90
         max_lon, max_lat = -180, -90
-
-        def update_bounds(lon, lat):
-            nonlocal min_lon, min_lat, max_lon, max_lat
-            min_lon = min(min_lon, lon)
-            min_lat = min(min_lat, lat)
-            max_lon = max(max_lon, lon)
-            max_lat = max(max_lat, lat)
-
-        for feature in self.geo_data['features']:
-            geom = feature.get('geometry')
-            if not geom:
-                continue
-            geom_type = geom.get('type')
-            coords = geom.get('coordinates')
-            if not coords:
-                continue
-
-            if geom_type == 'Polygon':
-                # coords is list of rings, first ring is outer boundary
-                for lon, lat in coords[0]: 
-                    update_bounds(lon, lat)
-            elif geom_type == 'MultiPolygon':
-                # coords is list of polygons
-                for polygon in coords:
-                    # polygon is list of rings, first ring is outer
-                    for lon, lat in polygon[0]:
-                        update_bounds(lon, lat)
-            # Add other geometry types if needed (Point, LineString, etc.)
+        for _, lats, lons, _ in self.country_arrays:
+            if len(lats):
+                min_lon, max_lon = min(min_lon, float(lons.min())), max(max_lon, float(lons.max()))
+                min_lat, max_lat = min(min_lat, float(lats.min())), max(max_lat, float(lats.max()))
 
         if min_lon <= 180 and min_lat <= 90: # Check if any points were processed
             self.map_bounds = (min_lon, min_lat, max_lon, max_lat)
-            print(f"Calculated map bounds: {self.map_bounds}")
+            tracing.info("Calculated map bounds: %s", self.map_bounds)
         else:
             self.map_bounds = None # No valid points found
-            print("Warning: Could not calculate valid map bounds from GeoJSON.")
+            tracing.warning("Warning: Could not calculate valid map bounds from GeoJSON.")
+
+    @tracing.traced()
+    def add_trajectory(self, trajectory_id, points, times=None):
+        """Add a parsed trajectory to the drawn elements, filtering points outside map bounds.
 
-    def add_trajectory(self, trajectory_id, points):
-        """Add a parsed trajectory to the drawn elements, filtering points outside map bounds."""
+        points may be a list of (lat, lon, alt) tuples, an (N, 3) numpy array or a
+        TrajectoryView from a memory-mapped TrajectoryStore. times is an optional
+        sequence of epoch seconds per point, used by trajectory playback.
+        """
+        if times is None and isinstance(points, TrajectoryView):
+            times = points.times
+        filtered_times = times
+        # Depo görünümleri kopyalanmaz; yalnızca sınır kutusu harita sınırlarıyla kesişiyor mu bakılır
+        if isinstance(points, TrajectoryView):
+            if self.map_bounds:
+                min_lon, min_lat, max_lon, max_lat = self.map_bounds
+                t_min_lon, t_min_lat, t_max_lon, t_max_lat = points.bounds
+                if t_max_lon < min_lon or t_min_lon > max_lon or t_max_lat < min_lat or t_min_lat > max_lat:
+                    tracing.warning("Warning: Trajectory '%s' has no points within the current map bounds (%s). Not adding.", trajectory_id, self.map_bounds)
+                    return
+            filtered_points = points
+        # Toplu içe aktarmadan gelen numpy dizileri (N x 3) vektörel olarak filtrele
+        elif isinstance(points, np.ndarray):
+            if self.map_bounds:
+                min_lon, min_lat, max_lon, max_lat = self.map_bounds
+                mask = ((points[:, 1] >= min_lon) & (points[:, 1] <= max_lon) &
+                        (points[:, 0] >= min_lat) & (points[:, 0] <= max_lat))
+                if not mask.all():
+                    filtered_points = points[mask]
+                    if times is not None:
+                        filtered_times = np.asarray(times, dtype=np.float64)[mask]
+                else:
+                    filtered_points = points
+            else:
+                filtered_points = points
+            if not len(filtered_points):
+                tracing.warning("Warning: Trajectory '%s' has no points within the current map bounds (%s). Not adding.", trajectory_id, self.map_bounds)
+                return
         # Filter points based on map bounds
-        filtered_points = []
-        if self.map_bounds:
+        elif self.map_bounds:
+            filtered_points = []
+            kept_times = []
             min_lon, min_lat, max_lon, max_lat = self.map_bounds
-            for lat, lon, alt in points:
+            for i, (lat, lon, alt) in enumerate(points):
                 if min_lon <= lon <= max_lon and min_lat <= lat <= max_lat:
                     filtered_points.append((lat, lon, alt))
+                    if times is not None:
+                        kept_times.append(times[i])
+            if times is not None:
+                filtered_times = kept_times
             if not filtered_points:
-                print(f"Warning: Trajectory '{trajectory_id}' has no points within the current map bounds ({self.map_bounds}). Not adding.")
+                tracing.warning("Warning: Trajectory '%s' has no points within the current map bounds (%s). Not adding.", trajectory_id, self.map_bounds)
                 return
         else:
             filtered_points = points # No bounds, use all points
-            print("Warning: Map bounds not set, cannot filter trajectory points.")
-        
+            tracing.warning("Warning: Map bounds not set, cannot filter trajectory points.")
+
         # Assign a color based on the number of trajectories already present
         color_index = len(self.drawn_elements['trajectories']) % len(self.trajectory_colors)
         traj_color = self.trajectory_colors[color_index]
@@ -2308,8 +2696,10 @@ class MapWidget(QWidget):
             'color': traj_color,
             'type': 'trajectory'
         }
+        if filtered_times is not None:
+            trajectory_data['times'] = filtered_times
         self.drawn_elements['trajectories'].append(trajectory_data)
-        print(f"Added trajectory '{trajectory_id}' with {len(filtered_points)} points (filtered from {len(points)}) and color {traj_color.name()}.")
+        tracing.info("Added trajectory '%s' with %s points (filtered from %s) and color %s.", trajectory_id, len(filtered_points), len(points), traj_color.name())
         self.update() # Redraw the map to show the new trajectory
         
     def show_trombone_popup(self, trombone_config, screen_pos):
@@ -2321,9 +2711,10 @@ class MapWidget(QWidget):
         # Rota taşındı veya döndürüldüyse uyarı mesajı göster
         moved_or_rotated = popup_config.get('moved_or_rotated', False)
         if moved_or_rotated:
-            print(f"Uyarı: Bu trombone rotası taşındı veya döndürüldü. Parametre değişiklikleri kilitlendi.")
+            tracing.warning("Uyarı: Bu trombone rotası taşındı veya döndürüldü. Parametre değişiklikleri kilitlendi.")
         
         # Popup menüyü oluştur
+        from trombone_popup import TrombonePopupDialog
         popup = TrombonePopupDialog(popup_config, self)
         
         # Eğer daha önce bir konum kaydedildiyse, popup orada açılsın
@@ -2377,16 +2768,16 @@ class MapWidget(QWidget):
         
         # Eğer sadece görsel güncellemeyse
         if updated_config.get('visual_only_update', False):
-            print("Sadece Trombone görsel ayarlar güncelleniyor...")
+            tracing.debug("Sadece Trombone görsel ayarlar güncelleniyor...")
             # Mevcut rotayı bul ve sadece color/width güncelle
             for i, route in enumerate(self.drawn_elements.get('routes', [])):
                 if route.get('id') == route_id:
                     route['color'] = updated_config.get('color', route.get('color', '#CC6600'))
                     route['width'] = updated_config.get('width', route.get('width', 2))
-                    print(f"Trombone {route_id} görsel ayarları güncellendi: color={route['color']}, width={route['width']}")
+                    tracing.debug("Trombone %s görsel ayarları güncellendi: color=%s, width=%s", route_id, route['color'], route['width'])
                     self.update()  # Haritayı yeniden çiz
                     return
-            print(f"Hata: {route_id} ID'li Trombone bulunamadı!")
+            tracing.error("Hata: %s ID'li Trombone bulunamadı!", route_id)
             return
         
         # Önce ilgili rotanın trombone olduğundan emin olalım
@@ -2400,7 +2791,7 @@ class MapWidget(QWidget):
                 break
                 
         if not route_to_update:
-            print(f"Hata: Güncellenecek ruta bulunamadı: {route_id}")
+            tracing.error("Hata: Güncellenecek ruta bulunamadı: %s", route_id)
             return
             
         # Rotanın gerçekten bir trombone olduğunu doğrula
@@ -2408,13 +2799,13 @@ class MapWidget(QWidget):
         is_trombone = pattern_type == 'trombone'
         
         if not is_trombone:
-            print(f"Hata: Seçilen rota bir trombone değil: {pattern_type}")
+            tracing.error("Hata: Seçilen rota bir trombone değil: %s", pattern_type)
             return
             
         # Mevcut noktaları koru - taşınmış/döndürülmüş rotanın konumunu korumak için
         current_points = route_to_update.get('points', [])
         if not current_points or len(current_points) < 2:
-            print(f"Hata: Trombone rotasında yeterli nokta yok!")
+            tracing.error("Hata: Trombone rotasında yeterli nokta yok!")
             return
             
         # Artık sıralama A->B->C olduğu için ilk nokta pist yaklaşım noktasıdır (A)
@@ -2448,15 +2839,15 @@ class MapWidget(QWidget):
                     if key in original_runway:
                         runway_dict[key] = original_runway[key]
                 
-                print(f"Trombone güncelleniyor: Pist eşiğinin konumu sabit tutuldu")
-                print(f"  Threshold Distance değişiminde A noktasının hareketi sağlanıyor")
+                tracing.debug("Trombone güncelleniyor: Pist eşiğinin konumu sabit tutuldu")
+                tracing.debug("  Threshold Distance değişiminde A noktasının hareketi sağlanıyor")
                 
                 # Threshold distance değişikliğinin özel durumu
                 if 'threshold_distance' in config_copy and 'threshold_distance' in route_to_update.get('config', {}):
                     old_value = route_to_update['config']['threshold_distance']
                     new_value = config_copy['threshold_distance']
                     if old_value != new_value:
-                        print(f"  Threshold Distance değişti: {old_value}→{new_value} NM")
+                        tracing.debug("  Threshold Distance değişti: %s→%s NM", old_value, new_value)
                         # Threshold distance değiştiğinde pozisyon korumaması gerektiğini belirle
                         # Bu A noktasının hesaplamaya göre doğru konumlanmasını sağlar
                         config_copy['preserve_current_position'] = False
@@ -2464,7 +2855,7 @@ class MapWidget(QWidget):
                         # CSV'den import edilen trombonlarda özel işlem
                         # CSV'den yüklenen desenlerde de threshold_distance değişikliği A noktasını etkilemeli
                         if route_to_update.get('config', {}).get('is_csv_imported', False):
-                            print("  CSV'den yüklenmiş trombone için özel işlem uygulanıyor")
+                            tracing.debug("  CSV'den yüklenmiş trombone için özel işlem uygulanıyor")
                             # CSV'den yüklenen desenler için pozisyon koruma özelliğini tamamen devre dışı bırak
                             config_copy['is_csv_imported'] = True  # Bu bayrağı koru
         
@@ -2563,7 +2954,7 @@ class MapWidget(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Save Error", f"Failed to save CSV file: {e}")
         else:
-            print("Export CSV cancelled.")
+            tracing.debug("Export CSV cancelled.")
 
     def _on_trombone_export_json(self, route_id):
         """Handle export JSON request from trombone popup"""
@@ -2605,10 +2996,11 @@ class MapWidget(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Save Error", f"Failed to save JSON file: {e}")
         else:
-            print("Export JSON cancelled.")
+            tracing.debug("Export JSON cancelled.")
 
     def show_pointmerge_popup(self, pm_config, screen_pos):
         """Show point merge settings popup at the given screen position"""
+        from pointmerge_popup import PointMergePopupDialog
         popup = PointMergePopupDialog(pm_config, self)
         # Position logic: reuse last or offset
         if self.last_pointmerge_popup_pos:
@@ -2639,20 +3031,20 @@ class MapWidget(QWidget):
     
     def _on_pointmerge_settings_changed(self, cfg, route_id):
         """Handle pointmerge settings change"""
-        print(f"Point Merge güncelleniyor, ID: {route_id}")
+        tracing.debug("Point Merge güncelleniyor, ID: %s", route_id)
         
         # Eğer sadece görsel güncellemeyse
         if cfg.get('visual_only_update', False):
-            print("Sadece görsel ayarlar güncelleniyor...")
+            tracing.debug("Sadece görsel ayarlar güncelleniyor...")
             # Mevcut rotayı bul ve sadece color/width güncelle
             for i, route in enumerate(self.drawn_elements.get('routes', [])):
                 if route.get('id') == route_id:
                     route['color'] = cfg.get('color', route.get('color', '#0066CC'))
                     route['width'] = cfg.get('width', route.get('width', 2))
-                    print(f"Point Merge {route_id} görsel ayarları güncellendi: color={route['color']}, width={route['width']}")
+                    tracing.debug("Point Merge %s görsel ayarları güncellendi: color=%s, width=%s", route_id, route['color'], route['width'])
                     self.update()  # Haritayı yeniden çiz
                     return
-            print(f"Hata: {route_id} ID'li Point Merge bulunamadı!")
+            tracing.error("Hata: %s ID'li Point Merge bulunamadı!", route_id)
             return
         
         # Öncelikle mevcut rotayı bul
@@ -2666,13 +3058,13 @@ class MapWidget(QWidget):
         
         # Eğer mevcut rota bulunamadıysa, hata mesajı göster
         if not current_route:
-            print(f"Hata: {route_id} ID'li Point Merge bulunamadı!")
+            tracing.error("Hata: %s ID'li Point Merge bulunamadı!", route_id)
             return
             
         # Mevcut noktaları koru - taşınmış/döndürülmüş rotanın konumunu korumak için
         current_points = current_route.get('points', [])
         if not current_points or len(current_points) < 2:
-            print(f"Hata: Point Merge rotasında yeterli nokta yok!")
+            tracing.error("Hata: Point Merge rotasında yeterli nokta yok!")
             return
             
         # Mevcut merge point (son nokta)
@@ -2681,7 +3073,7 @@ class MapWidget(QWidget):
         # Tüm gerekli parametrelerin olduğundan emin ol
         if 'config' in current_route:
             original_cfg = current_route['config']
-            print(f"Mevcut Point Merge config: {original_cfg}")
+            tracing.debug("Mevcut Point Merge config: %s", original_cfg)
             
             # Yeni parametre değerleri için orijinal config'i bir temel olarak kopyala 
             updated_cfg = original_cfg.copy()
@@ -2740,10 +3132,10 @@ class MapWidget(QWidget):
         missing_fields = [field for field in critical_fields if field not in updated_cfg]
         
         if missing_fields:
-            print(f"UYARI: Point Merge güncellemesi için kritik alanlar eksik: {missing_fields}")
+            tracing.warning("UYARI: Point Merge güncellemesi için kritik alanlar eksik: %s", missing_fields)
             return
             
-        print(f"Point Merge için kullanılacak güncellenmiş config: {updated_cfg}")
+        tracing.debug("Point Merge için kullanılacak güncellenmiş config: %s", updated_cfg)
         
         # Güncellenen point merge rotasını çiz
         self.draw_path_extension(updated_cfg, route_id_to_update=route_id)
@@ -2795,10 +3187,11 @@ class MapWidget(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Save Error", f"Failed to save JSON file: {e}")
         else:
-            print("Export JSON cancelled.")
+            tracing.debug("Export JSON cancelled.")
 
     def show_route_popup(self, route_config, screen_pos):
         """Show user route settings popup at the given screen position"""
+        from route_popup import RoutePopupDialog
         popup = RoutePopupDialog(route_config, self)
         
         # Position logic: reuse last or offset
@@ -2860,7 +3253,7 @@ class MapWidget(QWidget):
     
     def _on_route_settings_changed(self, updated_config):
         """Handle route settings change from the popup"""
-        print(f"Route settings updated received: {updated_config}")
+        tracing.debug("Route settings updated received: %s", updated_config)
         
         # Belirtilen ID'ye sahip rotayı bul ve güncelle
         routes = self.drawn_elements['routes']
@@ -2868,9 +3261,10 @@ class MapWidget(QWidget):
             if route.get('id') == updated_config.get('id'):
                 # Config'i güncelle
                 routes[i].update(updated_config)
-                print(f"Route {updated_config.get('id')} updated in map widget")
+                tracing.debug("Route %s updated in map widget", updated_config.get('id'))
                 # Haritayı güncelle
                 self.update()
+                self.drawingsChanged.emit()
                 break
     
     def _on_route_export_json(self, route_id):
@@ -2920,13 +3314,13 @@ class MapWidget(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Save Error", f"Failed to save JSON file: {e}")
         else:
-            print("Export JSON cancelled.")
+            tracing.debug("Export JSON cancelled.")
 
     def _on_route_export_csv(self, route_id):
         """Handle route export to CSV request from the popup"""
         # Bu metod artık kullanılmıyor, JSON export kullanılıyor
         # Geriye dönük uyumluluk için bırakıldı
-        print("CSV export replaced with JSON export")
+        tracing.debug("CSV export replaced with JSON export")
 
     def _on_route_move_requested(self, route_id):
         """User Route taşıma modunu etkinleştir"""
@@ -2936,7 +3330,7 @@ class MapWidget(QWidget):
         """Trombone taşıma modunu etkinleştir"""
         # ID formatı kontrolü ekle
         if not route_id.startswith("trombone_") and not "_" in route_id:
-            print(f"UYARI: {route_id} ID'si bir trombone formatında değil. 'trombone_' önekiyle başlaması beklenir.")
+            tracing.warning("UYARI: %s ID'si bir trombone formatında değil. 'trombone_' önekiyle başlaması beklenir.", route_id)
             
         # Route ID'nin gerçekten bir trombone'a ait olduğunu kontrol et
         route_found = False
@@ -2945,14 +3339,14 @@ class MapWidget(QWidget):
                 route_type = route.get('type', route.get('config', {}).get('pattern_type', ''))
                 if route_type == 'trombone':
                     route_found = True
-                    print(f"Geçerli trombone bulundu, ID: {route_id}, taşıma modu başlatılıyor")
+                    tracing.debug("Geçerli trombone bulundu, ID: %s, taşıma modu başlatılıyor", route_id)
                     self._start_route_move_mode(route_id)
                 else:
-                    print(f"HATA: {route_id} ID'li rota bir trombone değil! Tip: {route_type}")
+                    tracing.error("HATA: %s ID'li rota bir trombone değil! Tip: %s", route_id, route_type)
                 break
                 
         if not route_found:
-            print(f"HATA: {route_id} ID'li trombone bulunamadı")
+            tracing.error("HATA: %s ID'li trombone bulunamadı", route_id)
     
     def _on_pointmerge_move_requested(self, route_id):
         """Point Merge taşıma modunu etkinleştir"""
@@ -2963,15 +3357,16 @@ class MapWidget(QWidget):
                 route_type = route.get('type', route.get('config', {}).get('pattern_type', ''))
                 if route_type == 'pointmerge':
                     route_found = True
-                    print(f"Geçerli point merge bulundu, ID: {route_id}, taşıma modu başlatılıyor")
+                    tracing.debug("Geçerli point merge bulundu, ID: %s, taşıma modu başlatılıyor", route_id)
                     self._start_route_move_mode(route_id)
                 else:
-                    print(f"HATA: {route_id} ID'li rota bir point merge değil! Tip: {route_type}")
+                    tracing.error("HATA: %s ID'li rota bir point merge değil! Tip: %s", route_id, route_type)
                 break
                 
         if not route_found:
-            print(f"HATA: {route_id} ID'li point merge bulunamadı")
+            tracing.error("HATA: %s ID'li point merge bulunamadı", route_id)
         
+    @tracing.traced()
     def _on_route_rotate_requested(self, route_id):
         """User Route döndürme modunu etkinleştir"""
         # Route ID'nin gerçekten bir user_route'a ait olduğunu kontrol et
@@ -2986,13 +3381,13 @@ class MapWidget(QWidget):
                     route_found = True
                     selected_route = route
                     route_index = i
-                    print(f"Geçerli user route bulundu, ID: {route_id}")
+                    tracing.debug("Geçerli user route bulundu, ID: %s", route_id)
                 else:
-                    print(f"HATA: {route_id} ID'li rota bir user_route değil! Tip: {route_type}")
+                    tracing.error("HATA: %s ID'li rota bir user_route değil! Tip: %s", route_id, route_type)
                 break
                 
         if not route_found or not selected_route:
-            print(f"HATA: {route_id} ID'li user route bulunamadı")
+            tracing.error("HATA: %s ID'li user route bulunamadı", route_id)
             return
             
         # Eğer rota bulunduysa, döndürme merkezi seçim dialogunu göster
@@ -3007,18 +3402,19 @@ class MapWidget(QWidget):
             # Dialog'un sonucuna göre işlem yap
             if dialog.exec_() == QDialog.Accepted:
                 selected_point_index = dialog.selected_point_index
-                print(f"Döndürme merkezi seçildi: Waypoint {selected_point_index + 1}")
+                tracing.debug("Döndürme merkezi seçildi: Waypoint %s", selected_point_index + 1)
                 self._start_route_rotate_mode(route_id, center_point_index=selected_point_index)
             else:
-                print("Döndürme merkezi seçimi iptal edildi")
+                tracing.debug("Döndürme merkezi seçimi iptal edildi")
         else:
-            print(f"HATA: {route_id} ID'li rotada waypoint bulunamadı")
+            tracing.error("HATA: %s ID'li rotada waypoint bulunamadı", route_id)
     
+    @tracing.traced()
     def _on_trombone_rotate_requested(self, route_id):
         """Trombone döndürme modunu etkinleştir"""
         # ID formatı kontrolü ekle
         if not route_id.startswith("trombone_") and not "_" in route_id:
-            print(f"UYARI: {route_id} ID'si bir trombone formatında değil. 'trombone_' önekiyle başlaması beklenir.")
+            tracing.warning("UYARI: %s ID'si bir trombone formatında değil. 'trombone_' önekiyle başlaması beklenir.", route_id)
             
         # Route ID'nin gerçekten bir trombone'a ait olduğunu kontrol et
         route_found = False
@@ -3032,13 +3428,13 @@ class MapWidget(QWidget):
                     route_found = True
                     selected_route = route
                     route_index = i
-                    print(f"Geçerli trombone bulundu, ID: {route_id}")
+                    tracing.debug("Geçerli trombone bulundu, ID: %s", route_id)
                 else:
-                    print(f"HATA: {route_id} ID'li rota bir trombone değil! Tip: {route_type}")
+                    tracing.error("HATA: %s ID'li rota bir trombone değil! Tip: %s", route_id, route_type)
                 break
                 
         if not route_found or not selected_route:
-            print(f"HATA: {route_id} ID'li trombone bulunamadı")
+            tracing.error("HATA: %s ID'li trombone bulunamadı", route_id)
             return
             
         # Eğer rota bulunduysa, döndürme merkezi seçim dialogunu göster
@@ -3053,13 +3449,14 @@ class MapWidget(QWidget):
             # Dialog'un sonucuna göre işlem yap
             if dialog.exec_() == QDialog.Accepted:
                 selected_point_index = dialog.selected_point_index
-                print(f"Döndürme merkezi seçildi: Waypoint {selected_point_index + 1}")
+                tracing.debug("Döndürme merkezi seçildi: Waypoint %s", selected_point_index + 1)
                 self._start_route_rotate_mode(route_id, center_point_index=selected_point_index)
             else:
-                print("Döndürme merkezi seçimi iptal edildi")
+                tracing.debug("Döndürme merkezi seçimi iptal edildi")
         else:
-            print(f"HATA: {route_id} ID'li trombone'da waypoint bulunamadı")
+            tracing.error("HATA: %s ID'li trombone'da waypoint bulunamadı", route_id)
     
+    @tracing.traced()
     def _on_pointmerge_rotate_requested(self, route_id):
         """Point Merge döndürme modunu etkinleştir"""
         # Route ID'nin gerçekten bir point merge'e ait olduğunu kontrol et
@@ -3074,13 +3471,13 @@ class MapWidget(QWidget):
                     route_found = True
                     selected_route = route
                     route_index = i
-                    print(f"Geçerli point merge bulundu, ID: {route_id}")
+                    tracing.debug("Geçerli point merge bulundu, ID: %s", route_id)
                 else:
-                    print(f"HATA: {route_id} ID'li rota bir point merge değil! Tip: {route_type}")
+                    tracing.error("HATA: %s ID'li rota bir point merge değil! Tip: %s", route_id, route_type)
                 break
                 
         if not route_found or not selected_route:
-            print(f"HATA: {route_id} ID'li point merge bulunamadı")
+            tracing.error("HATA: %s ID'li point merge bulunamadı", route_id)
             return
             
         # Eğer rota bulunduysa, döndürme merkezi seçim dialogunu göster
@@ -3095,21 +3492,77 @@ class MapWidget(QWidget):
             # Dialog'un sonucuna göre işlem yap
             if dialog.exec_() == QDialog.Accepted:
                 selected_point_index = dialog.selected_point_index
-                print(f"Döndürme merkezi seçildi: Waypoint {selected_point_index + 1}")
+                tracing.debug("Döndürme merkezi seçildi: Waypoint %s", selected_point_index + 1)
                 self._start_route_rotate_mode(route_id, center_point_index=selected_point_index)
             else:
-                print("Döndürme merkezi seçimi iptal edildi")
+                tracing.debug("Döndürme merkezi seçimi iptal edildi")
         else:
-            print(f"HATA: {route_id} ID'li point merge'de waypoint bulunamadı")
+            tracing.error("HATA: %s ID'li point merge'de waypoint bulunamadı", route_id)
     
     def _start_route_move_mode(self, route_id):
         """Start route move mode"""
         self._save_state_for_undo() # Save state before starting move
         self.route_move_mode = True
         self.route_being_moved = route_id
+        self.route_transform = RouteTransform([route for route in self.drawn_elements.get('routes', [])
+                                               if route.get('id') == route_id])
         self.setCursor(Qt.SizeAllCursor)
         self.update_status_message("Route move mode - Drag to move, left-click to release")
 
+    def _selected_routes(self):
+        """Routes selected in multi-select mode, in drawing order"""
+        routes = self.drawn_elements.get('routes', [])
+        return [routes[index] for index in sorted(self.selected_route_indices) if 0 <= index < len(routes)]
+
+    def start_selected_routes_move(self):
+        """Start move mode for all routes selected in multi-select mode"""
+        routes = self._selected_routes()
+        if not routes:
+            return False
+        self._save_state_for_undo() # Save state before starting move
+        self.route_rotate_mode = False
+        self.route_move_mode = True
+        self.route_transform = RouteTransform(routes)
+        self.route_being_moved = self.route_transform.route_ids[0]
+        self.move_reference_point = None
+        self.setCursor(Qt.SizeAllCursor)
+        self.update_status_message(f"{len(routes)} rota taşıma modu - Taşımak için sürükleyin, bitirmek için fare tuşunu bırakın")
+        return True
+
+    @tracing.traced()
+    def start_selected_routes_rotate(self):
+        """Start rotate mode for all selected routes around the center of their bounding box"""
+        routes = self._selected_routes()
+        if not routes:
+            return False
+        self._save_state_for_undo() # Save state before starting rotate
+        self.route_move_mode = False
+        self.route_rotate_mode = True
+        self.route_transform = RouteTransform(routes)
+        self.route_being_rotated = self.route_transform.route_ids[0]
+        self.rotate_center_lat_lon = self.route_transform.bounds_center()
+        self.rotate_reference_point = None
+        self.setCursor(Qt.CrossCursor)
+        self.update_status_message(f"{len(routes)} rota döndürme modu - Döndürmek için sürükleyin, bitirmek için fare tuşunu bırakın")
+        return True
+
+    def _finish_route_transform(self, action_text):
+        """Taşıma/döndürme bitince desenleri kilitle ve segment metriklerini kesin olarak hesapla"""
+        transform, self.route_transform = self.route_transform, None
+        if transform is None:
+            return []
+        for route in transform.routes:
+            # Eğer trombone veya point merge ise moved_or_rotated bayrağını ekle
+            if route.get('type') in ('trombone', 'pointmerge') and 'config' in route:
+                route['config']['moved_or_rotated'] = True
+                tracing.debug("%s %s. Parametre değişiklikleri kilitlendi. ID: %s", route.get('type'), action_text, route.get('id'))
+            self.update_segment_metrics(route)
+        if len(transform.routes) == 1:
+            self.pathSelected.emit(transform.routes[0])
+        self.update()
+        return transform.routes
+
+    @tracing.traced()
     def _start_route_rotate_mode(self, route_id, center_point_index=None):
         """Start route rotate mode, optionally with a center point"""
         self._save_state_for_undo() # Save state before starting rotate
@@ -3138,11 +3591,11 @@ class MapWidget(QWidget):
                         if center_point_index is not None and center_point_index < len(route['points']):
                             # Kullanıcının seçtiği noktayı merkez al
                             center_lat, center_lon = route['points'][center_point_index]
-                            print(f"Point Merge için seçilen rotasyon merkezi: Waypoint {center_point_index + 1}")
+                            tracing.debug("Point Merge için seçilen rotasyon merkezi: Waypoint %s", center_point_index + 1)
                         else:
                             # Varsayılan olarak merge point'i (son nokta) merkez al
                             center_lat, center_lon = route['points'][-1]  # Son nokta (merge point)
-                            print(f"Point Merge için varsayılan rotasyon merkezi (merge point) kullanılıyor")
+                            tracing.debug("Point Merge için varsayılan rotasyon merkezi (merge point) kullanılıyor")
                         self.rotate_center_lat_lon = (center_lat, center_lon)
                 elif route_type == 'trombone':
                     # Trombone için kullanıcının seçtiği noktayı veya varsayılan olarak son noktayı merkez al
@@ -3150,11 +3603,11 @@ class MapWidget(QWidget):
                         if center_point_index is not None and center_point_index < len(route['points']):
                             # Kullanıcının seçtiği noktayı merkez al
                             center_lat, center_lon = route['points'][center_point_index]
-                            print(f"Trombone için seçilen rotasyon merkezi: Waypoint {center_point_index + 1}")
+                            tracing.debug("Trombone için seçilen rotasyon merkezi: Waypoint %s", center_point_index + 1)
                         else:
                             # Varsayılan olarak son noktayı (pist yaklaşım noktası) döndürme merkezi olarak kullan
                             center_lat, center_lon = route['points'][-1]  # Son nokta
-                            print(f"Trombone için varsayılan rotasyon merkezi (son nokta) kullanılıyor")
+                            tracing.debug("Trombone için varsayılan rotasyon merkezi (son nokta) kullanılıyor")
                         self.rotate_center_lat_lon = (center_lat, center_lon)
                 else:
                     # Normal rotalar için kullanıcının seçtiği noktayı ya da varsayılan olarak ilk noktayı merkez al
@@ -3167,20 +3620,21 @@ class MapWidget(QWidget):
                             center_lat, center_lon = route['points'][0]
                             
                         self.rotate_center_lat_lon = (center_lat, center_lon)
-                        print(f"Rota rotasyon merkezi belirlendi: Waypoint {center_point_index + 1 if center_point_index is not None else 1}, lat={center_lat}, lon={center_lon}")
+                        tracing.debug("Rota rotasyon merkezi belirlendi: Waypoint %s, lat=%s, lon=%s", center_point_index + 1 if center_point_index is not None else 1, center_lat, center_lon)
                 
+                self.route_transform = RouteTransform([route])
                 self.setCursor(Qt.CrossCursor)  # Döndürme işlemi için çapraz imleç
                 
                 # Rota tipini belirle ve uygun mesaj göster
                 type_str = "Trombone" if route_type == 'trombone' else "Point Merge" if route_type == 'pointmerge' else "Rota"
                 self.update_status_message(f"{type_str} DÖNDÜRME MODU: {route_id} rotasını döndürmek için sürükleyin - Bitirmek için fare tuşunu bırakın")
                 
-                print(f"Döndürme modu başlatıldı - {route_type} rotası: {route_id}")
+                tracing.debug("Döndürme modu başlatıldı - %s rotası: %s", route_type, route_id)
                 route_found = True
                 break
                 
         if not route_found:
-            print(f"Hata: {route_id} ID'li rota bulunamadı!")
+            tracing.error("Hata: %s ID'li rota bulunamadı!", route_id)
 
     def draw_waypoints(self, painter):
         """Draw all waypoints on the map if they are set to be visible"""
@@ -3196,37 +3650,66 @@ class MapWidget(QWidget):
         show_labels = display.get('show_labels', True)
         label_font_size = display.get('label_font_size', 10)
         
+        if not self.data_manager.waypoint_coords:
+            return
+        names = list(self.data_manager.waypoint_coords)
+        coords = np.array(list(self.data_manager.waypoint_coords.values()), dtype=float)
+        xs, ys = self.geo_to_screen_array(coords[:, 0], coords[:, 1])
+        
         # Set up painter for waypoints
         painter.setPen(QPen(border_color, border_width))
         painter.setBrush(QBrush(color))
         
-        # Draw each waypoint
-        for name, coords in self.data_manager.waypoint_coords.items():
-            lat, lon = coords
-            screen_pos = self.geo_to_screen(lat, lon)
+        # Önce tüm işaretler, ardından etiketler tek font ayarıyla çizilir
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            painter.drawEllipse(QPointF(x, y), size, size)
+        self.frame_profiler.lap('waypoints', len(names))
             
-            # Draw the waypoint marker
-            painter.drawEllipse(screen_pos, size, size)
+        # Draw the waypoint labels if enabled
+        if show_labels:
+            painter.setPen(QPen(border_color, 1))
+            # Save current font to restore later
+            old_font = painter.font()
+            font = painter.font()
+            font.setPointSize(label_font_size)
+            painter.setFont(font)
             
-            # Draw the waypoint label if enabled
-            if show_labels:
-                painter.setPen(QPen(border_color, 1))
-                # Save current font to restore later
-                old_font = painter.font()
-                font = painter.font()
-                font.setPointSize(label_font_size)
-                painter.setFont(font)
-                
-                # Draw text with a small offset from the waypoint
-                text_pos = QPointF(screen_pos.x() + size + 2, screen_pos.y() - size)
-                painter.drawText(text_pos, name)
-                
-                # Restore the original font
-                painter.setFont(old_font)
+            # Draw text with a small offset from the waypoint
+            for name, x, y in zip(names, xs.tolist(), ys.tolist()):
+                painter.drawText(QPointF(x + size + 2, y - size), name)
+            
+            # Restore the original font
+            painter.setFont(old_font)
+            self.frame_profiler.lap('waypoint_labels', len(names))
                 
         # Restore painter state
         painter.setPen(QPen(Qt.black, 1))
 
+    def set_frame_profiler_hud(self, visible):
+        """Kare süresi HUD'unu göster/gizle"""
+        self.show_frame_profiler_hud = visible
+        self.update()
+
+    def draw_frame_profiler_hud(self, painter, max_layers=10):
+        """Katman bazlı kare süresi istatistiklerini sol üst köşede göster"""
+        lines = self.frame_profiler.summary_lines(max_layers)
+        painter.save()
+        font = painter.font()
+        font.setFamily("Monospace")
+        font.setStyleHint(font.TypeWriter)
+        font.setPointSize(8)
+        painter.setFont(font)
+        metrics = painter.fontMetrics()
+        line_height = metrics.height()
+        width = max(metrics.horizontalAdvance(line) for line in lines) + 12
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 170))
+        painter.drawRect(QRectF(8, 8, width, line_height * len(lines) + 8))
+        painter.setPen(QColor(230, 255, 230))
+        for row, line in enumerate(lines):
+            painter.drawText(QPointF(14, 12 + metrics.ascent() + row * line_height), line)
+        painter.restore()
+
     def set_data_manager(self, data_manager):
         """Set the data manager reference for accessing waypoints and other data"""
         self.data_manager = data_manager
@@ -3280,6 +3763,15 @@ class MapWidget(QWidget):
         self.drawn_elements['routes'] = []
         self.drawn_elements['trajectories'] = []
         self.drawn_elements['waypoints'] = []
+        self.playback_aircraft = None
+        self.conformance_overlay = None
+        self.hidden_trajectory_ids = set()
+        self._density_grid = None
+        self._density_sources = set()
+        self.route_infringements = {}
+        self.separation_conflicts = None
+        self.selected_conflict_index = None
+        self.sweep_preview = None
         
         # Reset route drawing state (if active)
         if self.route_drawing_mode:
@@ -3292,6 +3784,7 @@ class MapWidget(QWidget):
         self.route_rotate_mode = False
         self.route_being_moved = None
         self.route_being_rotated = None
+        self.route_transform = None
         
         # Update the display
         self.update()
@@ -3397,6 +3890,7 @@ class MapWidget(QWidget):
         self.selected_path_index = len(self.drawn_elements['routes']) - 1  # Yeni eklenen rotayı seç
         
         self.update()
+        self.drawingsChanged.emit()
         return True
     
     def delete_selected_routes(self):
@@ -3414,6 +3908,7 @@ class MapWidget(QWidget):
         self.selected_path_index = -1  # Hiçbir rota seçili değil
         
         self.update()
+        self.drawingsChanged.emit()
         return True
 
     def _check_and_update_waypoint_name(self, route_index, waypoint_index, lat, lon):
@@ -3501,7 +3996,7 @@ class MapWidget(QWidget):
                 break
         
         if not route_to_flip:
-            print(f"Error: Could not find route ID {route_id} to flip.")
+            tracing.error("Error: Could not find route ID %s to flip.", route_id)
             return
 
         points = route_to_flip.get('points', [])
@@ -3515,7 +4010,7 @@ class MapWidget(QWidget):
 
             num_main_points = num_main_segments + 1
             if len(points) < (num_main_points * 2) + 1:
-                print("Error: Not enough points in Double PMS route to flip.")
+                tracing.error("Error: Not enough points in Double PMS route to flip.")
                 return
 
             # Deconstruct the points list
@@ -3547,7 +4042,7 @@ class MapWidget(QWidget):
         if 'config' in route_to_flip:
             route_to_flip['config']['clockwise'] = not route_to_flip['config'].get('clockwise', True)
             
-        print(f"Route {route_id} flipped.")
+        tracing.debug("Route %s flipped.", route_id)
         self.update() # Redraw the map
 
     def _on_pointmerge_remove_requested(self, route_id):
@@ -3586,4 +4081,4 @@ class MapWidget(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Save Error", f"Failed to save JSON file: {e}")
         else:
-            print("Export JSON cancelled.")
\ No newline at end of file
+            tracing.debug("Export JSON cancelled.")
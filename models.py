@@ -4,6 +4,10 @@ import os
 import xml.etree.ElementTree as ET # Import XML parser
 import re # Import regex for route parsing
 import csv # Import csv module
+import datetime
+import numpy as np
+
+import tracing
 
 # Import the specific DMS parser function needed
 from utils import parse_dms as utils_parse_dms
@@ -49,6 +53,45 @@ class RouteExtension:
         self.points = points  # List of (lat, lon) tuples
         self.color = color
 
+@tracing.traced()
+def country_arrays_from_geojson(geo_data):
+    """Flatten GeoJSON rings into (name, lats, lons, connect) arrays; Qt-free, safe off the GUI thread"""
+    country_arrays = []
+    for feature in geo_data['features']:
+        geometry = feature.get('geometry') or {}
+        if geometry.get('type') == 'Polygon':
+            rings = geometry['coordinates']
+        elif geometry.get('type') == 'MultiPolygon':
+            rings = [ring for polygon in geometry['coordinates'] for ring in polygon]
+        else:
+            rings = []
+        ring_arrays = []
+        for ring in rings:
+            coords = np.asarray(ring, dtype=np.float64).reshape(-1, 2)[:, :2]
+            if len(coords) == 0:
+                continue
+            if not np.array_equal(coords[0], coords[-1]):
+                # closeSubpath yerine halka ilk noktaya bağlanarak kapatılır
+                coords = np.vstack([coords, coords[:1]])
+            ring_arrays.append(coords)
+        if ring_arrays:
+            coords = np.concatenate(ring_arrays)
+            # Her halkanın ilk noktası yeni alt yol başlatır (moveTo)
+            connect = np.ones(len(coords), dtype=np.int32)
+            connect[np.cumsum([0] + [len(ring) for ring in ring_arrays[:-1]])] = 0
+        else:
+            coords = np.empty((0, 2))
+            connect = np.empty(0, dtype=np.int32)
+        country_arrays.append((feature['properties']['name'], coords[:, 1].copy(), coords[:, 0].copy(), connect))
+    return country_arrays
+
+# iter_airspace_data parçaları ve her parçada dolan DataManager özellikleri
+AIRSPACE_PART_ATTRIBUTES = {
+    'areas': ('tma_boundary_points', 'restricted_areas'),
+    'procedures': ('waypoint_coords', 'procedures'),
+    'runways': ('runways',),
+}
+
 class DataManager:
     """Manages loading and saving of application data"""
     def __init__(self):
@@ -90,6 +133,9 @@ class DataManager:
             'grid_line_width': 0.5       # Grid çizgi kalınlığı
         }
         
+        # Açık proje deposu (ProjectStore); aynı dosyaya tekrar kayıtta yalnızca değişenler yazılır
+        self.project_store = None
+        
     # Çizimleri JSON dosyasına kaydetmek için yeni fonksiyon
     def save_drawings_to_json(self, filepath):
         """Save all drawn routes (trombone, point-merge, user routes) to a JSON file."""
@@ -108,6 +154,7 @@ class DataManager:
             return False, f"Çizimleri kaydetme hatası: {str(e)}"
     
     # Çizimleri JSON dosyasından yüklemek için yeni fonksiyon
+    @tracing.traced()
     def load_drawings_from_json(self, filepath):
         """Load drawn routes (trombone, point-merge, user routes) from a JSON file."""
         try:
@@ -125,12 +172,50 @@ class DataManager:
                 return False, "JSON dosyasında çizim bulunamadı"
         except Exception as e:
             return False, f"Çizimleri yükleme hatası: {str(e)}"
+
+    def _open_project_store(self, filepath):
+        """Open (or reuse) the ProjectStore for filepath"""
+        from project_store import ProjectStore
+        if self.project_store is not None and self.project_store.path == os.path.abspath(filepath):
+            return self.project_store
+        if self.project_store is not None:
+            self.project_store.close()
+            self.project_store = None
+        self.project_store = ProjectStore(filepath)
+        return self.project_store
+
+    @tracing.traced()
+    def save_drawings_to_store(self, filepath):
+        """Save routes and trajectories to a project store, writing only what changed since the last save."""
+        try:
+            store = self._open_project_store(filepath)
+            stats = store.save(self.drawn_elements['routes'], self.drawn_elements.get('trajectories', []))
+            tracing.info("Project store save: %s", stats)
+            return True, (f"Proje kaydedildi: {filepath} ({stats['routes_written']} rota, "
+                          f"{stats['trajectories_written']} trajectory yazıldı, {stats['seconds'] * 1000:.0f} ms)")
+        except Exception as e:
+            return False, f"Proje kaydetme hatası: {str(e)}"
+
+    @tracing.traced()
+    def load_drawings_from_store(self, filepath):
+        """Load routes (appended to drawn_elements) and trajectories from a project store.
+
+        Returns (success, message, trajectories).
+        """
+        try:
+            store = self._open_project_store(filepath)
+            loaded_routes = store.load_routes()
+            trajectories = store.load_trajectories()
+            self.drawn_elements['routes'].extend(loaded_routes)
+            return True, f"{len(loaded_routes)} çizim ve {len(trajectories)} trajectory yüklendi", trajectories
+        except Exception as e:
+            return False, f"Proje yükleme hatası: {str(e)}", []
         
     def find_airspace_folders(self):
         """Scan the data directory for folders starting with 'Airspace' (case-insensitive)"""
         airspace_folders = []
         if not os.path.isdir(self.data_dir):
-            print(f"Error: Data directory '{self.data_dir}' not found.")
+            tracing.error("Error: Data directory '%s' not found.", self.data_dir)
             return []
             
         try:
@@ -140,10 +225,11 @@ class DataManager:
                 if os.path.isdir(item_path) and item.lower().startswith("airspace"):
                     airspace_folders.append(item)
         except Exception as e:
-            print(f"Error scanning data directory '{self.data_dir}': {e}")
+            tracing.error("Error scanning data directory '%s': %s", self.data_dir, e)
             
         return airspace_folders
 
+    @tracing.traced()
     def _load_waypoints_xml(self, waypoints_xml_path):
         """Parse waypoints.xml (<Fixes><Point><Latitude/Longitude>) to get coordinates."""
         self.waypoint_coords = {}
@@ -153,7 +239,7 @@ class DataManager:
             tree = ET.parse(waypoints_xml_path)
             root = tree.getroot()
             if root.tag != 'Fixes':
-                print(f"Warning: Expected root tag 'Fixes' but found '{root.tag}' in {waypoints_xml_path}")
+                tracing.warning("Warning: Expected root tag 'Fixes' but found '%s' in %s", root.tag, waypoints_xml_path)
                 # Attempt to find Point elements anyway
 
             for point_elem in root.findall('.//Point'): # Find Point anywhere under root
@@ -173,30 +259,32 @@ class DataManager:
                             self.waypoint_coords[name] = (lat_decimal, lon_decimal)
                             waypoints_loaded += 1
                         else:
-                            print(f"Warning: Could not parse DMS coordinates for waypoint '{name}' ('{lat_str}', '{lon_str}') in {waypoints_xml_path}")
+                            tracing.warning("Warning: Could not parse DMS coordinates for waypoint '%s' ('%s', '%s') in %s", name, lat_str, lon_str, waypoints_xml_path)
                             waypoints_skipped += 1
                     except Exception as e:
-                        print(f"Warning: Error parsing coordinates for waypoint '{name}' ('{lat_str}', '{lon_str}') in {waypoints_xml_path}: {e}")
+                        tracing.warning("Warning: Error parsing coordinates for waypoint '%s' ('%s', '%s') in %s: %s", name, lat_str, lon_str, waypoints_xml_path, e)
                         waypoints_skipped += 1
                 else:
                     # Try to get name from attribute if elements are missing
                     if not name:
                         name = point_elem.get('name', '{Unknown}') 
-                    print(f"Warning: Missing data (Name/Lat/Lon element or text) for waypoint '{name}' in {waypoints_xml_path}")
+                    tracing.warning("Warning: Missing data (Name/Lat/Lon element or text) for waypoint '%s' in %s", name, waypoints_xml_path)
                     waypoints_skipped += 1
                    
-            print(f"Loaded {waypoints_loaded} waypoints from {waypoints_xml_path}. Skipped {waypoints_skipped}.")
+            tracing.info("Loaded %s waypoints from %s. Skipped %s.", waypoints_loaded, waypoints_xml_path, waypoints_skipped)
+            tracing.count('models.waypoints_loaded', waypoints_loaded)
+            tracing.count('models.waypoints_skipped', waypoints_skipped)
             if not self.waypoint_coords:
-                print(f"Warning: No valid waypoints loaded from {waypoints_xml_path}. Check file format and content.")
+                tracing.warning("Warning: No valid waypoints loaded from %s. Check file format and content.", waypoints_xml_path)
                 
         except ET.ParseError as e:
-            print(f"Error parsing {waypoints_xml_path}: {e}")
+            tracing.error("Error parsing %s: %s", waypoints_xml_path, e)
             raise ValueError(f"Invalid XML format in {waypoints_xml_path}")
         except FileNotFoundError:
-            print(f"Error: {waypoints_xml_path} not found.")
+            tracing.error("Error: %s not found.", waypoints_xml_path)
             raise
         except Exception as e:
-            print(f"Error loading {waypoints_xml_path}: {e}")
+            tracing.error("Error loading %s: %s", waypoints_xml_path, e)
             raise
             
     def _parse_route_string(self, route_string):
@@ -226,6 +314,7 @@ class DataManager:
         # waypoints = [x for x in waypoints if not (x in seen or seen.add(x))]
         return waypoints
 
+    @tracing.traced()
     def _load_airspace_xml(self, airspace_xml_path):
         """Parse STAR_SID.xml to load procedures (SIDs/STARs) using waypoint coordinates.
         Handles XML structure like <Procedures><SIDs><Runway Name="...""><SID Name="..."><Route><Waypoint Name="...">...</Route></SID></Runway></Procedures>
@@ -236,7 +325,7 @@ class DataManager:
         missing_waypoints_count = 0
 
         if not self.waypoint_coords:
-            print("Error: Cannot load procedures because waypoint coordinates were not loaded successfully.")
+            tracing.error("Error: Cannot load procedures because waypoint coordinates were not loaded successfully.")
             return # Cannot proceed without waypoint coordinates
 
         try:
@@ -244,14 +333,14 @@ class DataManager:
             root = tree.getroot()
 
             if root.tag != 'Procedures':
-                print(f"Warning: Expected root tag 'Procedures' but found '{root.tag}' in {airspace_xml_path}")
+                tracing.warning("Warning: Expected root tag 'Procedures' but found '%s' in %s", root.tag, airspace_xml_path)
                 # Attempt to find SIDs/STARs anyway
 
             # Process SIDs
             for runway_elem in root.findall('./SIDs/Runway'):
                 runway_name = runway_elem.get('Name')
                 if not runway_name:
-                    print(f"Warning: Skipping Runway element under SIDs without a Name in {airspace_xml_path}")
+                    tracing.warning("Warning: Skipping Runway element under SIDs without a Name in %s", airspace_xml_path)
                     continue
                 
                 for sid_elem in runway_elem.findall('./SID'):
@@ -261,7 +350,7 @@ class DataManager:
                     route_elem = sid_elem.find('Route')
 
                     if not (airport and proc_name and route_elem is not None):
-                        print(f"Warning: Incomplete data for a {proc_type} under Runway '{runway_name}' (Airport/Name/Route missing) in {airspace_xml_path}")
+                        tracing.warning("Warning: Incomplete data for a %s under Runway '%s' (Airport/Name/Route missing) in %s", proc_type, runway_name, airspace_xml_path)
                         procedures_skipped += 1
                         continue
 
@@ -271,7 +360,7 @@ class DataManager:
                     for wp_elem in route_elem.findall('Waypoint'):
                         wp_name = wp_elem.get('Name')
                         if not wp_name:
-                            print(f"Warning: Skipping Waypoint without a Name in {proc_type} '{proc_name}' (Runway {runway_name}) in {airspace_xml_path}")
+                            tracing.warning("Warning: Skipping Waypoint without a Name in %s '%s' (Runway %s) in %s", proc_type, proc_name, runway_name, airspace_xml_path)
                             continue # Skip this specific waypoint
                             
                         if wp_name in self.waypoint_coords:
@@ -288,7 +377,7 @@ class DataManager:
                             })
                             sequence += 1
                         else:
-                            print(f"Warning: Waypoint '{wp_name}' (from {proc_type} '{proc_name}', Runway {runway_name}) not found in loaded waypoints. Skipping procedure.")
+                            tracing.warning("Warning: Waypoint '%s' (from %s '%s', Runway %s) not found in loaded waypoints. Skipping procedure.", wp_name, proc_type, proc_name, runway_name)
                             valid_procedure = False
                             missing_waypoints_count += 1
                             break # Skip this whole procedure
@@ -299,14 +388,14 @@ class DataManager:
                     elif not valid_procedure:
                         procedures_skipped += 1 # Already counted missing waypoint
                     else: # Not valid and no waypoints (e.g., all waypoints skipped)
-                        print(f"Warning: No valid waypoints could be processed for {proc_type} '{proc_name}' (Runway {runway_name}) in {airspace_xml_path}")
+                        tracing.warning("Warning: No valid waypoints could be processed for %s '%s' (Runway %s) in %s", proc_type, proc_name, runway_name, airspace_xml_path)
                         procedures_skipped += 1
 
             # Process STARs (similar logic)
             for runway_elem in root.findall('./STARs/Runway'):
                 runway_name = runway_elem.get('Name')
                 if not runway_name:
-                    print(f"Warning: Skipping Runway element under STARs without a Name in {airspace_xml_path}")
+                    tracing.warning("Warning: Skipping Runway element under STARs without a Name in %s", airspace_xml_path)
                     continue
                 
                 for star_elem in runway_elem.findall('./STAR'):
@@ -316,7 +405,7 @@ class DataManager:
                     route_elem = star_elem.find('Route')
 
                     if not (airport and proc_name and route_elem is not None):
-                        print(f"Warning: Incomplete data for a {proc_type} under Runway '{runway_name}' (Airport/Name/Route missing) in {airspace_xml_path}")
+                        tracing.warning("Warning: Incomplete data for a %s under Runway '%s' (Airport/Name/Route missing) in %s", proc_type, runway_name, airspace_xml_path)
                         procedures_skipped += 1
                         continue
 
@@ -326,7 +415,7 @@ class DataManager:
                     for wp_elem in route_elem.findall('Waypoint'):
                         wp_name = wp_elem.get('Name')
                         if not wp_name:
-                            print(f"Warning: Skipping Waypoint without a Name in {proc_type} '{proc_name}' (Runway {runway_name}) in {airspace_xml_path}")
+                            tracing.warning("Warning: Skipping Waypoint without a Name in %s '%s' (Runway %s) in %s", proc_type, proc_name, runway_name, airspace_xml_path)
                             continue
                             
                         if wp_name in self.waypoint_coords:
@@ -343,7 +432,7 @@ class DataManager:
                             })
                             sequence += 1
                         else:
-                            print(f"Warning: Waypoint '{wp_name}' (from {proc_type} '{proc_name}', Runway {runway_name}) not found in loaded waypoints. Skipping procedure.")
+                            tracing.warning("Warning: Waypoint '%s' (from %s '%s', Runway %s) not found in loaded waypoints. Skipping procedure.", wp_name, proc_type, proc_name, runway_name)
                             valid_procedure = False
                             missing_waypoints_count += 1
                             break
@@ -354,23 +443,25 @@ class DataManager:
                     elif not valid_procedure:
                         procedures_skipped += 1
                     else:
-                        print(f"Warning: No valid waypoints could be processed for {proc_type} '{proc_name}' (Runway {runway_name}) in {airspace_xml_path}")
+                        tracing.warning("Warning: No valid waypoints could be processed for %s '%s' (Runway %s) in %s", proc_type, proc_name, runway_name, airspace_xml_path)
                         procedures_skipped += 1
 
-            print(f"Loaded {procedures_loaded} procedures from {airspace_xml_path}. Skipped {procedures_skipped} procedures.")
+            tracing.info("Loaded %s procedures from %s. Skipped %s procedures.", procedures_loaded, airspace_xml_path, procedures_skipped)
+            tracing.count('models.procedures_loaded', procedures_loaded)
+            tracing.count('models.procedures_skipped', procedures_skipped)
             if missing_waypoints_count > 0:
-                print(f"Warning: Skipped {procedures_skipped} procedures due to {missing_waypoints_count} missing waypoint definitions.")
+                tracing.warning("Warning: Skipped %s procedures due to %s missing waypoint definitions.", procedures_skipped, missing_waypoints_count)
             if procedures_loaded == 0 and procedures_skipped > 0:
-                print(f"Warning: No procedures were successfully loaded from {airspace_xml_path}. Check XML structure, waypoint names, and ensure waypoints.xml is loaded correctly.")
+                tracing.warning("Warning: No procedures were successfully loaded from %s. Check XML structure, waypoint names, and ensure waypoints.xml is loaded correctly.", airspace_xml_path)
 
         except ET.ParseError as e:
-            print(f"Error parsing {airspace_xml_path}: {e}")
+            tracing.error("Error parsing %s: %s", airspace_xml_path, e)
             raise ValueError(f"Invalid XML format in {airspace_xml_path}")
         except FileNotFoundError:
-            print(f"Error: {airspace_xml_path} not found.")
+            tracing.error("Error: %s not found.", airspace_xml_path)
             raise
         except Exception as e:
-            print(f"Error loading {airspace_xml_path}: {e}")
+            tracing.error("Error loading %s: %s", airspace_xml_path, e)
             import traceback
             traceback.print_exc()
             raise
@@ -385,6 +476,7 @@ class DataManager:
         
         return lat_dms_str, lon_dms_str
 
+    @tracing.traced()
     def _load_tma_boundary_xml(self, tma_xml_path):
         """Istanbul_TMA.xml dosyasından TMA sınır noktalarını yükle."""
         try:
@@ -412,12 +504,13 @@ class DataManager:
             if len(self.tma_boundary_points) > 1 and self.tma_boundary_points[0] != self.tma_boundary_points[-1]:
                 self.tma_boundary_points.append(self.tma_boundary_points[0])
             
-            print(f"TMA sınır noktaları başarıyla yüklendi. Toplam {len(self.tma_boundary_points)} nokta.")
+            tracing.info("TMA sınır noktaları başarıyla yüklendi. Toplam %s nokta.", len(self.tma_boundary_points))
             return True
         except Exception as e:
-            print(f"TMA sınırlarını yükleme hatası: {e}")
+            tracing.error("TMA sınırlarını yükleme hatası: %s", e)
             return False
 
+    @tracing.traced()
     def _load_ltd_pr_xml(self, ltd_pr_xml_path):
         """LTD_P_R.xml dosyasından yasaklı/kısıtlı sahaları yükle."""
         try:
@@ -470,14 +563,15 @@ class DataManager:
                         'original_names': [p[2] for p in sorted_points]
                     })
             
-            print(f"Yasaklı/kısıtlı sahalar başarıyla yüklendi. Toplam {len(self.restricted_areas)} saha.")
+            tracing.info("Yasaklı/kısıtlı sahalar başarıyla yüklendi. Toplam %s saha.", len(self.restricted_areas))
             return True
         except Exception as e:
-            print(f"Yasaklı/kısıtlı sahaları yükleme hatası: {e}")
+            tracing.error("Yasaklı/kısıtlı sahaları yükleme hatası: %s", e)
             import traceback
             traceback.print_exc()
             return False
 
+    @tracing.traced()
     def _load_runways_xml(self, runways_xml_path):
         """Parse Runways.xml (<Airport><Runway><Threshold>) to load runways and their types."""
         self.runways = []
@@ -491,13 +585,13 @@ class DataManager:
             root = tree.getroot()
 
             if root.tag != 'Airports':
-                print(f"Warning: Expected root tag 'Airports' but found '{root.tag}' in {runways_xml_path}")
+                tracing.warning("Warning: Expected root tag 'Airports' but found '%s' in %s", root.tag, runways_xml_path)
 
             # --- Step 1: Collect all Thresholds with their Types --- 
             for airport_elem in root.findall('.//Airport'):
                 airport_name = airport_elem.get('Name')
                 if not airport_name:
-                    print(f"Warning: Skipping Airport element without a Name in {runways_xml_path}")
+                    tracing.warning("Warning: Skipping Airport element without a Name in %s", runways_xml_path)
                     continue
                 
                 for runway_elem in airport_elem.findall('.//Runway'):
@@ -519,16 +613,16 @@ class DataManager:
                                 lon_decimal = utils_parse_dms(lon_str)
                                 if lat_decimal is not None and lon_decimal is not None:
                                     if thr_name in thresholds_by_airport[airport_name]:
-                                        print(f"Warning: Duplicate threshold name '{thr_name}' found for airport '{airport_name}'. Overwriting.")
+                                        tracing.warning("Warning: Duplicate threshold name '%s' found for airport '%s'. Overwriting.", thr_name, airport_name)
                                     thresholds_by_airport[airport_name][thr_name] = (lat_decimal, lon_decimal, thr_type) # Store type
                                 else:
-                                    print(f"Warning: Could not parse DMS for threshold '{thr_name}' at airport '{airport_name}'.")
+                                    tracing.warning("Warning: Could not parse DMS for threshold '%s' at airport '%s'.", thr_name, airport_name)
                                     runways_skipped += 1 
                             except Exception as e:
-                                print(f"Warning: Error parsing coordinates for threshold '{thr_name}' at airport '{airport_name}': {e}")
+                                tracing.warning("Warning: Error parsing coordinates for threshold '%s' at airport '%s': %s", thr_name, airport_name, e)
                                 runways_skipped += 1
                         else:
-                            print(f"Warning: Missing data (Name/Lat/Lon) for a threshold at airport '{airport_name}'.")
+                            tracing.warning("Warning: Missing data (Name/Lat/Lon) for a threshold at airport '%s'.", airport_name)
                             runways_skipped += 1
                            
             # --- Step 2: Pair Thresholds and Determine Runway Type --- 
@@ -596,26 +690,50 @@ class DataManager:
                             pass # Could not find a pair
                             
                     except (ValueError, AttributeError, IndexError) as e: # Handle errors in number parsing
-                        print(f"Warning: Could not determine opposing runway for '{thr1_name}' at '{airport_name}': {e}")
+                        tracing.warning("Warning: Could not determine opposing runway for '%s' at '%s': %s", thr1_name, airport_name, e)
                         runways_skipped += 1
                         processed_thresholds.add(thr1_name) # Mark as processed to avoid re-checking
                        
-            print(f"Processed thresholds and formed {runways_loaded} runways. Issues encountered with {runways_skipped} thresholds/pairs.")
+            tracing.info("Processed thresholds and formed %s runways. Issues encountered with %s thresholds/pairs.", runways_loaded, runways_skipped)
+            tracing.count('models.runways_loaded', runways_loaded)
             if runways_loaded == 0:
-                print(f"Warning: No valid runway pairs could be formed. Check threshold names and coordinates in {runways_xml_path}.")
+                tracing.warning("Warning: No valid runway pairs could be formed. Check threshold names and coordinates in %s.", runways_xml_path)
                     
         except FileNotFoundError:
-            print(f"Error: {runways_xml_path} not found.")
+            tracing.error("Error: %s not found.", runways_xml_path)
             raise # Re-raise critical error
         except Exception as e:
-            print(f"Error loading/processing {runways_xml_path}: {e}")
+            tracing.error("Error loading/processing %s: %s", runways_xml_path, e)
             import traceback
             traceback.print_exc()
             raise # Re-raise critical error
             
+    @tracing.traced()
     def load_airspace_data(self, selected_folder):
         """Load all airspace data (waypoints, procedures, runways) from selected folder."""
-        print(f"Loading airspace data using folder: {selected_folder}")
+        success = all([ok for _, ok in self.iter_airspace_data(selected_folder)])
+
+        if success:
+            tracing.info("Airspace data loading process completed.")
+        else:
+            tracing.warning("Airspace data loading process completed with errors.")
+            self.procedures.clear()
+            self.runways = []
+            self.waypoint_coords = {}
+            
+        return success
+
+    def iter_airspace_data(self, selected_folder):
+        """Load airspace data part by part, yielding (part, ok) after each part.
+
+        Parçalar AIRSPACE_PARTS sırasıyla yüklenir: önce çizimi hızlı olan
+        TMA ve yasaklı sahalar ('areas'), sonra waypoint'ler ve prosedürler
+        ('procedures'), en son pistler ('runways'). ok, kritik parçalarda
+        (waypoint'ler, pistler) başarısızlıkta False olur. Her parçanın
+        nesneleri (AIRSPACE_PART_ATTRIBUTES) yield'den sonra değiştirilmez;
+        arka plan yükleyicisi bunları doğrudan GUI thread'ine aktarabilir.
+        """
+        tracing.info("Loading airspace data using folder: %s", selected_folder)
         waypoints_file = os.path.join(selected_folder, "waypoints.xml")
         airspace_file = os.path.join(selected_folder, "STAR_SID.xml")
         runways_file = os.path.join(selected_folder, "Runways.xml") # Path to Runways.xml
@@ -628,16 +746,37 @@ class DataManager:
         self.waypoint_coords = {}
         self.tma_boundary_points = []
         self.restricted_areas = []
-        
+
+        # --- Load TMA Boundaries (Independent, non-critical) ---
+        try:
+            self._load_tma_boundary_xml(tma_file)
+            if not self.tma_boundary_points:
+                tracing.warning("Warning: No valid TMA boundary points were loaded.")
+                # TMA sınır noktaları kritik değil, bu yüzden success değerini etkilemez
+        except Exception as e:
+            tracing.error("ERROR: Failed to load TMA boundaries from %s. Error: %s", tma_file, e)
+            # TMA sınır noktaları kritik değil, bu yüzden success değerini etkilemez
+
+        # --- Load LTD_P_R Areas (Independent, non-critical) ---
+        try:
+            self._load_ltd_pr_xml(ltd_pr_file)
+            if not self.restricted_areas:
+                tracing.warning("Warning: No valid restricted areas were loaded.")
+                # LTD_P_R sahaları kritik değil, bu yüzden success değerini etkilemez
+        except Exception as e:
+            tracing.error("ERROR: Failed to load restricted areas from %s. Error: %s", ltd_pr_file, e)
+            # LTD_P_R sahaları kritik değil, bu yüzden success değerini etkilemez
+        yield 'areas', True
+
         success = True
         # --- Load Waypoints (Critical) ---
         try:
             self._load_waypoints_xml(waypoints_file)
             if not self.waypoint_coords: # Check if any waypoints were actually loaded
-                print("CRITICAL: No valid waypoints loaded. Procedures cannot be loaded.")
+                tracing.error("CRITICAL: No valid waypoints loaded. Procedures cannot be loaded.")
                 success = False
         except Exception as e:
-            print(f"CRITICAL: Failed to load waypoints from {waypoints_file}. Procedures cannot be loaded. Error: {e}")
+            tracing.error("CRITICAL: Failed to load waypoints from %s. Procedures cannot be loaded. Error: %s", waypoints_file, e)
             success = False
             
         # --- Load Procedures (Requires Waypoints) ---
@@ -645,79 +784,53 @@ class DataManager:
             try:
                 self._load_airspace_xml(airspace_file)
             except Exception as e:
-                print(f"ERROR: Failed to load procedures from {airspace_file}. Error: {e}")
+                tracing.error("ERROR: Failed to load procedures from %s. Error: %s", airspace_file, e)
                 # Decide if procedures are critical
                 # success = False
         else:
-            print("Skipping procedure loading due to waypoint loading failure.")
+            tracing.warning("Skipping procedure loading due to waypoint loading failure.")
+        yield 'procedures', success
             
         # --- Load Runways (Independent but potentially Critical) ---
+        success = True
         try:
             self._load_runways_xml(runways_file) # Call the new XML runway loader
             if not self.runways: # Check if any runways were loaded
-                print("Warning: No valid runways were loaded from XML.")
+                tracing.warning("Warning: No valid runways were loaded from XML.")
                 # Decide if this is critical
                 # success = False
         except Exception as e:
-            print(f"ERROR: Failed to load runways from {runways_file}. Error: {e}")
+            tracing.error("ERROR: Failed to load runways from %s. Error: %s", runways_file, e)
             success = False # Assume runways are critical
-            
-        # --- Load TMA Boundaries (Independent, non-critical) ---
-        try:
-            self._load_tma_boundary_xml(tma_file)
-            if not self.tma_boundary_points:
-                print("Warning: No valid TMA boundary points were loaded.")
-                # TMA sınır noktaları kritik değil, bu yüzden success değerini etkilemez
-        except Exception as e:
-            print(f"ERROR: Failed to load TMA boundaries from {tma_file}. Error: {e}")
-            # TMA sınır noktaları kritik değil, bu yüzden success değerini etkilemez
-
-        # --- Load LTD_P_R Areas (Independent, non-critical) ---
-        try:
-            self._load_ltd_pr_xml(ltd_pr_file)
-            if not self.restricted_areas:
-                print("Warning: No valid restricted areas were loaded.")
-                # LTD_P_R sahaları kritik değil, bu yüzden success değerini etkilemez
-        except Exception as e:
-            print(f"ERROR: Failed to load restricted areas from {ltd_pr_file}. Error: {e}")
-            # LTD_P_R sahaları kritik değil, bu yüzden success değerini etkilemez
-
-        if success:
-            print("Airspace data loading process completed.")
-        else:
-            print("Airspace data loading process completed with errors.")
-            self.procedures.clear()
-            self.runways = []
-            self.waypoint_coords = {}
-            
-        return success
+        yield 'runways', success
 
     # Remove original runway loader
     # def load_runway_data(self): ... 
 
     # Keep load_geo_data if map.geojson is independent of airspace folders
+    @tracing.traced()
     def load_geo_data(self, geojson_path):
         """Load GeoJSON data for map from the specified path."""
         try:
             with open(geojson_path, 'r', encoding='utf-8') as f:
                 geo_data = json.load(f)
-            print(f"GeoJSON data loaded successfully from {geojson_path}.")
+            tracing.info("GeoJSON data loaded successfully from %s.", geojson_path)
             return geo_data
         except FileNotFoundError:
-            print(f"Error: GeoJSON file not found at {geojson_path}")
+            tracing.error("Error: GeoJSON file not found at %s", geojson_path)
             return None # Return None on error
         except json.JSONDecodeError:
-            print(f"Error: Invalid JSON in {geojson_path}")
+            tracing.error("Error: Invalid JSON in %s", geojson_path)
             return None # Return None on error
         except Exception as e:
-            print(f"Error loading {geojson_path}: {str(e)}")
+            tracing.error("Error loading %s: %s", geojson_path, e)
             return None # Return None on error
 
     def find_geojson_files(self):
         """Scan the data directory for files ending with .geojson."""
         geojson_files = []
         if not os.path.isdir(self.data_dir):
-            print(f"Error: Data directory '{self.data_dir}' not found.")
+            tracing.error("Error: Data directory '%s' not found.", self.data_dir)
             return []
             
         try:
@@ -727,7 +840,7 @@ class DataManager:
                 if os.path.isfile(item_path) and item.lower().endswith(".geojson"):
                     geojson_files.append(item)
         except Exception as e:
-            print(f"Error scanning data directory '{self.data_dir}' for GeoJSON files: {e}")
+            tracing.error("Error scanning data directory '%s' for GeoJSON files: %s", self.data_dir, e)
             
         return geojson_files 
 
@@ -737,9 +850,25 @@ class DataManager:
         Assumes format: Timestamp,UTC,Callsign,Position,Altitude,Speed,Direction
         where Position is "lat,lon".
 
-        Returns trajectory_id (filename) and a list of (lat, lon) tuples.
+        Returns trajectory_id (filename) and a list of (lat, lon, alt) tuples.
+        Zaman bilgisi için bkz. parse_csv_trajectory_with_times.
+        """
+        trajectory_id, points, _times = self.parse_csv_trajectory_with_times(filepath)
+        return trajectory_id, points
+
+    @tracing.traced()
+    def parse_csv_trajectory_with_times(self, filepath):
+        """Parse a CSV trajectory keeping the time of every point.
+
+        Zaman önce Timestamp (Unix epoch saniye) sütunundan, yoksa UTC
+        (ISO 8601) sütunundan okunur.
+
+        Returns trajectory_id, a list of (lat, lon, alt) tuples and a parallel
+        list of epoch seconds (NaN where a row has no usable time), or None
+        instead of the time list if the file has no time column at all.
         """
         points = []
+        times = []
         trajectory_id = os.path.splitext(os.path.basename(filepath))[0]
         callsign = None
         
@@ -748,8 +877,9 @@ class DataManager:
                 reader = csv.DictReader(csvfile)
                 # Check header implicitly by trying to access fields
                 if not all(h in reader.fieldnames for h in ['Position', 'Callsign']):
-                    print(f"Warning: Missing required columns ('Position', 'Callsign') in {filepath}")
-                    return trajectory_id, None
+                    tracing.warning("Warning: Missing required columns ('Position', 'Callsign') in %s", filepath)
+                    return trajectory_id, None, None
+                has_times = 'Timestamp' in reader.fieldnames or 'UTC' in reader.fieldnames
                     
                 for i, row in enumerate(reader):
                     if i == 0: # Get callsign from first row
@@ -768,147 +898,182 @@ class DataManager:
                             except ValueError:
                                 alt = 0.0 # Default altitude if conversion fails
                             points.append((lat, lon, alt)) # Store altitude
+                            if has_times:
+                                times.append(self._parse_csv_trajectory_time(row))
                         except ValueError:
-                            print(f"Warning: Could not parse lat/lon from '{position_str}' in row {i+2} of {filepath}")
+                            tracing.warning("Warning: Could not parse lat/lon from '%s' in row %s of %s", position_str, i+2, filepath)
                             continue # Skip this row
             
             if not points:
-                print(f"Warning: No valid trajectory points found in {filepath}")
-                return trajectory_id, None
+                tracing.warning("Warning: No valid trajectory points found in %s", filepath)
+                return trajectory_id, None, None
                 
-            return trajectory_id, points
+            return trajectory_id, points, (times if has_times else None)
         except FileNotFoundError:
-            print(f"Error: CSV file not found: {filepath}")
-            return trajectory_id, None
+            tracing.error("Error: CSV file not found: %s", filepath)
+            return trajectory_id, None, None
         except Exception as e:
-            print(f"Error parsing CSV file {filepath}: {e}")
+            tracing.error("Error parsing CSV file %s: %s", filepath, e)
             import traceback
             traceback.print_exc()
-            return trajectory_id, None
+            return trajectory_id, None, None
 
+    def _parse_csv_trajectory_time(self, row):
+        """Return the epoch seconds of a trajectory CSV row, or NaN"""
+        timestamp_str = (row.get('Timestamp') or '').strip()
+        if timestamp_str:
+            try:
+                return float(timestamp_str)
+            except ValueError:
+                pass
+        utc_str = (row.get('UTC') or '').strip()
+        if utc_str:
+            try:
+                parsed = datetime.datetime.fromisoformat(utc_str.replace('Z', '+00:00'))
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+                return parsed.timestamp()
+            except ValueError:
+                pass
+        return float('nan')
+
+    @tracing.traced()
     def parse_kml_trajectory(self, filepath):
-        """Parse a KML file for the first LineString coordinates.
+        """Parse the 'Trail' folder of a KML file into a trajectory array.
 
-        Returns trajectory_id (filename) and a list of (lat, lon) tuples.
+        The file is streamed with iterparse: coordinates are converted to
+        arrays as each Placemark closes and parsing stops once the Trail
+        folder ends, so the whole tree is never held in memory.
+
+        Returns trajectory_id (filename) and a float64 array of shape (N, 3)
+        holding lat, lon, alt, or None if nothing could be parsed.
         """
-        points = []
         trajectory_id = os.path.splitext(os.path.basename(filepath))[0]
         
         try:
-            # KML uses namespaces, we need to handle them
-            # Common namespace (may need adjustment if file uses different prefix)
-            namespaces = {'kml': 'http://www.opengis.net/kml/2.2'}
+            context = ET.iterparse(filepath, events=('start', 'end'))
             
-            tree = ET.parse(filepath)
-            root = tree.getroot()
+            # Namespace'i kök elemandan bir kez çöz, sonra sadece tam tag karşılaştırması yap
+            _, root = next(context)
+            ns = root.tag[:root.tag.index('}') + 1] if root.tag.startswith('{') else ''
+            folder_tag = ns + 'Folder'
+            name_tag = ns + 'name'
+            placemark_tag = ns + 'Placemark'
+            linestring_tag = ns + 'LineString'
+            coordinates_tag = ns + 'coordinates'
+            
+            tag_stack = [root.tag]
+            trail_depth = None        # Trail klasörünün tag_stack derinliği
+            trail_found = False
+            in_placemark = False
+            placemark_has_coords = False
+            coord_chunks = []         # Her Placemark için ayrı numpy dizisi
             
-            # Find the Folder named 'Trail'
-            trail_folder = None
-            # Try with namespace first
-            for folder in root.findall('.//kml:Folder', namespaces):
-                name_elem = folder.find('kml:name', namespaces)
-                if name_elem is not None and name_elem.text and 'trail' in name_elem.text.lower():
-                    trail_folder = folder
+            for event, elem in context:
+                if event == 'start':
+                    tag_stack.append(elem.tag)
+                    if elem.tag == placemark_tag and trail_depth is not None:
+                        in_placemark = True
+                        placemark_has_coords = False
+                    continue
+                
+                # 'end' olayı
+                tag = tag_stack.pop()
+                depth = len(tag_stack)
+                
+                if tag == name_tag and not trail_found and tag_stack[-1] == folder_tag:
+                    # Klasör adı: ilk 'trail' klasörünü işaretle
+                    if elem.text and 'trail' in elem.text.lower():
+                        trail_found = True
+                        trail_depth = depth - 1
+                elif tag == coordinates_tag and in_placemark:
+                    # Placemark başına ilk LineString koordinatlarını kullan (MultiGeometry dahil)
+                    if not placemark_has_coords and tag_stack[-1] == linestring_tag and elem.text:
+                        chunk = self._parse_kml_coordinates(elem.text, filepath)
+                        if chunk is not None and len(chunk):
+                            coord_chunks.append(chunk)
+                            placemark_has_coords = True
+                elif tag == placemark_tag:
+                    in_placemark = False
+                    elem.clear()
+                elif tag == folder_tag and trail_depth is not None and depth == trail_depth:
+                    # Trail klasörü kapandı, dosyanın geri kalanını okumaya gerek yok
                     break
-            # If not found, try without namespace
-            if trail_folder is None:
-                for folder in root.findall('.//Folder'):
-                    name_elem = folder.find('name')
-                    if name_elem is not None and name_elem.text and 'trail' in name_elem.text.lower():
-                        trail_folder = folder
-                        break
             
-            if trail_folder is None:
-                print(f"Warning: Could not find a Folder named 'Trail' in {filepath}")
+            if not trail_found:
+                tracing.warning("Warning: Could not find a Folder named 'Trail' in %s", filepath)
                 return trajectory_id, None
-
-            # Find ALL Placemarks within the Trail folder
-            placemarks = trail_folder.findall('.//kml:Placemark', namespaces) 
-            if not placemarks:
-                placemarks = trail_folder.findall('.//Placemark') # Try without namespace
             
-            if not placemarks:
-                print(f"Warning: No Placemarks found within the 'Trail' folder in {filepath}")
+            if not coord_chunks:
+                tracing.warning("Warning: No coordinate text found in any Placemark within the 'Trail' folder of %s", filepath)
                 return trajectory_id, None
-
-            # Iterate through each placemark and extract coordinates
-            all_coords_text = ""
-            for placemark in placemarks:
-                # Look for coordinates within MultiGeometry/LineString or directly in LineString
-                coord_paths = [
-                    'kml:MultiGeometry/kml:LineString/kml:coordinates', 
-                    'kml:LineString/kml:coordinates'
-                ]
-                coordinates_elem = None
-                for path in coord_paths:
-                    coordinates_elem = placemark.find(path, namespaces)
-                    if coordinates_elem is not None and coordinates_elem.text:
-                        break # Found coordinates with namespace
-                
-                # If not found with namespace, try without
-                if coordinates_elem is None or not coordinates_elem.text:
-                    coord_paths_no_ns = [
-                        'MultiGeometry/LineString/coordinates',
-                        'LineString/coordinates'
-                    ]
-                    for path in coord_paths_no_ns:
-                        coordinates_elem = placemark.find(path)
-                        if coordinates_elem is not None and coordinates_elem.text:
-                            break # Found coordinates without namespace
-
-                if coordinates_elem is not None and coordinates_elem.text:
-                    # Append coordinates text, ensuring space separation
-                    all_coords_text += coordinates_elem.text.strip() + " " 
-                # else: # Optional: Warn if a placemark doesn't have coordinates?
-                #     print(f"Warning: No coordinates found in a Placemark within {filepath}")
             
-            # Process the concatenated coordinates string
-            if not all_coords_text:
-                print(f"Warning: No coordinate text found in any Placemark within the 'Trail' folder of {filepath}")
-                return trajectory_id, None
-
-            coord_tuples = all_coords_text.strip().split()
+            points = np.concatenate(coord_chunks) if len(coord_chunks) > 1 else coord_chunks[0]
             
-            last_point = None # To handle potential duplicates between segments
-            for coord_str in coord_tuples:
-                try:
-                    lon_str, lat_str, *alt_parts = coord_str.split(',') # Capture optional altitude
-                    lat = float(lat_str.strip())
-                    lon = float(lon_str.strip())
-                    alt = 0.0 # Default altitude
-                    if alt_parts:
-                        try:
-                            alt = float(alt_parts[0].strip())
-                        except ValueError:
-                            pass # Keep default alt if conversion fails
-                            
-                    current_point = (lat, lon, alt) # Store altitude
-                    # Avoid adding duplicate points that often connect segments
-                    if current_point != last_point:
-                        points.append(current_point)
-                        last_point = current_point
-                except ValueError:
-                    print(f"Warning: Could not parse lon/lat from '{coord_str}' in {filepath}")
-                    continue # Skip this tuple
+            # Segmentleri birleştiren ardışık tekrar noktalarını at
+            keep = np.ones(len(points), dtype=bool)
+            keep[1:] = np.any(points[1:] != points[:-1], axis=1)
+            points = points[keep]
             
-            if not points:
-                print(f"Warning: No valid trajectory points found in KML {filepath}")
+            if not len(points):
+                tracing.warning("Warning: No valid trajectory points found in KML %s", filepath)
                 return trajectory_id, None
 
             return trajectory_id, points
         except FileNotFoundError:
-            print(f"Error: KML file not found: {filepath}")
+            tracing.error("Error: KML file not found: %s", filepath)
             return trajectory_id, None
         except ET.ParseError as e:
-            print(f"Error parsing KML file {filepath}: {e}")
+            tracing.error("Error parsing KML file %s: %s", filepath, e)
             return trajectory_id, None
         except Exception as e:
-            print(f"Error processing KML file {filepath}: {e}")
+            tracing.error("Error processing KML file %s: %s", filepath, e)
             import traceback
             traceback.print_exc()
             return trajectory_id, None
 
+    def _parse_kml_coordinates(self, text, filepath):
+        """Convert a KML coordinates block ("lon,lat[,alt] ...") to an (N, 3) lat/lon/alt array."""
+        tokens = text.split()
+        if not tokens:
+            return None
+        
+        # Hızlı yol: tüm tuple'lar aynı boyutta ise metni tek seferde sayıya çevir
+        dims = tokens[0].count(',') + 1
+        if dims in (2, 3) and text.count(',') == len(tokens) * (dims - 1):
+            try:
+                values = np.fromstring(text.replace(',', ' '), dtype=np.float64, sep=' ')
+            except ValueError:
+                values = None  # Sayı olmayan değer; hatalı tuple'lar aşağıda tek tek atlanır
+            if values is not None and values.size == len(tokens) * dims:
+                values = values.reshape(-1, dims)
+                result = np.zeros((len(values), 3), dtype=np.float64)
+                result[:, 0] = values[:, 1]
+                result[:, 1] = values[:, 0]
+                if dims == 3:
+                    result[:, 2] = values[:, 2]
+                return result
+        
+        # Yavaş yol: karışık veya hatalı tuple'ları tek tek ayrıştır
+        rows = []
+        for coord_str in tokens:
+            try:
+                lon_str, lat_str, *alt_parts = coord_str.split(',')
+                lat = float(lat_str)
+                lon = float(lon_str)
+                alt = 0.0 # Default altitude
+                if alt_parts:
+                    try:
+                        alt = float(alt_parts[0])
+                    except ValueError:
+                        pass # Keep default alt if conversion fails
+                rows.append((lat, lon, alt))
+            except ValueError:
+                tracing.warning("Warning: Could not parse lon/lat from '%s' in %s", coord_str, filepath)
+        return np.array(rows, dtype=np.float64).reshape(-1, 3)
+
     # CSV dosyasından çizilen rotaları yükleme fonksiyonu
+    @tracing.traced()
     def load_route_from_csv(self, filepath):
         """Load a route from CSV file format.
         Supports standard user routes, trombone, and point merge route types.
@@ -1032,7 +1197,7 @@ class DataManager:
                             if len(parts) > 1:
                                 try:
                                     trombone_config['threshold_distance'] = float(parts[1].strip())
-                                    print(f"CSV'den trombone threshold distance: {trombone_config['threshold_distance']}")
+                                    tracing.debug("CSV'den trombone threshold distance: %s", trombone_config['threshold_distance'])
                                 except (ValueError, IndexError):
                                     pass
                                     
@@ -1042,7 +1207,7 @@ class DataManager:
                             if len(parts) > 1:
                                 try:
                                     trombone_config['base_angle'] = float(parts[1].strip())
-                                    print(f"CSV'den trombone base angle: {trombone_config['base_angle']}")
+                                    tracing.debug("CSV'den trombone base angle: %s", trombone_config['base_angle'])
                                 except (ValueError, IndexError):
                                     pass
                                     
@@ -1052,7 +1217,7 @@ class DataManager:
                             if len(parts) > 1:
                                 try:
                                     trombone_config['base_distance'] = float(parts[1].strip())
-                                    print(f"CSV'den trombone base distance: {trombone_config['base_distance']}")
+                                    tracing.debug("CSV'den trombone base distance: %s", trombone_config['base_distance'])
                                 except (ValueError, IndexError):
                                     pass
                                     
@@ -1062,7 +1227,7 @@ class DataManager:
                             if len(parts) > 1:
                                 try:
                                     trombone_config['extension_length'] = float(parts[1].strip())
-                                    print(f"CSV'den trombone extension length: {trombone_config['extension_length']}")
+                                    tracing.debug("CSV'den trombone extension length: %s", trombone_config['extension_length'])
                                 except (ValueError, IndexError):
                                     pass
 
@@ -1094,7 +1259,7 @@ class DataManager:
                                 if lat is not None and lon is not None:
                                     points.append((lat, lon))
                             except (ValueError, IndexError) as e:
-                                print(f"Hata: Satır işlenirken hata oluştu: {row}, Detay: {str(e)}")
+                                tracing.error("Hata: Satır işlenirken hata oluştu: %s, Detay: %s", row, e)
                                 continue
                 else:
                     # Standart formatları kontrol et (geleneksel CSV)
@@ -1114,7 +1279,7 @@ class DataManager:
                                     lon = float(row[2])
                                     points.append((lat, lon))
                                 except (ValueError, IndexError):
-                                    print(f"Hata: Geçersiz satır: {row}")
+                                    tracing.error("Hata: Geçersiz satır: %s", row)
                                     continue
                     else:
                         # Alternatif format kontrolü - başlıkları arayalım
@@ -1134,7 +1299,7 @@ class DataManager:
                                         lon = float(row[lon_index])
                                         points.append((lat, lon))
                                     except (ValueError, IndexError):
-                                        print(f"Hata: Geçersiz satır: {row}")
+                                        tracing.error("Hata: Geçersiz satır: %s", row)
                                         continue
                         else:
                             return False, "CSV dosyasında geçerli Lat/Lon sütunları bulunamadı.", None
@@ -1252,8 +1417,8 @@ class DataManager:
                         'end_lon': 2*point_c[1] - point_b[1]    # B->C yönü extrapolasyonu
                     }
                     
-                    print(f"CSV yükleme: Pist eşik koordinatları hesaplandı - {runway_lat:.6f}, {runway_lon:.6f}")
-                    print(f"  Bu koordinatlar threshold_distance={threshold_distance} değiştiğinde SABIT kalacak")
+                    tracing.debug("CSV yükleme: Pist eşik koordinatları hesaplandı - %.6f, %.6f", runway_lat, runway_lon)
+                    tracing.debug("  Bu koordinatlar threshold_distance=%s değiştiğinde SABIT kalacak", threshold_distance)
                 
                 # Trombone parametrelerini varsayılan değerlerle ekle veya eksik olanları doldur
                 # Bu parametreler, CSV dosyasındaki değerlerden elde edilmiş veya
@@ -1275,30 +1440,30 @@ class DataManager:
                     if 'base_distance' not in trombone_config:
                         base_distance = calculate_distance(point_a[0], point_a[1], point_b[0], point_b[1])
                         trombone_config['base_distance'] = round(base_distance, 1)
-                        print(f"CSV yüklemesi: Hesaplanan base_distance = {trombone_config['base_distance']} NM")
+                        tracing.debug("CSV yüklemesi: Hesaplanan base_distance = %s NM", trombone_config['base_distance'])
                     
                     # 2. Extension length: B ve C noktaları arasındaki mesafe
                     if 'extension_length' not in trombone_config:
                         extension_length = calculate_distance(point_b[0], point_b[1], point_c[0], point_c[1])
                         trombone_config['extension_length'] = round(extension_length, 1)
-                        print(f"CSV yüklemesi: Hesaplanan extension_length = {trombone_config['extension_length']} NM")
+                        tracing.debug("CSV yüklemesi: Hesaplanan extension_length = %s NM", trombone_config['extension_length'])
                 
                 # Hala eksik değerler varsa varsayılanları kullan
                 if 'threshold_distance' not in trombone_config:
                     trombone_config['threshold_distance'] = 3.0
-                    print("CSV yüklemesi: Varsayılan threshold_distance = 3.0 NM kullanılıyor")
+                    tracing.debug("CSV yüklemesi: Varsayılan threshold_distance = 3.0 NM kullanılıyor")
                     
                 if 'base_angle' not in trombone_config:
                     trombone_config['base_angle'] = 90.0
-                    print("CSV yüklemesi: Varsayılan base_angle = 90.0° kullanılıyor")
+                    tracing.debug("CSV yüklemesi: Varsayılan base_angle = 90.0° kullanılıyor")
                     
                 if 'base_distance' not in trombone_config:
                     trombone_config['base_distance'] = 5.0
-                    print("CSV yüklemesi: Varsayılan base_distance = 5.0 NM kullanılıyor")
+                    tracing.debug("CSV yüklemesi: Varsayılan base_distance = 5.0 NM kullanılıyor")
                     
                 if 'extension_length' not in trombone_config:
                     trombone_config['extension_length'] = 3.0
-                    print("CSV yüklemesi: Varsayılan extension_length = 3.0 NM kullanılıyor")
+                    tracing.debug("CSV yüklemesi: Varsayılan extension_length = 3.0 NM kullanılıyor")
                 
                 # Config'i rotaya ekle
                 new_route['config'] = trombone_config
@@ -7,7 +7,9 @@ from PyQt5.QtGui import QDoubleValidator, QIntValidator
 from PyQt5.QtCore import Qt, pyqtSignal
 import re # Import re for threshold extraction
 
-from pointmerge import calculate_point_merge_waypoints, parse_dms, DMS, dms_to_decimal, decimal_to_dms
+from procedure_geometry import (calculate_point_merge_waypoints, calculate_trombone_waypoints, parse_dms, DMS,
+                                dms_to_decimal, decimal_to_dms)
+from procedure_geometry import calculate_path_extension_waypoints as core_calculate_path_extension_waypoints
 
 class PathExtensionDialog(QDialog):
     """Dialog for configuring a path extension from a runway"""
@@ -1335,13 +1337,9 @@ class PathExtensionDialog(QDialog):
 
 
 def calculate_path_extension_waypoints(runway, config):
-    """Calculate waypoints for path extension based on pattern type"""
-    pattern_type = config.get('pattern_type', 'trombone')
+    """Calculate waypoints for path extension; shows a message box on error"""
     try:
-        if pattern_type == 'pointmerge':
-            return calculate_point_merge_waypoints(runway, config)
-        else:
-            return calculate_trombone_waypoints(runway, config)
+        return core_calculate_path_extension_waypoints(runway, config)
     except Exception as e:
         print(f"Error in calculate_path_extension_waypoints: {str(e)}")
         import traceback
@@ -1349,158 +1347,3 @@ def calculate_path_extension_waypoints(runway, config):
         QMessageBox.critical(None, "Error Generating Path", 
                             f"Failed to generate path: {str(e)}")
         return []
-
-
-def calculate_trombone_waypoints(runway, config):
-    """Calculate waypoints for trombone pattern. Extension always points towards threshold."""
-    # Get APPROACH threshold coordinates and centerline direction
-    # 'runway' here is the approach_data dict created in get_configuration
-    
-    # Import math module at function level to ensure it's always available
-    import math
-    from utils import calculate_point_at_distance_and_bearing
-    
-    # Hata önleme ve eksik değerlerin kontrolü
-    if not runway:
-        print("Error: Runway data is missing or empty")
-        return []
-    
-    # Eksik 'start_lat' veya 'start_lon' için kontrol
-    if 'start_lat' not in runway or 'start_lon' not in runway:
-        # Threshold değerleri varsa onları kullan
-        if 'threshold_lat' in runway and 'threshold_lon' in runway:
-            runway['start_lat'] = runway['threshold_lat'] 
-            runway['start_lon'] = runway['threshold_lon']
-        else:
-            print("Error: Required coordinate data missing in runway")
-            return []
-    
-    # Eksik 'end_lat' veya 'end_lon' için kontrol - bunlar hesaplanacak açı için gerekli
-    if 'end_lat' not in runway or 'end_lon' not in runway:
-        # Varsayılan bir yön belirlememiz gerekiyor - kuzeye doğru
-        # Eğer end noktası yoksa, threshold'dan 1 NM kuzeye bir nokta belirle
-        north_bearing = 0  # Kuzeye doğru
-        runway['end_lat'], runway['end_lon'] = calculate_point_at_distance_and_bearing(
-            runway['start_lat'], runway['start_lon'], 1.0, north_bearing)
-        print(f"Warning: Created default end coordinates for runway calculation")
-    
-    # Değerleri al
-    start_lat, start_lon = runway['start_lat'], runway['start_lon']
-    end_lat, end_lon = runway['end_lat'], runway['end_lon'] 
-    
-    # --- DEBUG --- 
-    print(f"\n[DEBUG] Trombone Calc Input:")
-    print(f"  Approach ID: {runway.get('id', 'N/A')}")
-    print(f"  Start Coords (Threshold): Lat={start_lat}, Lon={start_lon}")
-    print(f"  End Coords (Opposite):  Lat={end_lat}, Lon={end_lon}")
-    # --- END DEBUG ---
-    
-    # Calculate runway heading (direction AWAY from the start threshold)
-    try:
-        # Koordinatların geçerli sayısal değerler olduğunu kontrol et
-        if not (isinstance(start_lat, (int, float)) and isinstance(start_lon, (int, float)) and 
-                isinstance(end_lat, (int, float)) and isinstance(end_lon, (int, float))):
-            print(f"Error: Invalid coordinate values: start_lat={start_lat}, start_lon={start_lon}, end_lat={end_lat}, end_lon={end_lon}")
-            # Varsayılan değerlerle devam et - 0 derece (kuzey)
-            runway_heading_rad = 0
-            runway_heading_deg = 0
-        else:
-            # Aynı nokta olma durumunda (end ve start aynı) kontrolü yap
-            if abs(end_lat - start_lat) < 0.00001 and abs(end_lon - start_lon) < 0.00001:
-                print("Warning: Start and end points are too close, using default north heading")
-                runway_heading_rad = 0  # Kuzey (0 derece)
-                runway_heading_deg = 0
-            else:
-                runway_heading_rad = math.atan2(end_lon - start_lon, end_lat - start_lat)
-                runway_heading_deg = (math.degrees(runway_heading_rad) + 360) % 360 # Normalize to 0-360
-    except Exception as e:
-        print(f"Error calculating runway heading: {e}")
-        runway_heading_rad = 0
-        runway_heading_deg = 0
-    
-    # Calculate the APPROACH heading (direction TOWARDS the start threshold)
-    approach_heading_rad = runway_heading_rad + math.pi
-    approach_heading_deg = (math.degrees(approach_heading_rad) + 360) % 360
-    
-    # --- DEBUG --- 
-    print(f"  Calculated Runway Heading (Away from Threshold): {runway_heading_deg:.2f} degrees")
-    print(f"  Calculated Approach Heading (Towards Threshold): {approach_heading_deg:.2f} degrees")
-    # --- END DEBUG ---
-    
-    nm_to_deg = 1 / 60.0  # Approximate conversion: 1 NM ≈ 1/60 degree
-
-    # Point 'A': The point on the centerline extended, 'threshold_distance' NM OUT along the APPROACH path
-    # 'threshold_distance' parametresi: Pist eşiğinden A noktasına olan mesafe (NM olarak)
-    # 
-    # Bu parametre diğerlerinden farklıdır, değiştiğinde A noktasının konumu değişmelidir.
-    # - threshold_distance arttığında: A noktası pistten daha uzaklaşır
-    # - threshold_distance azaldığında: A noktası piste yaklaşır
-    # - Diğer parametreler değişirse: A noktası aynı kalır, sadece B ve C noktaları değişir
-    #
-    # Pist threshold'dan, threshold_distance kadar uzaklıktaki noktayı hesapla
-    from utils import calculate_point_at_distance_and_bearing
-    approach_heading_deg = math.degrees(approach_heading_rad)
-    
-    print(f"  Calculating point A at threshold_distance={config['threshold_distance']} NM from runway threshold")
-    print(f"  Using runway coordinates: lat={start_lat}, lon={start_lon}")
-    point_a_lat, point_a_lon = calculate_point_at_distance_and_bearing(
-        start_lat, start_lon, 
-        config['threshold_distance'],
-        approach_heading_deg
-    )
-    
-    # Point 'B': Base leg turn point
-    # Base angle is relative to the APPROACH centerline
-    # Subtract angle for clockwise interpretation (90 deg = right turn)
-    base_leg_angle_rel_north_rad = approach_heading_rad - math.radians(config['base_angle'])
-    
-    # Daha doğru hesaplama için basit nm_to_deg çarpımı yerine büyük daire hesaplaması kullanıyoruz
-    from utils import calculate_point_at_distance_and_bearing
-    point_b_lat, point_b_lon = calculate_point_at_distance_and_bearing(
-        point_a_lat, point_a_lon, 
-        config['base_distance'],
-        math.degrees(base_leg_angle_rel_north_rad)
-    )
-    
-    # Point 'C': Extension leg end point
-    # Extension should be parallel to the approach centerline, but point AWAY from the threshold
-    # This direction is the same as the runway heading (away from threshold).
-    extension_leg_angle_rad = runway_heading_rad
-    
-    # Check if the extension direction should be inverted (flipped vertically)
-    if config.get('extension_inverted', False):
-        extension_leg_angle_rad += math.pi # Add 180 degrees
-        
-    extension_leg_angle_deg = math.degrees(extension_leg_angle_rad)
-
-    # Daha doğru hesaplama için büyük daire hesaplaması kullanıyoruz
-    from utils import calculate_point_at_distance_and_bearing
-    point_c_lat, point_c_lon = calculate_point_at_distance_and_bearing(
-        point_b_lat, point_b_lon, 
-        config['extension_length'],
-        extension_leg_angle_deg
-    )
-    
-    # Waypoints are A -> B -> C (logical order from threshold to extension)
-    # Format: List of dictionaries {'lat': ..., 'lon': ..., 'name': ...}
-    waypoints_coords = [
-        (point_a_lat, point_a_lon),  # Point A - Threshold point (First point)
-        (point_b_lat, point_b_lon),  # Point B - Base leg turn point (Middle point)
-        (point_c_lat, point_c_lon)   # Point C - Extension end point (Last point)
-    ]
-    
-    # Generate names for the waypoints
-    approach_id_simple = runway.get('id', 'RWY??').replace(" ", "") # e.g., LTFM36
-    base_angle_str = f"{config['base_angle']:.0f}".replace("-", "M") # e.g., 90 or M90
-    base_dist_str = f"{config['base_distance']:.0f}" # e.g., 5
-    ext_dist_str = f"{config['extension_length']:.0f}" # e.g., 3
-    # No direction character needed anymore
-    prefix = f"T{approach_id_simple}A{base_angle_str}B{base_dist_str}E{ext_dist_str}"
-
-    named_waypoints = [
-        {'lat': lat, 'lon': lon, 'name': f"{prefix}_{i+1}"} 
-        for i, (lat, lon) in enumerate(waypoints_coords)
-    ]
-
-    print(f"Calculated Trombone Waypoints ({prefix}): {named_waypoints}") # Debug print
-    return named_waypoints
\ No newline at end of file
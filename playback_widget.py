@@ -0,0 +1,152 @@
+import datetime
+
+from PyQt5.QtWidgets import (QWidget, QHBoxLayout, QLabel, QPushButton, QSlider, QComboBox)
+from PyQt5.QtCore import Qt, QTimer, QElapsedTimer, pyqtSignal
+
+from trajectory_playback import TrajectoryPlaybackIndex
+
+
+class TrajectoryPlaybackWidget(QWidget):
+    """Timeline slider and play controls that animate aircraft on a MapWidget.
+
+    Zamanlayıcı sabit kare hızında tetiklenir; simülasyon zamanı gerçek geçen
+    süre x hız çarpanı kadar ilerletilir, böylece geciken kareler animasyonu
+    yavaşlatmaz.
+    """
+    timeChanged = pyqtSignal(float)  # Geçerli oynatma zamanı (Unix epoch saniye)
+
+    SPEEDS = [1, 5, 10, 30, 60, 120, 300]
+
+    def __init__(self, map_widget, fps=25, parent=None):
+        super().__init__(parent)
+        self.map_widget = map_widget
+        self.index = None
+        self._index_signature = None
+        self.current_time = 0.0
+        self.speed = 30
+
+        self.setStyleSheet("""
+            QPushButton {
+                background-color: #f0f0f0;
+                border: 1px solid #cccccc;
+                border-radius: 2px;
+                padding: 4px 8px;
+                min-width: 45px;
+            }
+            QPushButton:hover {
+                background-color: #e5e5e5;
+            }
+            QLabel {
+                font-family: monospace;
+            }
+        """)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(6, 4, 6, 4)
+        layout.setSpacing(6)
+
+        self.play_button = QPushButton("Play")
+        self.play_button.setCheckable(True)
+        self.play_button.toggled.connect(self.set_playing)
+        layout.addWidget(self.play_button)
+
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.setRange(0, 0)
+        self.slider.valueChanged.connect(self.on_slider_moved)
+        layout.addWidget(self.slider, 1)
+
+        self.time_label = QLabel("--:--:--")
+        layout.addWidget(self.time_label)
+
+        self.speed_combo = QComboBox()
+        for speed in self.SPEEDS:
+            self.speed_combo.addItem(f"{speed}x", speed)
+        self.speed_combo.setCurrentIndex(self.SPEEDS.index(self.speed))
+        self.speed_combo.currentIndexChanged.connect(
+            lambda i: setattr(self, 'speed', self.speed_combo.itemData(i)))
+        layout.addWidget(self.speed_combo)
+
+        self.info_label = QLabel("")
+        layout.addWidget(self.info_label)
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(int(1000 / fps))
+        self.timer.timeout.connect(self.on_tick)
+        self._clock = QElapsedTimer()
+
+        self.setEnabled(False)
+
+    def refresh_index(self):
+        """Rebuild the time index if the map's trajectories changed"""
+        trajectories = [t for t in self.map_widget.drawn_elements.get('trajectories', [])
+                        if t.get('times') is not None]
+        signature = tuple(id(t) for t in trajectories)
+        if signature == self._index_signature:
+            return
+        self._index_signature = signature
+        self.index = TrajectoryPlaybackIndex.from_drawn_trajectories(trajectories)
+
+        if len(self.index) == 0:
+            self.set_playing(False)
+            self.setEnabled(False)
+            self.info_label.setText("No timed trajectories")
+            self.map_widget.set_playback_aircraft(None)
+            return
+
+        self.setEnabled(True)
+        self.info_label.setText(f"{len(self.index)} flights")
+        self.slider.blockSignals(True)
+        self.slider.setRange(0, int(self.index.end_time - self.index.start_time))
+        self.slider.blockSignals(False)
+        start = self.index.start_time
+        self.set_time(min(max(self.current_time, start), self.index.end_time) if self.current_time else start)
+
+    def set_time(self, t):
+        """Move playback to epoch time t and update the aircraft on the map"""
+        if self.index is None or len(self.index) == 0:
+            return
+        self.current_time = min(max(t, self.index.start_time), self.index.end_time)
+        self.slider.blockSignals(True)
+        self.slider.setValue(int(self.current_time - self.index.start_time))
+        self.slider.blockSignals(False)
+        self.time_label.setText(
+            datetime.datetime.fromtimestamp(self.current_time, datetime.timezone.utc).strftime("%H:%M:%S"))
+
+        positions = self.index.positions_at(self.current_time)
+        self.map_widget.set_playback_aircraft(positions)
+        self.info_label.setText(f"{len(positions['ids'])}/{len(self.index)} airborne")
+        self.timeChanged.emit(self.current_time)
+
+    def set_playing(self, playing):
+        if playing and (self.index is None or len(self.index) == 0):
+            playing = False
+        if self.play_button.isChecked() != playing:
+            self.play_button.blockSignals(True)
+            self.play_button.setChecked(playing)
+            self.play_button.blockSignals(False)
+        self.play_button.setText("Pause" if playing else "Play")
+        if playing:
+            # Sona gelinmişse baştan başla
+            if self.current_time >= self.index.end_time:
+                self.set_time(self.index.start_time)
+            self._clock.start()
+            self.timer.start()
+        else:
+            self.timer.stop()
+
+    def on_tick(self):
+        elapsed = self._clock.restart() / 1000.0
+        next_time = self.current_time + elapsed * self.speed
+        self.set_time(next_time)
+        if next_time >= self.index.end_time:
+            self.set_playing(False)
+
+    def on_slider_moved(self, value):
+        if self.index is not None:
+            self.set_time(self.index.start_time + value)
+
+    def stop(self):
+        """Pause playback and remove aircraft symbols from the map"""
+        self.set_playing(False)
+        self.map_widget.set_playback_aircraft(None)
@@ -1,5 +1,5 @@
 import math
-import numpy as np
+
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, 
                           QComboBox, QLabel, QLineEdit, QRadioButton, QCheckBox,
                           QDialogButtonBox, QFrame, QScrollArea, QPushButton,
@@ -8,168 +8,9 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGroupBox,
 from PyQt5.QtGui import QDoubleValidator, QIntValidator
 from PyQt5.QtCore import Qt
 
-class DMS:
-    """Degrees, Minutes, Seconds coordinate component"""
-    def __init__(self, degrees=0, minutes=0, seconds=0.0):
-        self.degrees = degrees
-        self.minutes = minutes
-        self.seconds = seconds
-
-def dms_to_decimal(dms, direction=None):
-    """Convert DMS coordinates to decimal degrees"""
-    decimal = abs(dms.degrees) + (dms.minutes / 60.0) + (dms.seconds / 3600.0)
-    if direction in ['S', 'W'] or dms.degrees < 0:
-        decimal = -decimal
-    return decimal
-
-def decimal_to_dms(decimal_degrees):
-    """Convert decimal degrees to DMS"""
-    is_negative = decimal_degrees < 0
-    decimal_degrees = abs(decimal_degrees)
-    degrees = int(decimal_degrees)
-    minutes_float = (decimal_degrees - degrees) * 60
-    minutes = int(minutes_float)
-    seconds = (minutes_float - minutes) * 60
-    
-    # If negative, adjust degrees
-    if is_negative:
-        degrees = -degrees
-        
-    return DMS(degrees, minutes, seconds)
-
-def format_dms_output(decimal_degrees, is_latitude=True):
-    """Format decimal degrees as DMS string"""
-    dms = decimal_to_dms(abs(decimal_degrees))
-    direction = 'N' if decimal_degrees >= 0 and is_latitude else 'S' if is_latitude else 'E' if decimal_degrees >= 0 else 'W'
-    return f"{abs(dms.degrees):02d}°{dms.minutes:02d}'{dms.seconds:06.3f}\"{direction}"
-
-def parse_dms(degrees_str, minutes_str, seconds_str, direction=None):
-    """Parse DMS strings into a DMS object"""
-    try:
-        degrees = int(degrees_str) if degrees_str else 0
-        minutes = int(minutes_str) if minutes_str else 0
-        seconds = float(seconds_str) if seconds_str else 0.0
-        
-        # Handle negation based on direction
-        if direction in ['S', 'W']:
-            degrees = -abs(degrees)
-            
-        return DMS(degrees, minutes, seconds)
-    except ValueError:
-        raise ValueError("Invalid coordinate format")
-
-def calculate_point_from_bearing(lat, lon, distance_nm, bearing_deg):
-    """Calculate a point at given distance and bearing from starting point
-    
-    Args:
-        lat: Latitude in decimal degrees
-        lon: Longitude in decimal degrees
-        distance_nm: Distance in nautical miles
-        bearing_deg: Bearing in degrees (0 = North, 90 = East, 180 = South, 270 = West)
-        
-    Returns:
-        Tuple of (latitude, longitude) in decimal degrees
-    """
-    # Convert to radians
-    lat1 = math.radians(lat)
-    lon1 = math.radians(lon)
-    bearing = math.radians(bearing_deg)
-    
-    # Earth radius in nautical miles
-    R = 3440.065  # Earth radius in NM
-    
-    # Calculate distance in radians
-    d = distance_nm / R
-    
-    # Calculate the destination point using exact spherical formulas
-    lat2 = math.asin(math.sin(lat1) * math.cos(d) + 
-                    math.cos(lat1) * math.sin(d) * math.cos(bearing))
-    
-    lon2 = lon1 + math.atan2(math.sin(bearing) * math.sin(d) * math.cos(lat1),
-                             math.cos(d) - math.sin(lat1) * math.sin(lat2))
-    
-    # Convert back to degrees
-    return (math.degrees(lat2), math.degrees(lon2))
-
-def calculate_leg_points(merge_lat, merge_lon, initial_track, leg_distance, segment_distances, clockwise=True):
-    """Calculate points along a sequencing leg
-    
-    Args:
-        merge_lat: Merge point latitude in decimal degrees
-        merge_lon: Merge point longitude in decimal degrees
-        initial_track: Initial track angle in degrees where:
-                      - 0 degrees = North
-                      - 90 degrees = East
-                      - 180 degrees = South
-                      - 270 degrees = West
-        leg_distance: Distance from merge point to leg in NM
-        segment_distances: List of segment distances in NM
-        clockwise: Whether the arc goes clockwise from the initial point
-        
-    Returns:
-        List of points (lat, lon) along the leg
-    """
-    try:
-        # Validate inputs
-        if merge_lat is None or merge_lon is None:
-            raise ValueError("Merge point coordinates cannot be None")
-            
-        if leg_distance <= 0:
-            raise ValueError("Leg distance must be positive")
-            
-        if not segment_distances:
-            raise ValueError("Segment distances list cannot be empty")
-            
-        for i, dist in enumerate(segment_distances):
-            if dist <= 0:
-                raise ValueError(f"Segment {i+1} distance must be positive")
-        
-        points = []
-        
-        # Calculate initial angle in radians
-        initial_angle_rad = math.radians(initial_track)
-        
-        # Determine angular segment sizes
-        total_arc_length = sum(segment_distances)
-        
-        # Calculate angles for each point directly from the merge point
-        # Start with the initial angle
-        current_angle_rad = initial_angle_rad
-        
-        # Add initial point
-        points.append(calculate_point_from_bearing(merge_lat, merge_lon, leg_distance, initial_track))
-        
-        # Calculate cumulative arc lengths
-        cumulative_arc = 0
-        
-        # Direction multiplier
-        direction = 1 if clockwise else -1
-        
-        # Calculate each waypoint
-        for segment_length in segment_distances:
-            # Add segment length to accumulated arc length
-            cumulative_arc += segment_length
-            
-            # Calculate angular displacement (in radians)
-            # arc_length = radius * angle => angle = arc_length / radius
-            angular_displacement = cumulative_arc / leg_distance
-            
-            # Apply direction
-            angle_displacement_with_direction = direction * angular_displacement
-            
-            # Calculate new angle (in degrees)
-            new_angle_deg = (initial_track + math.degrees(angle_displacement_with_direction)) % 360
-                
-            # Calculate point at exact distance from merge point
-            point = calculate_point_from_bearing(merge_lat, merge_lon, leg_distance, new_angle_deg)
-            points.append(point)
-        
-        return points
-    except Exception as e:
-        print(f"Error in calculate_leg_points: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        raise ValueError(f"Failed to calculate leg points: {str(e)}")
+from procedure_geometry import (DMS, dms_to_decimal, decimal_to_dms, format_dms_output, parse_dms,
+                                calculate_point_from_bearing, calculate_leg_points,
+                                calculate_point_merge_waypoints, _calculate_double_pms_from_config)
 
 class PointMergeDialog(QDialog):
     """Dialog for configuring a Point Merge System"""
@@ -817,277 +658,3 @@ class PointMergeDialog(QDialog):
                     f"Lon: {format_dms_output(point[1], False)}"
                 )
             self.results_text.append("")
-
-from PyQt5.QtWidgets import QTextEdit, QMessageBox
-
-def calculate_point_merge_waypoints(runway, config):
-    """Calculate waypoints for a Point Merge System based on the configuration
-    
-    Args:
-        runway: Dictionary with runway coordinates (not used if direct coordinates provided)
-        config: Configuration dictionary from PathExtensionDialog
-        
-    Returns:
-        Dictionary with merge point and leg points for visualization
-    """
-    try:
-        # Check if Double PMS is enabled and handle it
-        if config.get('double_pms_enabled'):
-            return _calculate_double_pms_from_config(config)
-
-        # Debug gelen config
-        print(f"calculate_point_merge_waypoints için config: {config}")
-        
-        # Determine merge point coordinates
-        if 'merge_lat' not in config or 'merge_lon' not in config:
-            raise ValueError("Merge point coordinates are missing from configuration")
-            
-        merge_lat, merge_lon = config.get('merge_lat', 0.0), config.get('merge_lon', 0.0)
-        
-        # Main leg configuration - her iki isimle de kontrol et
-        # Önce 'first_point_distance', yoksa 'distance' kullan
-        if 'first_point_distance' not in config and 'distance' not in config:
-            raise ValueError("Distance from merge point is missing (first_point_distance/distance)")
-            
-        first_point_distance = config.get('first_point_distance', config.get('distance', 15.0))
-        # Önce 'track_angle', yoksa 'angle' kullan
-        track_angle = config.get('track_angle', config.get('angle', 0.0))
-        clockwise = config.get('clockwise', True)
-        
-        # Extract segment distances for main leg, or create evenly spaced segments
-        segment_distances = []
-        
-        # Eğer 'segments' bir liste ise, doğrudan kullan
-        if 'segments' in config and isinstance(config['segments'], list):
-            segment_distances = config['segments']
-        # Eğer 'segments' bir sayı ise, eşit segmentler oluştur
-        elif 'segments' in config and isinstance(config['segments'], (int, float)):
-            num_segments = int(config['segments'])
-            total_arc_width = config.get('arc_width', 60.0)  # In degrees
-            arc_length_nm = math.radians(total_arc_width) * first_point_distance
-            segment_distance = arc_length_nm / num_segments if num_segments > 0 else arc_length_nm
-            segment_distances = [segment_distance] * num_segments
-        # Eğer 'num_segments' varsa, bu sayıda eşit segment oluştur
-        elif 'num_segments' in config:
-            num_segments = int(config.get('num_segments', 10))
-            total_arc_width = config.get('arc_width', 60.0)  # In degrees
-            arc_length_nm = math.radians(total_arc_width) * first_point_distance
-            segment_distances = [arc_length_nm / num_segments] * num_segments
-        # Hiçbir segment bilgisi yoksa, varsayılan 5 segment oluştur
-        else:
-            num_segments = 5
-            total_arc_width = config.get('arc_width', 60.0) 
-            arc_length_nm = math.radians(total_arc_width) * first_point_distance
-            segment_distances = [arc_length_nm / num_segments] * num_segments
-            
-        # Güvenlik kontrolü - segment_distances mutlaka bir liste olmalı
-        if not isinstance(segment_distances, list) or len(segment_distances) == 0:
-            print("UYARI: segment_distances düzgün bir liste değil, varsayılan liste oluşturuluyor")
-            segment_distances = [5.0] * 5
-        
-        # Calculate main leg points
-        main_leg_points = calculate_leg_points(
-            merge_lat, merge_lon,
-            track_angle, first_point_distance,
-            segment_distances, clockwise
-        )
-        
-        # Second leg configuration
-        second_leg_points = []
-        if 'second_leg' in config and config['second_leg']:
-            second_leg = config['second_leg']
-            
-            if 'type' not in second_leg or 'distance' not in second_leg:
-                raise ValueError("Second leg configuration is incomplete")
-                
-            is_inner = second_leg['type'] == 'inner'
-            leg_distance = second_leg['distance']
-            
-            # Calculate distance from merge point to second leg
-            second_leg_distance = (
-                first_point_distance - leg_distance if is_inner
-                else first_point_distance + leg_distance
-            )
-            
-            # Use provided segment distances or create even segments
-            if 'segments' in second_leg and second_leg['segments']:
-                second_segment_distances = second_leg['segments']
-            else:
-                num_segments = int(config.get('num_segments', 10))
-                total_arc_width = config.get('arc_width', 60.0)
-                arc_length_nm = math.radians(total_arc_width) * second_leg_distance
-                second_segment_distances = [arc_length_nm / num_segments] * num_segments
-            
-            # Calculate second leg points
-            second_leg_points = calculate_leg_points(
-                merge_lat, merge_lon,
-                track_angle, second_leg_distance,
-                second_segment_distances, clockwise
-            )
-        
-        # Build result with all points and connection information
-        result = {
-            'merge_point': (merge_lat, merge_lon),
-            'main_leg': main_leg_points,
-            'second_leg': second_leg_points,
-            'connections': config.get('connections', {
-                'merge_to_main_start': True,
-                'merge_to_main_end': False,
-                'merge_to_second_start': False,
-                'merge_to_second_end': False,
-                'legs_start_to_start': False,
-                'legs_end_to_end': False
-            })
-        }
-        
-        # Convert to flat list of points for compatibility with existing code
-        # The merge point is added as the last point
-        # all_points = main_leg_points.copy()
-        
-        # # Add second leg points if they exist
-        # if second_leg_points:
-        #     all_points.extend(second_leg_points)
-        
-        # # Add merge point as the last point
-        # all_points.append((merge_lat, merge_lon))
-        
-        # --- FIX: Return list of dicts with lat/lon/name --- 
-        all_waypoints_data = []
-        leg_counter = 1
-        # Add main leg points
-        for i, (lat, lon) in enumerate(main_leg_points):
-            all_waypoints_data.append({
-                'lat': lat, 
-                'lon': lon, 
-                'name': f"L{leg_counter}WP{i+1}" 
-            })
-        
-        # Add second leg points if they exist
-        if second_leg_points:
-            leg_counter += 1
-            for i, (lat, lon) in enumerate(second_leg_points):
-                 all_waypoints_data.append({
-                     'lat': lat, 
-                     'lon': lon, 
-                     'name': f"L{leg_counter}WP{i+1}" 
-                 })
-
-        # Add merge point as the last point
-        all_waypoints_data.append({
-            'lat': merge_lat, 
-            'lon': merge_lon, 
-            'name': 'MP' # Merge Point
-        })
-        
-        return all_waypoints_data
-        
-    except Exception as e:
-        # Print error for debugging and re-raise with more context
-        print(f"Error in calculate_point_merge_waypoints: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        raise ValueError(f"Failed to generate point merge: {str(e)}")
-
-def _calculate_double_pms_from_config(config):
-    """
-    Calculates waypoints for a Double Point-Merge System.
-    The structure involves a main leg, a perpendicular base segment leading
-    to an inner "double" leg that curves back towards the initial approach line.
-    """
-    # Extract common parameters
-    merge_lat, merge_lon = config['merge_lat'], config['merge_lon']
-    track_angle = config['track_angle']
-    first_point_distance = config['first_point_distance']
-    clockwise = config['clockwise']
-    base_segment_distance = config['base_segment_distance']
-    
-    # Handle segments - convert to list if needed
-    segments_raw = config['segments']
-    if isinstance(segments_raw, list):
-        first_leg_segments = segments_raw
-    elif isinstance(segments_raw, (int, float)):
-        num_segments = int(segments_raw)
-        total_arc_width = config.get('arc_width', 60.0)  # In degrees
-        arc_length_nm = math.radians(total_arc_width) * first_point_distance
-        segment_distance = arc_length_nm / num_segments if num_segments > 0 else arc_length_nm
-        first_leg_segments = [segment_distance] * num_segments
-    else:
-        # Fallback: create 5 equal segments
-        num_segments = 5
-        total_arc_width = config.get('arc_width', 60.0) 
-        arc_length_nm = math.radians(total_arc_width) * first_point_distance
-        first_leg_segments = [arc_length_nm / num_segments] * num_segments
-
-    # --- 1. Calculate Main Leg ---
-    main_leg_points = calculate_leg_points(
-        merge_lat, merge_lon,
-        track_angle, first_point_distance,
-        first_leg_segments, clockwise
-    )
-    if not main_leg_points:
-        raise ValueError("Failed to generate main leg for Double PMS.")
-
-    # --- 2. Calculate Double Leg Parameters ---
-    # The double leg is an inner arc, so its radius is smaller.
-    r_main = first_point_distance
-    r_double = r_main - base_segment_distance
-    if r_double <= 0:
-        raise ValueError("Base Segment Distance is too large; it must be less than the main leg's distance from the merge point.")
-
-    # Determine the start and end angles of the main leg arc
-    direction = 1 if clockwise else -1
-    total_arc_length_main = sum(first_leg_segments)
-    angular_displacement_rad = total_arc_length_main / r_main
-    
-    start_angle_deg = track_angle
-    end_angle_deg = (start_angle_deg + direction * math.degrees(angular_displacement_rad)) % 360
-
-    # --- 3. Calculate Double Leg ---
-    # The double leg starts at the same angle as the main leg's end, but on the inner radius.
-    # It then curves back towards the main leg's start angle.
-    # We use the same number of segments as the main leg.
-    num_segments_double = len(first_leg_segments)
-    arc_length_double = angular_displacement_rad * r_double
-    double_leg_segment_dist = arc_length_double / num_segments_double if num_segments_double > 0 else 0
-    double_leg_segments = [double_leg_segment_dist] * num_segments_double
-    
-    # We start from the end angle and go backwards, so the direction is reversed.
-    double_leg_points = calculate_leg_points(
-        merge_lat, merge_lon,
-        end_angle_deg, r_double,
-        double_leg_segments, not clockwise
-    )
-    if not double_leg_points:
-        raise ValueError("Failed to generate double leg for Double PMS.")
-
-    # The start of the drawn double leg is the first point calculated.
-    p_double_start = double_leg_points[0]
-    # The end is the last point, which lies on the line to the first point of the main leg.
-    p_double_end = double_leg_points[-1]
-
-    # --- 4. Assemble Waypoint List for Drawing ---
-    # The drawing sequence is: Main Leg -> Base Segment -> Double Leg -> Merge Point
-    # The base segment is the line from the end of the main leg to the start of the double leg.
-    p_main_end = main_leg_points[-1]
-    
-    # The final list is constructed to create a continuous line for drawing.
-    final_waypoints = []
-    # Add main leg points (from start to end)
-    final_waypoints.extend(main_leg_points)
-    # Add the points for the double leg (from its start to its end)
-    final_waypoints.extend(double_leg_points)
-    # Finally, add the merge point to connect the end of the double leg to it.
-    final_waypoints.append((merge_lat, merge_lon))
-
-    # Convert to the required dictionary format with names
-    all_waypoints_data = []
-    # Name main leg points
-    for i, (lat, lon) in enumerate(main_leg_points):
-        all_waypoints_data.append({'lat': lat, 'lon': lon, 'name': f"L1WP{i+1}"})
-    # Name double leg points
-    for i, (lat, lon) in enumerate(double_leg_points):
-        all_waypoints_data.append({'lat': lat, 'lon': lon, 'name': f"L2WP{i+1}"})
-    # Name merge point
-    all_waypoints_data.append({'lat': merge_lat, 'lon': merge_lon, 'name': 'MP'})
-
-    return all_waypoints_data
@@ -5,6 +5,8 @@ from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont, QColor
 import math
 
+import tracing
+
 class PointMergePopupDialog(QDialog):
     """Point Merge düzenleme popup menüsü"""
     pointMergeSettingsChanged = pyqtSignal(dict)
@@ -21,7 +23,7 @@ class PointMergePopupDialog(QDialog):
         self.config = config.copy()
         
         # Debug: config içeriğini göster
-        print(f"Point Merge popup'ı açılıyor, config: {self.config}")
+        tracing.debug("Point Merge popup'ı açılıyor, config: %s", self.config)
         
         # Normalize segments: if list provided, use its length
         segs = self.config.get('segments', None)
@@ -425,7 +427,7 @@ class PointMergePopupDialog(QDialog):
                 
                 # Double PMS waypoint'lerini hesapla ve göster
                 try:
-                    from pointmerge import calculate_point_merge_waypoints
+                    from procedure_geometry import calculate_point_merge_waypoints
                     waypoints_data = calculate_point_merge_waypoints(None, self.config)
                     
                     if waypoints_data:
@@ -499,7 +501,7 @@ class PointMergePopupDialog(QDialog):
     def on_color_changed(self):
         """Renk değiştiğinde çağrılır"""
         current_color = self.config.get('color', self.get_default_color())
-        print(f"Point Merge color dialog opening with current color: {current_color}")
+        tracing.debug("Point Merge color dialog opening with current color: %s", current_color)
         
         # QColorDialog'u modal olarak aç
         color_dialog = QColorDialog(QColor(current_color), self)
@@ -512,7 +514,7 @@ class PointMergePopupDialog(QDialog):
             color = color_dialog.selectedColor()
             if color.isValid():
                 color_hex = color.name()
-                print(f"Point Merge color changed to: {color_hex}")
+                tracing.debug("Point Merge color changed to: %s", color_hex)
                 self.config['color'] = color_hex
                 self.color_button.setStyleSheet(f"background-color: {color_hex}; border: 1px solid #444444;")
                 self.update_details_content()
@@ -523,16 +525,16 @@ class PointMergePopupDialog(QDialog):
                 self.raise_()
                 self.activateWindow()
             else:
-                print("Point Merge color dialog cancelled")
+                tracing.debug("Point Merge color dialog cancelled")
         else:
-            print("Point Merge color dialog cancelled")
+            tracing.debug("Point Merge color dialog cancelled")
             # Popup'ı öne getir
             self.raise_()
             self.activateWindow()
     
     def on_width_changed(self, value):
         """Kalınlık değiştiğinde çağrılır"""
-        print(f"Point Merge width changed to: {value}")
+        tracing.debug("Point Merge width changed to: %s", value)
         self.config['width'] = value
         self.width_label.setText(f"{value}px")
         self.update_details_content()
@@ -549,14 +551,14 @@ class PointMergePopupDialog(QDialog):
             'visual_only_update': True  # Bu bir sadece görsel güncelleme olduğunu belirten flag
         })
         
-        print(f"Point Merge visual settings updated: {visual_cfg}")
+        tracing.debug("Point Merge visual settings updated: %s", visual_cfg)
         self.pointMergeSettingsChanged.emit(visual_cfg)
     
     def on_apply(self):
         """Point merge ayarlarını güncelle"""
         # Debug mesajı
-        print("Point Merge güncelleniyor...")
-        print(f"Yeni değerler - Distance: {self.distance_spin.value()}, Angle: {self.angle_spin.value()}, Segments: {self.segments_spin.value()}")
+        tracing.debug("Point Merge güncelleniyor...")
+        tracing.debug("Yeni değerler - Distance: %s, Angle: %s, Segments: %s", self.distance_spin.value(), self.angle_spin.value(), self.segments_spin.value())
         
         # Mevcut config'den tam bir kopyasını oluştur
         updated_cfg = self.config.copy()
@@ -590,10 +592,10 @@ class PointMergePopupDialog(QDialog):
         
         # Kesinlikle merge point koordinatlarını dahil et
         if not 'merge_lat' in updated_cfg or not 'merge_lon' in updated_cfg:
-            print("UYARI: Merge koordinatları eksik!")
+            tracing.warning("UYARI: Merge koordinatları eksik!")
             
         # Debug bilgisi
-        print(f"Güncellenen Point Merge konfigürasyonu: {updated_cfg}")
+        tracing.debug("Güncellenen Point Merge konfigürasyonu: %s", updated_cfg)
             
         # Parametre değişim sinyalini gönder
         self.pointMergeSettingsChanged.emit(updated_cfg)
@@ -0,0 +1,216 @@
+"""
+Point merge tasarım uzayı taraması
+
+Parametre aralıklarının tüm kombinasyonları aynı segment sayısına sahip
+gruplar halinde geodesy ile vektörel olarak değerlendirilir.
+"""
+
+import math
+import time
+
+import numpy as np
+
+import geodesy
+from airspace_infringement import area_polygons, points_in_areas
+
+# Tek seferde işlenen en fazla tasarım sayısı (bellek sınırı)
+_DESIGN_CHUNK = 4096
+
+
+def parse_range_values(text):
+    """Parse '15, 20, 25' or '0:350:10' (inclusive) or mixed lists into a sorted list of floats."""
+    values = []
+    for item in str(text).replace(';', ',').split(','):
+        item = item.strip()
+        if not item:
+            continue
+        if ':' in item:
+            parts = [float(part) for part in item.split(':')]
+            if len(parts) != 3 or parts[2] <= 0:
+                raise ValueError(f"Geçersiz aralık: '{item}' (başlangıç:bitiş:adım)")
+            start, stop, step = parts
+            values.extend(np.arange(start, stop + step / 2.0, step).tolist())
+        else:
+            values.append(float(item))
+    if not values:
+        raise ValueError("En az bir değer gerekli")
+    return sorted(set(round(value, 9) for value in values))
+
+
+def merge_point_grid(center_lat, center_lon, count=1, spacing_nm=2.0):
+    """count x count merge point candidates spaced spacing_nm apart around the center."""
+    offsets = (np.arange(count) - (count - 1) / 2.0) * spacing_nm
+    north, east = np.meshgrid(offsets, offsets, indexing='ij')
+    lats = center_lat + north.ravel() / geodesy.NM_PER_DEG_LAT
+    lons = center_lon + east.ravel() / (geodesy.NM_PER_DEG_LAT * math.cos(math.radians(center_lat)))
+    return list(zip(lats.tolist(), lons.tolist()))
+
+
+def _leg_bearings(track_angles, radii, arc_lengths, directions, samples):
+    """Bearings (N, samples) along each leg arc, from the track angle to the arc end."""
+    fractions = np.linspace(0.0, 1.0, samples)
+    sweep_deg = np.degrees(arc_lengths / radii) * directions
+    return (track_angles[:, None] + sweep_deg[:, None] * fractions[None, :]) % 360.0
+
+
+def sweep_point_merge(merge_points, track_angles, first_point_distances, second_leg_offsets=(0.0,),
+                      segment_counts=(5,), clockwise=(True, False), arc_width=60.0,
+                      restricted_areas=None, speed_kt=220.0, sample_spacing_nm=1.0):
+    """Evaluate every combination of the given point merge parameters.
+
+    Args:
+        merge_points: [(lat, lon)] merge noktası adayları
+        track_angles: Bacak başlangıç yönleri (derece, merge noktasından)
+        first_point_distances: Ana bacak yarıçapları (NM)
+        second_leg_offsets: İkinci bacak yarıçap farkı (NM); 0 = ikinci bacak yok,
+            negatif = iç bacak, pozitif = dış bacak
+        segment_counts: Bacak başına eşit segment sayıları
+        clockwise: Denenecek dönüş yönleri (True = saat yönü)
+        arc_width: Bacakların açısal genişliği (derece)
+        restricted_areas: DataManager.restricted_areas biçiminde sahalar
+        speed_kt: Gecikme kapasitesi için bacak hızı (kt)
+        sample_spacing_nm: Saha kontrolünde bacak örnekleme aralığı (NM)
+
+    Returns (designs, stats). designs is a list of dicts with the parameters,
+    a drawable 'config' and:
+        leg_nm / second_leg_nm  Bacakların waypoint'ler arası uzunluğu
+        min_path_nm             En kısa yol: bacağa girer girmez merge noktasına direkt
+        max_path_nm             En uzun yol: bacağın sonuna kadar uçup merge noktasına direkt
+        delay_capacity_s        (max_path - min_path) / hız; bacakların emebileceği gecikme
+        conflict_nm             Bacakların yasaklı sahalar içinde kalan uzunluğu
+        conflict_areas          İhlal edilen saha isimleri
+    """
+    start_time = time.perf_counter()
+    areas = area_polygons(restricted_areas)
+    merge_array = np.asarray(merge_points, dtype=np.float64).reshape(-1, 2)
+    grids = np.meshgrid(np.arange(len(merge_array)), np.asarray(track_angles, dtype=np.float64),
+                        np.asarray(first_point_distances, dtype=np.float64),
+                        np.asarray(second_leg_offsets, dtype=np.float64),
+                        np.asarray(segment_counts, dtype=np.int64),
+                        np.asarray([1.0 if cw else -1.0 for cw in clockwise]), indexing='ij')
+    merge_index, tracks, radii, offsets, counts, directions = [grid.ravel() for grid in grids]
+    stats = {'combinations': len(tracks), 'designs': 0, 'rejected': 0, 'areas': len(areas), 'elapsed_s': 0.0}
+
+    # İç bacak yarıçapı pozitif kalmalı
+    valid = (radii > 0) & (radii + offsets > 0) & (counts > 0)
+    stats['rejected'] = int(np.count_nonzero(~valid))
+    merge_index, tracks, radii, offsets, counts, directions = (
+        array[valid] for array in (merge_index, tracks, radii, offsets, counts, directions))
+    merge_lats, merge_lons = merge_array[merge_index, 0], merge_array[merge_index, 1]
+    arc_rad = math.radians(arc_width)
+
+    designs = []
+    for count in np.unique(counts):
+        group = np.flatnonzero(counts == count)
+        for chunk_start in range(0, len(group), _DESIGN_CHUNK):
+            rows = group[chunk_start:chunk_start + _DESIGN_CHUNK]
+            designs.extend(_evaluate_group(
+                int(count), merge_lats[rows], merge_lons[rows], tracks[rows], radii[rows], offsets[rows],
+                directions[rows], arc_rad, areas, speed_kt, sample_spacing_nm))
+
+    stats['designs'] = len(designs)
+    stats['elapsed_s'] = time.perf_counter() - start_time
+    return designs, stats
+
+
+def _evaluate_group(count, merge_lats, merge_lons, tracks, radii, offsets, directions, arc_rad,
+                    areas, speed_kt, sample_spacing_nm):
+    """Metrics for designs sharing one segment count (arrays of length N)"""
+    n_designs = len(tracks)
+    has_second = offsets != 0
+    second_radii = np.where(has_second, radii + offsets, radii)
+    legs = [(radii, np.ones(n_designs, dtype=bool)), (second_radii, has_second)]
+
+    leg_lengths, conflict_nm = [], np.zeros(n_designs)
+    conflict_mask = np.zeros((n_designs, len(areas)), dtype=bool)
+    for leg_radii, present in legs:
+        arc_lengths = arc_rad * leg_radii
+        # Waypoint'ler: tasarım başına count + 1 nokta, bacak uzunluğu waypoint'ler arası mesafe
+        bearings = _leg_bearings(tracks, leg_radii, arc_lengths, directions, count + 1)
+        lats, lons = geodesy.destination(merge_lats[:, None], merge_lons[:, None], leg_radii[:, None], bearings)
+        lengths = geodesy.distance_nm(lats[:, :-1], lons[:, :-1], lats[:, 1:], lons[:, 1:]).sum(axis=1)
+        leg_lengths.append(np.where(present, lengths, 0.0))
+
+        if not areas:
+            continue
+        # Saha kontrolü için yayı sık örnekle (tüm gruptaki en uzun yaya göre)
+        samples = max(int(math.ceil(float(arc_lengths[present].max(initial=0.0)) / sample_spacing_nm)) + 1, count + 1)
+        bearings = _leg_bearings(tracks, leg_radii, arc_lengths, directions, samples)
+        lats, lons = geodesy.destination(merge_lats[:, None], merge_lons[:, None], leg_radii[:, None], bearings)
+        hits = points_in_areas(lats.ravel(), lons.ravel(), areas).reshape(n_designs, samples, len(areas))
+        hits &= present[:, None, None]
+        step_nm = arc_lengths / (samples - 1)
+        conflict_nm += hits.any(axis=2).sum(axis=1) * step_nm
+        conflict_mask |= hits.any(axis=1)
+
+    leg_nm, second_leg_nm = leg_lengths
+    min_path = np.where(has_second, np.minimum(radii, second_radii), radii)
+    max_path = np.where(has_second, np.maximum(leg_nm + radii, second_leg_nm + second_radii), leg_nm + radii)
+    capacity_s = (max_path - min_path) / speed_kt * 3600.0
+    area_names = [area.name for area in areas]
+
+    # Sözlükler Python skalerleriyle kurulur (numpy skaler ek yükü olmadan)
+    columns = [array.tolist() for array in (merge_lats, merge_lons, tracks, radii, offsets, directions, leg_nm,
+                                            second_leg_nm, min_path, max_path, capacity_s, conflict_nm)]
+    hit_lists = conflict_mask.tolist()
+    designs = []
+    for (merge_lat, merge_lon, track, radius, offset, direction, leg, second_leg, shortest, longest,
+         capacity, conflict), hit_row in zip(zip(*columns), hit_lists):
+        config = {
+            'pattern_type': 'pointmerge',
+            'merge_lat': merge_lat,
+            'merge_lon': merge_lon,
+            'track_angle': track,
+            'first_point_distance': radius,
+            'segments': [arc_rad * radius / count] * count,
+            'clockwise': direction > 0,
+        }
+        if offset != 0:
+            config['second_leg'] = {'type': 'inner' if offset < 0 else 'outer', 'distance': abs(offset),
+                                    'segments': [arc_rad * (radius + offset) / count] * count}
+        designs.append({
+            'merge_lat': merge_lat,
+            'merge_lon': merge_lon,
+            'track_angle': track,
+            'first_point_distance': radius,
+            'second_leg_offset': offset,
+            'segment_count': count,
+            'clockwise': direction > 0,
+            'leg_nm': leg,
+            'second_leg_nm': second_leg,
+            'min_path_nm': shortest,
+            'max_path_nm': longest,
+            'delay_capacity_s': capacity,
+            'conflict_nm': conflict,
+            'conflict_areas': [name for name, hit in zip(area_names, hit_row) if hit],
+            'config': config,
+        })
+    return designs
+
+
+def rank_designs(designs):
+    """Sort designs: conflict-free first, then by delay capacity (desc) and shortest max path."""
+    return sorted(designs, key=lambda d: (d['conflict_nm'] > 0, d['conflict_nm'],
+                                          -round(d['delay_capacity_s'], 6), d['max_path_nm']))
+
+
+def design_legs(design):
+    """Preview polylines for a design: each leg plus its start -> merge point line"""
+    config = design['config']
+    merge = (config['merge_lat'], config['merge_lon'])
+    radii = [config['first_point_distance']]
+    if config.get('second_leg'):
+        second = config['second_leg']
+        radii.append(config['first_point_distance'] + (second['distance'] if second['type'] == 'outer' else -second['distance']))
+    count = design['segment_count']
+    direction = 1.0 if config['clockwise'] else -1.0
+    polylines = []
+    for radius in radii:
+        arc_length = sum(config['segments']) * radius / config['first_point_distance']
+        bearings = _leg_bearings(np.array([config['track_angle']]), np.array([radius]),
+                                 np.array([arc_length]), np.array([direction]), count + 1)[0]
+        lats, lons = geodesy.destination(merge[0], merge[1], radius, bearings)
+        leg = list(zip(lats.tolist(), lons.tolist()))
+        polylines.append(leg)
+        polylines.append([leg[0], merge])
+    return polylines
@@ -0,0 +1,181 @@
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QDoubleSpinBox, QSpinBox, QLineEdit,
+    QComboBox, QPushButton, QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox, QAbstractItemView
+)
+from PyQt5.QtCore import Qt
+
+from conformance_dialog import NumericTableItem
+from pointmerge_sweep import (parse_range_values, merge_point_grid, sweep_point_merge,
+                              rank_designs, design_legs)
+
+
+class PointMergeSweepDialog(QDialog):
+    """Point merge parametre aralıklarını tarayıp tasarımları karşılaştıran dialog"""
+
+    COLUMNS = ["Rank", "Merge", "Track (°)", "Dist (NM)", "2nd Leg (NM)", "Segs", "Dir",
+               "Min Path (NM)", "Max Path (NM)", "Capacity (s)", "Conflict (NM)", "Areas"]
+    PREVIEW_COUNT = 5  # Seçim yoksa haritada gösterilen en iyi aday sayısı
+
+    def __init__(self, data_manager, map_widget, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Point Merge Sweep")
+        self.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
+        self.data_manager = data_manager
+        self.map_widget = map_widget
+        self.designs = []
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(7)
+        layout.setContentsMargins(10, 10, 10, 10)
+
+        params_layout = QGridLayout()
+        params_layout.addWidget(QLabel("Merge Lat/Lon:"), 0, 0)
+        self.merge_lat_spin = self._make_spin(-90.0, 90.0, self.map_widget.center_lat, "", 0.01, decimals=4)
+        self.merge_lon_spin = self._make_spin(-180.0, 180.0, self.map_widget.center_lon, "", 0.01, decimals=4)
+        params_layout.addWidget(self.merge_lat_spin, 0, 1)
+        params_layout.addWidget(self.merge_lon_spin, 0, 2)
+        params_layout.addWidget(QLabel("Merge ızgarası:"), 0, 3)
+        self.grid_count_spin = QSpinBox()
+        self.grid_count_spin.setRange(1, 9)
+        self.grid_count_spin.setValue(1)
+        params_layout.addWidget(self.grid_count_spin, 0, 4)
+        self.grid_spacing_spin = self._make_spin(0.5, 20.0, 2.0, " NM", 0.5)
+        params_layout.addWidget(self.grid_spacing_spin, 0, 5)
+
+        # Aralıklar: virgülle ayrılmış değerler veya başlangıç:bitiş:adım
+        self.track_edit = QLineEdit("0:330:30")
+        self.distance_edit = QLineEdit("15:30:5")
+        self.offset_edit = QLineEdit("0, -4, 4")
+        self.segments_edit = QLineEdit("4, 6, 8")
+        for row, (label, edit) in enumerate([("Track (°):", self.track_edit), ("Dist (NM):", self.distance_edit),
+                                             ("2. bacak (NM):", self.offset_edit), ("Segment:", self.segments_edit)]):
+            params_layout.addWidget(QLabel(label), 1 + row // 2, (row % 2) * 3)
+            params_layout.addWidget(edit, 1 + row // 2, (row % 2) * 3 + 1, 1, 2)
+
+        params_layout.addWidget(QLabel("Yön:"), 3, 0)
+        self.direction_combo = QComboBox()
+        self.direction_combo.addItems(["Her ikisi", "Saat yönü", "Saat yönü tersi"])
+        params_layout.addWidget(self.direction_combo, 3, 1)
+        params_layout.addWidget(QLabel("Yay / Hız:"), 3, 3)
+        self.arc_width_spin = self._make_spin(10.0, 180.0, 60.0, "°", 5.0)
+        params_layout.addWidget(self.arc_width_spin, 3, 4)
+        self.speed_spin = self._make_spin(120.0, 350.0, 220.0, " kt", 10.0)
+        params_layout.addWidget(self.speed_spin, 3, 5)
+        layout.addLayout(params_layout)
+
+        buttons_layout = QHBoxLayout()
+        self.sweep_button = QPushButton("Tara")
+        self.sweep_button.clicked.connect(self.run_sweep)
+        buttons_layout.addWidget(self.sweep_button)
+        self.add_button = QPushButton("Haritaya Ekle")
+        self.add_button.setToolTip("Seçili tasarımları point merge olarak çiz")
+        self.add_button.clicked.connect(self.add_selected_to_map)
+        buttons_layout.addWidget(self.add_button)
+        buttons_layout.addStretch()
+        layout.addLayout(buttons_layout)
+
+        self.summary_label = QLabel("")
+        layout.addWidget(self.summary_label)
+
+        self.results_table = QTableWidget()
+        self.results_table.setColumnCount(len(self.COLUMNS))
+        self.results_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.results_table.verticalHeader().setVisible(False)
+        self.results_table.setAlternatingRowColors(True)
+        self.results_table.verticalHeader().setDefaultSectionSize(20)
+        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.results_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.results_table.itemSelectionChanged.connect(self.update_preview)
+        layout.addWidget(self.results_table)
+
+        self.resize(980, 560)
+
+    def _make_spin(self, minimum, maximum, value, suffix, step, decimals=None):
+        spin = QDoubleSpinBox()
+        spin.setRange(minimum, maximum)
+        spin.setDecimals(decimals if decimals is not None else (1 if step < 10 else 0))
+        spin.setSingleStep(step)
+        spin.setValue(value)
+        spin.setSuffix(suffix)
+        return spin
+
+    def run_sweep(self):
+        """Tüm parametre kombinasyonlarını değerlendir"""
+        try:
+            tracks = [value % 360 for value in parse_range_values(self.track_edit.text())]
+            distances = parse_range_values(self.distance_edit.text())
+            offsets = parse_range_values(self.offset_edit.text())
+            segment_counts = [int(value) for value in parse_range_values(self.segments_edit.text())]
+        except ValueError as e:
+            QMessageBox.warning(self, "Point Merge Sweep", str(e))
+            return
+        clockwise = {0: (True, False), 1: (True,), 2: (False,)}[self.direction_combo.currentIndex()]
+        merge_points = merge_point_grid(self.merge_lat_spin.value(), self.merge_lon_spin.value(),
+                                        self.grid_count_spin.value(), self.grid_spacing_spin.value())
+        restricted_areas = getattr(self.data_manager, 'restricted_areas', None) if self.data_manager else None
+
+        designs, stats = sweep_point_merge(
+            merge_points, sorted(set(tracks)), distances, offsets, segment_counts, clockwise,
+            arc_width=self.arc_width_spin.value(), restricted_areas=restricted_areas,
+            speed_kt=self.speed_spin.value())
+        self.designs = rank_designs(designs)
+        self.populate_table(self.designs)
+
+        conflict_free = sum(1 for design in self.designs if design['conflict_nm'] == 0)
+        self.summary_label.setText(
+            f"{stats['designs']} tasarım ({stats['rejected']} geçersiz kombinasyon atlandı), "
+            f"{conflict_free} tanesi saha ihlalsiz; {stats['areas']} saha, {stats['elapsed_s']:.2f} sn")
+        self.update_preview()
+
+    def populate_table(self, designs):
+        self.results_table.setSortingEnabled(False)
+        self.results_table.clearSelection()
+        self.results_table.setRowCount(len(designs))
+        for row, design in enumerate(designs):
+            rank_item = NumericTableItem(row + 1, "{:.0f}")
+            # Sıralamadan sonra da doğru tasarımı bulmak için indeksi sakla
+            rank_item.setData(Qt.UserRole, row)
+            self.results_table.setItem(row, 0, rank_item)
+            self.results_table.setItem(row, 1, QTableWidgetItem(f"{design['merge_lat']:.4f}, {design['merge_lon']:.4f}"))
+            self.results_table.setItem(row, 2, NumericTableItem(design['track_angle'], "{:.0f}"))
+            self.results_table.setItem(row, 3, NumericTableItem(design['first_point_distance'], "{:.1f}"))
+            self.results_table.setItem(row, 4, NumericTableItem(design['second_leg_offset'], "{:+.1f}"))
+            self.results_table.setItem(row, 5, NumericTableItem(design['segment_count'], "{:.0f}"))
+            self.results_table.setItem(row, 6, QTableWidgetItem("CW" if design['clockwise'] else "CCW"))
+            self.results_table.setItem(row, 7, NumericTableItem(design['min_path_nm']))
+            self.results_table.setItem(row, 8, NumericTableItem(design['max_path_nm']))
+            self.results_table.setItem(row, 9, NumericTableItem(design['delay_capacity_s'], "{:.0f}"))
+            self.results_table.setItem(row, 10, NumericTableItem(design['conflict_nm']))
+            self.results_table.setItem(row, 11, QTableWidgetItem(", ".join(design['conflict_areas'])))
+        self.results_table.setSortingEnabled(True)
+
+    def selected_designs(self):
+        rows = self.results_table.selectionModel().selectedRows()
+        return [self.designs[self.results_table.item(index.row(), 0).data(Qt.UserRole)] for index in rows]
+
+    def update_preview(self):
+        """Seçili tasarımları, seçim yoksa en iyi adayları haritada önizle"""
+        selected = self.selected_designs()
+        candidates = selected or self.designs[:self.PREVIEW_COUNT]
+        previews = [{'polylines': design_legs(design), 'highlight': bool(selected) or i == 0,
+                     'conflict': design['conflict_nm'] > 0}
+                    for i, design in enumerate(candidates)]
+        self.map_widget.set_sweep_preview(previews)
+
+    def add_selected_to_map(self):
+        designs = self.selected_designs()
+        if not designs:
+            QMessageBox.information(self, "Point Merge Sweep", "Haritaya eklemek için tablodan tasarım seçin.")
+            return
+        for design in designs:
+            self.map_widget.draw_path_extension(dict(design['config']))
+        self.summary_label.setText(f"{len(designs)} tasarım point merge olarak haritaya eklendi")
+
+    def closeEvent(self, event):
+        # Dialog kapanınca önizlemeyi haritadan kaldır
+        self.map_widget.set_sweep_preview(None)
+        super().closeEvent(event)
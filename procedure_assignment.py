@@ -0,0 +1,358 @@
+"""
+Trajectory - prosedür otomatik eşleştirme
+
+Her uçuş, ucuz ön filtrelerden (tip, meydan, pist, sınır kutusu) geçen
+SID/STAR adaylarıyla ayrık Fréchet (varsayılan) veya DTW mesafesiyle
+karşılaştırılır ve en yakın prosedüre eşleştirilir.
+"""
+
+import math
+import re
+
+import numpy as np
+
+from conformance import (ProcedurePolyline, iter_procedures, to_local_nm, trajectory_columns)
+from geodesy import NM_PER_DEG_LAT
+
+# Uçuşun aday prosedürlere izdüşümü için kaba örnek sayısı; koridor penceresi
+# daha sık örnekten (_WINDOW_SAMPLES) kesilir
+_PROJECTION_SAMPLES = 64
+_WINDOW_SAMPLES = 256
+# Toplu DP'de parça başına çift sayısı (bellek sınırı)
+_PAIR_CHUNK = 4096
+
+
+def resample_polyline(xs, ys, count):
+    """Resample a polyline to count points evenly spaced by arc length; returns (count, 2)."""
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    if len(xs) == 0:
+        return np.zeros((count, 2))
+    steps = np.hypot(np.diff(xs), np.diff(ys))
+    cumulative = np.concatenate([[0.0], np.cumsum(steps)])
+    if cumulative[-1] <= 0:
+        return np.column_stack([np.full(count, xs[0]), np.full(count, ys[0])])
+    targets = np.linspace(0.0, cumulative[-1], count)
+    return np.column_stack([np.interp(targets, cumulative, xs), np.interp(targets, cumulative, ys)])
+
+
+def batched_shape_distance(first, second, method='frechet'):
+    """Shape distance between many polyline pairs at once.
+
+    Args:
+        first: (K, M, 2) dizisi
+        second: (K, N, 2) dizisi
+        method: 'frechet' (ayrık Fréchet) veya 'dtw' (yol uzunluğuna bölünmüş DTW)
+
+    Returns a (K,) array of distances in the input units. DP tablosu
+    anti-diyagonaller boyunca doldurulur; her adım tüm çiftler ve diyagonal
+    hücreleri için vektöreldir.
+    """
+    first = np.asarray(first, dtype=np.float64)
+    second = np.asarray(second, dtype=np.float64)
+    pairs, m, n = first.shape[0], first.shape[1], second.shape[1]
+    if pairs == 0:
+        return np.zeros(0)
+    cost = np.sqrt(((first[:, :, None, :] - second[:, None, :, :]) ** 2).sum(axis=-1))
+    table = np.full((pairs, m + 1, n + 1), np.inf)
+    table[:, 0, 0] = 0.0
+    # Tablo 1 tabanlı; 0. satır/sütun sınır koşulu
+    for diagonal in range(m + n - 1):
+        i = np.arange(max(0, diagonal - n + 1), min(diagonal, m - 1) + 1)
+        j = diagonal - i
+        best_previous = np.minimum(np.minimum(table[:, i, j + 1], table[:, i + 1, j]), table[:, i, j])
+        if method == 'frechet':
+            table[:, i + 1, j + 1] = np.maximum(cost[:, i, j], best_previous)
+        else:
+            table[:, i + 1, j + 1] = cost[:, i, j] + best_previous
+    result = table[:, m, n]
+    if method != 'frechet':
+        result = result / (m + n)
+    return result
+
+
+class _PaddedSegments:
+    """All procedures' segments in the common plane, padded to (procedures, max segments)"""
+
+    def __init__(self, shapes_xy):
+        max_segments = max(len(xs) - 1 for xs, _ys in shapes_xy)
+        count = len(shapes_xy)
+        self.x0 = np.zeros((count, max_segments))
+        self.y0 = np.zeros((count, max_segments))
+        self.dx = np.zeros((count, max_segments))
+        self.dy = np.zeros((count, max_segments))
+        self.lengths = np.ones((count, max_segments))
+        self.cumulative = np.zeros((count, max_segments))
+        self.valid = np.zeros((count, max_segments), dtype=bool)
+        self.total = np.zeros(count)
+        for i, (xs, ys) in enumerate(shapes_xy):
+            segments = len(xs) - 1
+            lengths = np.hypot(np.diff(xs), np.diff(ys))
+            self.x0[i, :segments] = xs[:-1]
+            self.y0[i, :segments] = ys[:-1]
+            self.dx[i, :segments] = np.diff(xs)
+            self.dy[i, :segments] = np.diff(ys)
+            self.lengths[i, :segments] = np.where(lengths > 0, lengths, 1.0)
+            self.cumulative[i, :segments] = np.concatenate([[0.0], np.cumsum(lengths)[:-1]])
+            self.valid[i, :segments] = lengths > 0
+            self.total[i] = lengths.sum()
+
+    def project(self, px, py, procedure_indices):
+        """Project points onto several procedures at once.
+
+        Returns (cross_track, along_track) arrays of shape (points, procedures);
+        cross-track işaretsiz mutlak mesafedir.
+        """
+        x0, y0 = self.x0[procedure_indices], self.y0[procedure_indices]
+        dx, dy = self.dx[procedure_indices], self.dy[procedure_indices]
+        lengths = self.lengths[procedure_indices]
+        rx = px[:, None, None] - x0[None]
+        ry = py[:, None, None] - y0[None]
+        t = np.clip((rx * dx + ry * dy) / (lengths ** 2), 0.0, 1.0)
+        dist_sq = (rx - t * dx) ** 2 + (ry - t * dy) ** 2
+        dist_sq = np.where(self.valid[procedure_indices][None], dist_sq, np.inf)
+        seg = np.argmin(dist_sq, axis=2)[..., None]
+        cross = np.sqrt(np.take_along_axis(dist_sq, seg, axis=2)[..., 0])
+        cumulative = np.broadcast_to(self.cumulative[procedure_indices][None], t.shape)
+        along = (np.take_along_axis(cumulative, seg, axis=2) +
+                 np.take_along_axis(t, seg, axis=2) *
+                 np.take_along_axis(np.broadcast_to(lengths[None], t.shape), seg, axis=2))[..., 0]
+        return cross, along
+
+
+def _heading_deg(x0, y0, x1, y1):
+    """Yerel düzlemde (x doğu, y kuzey) iki nokta arası yön, derece"""
+    return math.degrees(math.atan2(x1 - x0, y1 - y0)) % 360.0
+
+
+def _angle_difference(a, b):
+    return abs((a - b + 180.0) % 360.0 - 180.0)
+
+
+class _RunwayEnd:
+    """One usable runway direction: threshold position and heading toward the far end"""
+
+    def __init__(self, airport, name, x, y, heading):
+        self.airport = airport
+        self.name = name
+        self.x = x
+        self.y = y
+        self.heading = heading
+
+
+def _runway_ends(runways, ref_lat, ref_lon):
+    """Build runway directions per airport from data_manager.runways entries."""
+    ends = {}
+    for runway in runways or []:
+        runway_id = runway.get('id', '')
+        match = re.match(r'(\S+)\s+([^/]+)/(.+)', runway_id)
+        if not match:
+            continue
+        airport, thr1, thr2 = match.group(1), match.group(2).strip(), match.group(3).strip()
+        (x1, x2), (y1, y2) = to_local_nm([runway['start_lat'], runway['end_lat']],
+                                         [runway['start_lon'], runway['end_lon']], ref_lat, ref_lon)
+        ends.setdefault(airport, []).append(_RunwayEnd(airport, thr1, x1, y1, _heading_deg(x1, y1, x2, y2)))
+        ends.setdefault(airport, []).append(_RunwayEnd(airport, thr2, x2, y2, _heading_deg(x2, y2, x1, y1)))
+    return ends
+
+
+def _detect_runway(runway_ends, x, y, heading, arrival, max_lateral_nm=3.0, max_heading_diff=30.0):
+    """Return the runway end name a flight lands on (arrival) or departs from, or None.
+
+    İnişte son nokta eşiğin önündeki uzatılmış merkez hattında, kalkışta ilk
+    nokta eşiğin ilerisinde olmalıdır; pist yönü uçuş yönüyle hizalı olmalıdır.
+    """
+    best_name, best_lateral = None, max_lateral_nm
+    for end in runway_ends:
+        if _angle_difference(end.heading, heading) > max_heading_diff:
+            continue
+        rad = math.radians(end.heading)
+        ux, uy = math.sin(rad), math.cos(rad)
+        along = (x - end.x) * ux + (y - end.y) * uy
+        lateral = abs((x - end.x) * uy - (y - end.y) * ux)
+        # İniş: eşiğin gerisinde (along < ~pist boyu), kalkış: eşiğin ilerisinde
+        if arrival and along > 3.0:
+            continue
+        if not arrival and along < -1.0:
+            continue
+        if lateral < best_lateral:
+            best_name, best_lateral = end.name, lateral
+    return best_name
+
+
+def assign_procedures(trajectories, procedures, runways=None, method='frechet', resample_points=32,
+                      max_distance_nm=3.0, window_nm=5.0, min_coverage=0.5, airport_radius_nm=40.0,
+                      bbox_margin_nm=5.0, tie_tolerance_nm=0.5, min_altitude_change_ft=1000.0):
+    """Match each trajectory to its most likely SID/STAR.
+
+    Args:
+        trajectories: iterable of (trajectory_id, points) pairs
+        procedures: data_manager.procedures
+        runways: data_manager.runways (meydan/pist ön filtreleri için, isteğe bağlı)
+        method: 'frechet' veya 'dtw'
+        max_distance_nm: Bundan büyük şekil mesafesinde uçuş eşleştirilmez
+        window_nm: Uçuşun prosedüre bu kadar yakın bölümü karşılaştırılır
+        min_coverage: Prosedür uzunluğunun en az bu oranı uçulmuş olmalı
+        tie_tolerance_nm: En iyiye bu kadar yakın adaylardan en uzun kapsananı seçilir
+
+    Returns (assignments, stats). assignments is a list of dicts per flight
+    with 'id', 'proc_type', 'airport', 'runway', 'procedure' (None when
+    unassigned), 'distance_nm', 'coverage', 'candidates' and 'detected_runway';
+    stats holds pair counts before and after prefiltering.
+    """
+    procedure_entries = []
+    for proc_type, airport, runway, name, waypoints in iter_procedures(procedures):
+        try:
+            polyline = ProcedurePolyline(waypoints)
+        except ValueError:
+            continue
+        procedure_entries.append({'proc_type': proc_type, 'airport': airport, 'runway': runway,
+                                  'procedure': name, 'polyline': polyline})
+    flights = [(trajectory_id, trajectory_columns(points)) for trajectory_id, points in trajectories]
+    stats = {'flights': len(flights), 'procedures': len(procedure_entries),
+             'pairs_total': len(flights) * len(procedure_entries), 'pairs_compared': 0}
+    if not procedure_entries or not flights:
+        return [_unassigned(trajectory_id) for trajectory_id, _columns in flights], stats
+
+    # Ortak yerel düzlem: tüm prosedür waypoint'lerinin ortası
+    ref_lat = float(np.mean([p['polyline'].ref_lat for p in procedure_entries]))
+    ref_lon = float(np.mean([p['polyline'].ref_lon for p in procedure_entries]))
+    proc_types = np.array([p['proc_type'] for p in procedure_entries])
+    proc_airports = np.array([p['airport'] for p in procedure_entries])
+    proc_runways = np.array([p['runway'] for p in procedure_entries])
+    proc_boxes = np.array([p['polyline'].bounds for p in procedure_entries])
+    proc_shapes = []
+    proc_xy = []
+    for entry in procedure_entries:
+        xs, ys = to_local_nm(entry['polyline'].lats, entry['polyline'].lons, ref_lat, ref_lon)
+        proc_xy.append((xs, ys))
+        proc_shapes.append(resample_polyline(xs, ys, resample_points))
+        entry['covered_weight'] = entry['polyline'].length
+    padded_segments = _PaddedSegments(proc_xy)
+
+    runway_ends = _runway_ends(runways, ref_lat, ref_lon)
+    airport_centers = {airport: (np.mean([e.x for e in ends]), np.mean([e.y for e in ends]))
+                       for airport, ends in runway_ends.items()}
+    runway_names = {airport: {e.name for e in ends} for airport, ends in runway_ends.items()}
+    margin_lat = bbox_margin_nm / NM_PER_DEG_LAT
+    margin_lon = bbox_margin_nm / (NM_PER_DEG_LAT * max(math.cos(math.radians(ref_lat)), 0.01))
+
+    pair_flights, pair_procs, pair_coverage, pair_shapes = [], [], [], []
+    flight_info = []
+    for flight_index, (trajectory_id, (lats, lons, alts)) in enumerate(flights):
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        alts = np.asarray(alts, dtype=np.float64)
+        info = {'detected_runway': None, 'airport': None, 'proc_type': None}
+        flight_info.append(info)
+        if len(lats) < 2:
+            continue
+        fx, fy = to_local_nm(lats, lons, ref_lat, ref_lon)
+        fine_sample = resample_polyline(fx, fy, _WINDOW_SAMPLES)
+
+        # Tip ön filtresi: irtifa eğilimi
+        altitude_change = alts[-1] - alts[0]
+        if altitude_change <= -min_altitude_change_ft:
+            info['proc_type'] = 'STAR'
+        elif altitude_change >= min_altitude_change_ft:
+            info['proc_type'] = 'SID'
+        candidates = np.ones(len(procedure_entries), dtype=bool)
+        if info['proc_type'] is not None:
+            candidates &= proc_types == info['proc_type']
+
+        # Meydan ve pist ön filtresi: uçuşun alçak ucu
+        arrival = info['proc_type'] != 'SID'
+        end_index = -1 if arrival else 0
+        end_x, end_y = fx[end_index], fy[end_index]
+        best_airport, best_distance = None, airport_radius_nm
+        for airport, (cx, cy) in airport_centers.items():
+            distance = math.hypot(end_x - cx, end_y - cy)
+            if distance < best_distance:
+                best_airport, best_distance = airport, distance
+        if best_airport is not None and np.any(candidates & (proc_airports == best_airport)):
+            info['airport'] = best_airport
+            candidates &= proc_airports == best_airport
+            # Son (veya ilk) ~3 NM'lik bölümün yönü
+            end_length = np.hypot(*np.diff(fine_sample, axis=0).T).sum()
+            offset = max(1, min(_WINDOW_SAMPLES - 1, int(_WINDOW_SAMPLES * 3.0 / max(end_length, 1e-9))))
+            if arrival:
+                heading = _heading_deg(*fine_sample[-1 - offset], *fine_sample[-1])
+            else:
+                heading = _heading_deg(*fine_sample[0], *fine_sample[offset])
+            detected = _detect_runway(runway_ends[best_airport], end_x, end_y, heading, arrival)
+            info['detected_runway'] = detected
+            if detected is not None:
+                names = runway_names[best_airport]
+                threshold_named = np.isin(proc_runways, list(names))
+                candidates &= ~threshold_named | (proc_runways == detected)
+
+        # Sınır kutusu ön filtresi (vektörel)
+        min_lon, max_lon = lons.min() - margin_lon, lons.max() + margin_lon
+        min_lat, max_lat = lats.min() - margin_lat, lats.max() + margin_lat
+        candidates &= ((proc_boxes[:, 0] <= max_lon) & (proc_boxes[:, 2] >= min_lon) &
+                       (proc_boxes[:, 1] <= max_lat) & (proc_boxes[:, 3] >= min_lat))
+
+        # Uçuşu tüm adaylara tek seferde izdüşür; her adayın koridorundaki bölümünü kes
+        candidate_indices = np.flatnonzero(candidates)
+        if len(candidate_indices) == 0:
+            continue
+        sample = resample_polyline(fx, fy, _PROJECTION_SAMPLES)
+        to_fine = (_WINDOW_SAMPLES - 1) / (_PROJECTION_SAMPLES - 1)
+        cross, along = padded_segments.project(sample[:, 0], sample[:, 1], candidate_indices)
+        near = cross <= window_nm
+        has_near = near.sum(axis=0) >= 2
+        first = np.argmax(near, axis=0)
+        last = _PROJECTION_SAMPLES - 1 - np.argmax(near[::-1], axis=0)
+        columns = np.arange(len(candidate_indices))
+        coverage = (along[last, columns] - along[first, columns]) / padded_segments.total[candidate_indices]
+        for column in np.flatnonzero(has_near & (coverage >= min_coverage)):
+            window = fine_sample[int(round(first[column] * to_fine)):int(round(last[column] * to_fine)) + 1]
+            pair_flights.append(flight_index)
+            pair_procs.append(candidate_indices[column])
+            pair_coverage.append(coverage[column])
+            pair_shapes.append(resample_polyline(window[:, 0], window[:, 1], resample_points))
+
+    stats['pairs_compared'] = len(pair_flights)
+    pair_flights = np.asarray(pair_flights, dtype=np.int64)
+    pair_procs = np.asarray(pair_procs, dtype=np.int64)
+    pair_coverage = np.asarray(pair_coverage, dtype=np.float64)
+    distances = np.empty(len(pair_flights))
+    for start in range(0, len(pair_flights), _PAIR_CHUNK):
+        end = min(len(pair_flights), start + _PAIR_CHUNK)
+        flight_shapes = np.stack(pair_shapes[start:end])
+        procedure_shapes = np.stack([proc_shapes[i] for i in pair_procs[start:end]])
+        distances[start:end] = batched_shape_distance(flight_shapes, procedure_shapes, method)
+
+    assignments = []
+    for flight_index, (trajectory_id, _columns) in enumerate(flights):
+        info = flight_info[flight_index]
+        rows = np.flatnonzero(pair_flights == flight_index)
+        result = _unassigned(trajectory_id)
+        result['candidates'] = int(len(rows))
+        result['detected_runway'] = info['detected_runway']
+        if len(rows):
+            best = distances[rows].min()
+            if best <= max_distance_nm:
+                # Neredeyse eşit adaylardan kapsanan prosedür uzunluğu en büyük olanı seç
+                tied = rows[distances[rows] <= best + tie_tolerance_nm]
+                covered = pair_coverage[tied] * np.array(
+                    [procedure_entries[i]['covered_weight'] for i in pair_procs[tied]])
+                chosen = tied[int(np.argmax(covered))]
+                entry = procedure_entries[pair_procs[chosen]]
+                result.update({
+                    'proc_type': entry['proc_type'],
+                    'airport': entry['airport'],
+                    'runway': entry['runway'],
+                    'procedure': entry['procedure'],
+                    'distance_nm': float(distances[chosen]),
+                    'coverage': float(pair_coverage[chosen]),
+                })
+            else:
+                result['distance_nm'] = float(best)
+        assignments.append(result)
+    return assignments, stats
+
+
+def _unassigned(trajectory_id):
+    return {'id': trajectory_id, 'proc_type': None, 'airport': None, 'runway': None, 'procedure': None,
+            'distance_nm': float('nan'), 'coverage': 0.0, 'candidates': 0, 'detected_runway': None}
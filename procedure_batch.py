@@ -0,0 +1,251 @@
+"""
+Prosedür tasarımları için komut satırı toplu çalıştırıcısı
+
+JSON veya CSV tasarım dosyasındaki trombone, point merge ve double PMS
+tasarımlarının waypoint'lerini Qt başlatmadan hesaplar ve dışa aktarır.
+
+Kullanım:
+    python procedure_batch.py designs.json -o exports
+    python procedure_batch.py designs.csv -o exports --airspace data/Airspace_01.01.2025 --workers 4
+
+CSV'de liste değerleri ';' ile ayrılır (segments = "5;5;5"); trombone pisti
+'runway' ("LTFM 36/18") ve 'threshold' ("36") ya da start/end koordinatlarıyla
+verilir.
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import geodesy
+from procedure_geometry import calculate_path_extension_waypoints
+from trombone_sweep import runway_approach
+from utils import decimal_to_dms
+
+# CSV'de mantıksal olarak okunacak sütunlar
+BOOLEAN_KEYS = ('clockwise', 'extension_inverted', 'double_pms_enabled')
+TRUE_VALUES = ('1', 'true', 'yes', 'evet', 'e')
+# CSV'de sayıya çevrilmeden metin olarak okunacak sütunlar ("05" eşiği "5" olmamalı)
+STRING_KEYS = ('name', 'pattern_type', 'runway', 'threshold', 'second_leg_type')
+
+
+def _parse_csv_value(key, value):
+    value = value.strip()
+    if key in BOOLEAN_KEYS:
+        return value.lower() in TRUE_VALUES
+    if key in STRING_KEYS:
+        return value
+    if key == 'segments':
+        parts = [part for part in value.split(';') if part.strip()]
+        if len(parts) == 1 and '.' not in parts[0]:
+            return int(parts[0])
+        return [float(part) for part in parts]
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def load_design_specs(path):
+    """Read design dicts from a JSON or CSV file"""
+    if path.lower().endswith('.csv'):
+        designs = []
+        with open(path, 'r', newline='', encoding='utf-8-sig') as csvfile:
+            for row in csv.DictReader(csvfile):
+                design = {key.strip(): _parse_csv_value(key.strip(), value)
+                          for key, value in row.items() if key and value is not None and value.strip() != ''}
+                if design.get('second_leg_type'):
+                    design['second_leg'] = {'type': design.pop('second_leg_type'),
+                                            'distance': float(design.pop('second_leg_distance', 0.0))}
+                designs.append(design)
+        return designs
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    designs = data.get('designs', []) if isinstance(data, dict) else data
+    if not isinstance(designs, list):
+        raise ValueError("JSON tasarım dosyası bir liste ya da {'designs': [...]} olmalı")
+    return designs
+
+
+def load_runways_and_areas(airspace_folder, quiet=False):
+    """(runways, restricted_areas) from an airspace folder via DataManager"""
+    # Yalnızca --airspace verildiğinde gerekli; başlangıç süresine eklenmesin
+    from models import DataManager
+    data_manager = DataManager()
+    output = io.StringIO() if quiet else None
+    with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+        data_manager.load_airspace_data(airspace_folder)
+    return data_manager.runways, data_manager.restricted_areas
+
+
+def resolve_design(design, runways):
+    """Normalize a design spec into (name, config, approach); raises ValueError on bad input."""
+    config = dict(design)
+    name = str(config.pop('name', '') or '')
+    config['pattern_type'] = str(config.get('pattern_type', 'trombone')).lower()
+    approach = None
+    if config['pattern_type'] == 'trombone':
+        runway_id = config.pop('runway', None)
+        threshold = config.pop('threshold', None)
+        if all(key in config for key in ('start_lat', 'start_lon', 'end_lat', 'end_lon')):
+            approach = {'id': str(runway_id or 'RWY'),
+                        **{key: float(config.pop(key)) for key in ('start_lat', 'start_lon', 'end_lat', 'end_lon')}}
+        elif runway_id:
+            runway = next((r for r in runways if r['id'] == runway_id or r.get('alt_id') == runway_id), None)
+            if runway is None:
+                raise ValueError(f"Pist bulunamadı: {runway_id} (--airspace verildi mi?)")
+            approach = runway_approach(runway, None if threshold is None else str(threshold).split('.')[0])
+        else:
+            raise ValueError("Trombone için 'runway' ya da start/end koordinatları gerekli")
+        for key in ('threshold_distance', 'base_angle', 'base_distance', 'extension_length'):
+            if key not in config:
+                raise ValueError(f"Trombone parametresi eksik: {key}")
+        config['runway_id'] = approach['id']
+    elif config['pattern_type'] != 'pointmerge':
+        raise ValueError(f"Bilinmeyen pattern_type: {config['pattern_type']}")
+    return name, config, approach
+
+
+def compute_design(job):
+    """Worker: (index, name, config, approach) -> result dict (waypoints or error)"""
+    index, name, config, approach = job
+    result = {'index': index, 'name': name, 'pattern_type': config['pattern_type'], 'config': config}
+    try:
+        # Geometri fonksiyonlarının hata ayıklama çıktıları özet raporu karıştırmasın
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            waypoints = calculate_path_extension_waypoints(approach, config)
+        if not waypoints:
+            raise ValueError("Waypoint üretilemedi")
+        lats = [w['lat'] for w in waypoints]
+        lons = [w['lon'] for w in waypoints]
+        distances = geodesy.segment_distances_nm(lats, lons).tolist()
+        result['waypoints'] = waypoints
+        result['segment_distances'] = distances
+        result['total_distance_nm'] = sum(distances)
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+
+def _safe_file_name(name):
+    return re.sub(r'[^\w.-]+', '_', name).strip('_') or 'design'
+
+
+def write_route_csv(path, result):
+    """Write one design in the map's 'Export CSV' route format"""
+    with open(path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Route Name:", result['name']])
+        writer.writerow(["Route Type:", result['pattern_type']])
+        config = result['config']
+        if result['pattern_type'] == 'pointmerge':
+            writer.writerow(["Point Merge Configuration:", ""])
+            writer.writerow(["First Point Distance (NM):", f"{config.get('first_point_distance', config.get('distance', 0.0)):.2f}"])
+            writer.writerow(["Track Angle (°):", f"{config.get('track_angle', config.get('angle', 0.0)):.2f}"])
+            segments = config.get('segments', config.get('num_segments', 5))
+            writer.writerow(["Number of Segments:", f"{len(segments) if isinstance(segments, list) else int(segments)}"])
+        else:
+            writer.writerow(["Trombone Configuration:", ""])
+        writer.writerow(["Total Distance (NM):", f"{result['total_distance_nm']:.2f}"])
+        writer.writerow([])
+        writer.writerow(["Waypoints"])
+        writer.writerow(["Wpt", "Lat (DMS)", "Lon (DMS)", "Lat (Dec)", "Lon (Dec)"])
+        for waypoint in result['waypoints']:
+            lat, lon = waypoint['lat'], waypoint['lon']
+            writer.writerow([waypoint['name'], decimal_to_dms(lat, is_latitude=True),
+                             decimal_to_dms(lon, is_latitude=False), f"{lat:.6f}", f"{lon:.6f}"])
+
+
+def write_results(results, output_dir, output_format='csv'):
+    """Write exports for successful designs and a summary; returns written file paths"""
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    if output_format == 'json':
+        path = os.path.join(output_dir, 'designs.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump([{key: value for key, value in result.items() if key != 'index'} for result in results],
+                      f, indent=2, ensure_ascii=False)
+        return [path]
+
+    used_names = set()
+    summary_rows = []
+    for result in results:
+        file_name = ''
+        if 'error' not in result:
+            base = _safe_file_name(result['name'])
+            file_name, counter = f"{base}.csv", 2
+            while file_name in used_names:
+                file_name, counter = f"{base}_{counter}.csv", counter + 1
+            used_names.add(file_name)
+            write_route_csv(os.path.join(output_dir, file_name), result)
+            written.append(os.path.join(output_dir, file_name))
+        summary_rows.append([result['name'], result['pattern_type'], len(result.get('waypoints', [])),
+                             f"{result['total_distance_nm']:.2f}" if 'error' not in result else '',
+                             file_name, result.get('error', '')])
+    path = os.path.join(output_dir, 'summary.csv')
+    with open(path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['Name', 'Type', 'Waypoints', 'Total Distance (NM)', 'File', 'Error'])
+        writer.writerows(summary_rows)
+    written.append(path)
+    return written
+
+
+def run_batch(designs, runways=(), workers=1):
+    """Resolve and compute all designs; returns result dicts in input order"""
+    jobs, results = [], []
+    for index, design in enumerate(designs):
+        try:
+            name, config, approach = resolve_design(design, runways)
+            jobs.append((index, name or f"design_{index + 1}", config, approach))
+        except (ValueError, TypeError) as e:
+            results.append({'index': index, 'name': str(design.get('name') or f"design_{index + 1}"),
+                            'pattern_type': str(design.get('pattern_type', 'trombone')),
+                            'config': design, 'error': str(e)})
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results.extend(executor.map(compute_design, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    else:
+        results.extend(compute_design(job) for job in jobs)
+    return sorted(results, key=lambda result: result['index'])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Trombone / point merge tasarımlarını toplu hesapla ve dışa aktar")
+    parser.add_argument('specs', help="Tasarım dosyası (.json veya .csv)")
+    parser.add_argument('-o', '--output', required=True, help="Çıktı klasörü")
+    parser.add_argument('--airspace', help="Pist adları için hava sahası veri klasörü (Runways.xml)")
+    parser.add_argument('--format', choices=('csv', 'json'), default='csv', help="Çıktı biçimi")
+    parser.add_argument('--workers', type=int, default=1, help="Paralel işçi süreç sayısı")
+    parser.add_argument('-q', '--quiet', action='store_true', help="Veri yükleme çıktısını gizle")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    try:
+        designs = load_design_specs(args.specs)
+    except (OSError, ValueError) as e:
+        print(f"HATA: Tasarım dosyası okunamadı: {e}")
+        return 2
+    runways = []
+    if args.airspace:
+        runways, _ = load_runways_and_areas(args.airspace, quiet=args.quiet)
+
+    results = run_batch(designs, runways, workers=max(1, args.workers))
+    written = write_results(results, args.output, args.format)
+    failed = [result for result in results if 'error' in result]
+    for result in failed:
+        print(f"HATA: {result['name']}: {result['error']}")
+    print(f"{len(results) - len(failed)}/{len(results)} tasarım hesaplandı, {len(written)} dosya yazıldı "
+          f"({time.perf_counter() - start_time:.2f} sn)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,540 @@
+"""
+Prosedür tasarımı geometri çekirdeği
+
+Trombone (A-B-C), point merge (ana/ikinci bacak) ve double PMS waypoint
+hesapları ile DMS yardımcıları. Dialoglar (pointmerge, path_extension),
+harita ve komut satırı toplu çalıştırıcısı (procedure_batch) aynı
+fonksiyonları kullanır; pointmerge ve path_extension bu isimleri geriye
+uyumluluk için yeniden dışa aktarır.
+
+Bu modül Qt'ye bağımlı değildir; hatalar QMessageBox yerine ValueError
+olarak bildirilir.
+"""
+
+import math
+
+import numpy as np
+
+import geodesy
+import tracing
+from utils import calculate_point_at_distance_and_bearing
+
+class DMS:
+    """Degrees, Minutes, Seconds coordinate component"""
+    def __init__(self, degrees=0, minutes=0, seconds=0.0):
+        self.degrees = degrees
+        self.minutes = minutes
+        self.seconds = seconds
+
+def dms_to_decimal(dms, direction=None):
+    """Convert DMS coordinates to decimal degrees"""
+    decimal = abs(dms.degrees) + (dms.minutes / 60.0) + (dms.seconds / 3600.0)
+    if direction in ['S', 'W'] or dms.degrees < 0:
+        decimal = -decimal
+    return decimal
+
+def decimal_to_dms(decimal_degrees):
+    """Convert decimal degrees to DMS"""
+    is_negative = decimal_degrees < 0
+    decimal_degrees = abs(decimal_degrees)
+    degrees = int(decimal_degrees)
+    minutes_float = (decimal_degrees - degrees) * 60
+    minutes = int(minutes_float)
+    seconds = (minutes_float - minutes) * 60
+    
+    # If negative, adjust degrees
+    if is_negative:
+        degrees = -degrees
+        
+    return DMS(degrees, minutes, seconds)
+
+def format_dms_output(decimal_degrees, is_latitude=True):
+    """Format decimal degrees as DMS string"""
+    dms = decimal_to_dms(abs(decimal_degrees))
+    direction = 'N' if decimal_degrees >= 0 and is_latitude else 'S' if is_latitude else 'E' if decimal_degrees >= 0 else 'W'
+    return f"{abs(dms.degrees):02d}°{dms.minutes:02d}'{dms.seconds:06.3f}\"{direction}"
+
+def parse_dms(degrees_str, minutes_str, seconds_str, direction=None):
+    """Parse DMS strings into a DMS object"""
+    try:
+        degrees = int(degrees_str) if degrees_str else 0
+        minutes = int(minutes_str) if minutes_str else 0
+        seconds = float(seconds_str) if seconds_str else 0.0
+        
+        # Handle negation based on direction
+        if direction in ['S', 'W']:
+            degrees = -abs(degrees)
+            
+        return DMS(degrees, minutes, seconds)
+    except ValueError:
+        raise ValueError("Invalid coordinate format")
+
+def calculate_point_from_bearing(lat, lon, distance_nm, bearing_deg):
+    """Calculate a point at given distance and bearing from starting point
+    
+    Args:
+        lat: Latitude in decimal degrees
+        lon: Longitude in decimal degrees
+        distance_nm: Distance in nautical miles
+        bearing_deg: Bearing in degrees (0 = North, 90 = East, 180 = South, 270 = West)
+        
+    Returns:
+        Tuple of (latitude, longitude) in decimal degrees
+    """
+    return geodesy.destination_point(lat, lon, distance_nm, bearing_deg)
+
+def calculate_leg_points(merge_lat, merge_lon, initial_track, leg_distance, segment_distances, clockwise=True):
+    """Calculate points along a sequencing leg
+    
+    Args:
+        merge_lat: Merge point latitude in decimal degrees
+        merge_lon: Merge point longitude in decimal degrees
+        initial_track: Initial track angle in degrees where:
+                      - 0 degrees = North
+                      - 90 degrees = East
+                      - 180 degrees = South
+                      - 270 degrees = West
+        leg_distance: Distance from merge point to leg in NM
+        segment_distances: List of segment distances in NM
+        clockwise: Whether the arc goes clockwise from the initial point
+        
+    Returns:
+        List of points (lat, lon) along the leg
+    """
+    try:
+        # Validate inputs
+        if merge_lat is None or merge_lon is None:
+            raise ValueError("Merge point coordinates cannot be None")
+            
+        if leg_distance <= 0:
+            raise ValueError("Leg distance must be positive")
+            
+        if not segment_distances:
+            raise ValueError("Segment distances list cannot be empty")
+            
+        for i, dist in enumerate(segment_distances):
+            if dist <= 0:
+                raise ValueError(f"Segment {i+1} distance must be positive")
+        
+        # Her nokta birleşme noktasından leg_distance uzaklıkta; açılar
+        # kümülatif yay uzunluğundan (yay = yarıçap * açı) tek seferde hesaplanır
+        direction = 1 if clockwise else -1
+        cumulative_arc = np.concatenate([[0.0], np.cumsum(segment_distances, dtype=np.float64)])
+        bearings = (initial_track + np.degrees(direction * cumulative_arc / leg_distance)) % 360
+        lats, lons = geodesy.destination(merge_lat, merge_lon, leg_distance, bearings)
+        points = list(zip(lats.tolist(), lons.tolist()))
+        
+        return points
+    except Exception as e:
+        tracing.error("Error in calculate_leg_points: %s", e)
+        import traceback
+        traceback.print_exc()
+        raise ValueError(f"Failed to calculate leg points: {str(e)}")
+
+def calculate_path_extension_waypoints(runway, config):
+    """Calculate waypoints for path extension based on pattern type"""
+    pattern_type = config.get('pattern_type', 'trombone')
+    if pattern_type == 'pointmerge':
+        return calculate_point_merge_waypoints(runway, config)
+    return calculate_trombone_waypoints(runway, config)
+
+
+@tracing.traced()
+def calculate_point_merge_waypoints(runway, config):
+    """Calculate waypoints for a Point Merge System based on the configuration
+    
+    Args:
+        runway: Dictionary with runway coordinates (not used if direct coordinates provided)
+        config: Configuration dictionary from PathExtensionDialog
+        
+    Returns:
+        Dictionary with merge point and leg points for visualization
+    """
+    try:
+        # Check if Double PMS is enabled and handle it
+        if config.get('double_pms_enabled'):
+            return _calculate_double_pms_from_config(config)
+
+        # Determine merge point coordinates
+        if 'merge_lat' not in config or 'merge_lon' not in config:
+            raise ValueError("Merge point coordinates are missing from configuration")
+            
+        merge_lat, merge_lon = config.get('merge_lat', 0.0), config.get('merge_lon', 0.0)
+        
+        # Main leg configuration - her iki isimle de kontrol et
+        # Önce 'first_point_distance', yoksa 'distance' kullan
+        if 'first_point_distance' not in config and 'distance' not in config:
+            raise ValueError("Distance from merge point is missing (first_point_distance/distance)")
+            
+        first_point_distance = config.get('first_point_distance', config.get('distance', 15.0))
+        # Önce 'track_angle', yoksa 'angle' kullan
+        track_angle = config.get('track_angle', config.get('angle', 0.0))
+        clockwise = config.get('clockwise', True)
+        
+        # Extract segment distances for main leg, or create evenly spaced segments
+        segment_distances = []
+        
+        # Eğer 'segments' bir liste ise, doğrudan kullan
+        if 'segments' in config and isinstance(config['segments'], list):
+            segment_distances = config['segments']
+        # Eğer 'segments' bir sayı ise, eşit segmentler oluştur
+        elif 'segments' in config and isinstance(config['segments'], (int, float)):
+            num_segments = int(config['segments'])
+            total_arc_width = config.get('arc_width', 60.0)  # In degrees
+            arc_length_nm = math.radians(total_arc_width) * first_point_distance
+            segment_distance = arc_length_nm / num_segments if num_segments > 0 else arc_length_nm
+            segment_distances = [segment_distance] * num_segments
+        # Eğer 'num_segments' varsa, bu sayıda eşit segment oluştur
+        elif 'num_segments' in config:
+            num_segments = int(config.get('num_segments', 10))
+            total_arc_width = config.get('arc_width', 60.0)  # In degrees
+            arc_length_nm = math.radians(total_arc_width) * first_point_distance
+            segment_distances = [arc_length_nm / num_segments] * num_segments
+        # Hiçbir segment bilgisi yoksa, varsayılan 5 segment oluştur
+        else:
+            num_segments = 5
+            total_arc_width = config.get('arc_width', 60.0) 
+            arc_length_nm = math.radians(total_arc_width) * first_point_distance
+            segment_distances = [arc_length_nm / num_segments] * num_segments
+            
+        # Güvenlik kontrolü - segment_distances mutlaka bir liste olmalı
+        if not isinstance(segment_distances, list) or len(segment_distances) == 0:
+            tracing.warning("UYARI: segment_distances düzgün bir liste değil, varsayılan liste oluşturuluyor")
+            segment_distances = [5.0] * 5
+        
+        # Calculate main leg points
+        main_leg_points = calculate_leg_points(
+            merge_lat, merge_lon,
+            track_angle, first_point_distance,
+            segment_distances, clockwise
+        )
+        
+        # Second leg configuration
+        second_leg_points = []
+        if 'second_leg' in config and config['second_leg']:
+            second_leg = config['second_leg']
+            
+            if 'type' not in second_leg or 'distance' not in second_leg:
+                raise ValueError("Second leg configuration is incomplete")
+                
+            is_inner = second_leg['type'] == 'inner'
+            leg_distance = second_leg['distance']
+            
+            # Calculate distance from merge point to second leg
+            second_leg_distance = (
+                first_point_distance - leg_distance if is_inner
+                else first_point_distance + leg_distance
+            )
+            
+            # Use provided segment distances or create even segments
+            if 'segments' in second_leg and second_leg['segments']:
+                second_segment_distances = second_leg['segments']
+            else:
+                num_segments = int(config.get('num_segments', 10))
+                total_arc_width = config.get('arc_width', 60.0)
+                arc_length_nm = math.radians(total_arc_width) * second_leg_distance
+                second_segment_distances = [arc_length_nm / num_segments] * num_segments
+            
+            # Calculate second leg points
+            second_leg_points = calculate_leg_points(
+                merge_lat, merge_lon,
+                track_angle, second_leg_distance,
+                second_segment_distances, clockwise
+            )
+        
+        # Build result with all points and connection information
+        result = {
+            'merge_point': (merge_lat, merge_lon),
+            'main_leg': main_leg_points,
+            'second_leg': second_leg_points,
+            'connections': config.get('connections', {
+                'merge_to_main_start': True,
+                'merge_to_main_end': False,
+                'merge_to_second_start': False,
+                'merge_to_second_end': False,
+                'legs_start_to_start': False,
+                'legs_end_to_end': False
+            })
+        }
+        
+        # Convert to flat list of points for compatibility with existing code
+        # The merge point is added as the last point
+        # all_points = main_leg_points.copy()
+        
+        # # Add second leg points if they exist
+        # if second_leg_points:
+        #     all_points.extend(second_leg_points)
+        
+        # # Add merge point as the last point
+        # all_points.append((merge_lat, merge_lon))
+        
+        # --- FIX: Return list of dicts with lat/lon/name --- 
+        all_waypoints_data = []
+        leg_counter = 1
+        # Add main leg points
+        for i, (lat, lon) in enumerate(main_leg_points):
+            all_waypoints_data.append({
+                'lat': lat, 
+                'lon': lon, 
+                'name': f"L{leg_counter}WP{i+1}" 
+            })
+        
+        # Add second leg points if they exist
+        if second_leg_points:
+            leg_counter += 1
+            for i, (lat, lon) in enumerate(second_leg_points):
+                 all_waypoints_data.append({
+                     'lat': lat, 
+                     'lon': lon, 
+                     'name': f"L{leg_counter}WP{i+1}" 
+                 })
+
+        # Add merge point as the last point
+        all_waypoints_data.append({
+            'lat': merge_lat, 
+            'lon': merge_lon, 
+            'name': 'MP' # Merge Point
+        })
+        
+        return all_waypoints_data
+        
+    except Exception as e:
+        # Print error for debugging and re-raise with more context
+        tracing.error("Error in calculate_point_merge_waypoints: %s", e)
+        import traceback
+        traceback.print_exc()
+        raise ValueError(f"Failed to generate point merge: {str(e)}")
+
+def _calculate_double_pms_from_config(config):
+    """
+    Calculates waypoints for a Double Point-Merge System.
+    The structure involves a main leg, a perpendicular base segment leading
+    to an inner "double" leg that curves back towards the initial approach line.
+    """
+    # Extract common parameters
+    merge_lat, merge_lon = config['merge_lat'], config['merge_lon']
+    track_angle = config['track_angle']
+    first_point_distance = config['first_point_distance']
+    clockwise = config['clockwise']
+    base_segment_distance = config['base_segment_distance']
+    
+    # Handle segments - convert to list if needed
+    segments_raw = config['segments']
+    if isinstance(segments_raw, list):
+        first_leg_segments = segments_raw
+    elif isinstance(segments_raw, (int, float)):
+        num_segments = int(segments_raw)
+        total_arc_width = config.get('arc_width', 60.0)  # In degrees
+        arc_length_nm = math.radians(total_arc_width) * first_point_distance
+        segment_distance = arc_length_nm / num_segments if num_segments > 0 else arc_length_nm
+        first_leg_segments = [segment_distance] * num_segments
+    else:
+        # Fallback: create 5 equal segments
+        num_segments = 5
+        total_arc_width = config.get('arc_width', 60.0) 
+        arc_length_nm = math.radians(total_arc_width) * first_point_distance
+        first_leg_segments = [arc_length_nm / num_segments] * num_segments
+
+    # --- 1. Calculate Main Leg ---
+    main_leg_points = calculate_leg_points(
+        merge_lat, merge_lon,
+        track_angle, first_point_distance,
+        first_leg_segments, clockwise
+    )
+    if not main_leg_points:
+        raise ValueError("Failed to generate main leg for Double PMS.")
+
+    # --- 2. Calculate Double Leg Parameters ---
+    # The double leg is an inner arc, so its radius is smaller.
+    r_main = first_point_distance
+    r_double = r_main - base_segment_distance
+    if r_double <= 0:
+        raise ValueError("Base Segment Distance is too large; it must be less than the main leg's distance from the merge point.")
+
+    # Determine the start and end angles of the main leg arc
+    direction = 1 if clockwise else -1
+    total_arc_length_main = sum(first_leg_segments)
+    angular_displacement_rad = total_arc_length_main / r_main
+    
+    start_angle_deg = track_angle
+    end_angle_deg = (start_angle_deg + direction * math.degrees(angular_displacement_rad)) % 360
+
+    # --- 3. Calculate Double Leg ---
+    # The double leg starts at the same angle as the main leg's end, but on the inner radius.
+    # It then curves back towards the main leg's start angle.
+    # We use the same number of segments as the main leg.
+    num_segments_double = len(first_leg_segments)
+    arc_length_double = angular_displacement_rad * r_double
+    double_leg_segment_dist = arc_length_double / num_segments_double if num_segments_double > 0 else 0
+    double_leg_segments = [double_leg_segment_dist] * num_segments_double
+    
+    # We start from the end angle and go backwards, so the direction is reversed.
+    double_leg_points = calculate_leg_points(
+        merge_lat, merge_lon,
+        end_angle_deg, r_double,
+        double_leg_segments, not clockwise
+    )
+    if not double_leg_points:
+        raise ValueError("Failed to generate double leg for Double PMS.")
+
+    # The start of the drawn double leg is the first point calculated.
+    p_double_start = double_leg_points[0]
+    # The end is the last point, which lies on the line to the first point of the main leg.
+    p_double_end = double_leg_points[-1]
+
+    # --- 4. Assemble Waypoint List for Drawing ---
+    # The drawing sequence is: Main Leg -> Base Segment -> Double Leg -> Merge Point
+    # The base segment is the line from the end of the main leg to the start of the double leg.
+    p_main_end = main_leg_points[-1]
+    
+    # The final list is constructed to create a continuous line for drawing.
+    final_waypoints = []
+    # Add main leg points (from start to end)
+    final_waypoints.extend(main_leg_points)
+    # Add the points for the double leg (from its start to its end)
+    final_waypoints.extend(double_leg_points)
+    # Finally, add the merge point to connect the end of the double leg to it.
+    final_waypoints.append((merge_lat, merge_lon))
+
+    # Convert to the required dictionary format with names
+    all_waypoints_data = []
+    # Name main leg points
+    for i, (lat, lon) in enumerate(main_leg_points):
+        all_waypoints_data.append({'lat': lat, 'lon': lon, 'name': f"L1WP{i+1}"})
+    # Name double leg points
+    for i, (lat, lon) in enumerate(double_leg_points):
+        all_waypoints_data.append({'lat': lat, 'lon': lon, 'name': f"L2WP{i+1}"})
+    # Name merge point
+    all_waypoints_data.append({'lat': merge_lat, 'lon': merge_lon, 'name': 'MP'})
+
+    return all_waypoints_data
+
+
+@tracing.traced()
+def calculate_trombone_waypoints(runway, config):
+    """Calculate waypoints for trombone pattern. Extension always points towards threshold."""
+    # Get APPROACH threshold coordinates and centerline direction
+    # 'runway' here is the approach_data dict created in get_configuration
+    
+    # Hata önleme ve eksik değerlerin kontrolü
+    if not runway:
+        tracing.error("Error: Runway data is missing or empty")
+        return []
+    
+    # Eksik 'start_lat' veya 'start_lon' için kontrol
+    if 'start_lat' not in runway or 'start_lon' not in runway:
+        # Threshold değerleri varsa onları kullan
+        if 'threshold_lat' in runway and 'threshold_lon' in runway:
+            runway['start_lat'] = runway['threshold_lat'] 
+            runway['start_lon'] = runway['threshold_lon']
+        else:
+            tracing.error("Error: Required coordinate data missing in runway")
+            return []
+    
+    # Eksik 'end_lat' veya 'end_lon' için kontrol - bunlar hesaplanacak açı için gerekli
+    if 'end_lat' not in runway or 'end_lon' not in runway:
+        # Varsayılan bir yön belirlememiz gerekiyor - kuzeye doğru
+        # Eğer end noktası yoksa, threshold'dan 1 NM kuzeye bir nokta belirle
+        north_bearing = 0  # Kuzeye doğru
+        runway['end_lat'], runway['end_lon'] = calculate_point_at_distance_and_bearing(
+            runway['start_lat'], runway['start_lon'], 1.0, north_bearing)
+        tracing.warning("Warning: Created default end coordinates for runway calculation")
+    
+    # Değerleri al
+    start_lat, start_lon = runway['start_lat'], runway['start_lon']
+    end_lat, end_lon = runway['end_lat'], runway['end_lon'] 
+    
+    # Calculate runway heading (direction AWAY from the start threshold)
+    try:
+        # Koordinatların geçerli sayısal değerler olduğunu kontrol et
+        if not (isinstance(start_lat, (int, float)) and isinstance(start_lon, (int, float)) and 
+                isinstance(end_lat, (int, float)) and isinstance(end_lon, (int, float))):
+            tracing.error("Error: Invalid coordinate values: start_lat=%s, start_lon=%s, end_lat=%s, end_lon=%s", start_lat, start_lon, end_lat, end_lon)
+            # Varsayılan değerlerle devam et - 0 derece (kuzey)
+            runway_heading_rad = 0
+            runway_heading_deg = 0
+        else:
+            # Aynı nokta olma durumunda (end ve start aynı) kontrolü yap
+            if abs(end_lat - start_lat) < 0.00001 and abs(end_lon - start_lon) < 0.00001:
+                tracing.warning("Warning: Start and end points are too close, using default north heading")
+                runway_heading_rad = 0  # Kuzey (0 derece)
+                runway_heading_deg = 0
+            else:
+                runway_heading_rad = math.atan2(end_lon - start_lon, end_lat - start_lat)
+                runway_heading_deg = (math.degrees(runway_heading_rad) + 360) % 360 # Normalize to 0-360
+    except Exception as e:
+        tracing.error("Error calculating runway heading: %s", e)
+        runway_heading_rad = 0
+        runway_heading_deg = 0
+    
+    # Calculate the APPROACH heading (direction TOWARDS the start threshold)
+    approach_heading_rad = runway_heading_rad + math.pi
+    approach_heading_deg = (math.degrees(approach_heading_rad) + 360) % 360
+    
+    # Point 'A': The point on the centerline extended, 'threshold_distance' NM OUT along the APPROACH path
+    # 'threshold_distance' parametresi: Pist eşiğinden A noktasına olan mesafe (NM olarak)
+    # 
+    # Bu parametre diğerlerinden farklıdır, değiştiğinde A noktasının konumu değişmelidir.
+    # - threshold_distance arttığında: A noktası pistten daha uzaklaşır
+    # - threshold_distance azaldığında: A noktası piste yaklaşır
+    # - Diğer parametreler değişirse: A noktası aynı kalır, sadece B ve C noktaları değişir
+    #
+    # Pist threshold'dan, threshold_distance kadar uzaklıktaki noktayı hesapla
+    point_a_lat, point_a_lon = calculate_point_at_distance_and_bearing(
+        start_lat, start_lon, 
+        config['threshold_distance'],
+        approach_heading_deg
+    )
+    
+    # Point 'B': Base leg turn point
+    # Base angle is relative to the APPROACH centerline
+    # Subtract angle for clockwise interpretation (90 deg = right turn)
+    base_leg_angle_rel_north_rad = approach_heading_rad - math.radians(config['base_angle'])
+    
+    # Daha doğru hesaplama için basit nm_to_deg çarpımı yerine büyük daire hesaplaması kullanıyoruz
+    point_b_lat, point_b_lon = calculate_point_at_distance_and_bearing(
+        point_a_lat, point_a_lon, 
+        config['base_distance'],
+        math.degrees(base_leg_angle_rel_north_rad)
+    )
+    
+    # Point 'C': Extension leg end point
+    # Extension should be parallel to the approach centerline, but point AWAY from the threshold
+    # This direction is the same as the runway heading (away from threshold).
+    extension_leg_angle_rad = runway_heading_rad
+    
+    # Check if the extension direction should be inverted (flipped vertically)
+    if config.get('extension_inverted', False):
+        extension_leg_angle_rad += math.pi # Add 180 degrees
+        
+    extension_leg_angle_deg = math.degrees(extension_leg_angle_rad)
+
+    # Daha doğru hesaplama için büyük daire hesaplaması kullanıyoruz
+    point_c_lat, point_c_lon = calculate_point_at_distance_and_bearing(
+        point_b_lat, point_b_lon, 
+        config['extension_length'],
+        extension_leg_angle_deg
+    )
+    
+    # Waypoints are A -> B -> C (logical order from threshold to extension)
+    # Format: List of dictionaries {'lat': ..., 'lon': ..., 'name': ...}
+    waypoints_coords = [
+        (point_a_lat, point_a_lon),  # Point A - Threshold point (First point)
+        (point_b_lat, point_b_lon),  # Point B - Base leg turn point (Middle point)
+        (point_c_lat, point_c_lon)   # Point C - Extension end point (Last point)
+    ]
+    
+    # Generate names for the waypoints
+    approach_id_simple = runway.get('id', 'RWY??').replace(" ", "") # e.g., LTFM36
+    base_angle_str = f"{config['base_angle']:.0f}".replace("-", "M") # e.g., 90 or M90
+    base_dist_str = f"{config['base_distance']:.0f}" # e.g., 5
+    ext_dist_str = f"{config['extension_length']:.0f}" # e.g., 3
+    # No direction character needed anymore
+    prefix = f"T{approach_id_simple}A{base_angle_str}B{base_dist_str}E{ext_dist_str}"
+
+    named_waypoints = [
+        {'lat': lat, 'lon': lon, 'name': f"{prefix}_{i+1}"} 
+        for i, (lat, lon) in enumerate(waypoints_coords)
+    ]
+
+    return named_waypoints
@@ -0,0 +1,262 @@
+"""
+SQLite tabanlı, artımlı proje deposu
+
+Bir proje tek bir SQLite dosyasıdır (.procdb); rotalar ve trajectory'ler
+satır başına paketlenmiş koordinat blob'ları olarak saklanır. Kaydetmede
+yalnızca içerik özeti değişen satırlar tek bir transaction'da yazılır.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+
+import numpy as np
+
+PROJECT_FORMAT_VERSION = 1
+PROJECT_EXTENSION = '.procdb'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS routes (
+    key TEXT PRIMARY KEY,
+    type TEXT,
+    name TEXT,
+    point_count INTEGER NOT NULL,
+    point_width INTEGER NOT NULL,
+    points BLOB,
+    attributes TEXT NOT NULL,
+    digest BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trajectories (
+    key TEXT PRIMARY KEY,
+    point_count INTEGER NOT NULL,
+    points BLOB NOT NULL,
+    times BLOB,
+    attributes TEXT NOT NULL
+);
+"""
+
+
+def _json_default(obj):
+    """numpy değerleri ve QColor benzeri nesneler için JSON dönüşümü"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if hasattr(obj, 'rgba') and hasattr(obj, 'alpha'):
+        return {"_qcolor_": True, "r": obj.red(), "g": obj.green(), "b": obj.blue(), "a": obj.alpha()}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def encode_json(value):
+    return json.dumps(value, default=_json_default, separators=(',', ':'), ensure_ascii=False)
+
+
+def decode_json(text):
+    # object_hook yalnızca renk içeren satırlarda kullanılır
+    if '"_qcolor_"' in text:
+        from json_utils import decode_qcolor
+        return json.loads(text, object_hook=decode_qcolor)
+    return json.loads(text)
+
+
+def route_digest(route):
+    """Content digest of a route dict (değişiklik tespiti için)"""
+    return hashlib.blake2b(pickle.dumps(route, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16).digest()
+
+
+def element_keys(elements):
+    """Stable row keys from element ids; duplicates get '#2', '#3' suffixes.
+
+    Kimliği olmayan öğeler 'noid', 'noid#2', ... anahtarlarını alır; böylece
+    listenin başka yerinden silme bu anahtarları kaydırmaz.
+    """
+    keys = []
+    seen = {}
+    for element in elements:
+        element_id = element.get('id')
+        base = 'noid' if element_id is None else str(element_id)
+        occurrence = seen.get(base, 0) + 1
+        seen[base] = occurrence
+        keys.append(base if occurrence == 1 else f"{base}#{occurrence}")
+    return keys
+
+
+def _pack_points(points):
+    """Route points -> (blob, count, width); non-numeric points stay in the JSON attributes (blob None)"""
+    try:
+        array = np.asarray(points, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None, len(points), 0
+    if array.ndim != 2:
+        return None, len(points), 0
+    return array.tobytes(), array.shape[0], array.shape[1]
+
+
+class ProjectStore:
+    """Incrementally saved project (routes and trajectories) in one SQLite file.
+
+    Kullanım:
+        store = ProjectStore('proje.procdb')
+        stats = store.save(routes, trajectories)   # yalnızca değişenleri yazar
+        routes = store.load_routes()
+        store.close()
+    """
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.executescript(_SCHEMA)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        meta = dict(self.connection.execute("SELECT key, value FROM meta"))
+        version = int(meta.get('format_version', PROJECT_FORMAT_VERSION))
+        if version > PROJECT_FORMAT_VERSION:
+            self.connection.close()
+            raise ValueError(f"Proje biçim sürümü {version} desteklenmiyor (en fazla {PROJECT_FORMAT_VERSION})")
+        self._route_order = json.loads(meta.get('route_order', '[]'))
+        self._trajectory_order = json.loads(meta.get('trajectory_order', '[]'))
+        # Anahtar -> son yazılan/yüklenen rota özeti
+        self._route_digests = dict(self.connection.execute("SELECT key, digest FROM routes"))
+        # Anahtar -> (trajectory nesnesi, noktalar nesnesi); yalnızca bu oturumda kaydedilen/yüklenenler
+        self._trajectory_identity = {}
+        self._trajectory_keys = set(self._trajectory_order)
+        if 'format_version' not in meta:
+            with self.connection:
+                self.connection.execute("INSERT INTO meta VALUES ('format_version', ?)", (str(PROJECT_FORMAT_VERSION),))
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _route_row(self, key, route, digest):
+        blob, count, width = _pack_points(route.get('points', []))
+        attributes = {name: value for name, value in route.items() if name != 'points' or blob is None}
+        return (key, route.get('type'), route.get('name'), count, width, blob, encode_json(attributes), digest)
+
+    def _trajectory_row(self, key, trajectory):
+        points = np.ascontiguousarray(np.asarray(trajectory['points'], dtype=np.float64).reshape(-1, 3))
+        times = trajectory.get('times')
+        times_blob = None if times is None else np.asarray(times, dtype=np.float64).tobytes()
+        attributes = {name: value for name, value in trajectory.items() if name not in ('points', 'times')}
+        return (key, len(points), points.tobytes(), times_blob, encode_json(attributes))
+
+    def save(self, routes, trajectories=(), meta=None):
+        """Write changed, added and removed routes/trajectories in one transaction.
+
+        meta: isteğe bağlı {anahtar: değer}; aynı transaction'da meta tablosuna yazılır.
+
+        Returns {'routes_written', 'routes_deleted', 'trajectories_written',
+        'trajectories_deleted', 'seconds'}.
+        """
+        start = time.perf_counter()
+        route_keys = element_keys(routes)
+        route_rows = []
+        new_digests = {}
+        for key, route in zip(route_keys, routes):
+            digest = route_digest(route)
+            new_digests[key] = digest
+            if self._route_digests.get(key) != digest:
+                route_rows.append(self._route_row(key, route, digest))
+        removed_routes = [(key,) for key in self._route_digests if key not in new_digests]
+
+        trajectories = list(trajectories)
+        trajectory_keys = element_keys(trajectories)
+        trajectory_rows = []
+        identities = {}
+        for key, trajectory in zip(trajectory_keys, trajectories):
+            identity = (trajectory, trajectory.get('points'))
+            identities[key] = identity
+            previous = self._trajectory_identity.get(key)
+            if previous is None or previous[0] is not identity[0] or previous[1] is not identity[1]:
+                trajectory_rows.append(self._trajectory_row(key, trajectory))
+        current_trajectory_keys = set(trajectory_keys)
+        removed_trajectories = [(key,) for key in self._trajectory_keys if key not in current_trajectory_keys]
+
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO routes VALUES (?, ?, ?, ?, ?, ?, ?, ?)", route_rows)
+            self.connection.executemany("DELETE FROM routes WHERE key = ?", removed_routes)
+            self.connection.executemany("INSERT OR REPLACE INTO trajectories VALUES (?, ?, ?, ?, ?)", trajectory_rows)
+            self.connection.executemany("DELETE FROM trajectories WHERE key = ?", removed_trajectories)
+            if route_keys != self._route_order:
+                self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('route_order', ?)", (json.dumps(route_keys),))
+            if trajectory_keys != self._trajectory_order:
+                self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('trajectory_order', ?)",
+                                        (json.dumps(trajectory_keys),))
+            self.connection.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                                        [(key, str(value)) for key, value in (meta or {}).items()])
+
+        self._route_digests = new_digests
+        self._route_order = route_keys
+        self._trajectory_identity = identities
+        self._trajectory_keys = current_trajectory_keys
+        self._trajectory_order = trajectory_keys
+        return {'routes_written': len(route_rows), 'routes_deleted': len(removed_routes),
+                'trajectories_written': len(trajectory_rows), 'trajectories_deleted': len(removed_trajectories),
+                'seconds': time.perf_counter() - start}
+
+    def meta_value(self, key, default=None):
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def route_summaries(self):
+        """[{'key', 'type', 'name', 'point_count'}] in saved order, without reading coordinates"""
+        rows = {key: (route_type, name, count) for key, route_type, name, count in
+                self.connection.execute("SELECT key, type, name, point_count FROM routes")}
+        return [{'key': key, 'type': rows[key][0], 'name': rows[key][1], 'point_count': rows[key][2]}
+                for key in self._route_order if key in rows]
+
+    def _route_from_row(self, key, count, width, blob, attributes):
+        route = decode_json(attributes)
+        if blob is not None:
+            points = np.frombuffer(blob, dtype=np.float64).reshape(count, width)
+            route['points'] = [tuple(point) for point in points.tolist()]
+        # Sonraki kayıtta yüklenen nesne değişmemiş sayılsın
+        self._route_digests[key] = route_digest(route)
+        return route
+
+    def load_route(self, key):
+        """Load one route by its key (route_summaries), or None"""
+        row = self.connection.execute(
+            "SELECT point_count, point_width, points, attributes FROM routes WHERE key = ?", (key,)).fetchone()
+        return None if row is None else self._route_from_row(key, *row)
+
+    def load_routes(self):
+        """All routes in saved order"""
+        rows = {row[0]: row[1:] for row in self.connection.execute(
+            "SELECT key, point_count, point_width, points, attributes FROM routes")}
+        return [self._route_from_row(key, *rows[key]) for key in self._route_order if key in rows]
+
+    def load_trajectories(self):
+        """All trajectories in saved order; points are (N, 3) arrays, times arrays or absent"""
+        rows = {row[0]: row[1:] for row in self.connection.execute(
+            "SELECT key, point_count, points, times, attributes FROM trajectories")}
+        trajectories = []
+        for key in self._trajectory_order:
+            if key not in rows:
+                continue
+            count, points_blob, times_blob, attributes = rows[key]
+            trajectory = decode_json(attributes)
+            trajectory['points'] = np.frombuffer(points_blob, dtype=np.float64).reshape(count, 3).copy()
+            if times_blob is not None:
+                trajectory['times'] = np.frombuffer(times_blob, dtype=np.float64).copy()
+            self._trajectory_identity[key] = (trajectory, trajectory['points'])
+            trajectories.append(trajectory)
+        return trajectories
+
+
+def is_project_store(path):
+    """True if path is an SQLite project store file"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(16) == b'SQLite format 3\x00'
+    except OSError:
+        return False
@@ -89,6 +89,8 @@ class RouteDrawer(QObject):
             'name': f"Route {len(self.map_widget.drawn_elements['routes']) + 1}"
         }
         self.map_widget.drawn_elements['routes'].append(route_config)
+        # Yeni rota geri alma yığınından geçmez; otomatik kayıt için bildir
+        self.map_widget.drawingsChanged.emit()
         self.routeDrawingFinished.emit(route_id, self.current_route_points)
         self.cancel_route_drawing()
         
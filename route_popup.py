@@ -3,7 +3,8 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QGridLayout, QSlider, QColorDialog)
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont, QColor
-import math
+import geodesy
+import tracing
 
 class RoutePopupDialog(QDialog):
     """User Route düzenleme popup menüsü"""
@@ -18,7 +19,7 @@ class RoutePopupDialog(QDialog):
         self.config = config.copy()
         
         # Debug: config içeriğini göster
-        print(f"Route popup'ı açılıyor, config: {self.config}")
+        tracing.debug("Route popup'ı açılıyor, config: %s", self.config)
         
         self.setWindowTitle("Route Options")
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
@@ -287,7 +288,7 @@ class RoutePopupDialog(QDialog):
     def on_color_changed(self):
         """Renk değiştiğinde çağrılır"""
         current_color = self.config.get('color', self.get_default_color())
-        print(f"Color dialog opening with current color: {current_color}")
+        tracing.debug("Color dialog opening with current color: %s", current_color)
         
         # QColorDialog'u modal olarak aç
         color_dialog = QColorDialog(QColor(current_color), self)
@@ -300,7 +301,7 @@ class RoutePopupDialog(QDialog):
             color = color_dialog.selectedColor()
             if color.isValid():
                 color_hex = color.name()
-                print(f"Color changed to: {color_hex}")
+                tracing.debug("Color changed to: %s", color_hex)
                 self.config['color'] = color_hex
                 self.color_button.setStyleSheet(f"background-color: {color_hex}; border: 1px solid #444444;")
                 self.update_details_content()
@@ -309,16 +310,16 @@ class RoutePopupDialog(QDialog):
                 self.raise_()
                 self.activateWindow()
             else:
-                print("Color dialog cancelled")
+                tracing.debug("Color dialog cancelled")
         else:
-            print("Color dialog cancelled")
+            tracing.debug("Color dialog cancelled")
             # Popup'ı öne getir
             self.raise_()
             self.activateWindow()
     
     def on_width_changed(self, value):
         """Kalınlık değiştiğinde çağrılır"""
-        print(f"Width changed to: {value}")
+        tracing.debug("Width changed to: %s", value)
         self.config['width'] = value
         self.width_label.setText(f"{value}px")
         self.update_details_content()
@@ -333,10 +334,10 @@ class RoutePopupDialog(QDialog):
         try:
             # Debug: points yapısını kontrol et
             points = self.config.get('points', [])
-            print(f"Points type: {type(points)}")
+            tracing.debug("Points type: %s", type(points))
             if points:
-                print(f"First point type: {type(points[0])}")
-                print(f"First point content: {points[0]}")
+                tracing.debug("First point type: %s", type(points[0]))
+                tracing.debug("First point content: %s", points[0])
             
             # Detay bilgilerini oluştur
             details = []
@@ -420,33 +421,11 @@ class RoutePopupDialog(QDialog):
     
     def calculate_distance(self, lat1, lon1, lat2, lon2):
         """İki nokta arasındaki mesafeyi nautical mile cinsinden hesaplar"""
-        # Haversine formula
-        R = 3440.065  # Dünya yarıçapı nautical mile cinsinden
-        
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
-        
-        a = math.sin(delta_lat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon/2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        
-        return R * c
+        return geodesy.distance(lat1, lon1, lat2, lon2)
     
     def calculate_bearing(self, lat1, lon1, lat2, lon2):
         """İki nokta arasındaki bearing'i hesaplar"""
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lon = math.radians(lon2 - lon1)
-        
-        y = math.sin(delta_lon) * math.cos(lat2_rad)
-        x = math.cos(lat1_rad) * math.sin(lat2_rad) - math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(delta_lon)
-        
-        bearing = math.atan2(y, x)
-        bearing = math.degrees(bearing)
-        bearing = (bearing + 360) % 360
-        
-        return bearing
+        return geodesy.bearing(lat1, lon1, lat2, lon2)
     
     def get_default_color(self):
         """Route için varsayılan renk"""
@@ -467,7 +446,7 @@ class RoutePopupDialog(QDialog):
         
         # Route güncellemesi sinyalini gönder
         self.routeSettingsChanged.emit(updated_config)
-        print(f"Route settings updated: {updated_config}")
+        tracing.debug("Route settings updated: %s", updated_config)
         
     def on_export_json(self):
         """Rotayı JSON olarak kaydet"""
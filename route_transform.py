@@ -0,0 +1,141 @@
+"""
+Rotaların toplu taşıma ve döndürme dönüşümleri
+
+RouteTransform seçili rotaların başlangıç geometrisini bir kez saklar ve her
+fare olayında toplam öteleme/döndürmeyi NumPy ile tek seferde uygular.
+"""
+
+import math
+
+import numpy as np
+
+import geodesy
+
+
+def _normalize_signed_angle(angle):
+    """-180 ile 180 arasına normalize et"""
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+def rotate_points_planar(lats, lons, center_lat, center_lon, angle_deg):
+    """Rotate point arrays counter-clockwise by angle_deg around the center in the local plane.
+
+    Returns (lats, lons) arrays.
+    """
+    cos_center = math.cos(math.radians(center_lat))
+    angle_rad = math.radians(angle_deg)
+    cos_a, sin_a = math.cos(angle_rad), math.sin(angle_rad)
+    x_diff = (np.asarray(lons, dtype=np.float64) - center_lon) * cos_center
+    y_diff = np.asarray(lats, dtype=np.float64) - center_lat
+    x_new = x_diff * cos_a - y_diff * sin_a
+    y_new = x_diff * sin_a + y_diff * cos_a
+    return center_lat + y_new, center_lon + x_new / cos_center
+
+
+def rotate_about_point_geodesic(lats, lons, center_lat, center_lon, delta_bearing_deg):
+    """Turn points around the center by delta_bearing_deg (clockwise), keeping great-circle distances.
+
+    Returns (lats, lons) arrays.
+    """
+    distances = geodesy.distance_nm(center_lat, center_lon, lats, lons)
+    bearings = geodesy.bearing_deg(center_lat, center_lon, lats, lons) + delta_bearing_deg
+    return geodesy.destination(center_lat, center_lon, distances, bearings)
+
+
+def _as_point_list(lats, lons):
+    return list(zip(lats.tolist(), lons.tolist()))
+
+
+class RouteTransform:
+    """Translate or rotate one or many routes from their geometry at session start.
+
+    Args:
+        routes: MapWidget drawn_elements['routes'] içindeki rota sözlükleri
+            (yerinde güncellenir)
+    """
+
+    def __init__(self, routes):
+        self.routes = [route for route in routes if route.get('points')]
+        self._origins = []
+        for route in self.routes:
+            points = np.asarray(route['points'], dtype=np.float64).reshape(len(route['points']), -1)
+            self._origins.append((points[:, 0].copy(), points[:, 1].copy()))
+        # Config referanslarının ve segment açılarının oturum başındaki değerleri
+        self._config_origins = [dict(route.get('config') or {}) for route in self.routes]
+        self._angle_origins = [list(route['segment_angles'])
+                               if isinstance(route.get('segment_angles'), list) and
+                               len(route['segment_angles']) == len(route['points']) - 1 else None
+                               for route in self.routes]
+        self.delta_lat = 0.0
+        self.delta_lon = 0.0
+        self.angle = 0.0
+
+    def __len__(self):
+        return len(self.routes)
+
+    @property
+    def route_ids(self):
+        return [route.get('id') for route in self.routes]
+
+    def bounds_center(self):
+        """(lat, lon) center of the bounding box of all routes at session start"""
+        if not self.routes:
+            return None
+        lats = np.concatenate([origin[0] for origin in self._origins])
+        lons = np.concatenate([origin[1] for origin in self._origins])
+        return (float(lats.min() + lats.max()) / 2.0, float(lons.min() + lons.max()) / 2.0)
+
+    def translate(self, delta_lat, delta_lon):
+        """Move every route by the total (delta_lat, delta_lon) degrees from the start geometry."""
+        self.delta_lat, self.delta_lon = delta_lat, delta_lon
+        for route, (lats, lons), config_origin in zip(self.routes, self._origins, self._config_origins):
+            route['points'] = _as_point_list(lats + delta_lat, lons + delta_lon)
+            config = route.get('config')
+            if not config:
+                continue
+            # Trombone başlangıç noktası ve point merge merge noktası birlikte taşınır
+            for lat_key, lon_key in (('start_lat', 'start_lon'), ('merge_lat', 'merge_lon')):
+                if lat_key in config_origin and lon_key in config_origin:
+                    config[lat_key] = config_origin[lat_key] + delta_lat
+                    config[lon_key] = config_origin[lon_key] + delta_lon
+
+    def rotate(self, center_lat, center_lon, angle_deg):
+        """Rotate every route by the total angle_deg (counter-clockwise) around the center."""
+        self.angle = angle_deg
+        for route, (lats, lons), config_origin, angle_origin in zip(
+                self.routes, self._origins, self._config_origins, self._angle_origins):
+            new_lats, new_lons = rotate_points_planar(lats, lons, center_lat, center_lon, angle_deg)
+            route['points'] = _as_point_list(new_lats, new_lons)
+            if angle_origin is not None:
+                # Segment uzunlukları korunur, açılar yaklaşık olarak döndürme kadar azalır;
+                # kesin değerler bırakınca MapWidget.update_segment_metrics ile hesaplanır
+                route['segment_angles'] = [(angle - angle_deg) % 360 for angle in angle_origin]
+            config = route.get('config')
+            if not config:
+                continue
+            if route.get('type') == 'trombone' and 'base_angle' in config:
+                # Trombone'da başlangıç (pist) bilgisi korunur, yalnızca base_angle döner
+                config['base_angle'] = _normalize_signed_angle(config_origin.get('base_angle', 90.0) + angle_deg)
+            elif route.get('type') == 'pointmerge':
+                if 'merge_lat' in config_origin and 'merge_lon' in config_origin:
+                    merge_lat, merge_lon = rotate_points_planar(
+                        config_origin['merge_lat'], config_origin['merge_lon'], center_lat, center_lon, angle_deg)
+                    config['merge_lat'], config['merge_lon'] = float(merge_lat), float(merge_lon)
+                if 'track_angle' in config_origin:
+                    # Saat yönünün tersine döndürme yön açısını azaltır
+                    config['track_angle'] = (config_origin['track_angle'] - angle_deg) % 360
+
+
+def rotate_pointmerge(route, delta_bearing_deg):
+    """Turn a point merge route around its merge point (last point) by delta_bearing_deg."""
+    points = route.get('points') or []
+    if len(points) < 2:
+        return False
+    merge_lat, merge_lon = points[-1][0], points[-1][1]
+    array = np.asarray(points[:-1], dtype=np.float64).reshape(len(points) - 1, -1)
+    new_lats, new_lons = rotate_about_point_geodesic(array[:, 0], array[:, 1], merge_lat, merge_lon, delta_bearing_deg)
+    route['points'] = _as_point_list(new_lats, new_lons) + [points[-1]]
+    config = route.get('config')
+    if config and 'track_angle' in config:
+        config['track_angle'] = (config['track_angle'] + delta_bearing_deg) % 360
+    return True
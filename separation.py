@@ -0,0 +1,135 @@
+"""
+Trajectory'ler arası ayırma kaybı (loss of separation) tespiti
+
+Ortak zaman ızgarasında örneklenen uçuşlar uzay-zaman hash ızgarasına
+yerleştirilir; yalnızca komşu hücrelerdeki çiftler karşılaştırılır.
+"""
+
+import math
+
+import numpy as np
+
+from geodesy import NM_PER_DEG_LAT
+from trajectory_playback import TrajectoryPlaybackIndex
+
+# Yarım komşuluk: (dz, dy, dx) sözlük sırasında (0, 0, 0)'dan büyük ofsetler;
+# her komşu hücre çifti yalnızca bir kez ziyaret edilir
+_HALF_NEIGHBOURHOOD = [(dz, dy, dx) for dz in (-1, 0, 1) for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+                       if (dz, dy, dx) > (0, 0, 0)]
+
+
+def _neighbour_pairs(sorted_keys, offset, same_cell):
+    """Index pairs (i, j) into sorted_keys with sorted_keys[j] == sorted_keys[i] + offset."""
+    targets = sorted_keys + offset
+    low = np.searchsorted(sorted_keys, targets, side='left')
+    high = np.searchsorted(sorted_keys, targets, side='right')
+    if same_cell:
+        # Aynı hücrede her çift bir kez: yalnızca j > i
+        low = np.maximum(low, np.arange(len(sorted_keys)) + 1)
+    counts = np.maximum(high - low, 0)
+    total = int(counts.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    first = np.repeat(np.arange(len(sorted_keys), dtype=np.int64), counts)
+    run_starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    second = low[first] + (np.arange(total, dtype=np.int64) - run_starts[first])
+    return first, second
+
+
+def detect_conflicts(index, lateral_nm=5.0, vertical_ft=1000.0, step_s=4.0):
+    """Find pairs of flights closer than both minima at the same time.
+
+    Args:
+        index: TrajectoryPlaybackIndex (zamanlı uçuşlar)
+        lateral_nm: Yatay ayırma minimumu (NM)
+        vertical_ft: Dikey ayırma minimumu (ft)
+        step_s: Örnekleme adımı (sn); iki uçağın bir adımda yaklaşma mesafesi
+            yatay minimumdan küçük olmalıdır
+
+    Returns (conflicts, stats). conflicts is a list of dicts sorted by start
+    time with 'flight_a', 'flight_b' (ids), 'start_time', 'end_time',
+    'duration_s', 'min_distance_nm', 'vertical_ft' (at closest point),
+    'time_of_min', 'position_a' and 'position_b' ((lat, lon) at closest point).
+    """
+    samples = index.resample(step_s)
+    stats = {'flights': len(index), 'samples': len(samples['times']), 'candidate_pairs': 0,
+             'all_pairs': 0, 'conflict_samples': 0}
+    if len(samples['times']) < 2:
+        return [], stats
+
+    # Yerel düzlem (NM) ve hücre indeksleri; kenarlarda bir hücre boşluk bırakılır ki
+    # komşu ofsetleri bir sonraki satıra/banda taşmasın
+    ref_lat = float(np.mean(samples['lats']))
+    ref_lon = float(np.mean(samples['lons']))
+    xs = (samples['lons'] - ref_lon) * NM_PER_DEG_LAT * math.cos(math.radians(ref_lat))
+    ys = (samples['lats'] - ref_lat) * NM_PER_DEG_LAT
+    zs = samples['alts']
+    ix = np.floor(xs / lateral_nm).astype(np.int64)
+    iy = np.floor(ys / lateral_nm).astype(np.int64)
+    iz = np.floor(zs / vertical_ft).astype(np.int64)
+    ix -= ix.min() - 1
+    iy -= iy.min() - 1
+    iz -= iz.min() - 1
+    nx, ny, nz = int(ix.max()) + 2, int(iy.max()) + 2, int(iz.max()) + 2
+    keys = ((samples['steps'] * nz + iz) * ny + iy) * nx + ix
+
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    first_parts, second_parts = [], []
+    for same_cell, (dz, dy, dx) in [(True, (0, 0, 0))] + [(False, o) for o in _HALF_NEIGHBOURHOOD]:
+        first, second = _neighbour_pairs(sorted_keys, (dz * ny + dy) * nx + dx, same_cell)
+        first_parts.append(order[first])
+        second_parts.append(order[second])
+    first = np.concatenate(first_parts)
+    second = np.concatenate(second_parts)
+    stats['candidate_pairs'] = len(first)
+    _steps, per_step = np.unique(samples['steps'], return_counts=True)
+    stats['all_pairs'] = int((per_step * (per_step - 1) // 2).sum())
+
+    # Kesin kontrol
+    horizontal = np.hypot(xs[first] - xs[second], ys[first] - ys[second])
+    vertical = np.abs(zs[first] - zs[second])
+    flights = samples['flight_indices']
+    violating = (horizontal < lateral_nm) & (vertical < vertical_ft) & (flights[first] != flights[second])
+    first, second = first[violating], second[violating]
+    horizontal, vertical = horizontal[violating], vertical[violating]
+    stats['conflict_samples'] = len(first)
+    if len(first) == 0:
+        return [], stats
+
+    # Çiftleri (küçük uçuş, büyük uçuş, adım) sırasına koy ve ardışık adımları birleştir
+    swap = flights[first] > flights[second]
+    first, second = np.where(swap, second, first), np.where(swap, first, second)
+    flight_a, flight_b = flights[first], flights[second]
+    steps = samples['steps'][first]
+    event_order = np.lexsort((steps, flight_b, flight_a))
+    flight_a, flight_b, steps = flight_a[event_order], flight_b[event_order], steps[event_order]
+    first, second = first[event_order], second[event_order]
+    horizontal, vertical = horizontal[event_order], vertical[event_order]
+    breaks = np.flatnonzero((np.diff(flight_a) != 0) | (np.diff(flight_b) != 0) | (np.diff(steps) != 1)) + 1
+    event_starts = np.concatenate([[0], breaks])
+    event_ends = np.concatenate([breaks, [len(steps)]])
+
+    conflicts = []
+    for start, end in zip(event_starts, event_ends):
+        closest = start + int(np.argmin(horizontal[start:end]))
+        a, b = first[closest], second[closest]
+        conflicts.append({
+            'flight_a': index.ids[flight_a[start]],
+            'flight_b': index.ids[flight_b[start]],
+            'start_time': float(samples['times'][first[start]]),
+            'end_time': float(samples['times'][first[end - 1]]),
+            'duration_s': float(samples['times'][first[end - 1]] - samples['times'][first[start]]),
+            'min_distance_nm': float(horizontal[closest]),
+            'vertical_ft': float(vertical[closest]),
+            'time_of_min': float(samples['times'][a]),
+            'position_a': (float(samples['lats'][a]), float(samples['lons'][a])),
+            'position_b': (float(samples['lats'][b]), float(samples['lons'][b])),
+        })
+    conflicts.sort(key=lambda c: c['start_time'])
+    return conflicts, stats
+
+
+def detect_conflicts_in_trajectories(trajectories, **kwargs):
+    """Convenience wrapper for MapWidget drawn_elements['trajectories'] entries."""
+    return detect_conflicts(TrajectoryPlaybackIndex.from_drawn_trajectories(trajectories), **kwargs)
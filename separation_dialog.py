@@ -0,0 +1,132 @@
+import datetime
+import time
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QDoubleSpinBox, QPushButton,
+    QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox, QAbstractItemView
+)
+from PyQt5.QtCore import Qt, pyqtSignal
+
+from conformance_dialog import NumericTableItem
+from separation import detect_conflicts_in_trajectories
+
+
+def format_epoch(seconds):
+    return datetime.datetime.fromtimestamp(seconds, tz=datetime.timezone.utc).strftime("%H:%M:%S")
+
+
+class SeparationDialog(QDialog):
+    """Zamanlı trajectory'ler arasındaki ayırma kayıplarını listeleyen dialog"""
+
+    conflictSelected = pyqtSignal(float)  # En yakın anın epoch zamanı (oynatma için)
+
+    COLUMNS = ["Flight A", "Flight B", "Start (UTC)", "Duration (s)", "Min Dist (NM)", "Vertical (ft)"]
+
+    def __init__(self, map_widget, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Separation Conflicts")
+        self.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
+        self.map_widget = map_widget
+        self.conflicts = []
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(7)
+        layout.setContentsMargins(10, 10, 10, 10)
+
+        params_layout = QHBoxLayout()
+        params_layout.addWidget(QLabel("Yatay:"))
+        self.lateral_spin = self._make_spin(0.5, 20.0, 3.0, " NM", 0.5)
+        params_layout.addWidget(self.lateral_spin)
+        params_layout.addWidget(QLabel("Dikey:"))
+        self.vertical_spin = self._make_spin(100.0, 5000.0, 1000.0, " ft", 100.0)
+        params_layout.addWidget(self.vertical_spin)
+        params_layout.addWidget(QLabel("Adım:"))
+        self.step_spin = self._make_spin(1.0, 30.0, 4.0, " sn", 1.0)
+        params_layout.addWidget(self.step_spin)
+        params_layout.addStretch()
+        layout.addLayout(params_layout)
+
+        buttons_layout = QHBoxLayout()
+        self.probe_button = QPushButton("Tara")
+        self.probe_button.clicked.connect(self.run_probe)
+        buttons_layout.addWidget(self.probe_button)
+        buttons_layout.addStretch()
+        layout.addLayout(buttons_layout)
+
+        self.summary_label = QLabel("")
+        layout.addWidget(self.summary_label)
+
+        self.results_table = QTableWidget()
+        self.results_table.setColumnCount(len(self.COLUMNS))
+        self.results_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.results_table.verticalHeader().setVisible(False)
+        self.results_table.setAlternatingRowColors(True)
+        self.results_table.verticalHeader().setDefaultSectionSize(20)
+        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.results_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.results_table.itemSelectionChanged.connect(self.on_selection_changed)
+        layout.addWidget(self.results_table)
+
+        self.resize(720, 460)
+
+    def _make_spin(self, minimum, maximum, value, suffix, step):
+        spin = QDoubleSpinBox()
+        spin.setRange(minimum, maximum)
+        spin.setDecimals(1 if step < 10 else 0)
+        spin.setSingleStep(step)
+        spin.setValue(value)
+        spin.setSuffix(suffix)
+        return spin
+
+    def run_probe(self):
+        """Tüm zamanlı trajectory'ler için ayırma kaybı taraması"""
+        trajectories = [t for t in self.map_widget.drawn_elements.get('trajectories', [])
+                        if t.get('times') is not None]
+        if not trajectories:
+            QMessageBox.information(self, "Separation", "Tarama için zaman damgalı trajectory gerekli.")
+            return
+        start = time.perf_counter()
+        self.conflicts, stats = detect_conflicts_in_trajectories(
+            trajectories, lateral_nm=self.lateral_spin.value(),
+            vertical_ft=self.vertical_spin.value(), step_s=self.step_spin.value())
+        elapsed = time.perf_counter() - start
+
+        self.populate_table(self.conflicts)
+        self.summary_label.setText(
+            f"{stats['flights']} uçuş, {len(self.conflicts)} conflict; "
+            f"{stats['candidate_pairs']} aday çift ({stats['all_pairs']} olası), {elapsed:.2f} sn")
+        self.map_widget.set_separation_conflicts(self.conflicts, self.lateral_spin.value())
+
+    def populate_table(self, conflicts):
+        self.results_table.setSortingEnabled(False)
+        self.results_table.setRowCount(len(conflicts))
+        for row, conflict in enumerate(conflicts):
+            flight_item = QTableWidgetItem(str(conflict['flight_a']))
+            # Sıralamadan sonra da doğru conflict'i bulmak için indeksi sakla
+            flight_item.setData(Qt.UserRole, row)
+            self.results_table.setItem(row, 0, flight_item)
+            self.results_table.setItem(row, 1, QTableWidgetItem(str(conflict['flight_b'])))
+            start_item = NumericTableItem(conflict['start_time'], "{:.0f}")
+            start_item.setText(format_epoch(conflict['start_time']))
+            self.results_table.setItem(row, 2, start_item)
+            self.results_table.setItem(row, 3, NumericTableItem(conflict['duration_s'], "{:.0f}"))
+            self.results_table.setItem(row, 4, NumericTableItem(conflict['min_distance_nm']))
+            self.results_table.setItem(row, 5, NumericTableItem(conflict['vertical_ft'], "{:.0f}"))
+        self.results_table.setSortingEnabled(True)
+
+    def on_selection_changed(self):
+        rows = self.results_table.selectionModel().selectedRows()
+        if not rows:
+            return
+        conflict_index = self.results_table.item(rows[0].row(), 0).data(Qt.UserRole)
+        self.map_widget.select_separation_conflict(conflict_index)
+        self.conflictSelected.emit(self.conflicts[conflict_index]['time_of_min'])
+
+    def closeEvent(self, event):
+        # Dialog kapanınca conflict işaretlerini haritadan kaldır
+        self.map_widget.set_separation_conflicts(None)
+        super().closeEvent(event)
@@ -2,6 +2,8 @@ from PyQt5.QtCore import Qt, QObject, QPointF
 from PyQt5.QtGui import QColor, QPen, QBrush
 import math
 
+import numpy as np
+
 class SnapPoint:
     """Snap noktalarını temsil eden sınıf"""
     
@@ -115,33 +117,32 @@ class SnapManager(QObject):
                 continue
                 
             points = route['points']
+            if not points:
+                continue
+            
+            # Tüm noktaları tek seferde ekrana izdüşür; yalnızca fareye yakın olanlar için SnapPoint oluşturulur
+            lats, lons = np.asarray(points, dtype=np.float64).T[:2]
+            reach = self.snap_tolerance * 2  # Biraz daha geniş tarama
+            mouse_x, mouse_y = mouse_pos.x(), mouse_pos.y()
             
             # Uç noktaları kontrol et
             if self.snap_mode & self.SNAP_ENDPOINT:
-                for i, point in enumerate(points):
-                    lat, lon = point
-                    screen_pos = self.map_widget.geo_to_screen(lat, lon)
-                    
-                    # Fare pozisyonuna yeterince yakınsa, snap noktası olarak ekle
-                    if (screen_pos - mouse_pos).manhattanLength() <= self.snap_tolerance * 2:  # Biraz daha geniş tarama
-                        desc = f"Uç nokta: {route.get('waypoint_names', [])[i] if 'waypoint_names' in route and i < len(route.get('waypoint_names', [])) else f'Nokta {i+1}'}"
-                        self.snap_points.append(SnapPoint(screen_pos, (lat, lon), desc, "endpoint"))
+                xs, ys = self.map_widget.geo_to_screen_array(lats, lons)
+                for i in np.flatnonzero(np.abs(xs - mouse_x) + np.abs(ys - mouse_y) <= reach):
+                    i = int(i)
+                    desc = f"Uç nokta: {route.get('waypoint_names', [])[i] if 'waypoint_names' in route and i < len(route.get('waypoint_names', [])) else f'Nokta {i+1}'}"
+                    self.snap_points.append(SnapPoint(QPointF(xs[i], ys[i]), (float(lats[i]), float(lons[i])), desc, "endpoint"))
             
             # Orta noktaları kontrol et
             if self.snap_mode & self.SNAP_MIDPOINT and len(points) > 1:
-                for i in range(len(points) - 1):
-                    lat1, lon1 = points[i]
-                    lat2, lon2 = points[i + 1]
-                    
-                    # Orta nokta hesapla (hem coğrafi hem de ekran koordinatlarında)
-                    mid_lat = (lat1 + lat2) / 2
-                    mid_lon = (lon1 + lon2) / 2
-                    mid_screen = self.map_widget.geo_to_screen(mid_lat, mid_lon)
-                    
-                    # Fare pozisyonuna yeterince yakınsa, snap noktası olarak ekle
-                    if (mid_screen - mouse_pos).manhattanLength() <= self.snap_tolerance * 2:
-                        desc = f"Orta nokta: Segment {i+1}-{i+2}"
-                        self.snap_points.append(SnapPoint(mid_screen, (mid_lat, mid_lon), desc, "midpoint"))
+                # Orta nokta hesapla (hem coğrafi hem de ekran koordinatlarında)
+                mid_lats = (lats[:-1] + lats[1:]) / 2
+                mid_lons = (lons[:-1] + lons[1:]) / 2
+                xs, ys = self.map_widget.geo_to_screen_array(mid_lats, mid_lons)
+                for i in np.flatnonzero(np.abs(xs - mouse_x) + np.abs(ys - mouse_y) <= reach):
+                    i = int(i)
+                    desc = f"Orta nokta: Segment {i+1}-{i+2}"
+                    self.snap_points.append(SnapPoint(QPointF(xs[i], ys[i]), (float(mid_lats[i]), float(mid_lons[i])), desc, "midpoint"))
     
 
     def _find_intersection_snap_points(self, mouse_pos):
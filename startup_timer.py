@@ -0,0 +1,91 @@
+"""
+Uygulama başlangıç süresi ölçümü
+
+main.py bu modülü ilk satırda içe aktarır; başlangıç adımları mark() ile
+işaretlenir ve harita ilk kez çizilip veri yüklemesi bittiğinde rapor
+konsola yazılır (PROCEDURE_STARTUP_REPORT verilirse JSON olarak da).
+"""
+
+import json
+import os
+import time
+
+_start = time.perf_counter()
+_marks = {}
+_reported = False
+
+
+def reset():
+    """Restart the clock (yeniden başlatma ve testler için)"""
+    global _start, _reported
+    _start = time.perf_counter()
+    _marks.clear()
+    _reported = False
+
+
+def mark(name):
+    """Record the first time (seconds since start) a startup step is reached."""
+    if name not in _marks:
+        _marks[name] = time.perf_counter() - _start
+    return _marks[name]
+
+
+def marks():
+    return dict(_marks)
+
+
+def user_wait():
+    """Seconds spent in the data selection dialog"""
+    if 'options_shown' in _marks and 'options_closed' in _marks:
+        return _marks['options_closed'] - _marks['options_shown']
+    return 0.0
+
+
+def report():
+    """Startup report dict: step times, user wait and wait-excluded totals"""
+    wait = user_wait()
+    result = {'marks': marks(), 'user_wait_s': wait}
+    for name, key in (('first_window', 'time_to_first_window_s'), ('first_map_paint', 'time_to_first_map_paint_s')):
+        if name in _marks:
+            result[key] = _marks[name] - (wait if _marks[name] >= _marks.get('options_closed', float('inf')) else 0.0)
+    return result
+
+
+def report_lines():
+    data = report()
+    lines = ["=== Başlangıç Süresi Raporu ==="]
+    previous = 0.0
+    for name, seconds in sorted(data['marks'].items(), key=lambda item: item[1]):
+        lines.append(f"  {name:<16} {seconds * 1000:8.0f} ms  (+{(seconds - previous) * 1000:.0f} ms)")
+        previous = seconds
+    if data['user_wait_s']:
+        lines.append(f"  Seçim penceresinde bekleme: {data['user_wait_s'] * 1000:.0f} ms")
+    if 'time_to_first_window_s' in data:
+        lines.append(f"  İlk pencere (bekleme hariç): {data['time_to_first_window_s'] * 1000:.0f} ms")
+    if 'time_to_first_map_paint_s' in data:
+        lines.append(f"  İlk harita çizimi (bekleme hariç): {data['time_to_first_map_paint_s'] * 1000:.0f} ms")
+    return lines
+
+
+# Rapor bu adımların hepsi işaretlendiğinde yazılır
+REPORT_AFTER = ('first_map_paint', 'data_loaded')
+
+
+def finish(name='first_map_paint'):
+    """Mark a final step; print the report once all REPORT_AFTER steps are marked."""
+    global _reported
+    # Başlangıç işaretlenmediyse (testler, tek başına widget) rapor yok
+    if _reported or not _marks:
+        return
+    mark(name)
+    if not all(step in _marks for step in REPORT_AFTER):
+        return
+    _reported = True
+    print("\n".join(report_lines()))
+    path = os.environ.get('PROCEDURE_STARTUP_REPORT')
+    if path:
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report(), f, indent=2)
+        except OSError as e:
+            print(f"Başlangıç raporu yazılamadı: {e}")
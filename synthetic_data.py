@@ -0,0 +1,377 @@
+"""
+Ölçek testleri için sentetik hava sahası ve trafik verisi üreticisi
+
+Kullanım:
+    python synthetic_data.py data/Airspace_Synthetic --fixes 50000 --procedures 5000 --flights 10000
+    python synthetic_data.py data/Airspace_Small --fixes 2000 --procedures 200 --flights 100 --trajectory-format both
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from geodesy import NM_PER_DEG_LAT
+
+# Varsayılan üretim bölgesi: Türkiye ve çevresi (min_lat, max_lat, min_lon, max_lon)
+DEFAULT_REGION = (36.0, 42.0, 26.0, 45.0)
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+EPOCH_START = 1735725600.0  # 2025-01-01 10:00:00 UTC
+
+
+def letter_code(index, length):
+    """Index -> fixed-length uppercase code (0 -> 'AA..A'); digit-free for area name prefixes"""
+    chars = []
+    for _ in range(length):
+        index, remainder = divmod(index, 26)
+        chars.append(LETTERS[remainder])
+    return ''.join(reversed(chars))
+
+
+def format_dms(value, is_latitude=True):
+    """Decimal degrees -> 'DD MM SS.SS N' as read by utils.parse_dms"""
+    direction = ('N' if value >= 0 else 'S') if is_latitude else ('E' if value >= 0 else 'W')
+    hundredths = round(abs(value) * 360000)
+    degrees, hundredths = divmod(hundredths, 360000)
+    minutes, hundredths = divmod(hundredths, 6000)
+    return f"{degrees:02d} {minutes:02d} {hundredths / 100:05.2f} {direction}"
+
+
+def format_compact_dms(value, is_latitude=True):
+    """Decimal degrees -> 'DDMMSSN' / 'DDDMMSSE' as used in Danger_ files"""
+    direction = ('N' if value >= 0 else 'S') if is_latitude else ('E' if value >= 0 else 'W')
+    seconds_total = round(abs(value) * 3600)
+    degrees, seconds_total = divmod(seconds_total, 3600)
+    minutes, seconds = divmod(seconds_total, 60)
+    return f"{degrees:0{2 if is_latitude else 3}d}{minutes:02d}{seconds:02d}{direction}"
+
+
+def _offset(lat, lon, distance_nm, bearing_deg):
+    """Flat-earth offset; adequate for synthetic geometry of a few hundred NM"""
+    bearing = np.radians(bearing_deg)
+    dlat = distance_nm * np.cos(bearing) / NM_PER_DEG_LAT
+    dlon = distance_nm * np.sin(bearing) / (NM_PER_DEG_LAT * np.cos(np.radians(lat)))
+    return lat + dlat, lon + dlon
+
+
+def generate_fixes(count, region, rng):
+    """(names, lats, lons) for count uniformly spread 5-letter fixes"""
+    min_lat, max_lat, min_lon, max_lon = region
+    codes = rng.choice(26 ** 5, size=count, replace=False)
+    names = [letter_code(int(code), 5) for code in codes]
+    return names, rng.uniform(min_lat, max_lat, count), rng.uniform(min_lon, max_lon, count)
+
+
+def generate_airports(count, region, rng):
+    """Airport dicts with one or two (parallel) runways and threshold coordinates"""
+    min_lat, max_lat, min_lon, max_lon = region
+    airports = []
+    for index in range(count):
+        lat = rng.uniform(min_lat + 0.3, max_lat - 0.3)
+        lon = rng.uniform(min_lon + 0.3, max_lon - 0.3)
+        number = int(rng.integers(1, 19))  # 01..18, karşı uç +18
+        heading = number * 10.0
+        half_length_nm = rng.uniform(0.8, 1.8)
+        parallel = rng.random() < 0.3
+        offsets = (-0.5, 0.5) if parallel else (0.0,)
+        runways = []
+        for side, offset in zip(('L', 'R'), offsets):
+            # Paralel pistler için L solda (pist yönüne göre), karşı uçta R olur
+            suffix, opposite_suffix = (side, 'R' if side == 'L' else 'L') if parallel else ('', '')
+            center_lat, center_lon = _offset(lat, lon, offset, heading - 90.0)
+            start = _offset(center_lat, center_lon, half_length_nm, heading + 180.0)
+            end = _offset(center_lat, center_lon, half_length_nm, heading)
+            thresholds = [(f"{number:02d}{suffix}", float(start[0]), float(start[1])),
+                          (f"{number + 18:02d}{opposite_suffix}", float(end[0]), float(end[1]))]
+            runways.append({'thresholds': thresholds,
+                            'types': tuple(rng.choice(['ARR', 'DEP', 'MIX'], 2))})
+        airports.append({'name': 'S' + letter_code(index, 3), 'lat': lat, 'lon': lon, 'runways': runways})
+    return airports
+
+
+def generate_procedures(count, airports, fix_names, fix_lats, fix_lons, rng, min_length=3, max_length=8,
+                        candidates=300):
+    """Procedure dicts (type, airport, runway, name, route) over the nearest fixes of each airport"""
+    procedures = []
+    if not airports or not fix_names:
+        return procedures
+    used_names = set()
+    per_airport = [count // len(airports) + (1 if i < count % len(airports) else 0) for i in range(len(airports))]
+    for airport, airport_count in zip(airports, per_airport):
+        if not airport_count:
+            continue
+        scale = math.cos(math.radians(airport['lat']))
+        distance = np.hypot(fix_lats - airport['lat'], (fix_lons - airport['lon']) * scale)
+        nearest = np.argsort(distance)[:max(candidates, max_length)]
+        thresholds = [threshold[0] for runway in airport['runways'] for threshold in runway['thresholds']]
+        for index in range(airport_count):
+            proc_type = 'SID' if index % 2 == 0 else 'STAR'
+            length = int(rng.integers(min_length, max_length + 1))
+            chosen = rng.choice(nearest, size=min(length, len(nearest)), replace=False)
+            chosen = chosen[np.argsort(distance[chosen])]
+            if proc_type == 'STAR':
+                chosen = chosen[::-1]
+            route = []
+            for position, fix_index in enumerate(chosen):
+                waypoint = {'Name': fix_names[int(fix_index)]}
+                if position == 0 and proc_type == 'SID':
+                    waypoint.update({'Altitude': f"{int(rng.integers(15, 40)) * 100}+", 'Speed': '240-'})
+                elif position == len(chosen) - 1 and proc_type == 'STAR':
+                    waypoint.update({'Altitude': f"{int(rng.integers(20, 60)) * 100}", 'Speed': '220-'})
+                if position < len(chosen) - 1 and rng.random() < 0.5:
+                    waypoint['Turn'] = 'Left' if rng.random() < 0.5 else 'Right'
+                route.append(waypoint)
+            end_fix = route[-1]['Name'] if proc_type == 'SID' else route[0]['Name']
+            revision = 1
+            name = f"{end_fix}{revision}{LETTERS[index % 26]}"
+            while (airport['name'], name) in used_names:
+                revision += 1
+                name = f"{end_fix}{revision % 10}{LETTERS[(index + revision) % 26]}"
+            used_names.add((airport['name'], name))
+            procedures.append({'type': proc_type, 'airport': airport['name'],
+                               'runway': thresholds[index % len(thresholds)], 'name': name, 'route': route})
+    return procedures
+
+
+def generate_areas(count, region, rng, min_radius_nm=3.0, max_radius_nm=20.0):
+    """Restricted area dicts {'name', 'points'} with digit-free names (DataManager groups by them)"""
+    min_lat, max_lat, min_lon, max_lon = region
+    areas = []
+    for index in range(count):
+        lat, lon = rng.uniform(min_lat, max_lat), rng.uniform(min_lon, max_lon)
+        vertices = int(rng.integers(4, 13))
+        bearings = np.sort(rng.uniform(0, 360, vertices))
+        radii = rng.uniform(min_radius_nm, max_radius_nm) * rng.uniform(0.7, 1.0, vertices)
+        lats, lons = _offset(lat, lon, radii, bearings)
+        areas.append({'name': f"LTR{letter_code(index, 4)}", 'points': list(zip(lats.tolist(), lons.tolist()))})
+    return areas
+
+
+def tma_boundary(region, vertices=24):
+    """Polygon ring around the middle of the region"""
+    min_lat, max_lat, min_lon, max_lon = region
+    lat, lon = (min_lat + max_lat) / 2, (min_lon + max_lon) / 2
+    radius_nm = (max_lat - min_lat) * NM_PER_DEG_LAT * 0.3
+    bearings = np.linspace(0, 360, vertices, endpoint=False)
+    lats, lons = _offset(lat, lon, radius_nm * (1 + 0.15 * np.sin(np.radians(bearings) * 3)), bearings)
+    return list(zip(lats.tolist(), lons.tolist()))
+
+
+def flight_track(origin, destination, points_count, rng, cruise_ft=35000.0, step_s=4.0, start_time=EPOCH_START):
+    """(N, 3) lat/lon/alt track between two (lat, lon) positions and N epoch times"""
+    t = np.linspace(0.0, 1.0, points_count)
+    # Hafif kavisli yol ve iz gürültüsü
+    bend = rng.normal(0.0, 0.15)
+    lats = origin[0] + (destination[0] - origin[0]) * t + bend * np.sin(np.pi * t) * (destination[1] - origin[1]) * 0.2
+    lons = origin[1] + (destination[1] - origin[1]) * t - bend * np.sin(np.pi * t) * (destination[0] - origin[0]) * 0.2
+    lats = lats + rng.normal(0.0, 0.002, points_count)
+    lons = lons + rng.normal(0.0, 0.002, points_count)
+    # Tırmanış - seyir - alçalma profili
+    alts = cruise_ft * np.clip(np.minimum(t, 1.0 - t) * 5.0, 0.0, 1.0) + 500.0
+    times = start_time + np.arange(points_count) * step_s
+    return np.column_stack([lats, lons, alts]), times
+
+
+def write_trajectory_csv(path, callsign, points, times):
+    """Write one flight in the CSV format parsed by DataManager.parse_csv_trajectory_with_times"""
+    utc = np.char.replace(np.datetime_as_string(times.astype('datetime64[s]')), 'T', ' ')
+    if len(points) > 1:
+        headings = np.degrees(np.arctan2(np.diff(points[:, 1]) * np.cos(np.radians(points[:-1, 0])),
+                                         np.diff(points[:, 0]))) % 360
+        headings = np.append(headings, headings[-1])
+    else:
+        headings = np.zeros(len(points))
+    lines = ["Timestamp,UTC,Callsign,Position,Altitude,Speed,Direction"]
+    lines.extend(f'{int(epoch)},{stamp},{callsign},"{lat:.5f},{lon:.5f}",{alt:.0f},{250 if alt > 10000 else 200},{heading:.0f}'
+                 for (lat, lon, alt), epoch, stamp, heading in zip(points.tolist(), times.tolist(), utc, headings.tolist()))
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def write_trajectory_kml(path, callsign, points):
+    """Write one flight as a KML 'Trail' folder as parsed by DataManager.parse_kml_trajectory"""
+    coordinates = " ".join(f"{lon:.5f},{lat:.5f},{alt * 0.3048:.0f}" for lat, lon, alt in points.tolist())
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<kml xmlns="http://www.opengis.net/kml/2.2"><Document>\n'
+                f'<name>{callsign}</name>\n'
+                '<Folder><name>Trail</name>\n'
+                f'<Placemark><name>{callsign}</name><LineString><altitudeMode>absolute</altitudeMode>'
+                f'<coordinates>{coordinates}</coordinates></LineString></Placemark>\n'
+                '</Folder></Document></kml>\n')
+
+
+def write_waypoints_xml(path, names, lats, lons):
+    parts = ["<?xml version='1.0' encoding='utf-8'?>\n<Fixes>"]
+    parts.extend(f'<Point Name="{name}" Type="Fix">\n    <Latitude>{format_dms(lat, True)}</Latitude>\n'
+                 f'    <Longitude>{format_dms(lon, False)}</Longitude>\n  </Point>'
+                 for name, lat, lon in zip(names, lats.tolist(), lons.tolist()))
+    parts.append("</Fixes>\n")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("".join(parts))
+
+
+def write_procedures_xml(path, procedures):
+    lines = ["<?xml version='1.0' encoding='utf-8'?>", "<Procedures>"]
+    for proc_type in ('SID', 'STAR'):
+        lines.append(f"  <{proc_type}s>")
+        by_runway = {}
+        for procedure in procedures:
+            if procedure['type'] == proc_type:
+                by_runway.setdefault(procedure['runway'], []).append(procedure)
+        for runway, runway_procedures in by_runway.items():
+            lines.append(f'    <Runway Name="{runway}">')
+            for procedure in runway_procedures:
+                lines.append(f'      <{proc_type} Name="{procedure["name"]}" Airport="{procedure["airport"]}">')
+                lines.append("        <Route>")
+                for waypoint in procedure['route']:
+                    attributes = " ".join(f'{key}="{value}"' for key, value in waypoint.items())
+                    lines.append(f"          <Waypoint {attributes} />")
+                lines.append("        </Route>")
+                lines.append(f"      </{proc_type}>")
+            lines.append("    </Runway>")
+        lines.append(f"  </{proc_type}s>")
+    lines.append("</Procedures>")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def write_runways_xml(path, airports):
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', "<Airports>"]
+    for airport in airports:
+        lines.append(f'  <Airport Name="{airport["name"]}">')
+        for runway in airport['runways']:
+            for (name, lat, lon), runway_type in zip(runway['thresholds'], runway['types']):
+                lines.extend([f'    <Runway Name="{name}" Type="{runway_type}">',
+                              f'      <Threshold Name="{name}">',
+                              f"        <Latitude>{format_dms(lat, True)}</Latitude>",
+                              f"        <Longitude>{format_dms(lon, False)}</Longitude>",
+                              "      </Threshold>",
+                              "    </Runway>"])
+        lines.append("  </Airport>")
+        lines.append("")
+    lines.append("</Airports>")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def _boundary_points_xml(point_names, points):
+    return [f'  <Point Name="{name}" Type="Boundary">\n    <Latitude>{format_dms(lat, True)}</Latitude>\n'
+            f'    <Longitude>{format_dms(lon, False)}</Longitude>\n    </Point>'
+            for name, (lat, lon) in zip(point_names, points)]
+
+
+def write_boundary_xml(path, areas):
+    """Istanbul_TMA.xml / LTD_P_R.xml: <Fixes><Point Type="Boundary"> per area vertex"""
+    lines = ["<?xml version='1.0' encoding='utf-8'?>", "<Fixes>"]
+    for area in areas:
+        digits = max(2, len(str(len(area['points']))))
+        names = [f"{area['name']}{i + 1:0{digits}d}" for i in range(len(area['points']))]
+        lines.extend(_boundary_points_xml(names, area['points']))
+    lines.append("</Fixes>")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def write_danger_xml(folder, area):
+    """One Danger_/<name>.xml file in the compact single-line format"""
+    digits = max(2, len(str(len(area['points']))))
+    points = "".join(f'<Point Name="{area["name"]}{i + 1:0{digits}d}" Type="Boundary">'
+                     f"<Latitude>{format_compact_dms(lat, True)}</Latitude>"
+                     f"<Longitude>{format_compact_dms(lon, False)}</Longitude></Point>"
+                     for i, (lat, lon) in enumerate(area['points']))
+    with open(os.path.join(folder, f"{area['name']}.xml"), 'w', encoding='utf-8') as f:
+        f.write(f'<?xml version="1.0" encoding="utf-8"?>\n<Fixes>{points}</Fixes>')
+
+
+def generate_dataset(output, fixes=5000, procedures=500, airports=20, areas=100, flights=1000, flight_points=300,
+                     trajectory_format='csv', trajectories_dir=None, region=DEFAULT_REGION, seed=0):
+    """Write a complete synthetic airspace folder (and trajectories); returns a summary dict"""
+    rng = np.random.default_rng(seed)
+    os.makedirs(output, exist_ok=True)
+
+    fix_names, fix_lats, fix_lons = generate_fixes(fixes, region, rng)
+    airport_list = generate_airports(airports, region, rng)
+    procedure_list = generate_procedures(procedures, airport_list, fix_names, fix_lats, fix_lons, rng)
+    area_list = generate_areas(areas, region, rng)
+
+    write_waypoints_xml(os.path.join(output, 'waypoints.xml'), fix_names, fix_lats, fix_lons)
+    write_procedures_xml(os.path.join(output, 'STAR_SID.xml'), procedure_list)
+    write_runways_xml(os.path.join(output, 'Runways.xml'), airport_list)
+    write_boundary_xml(os.path.join(output, 'Istanbul_TMA.xml'), [{'name': 'SYNTMA', 'points': tma_boundary(region)}])
+    write_boundary_xml(os.path.join(output, 'LTD_P_R.xml'), area_list)
+    danger_folder = os.path.join(output, 'Danger_')
+    os.makedirs(danger_folder, exist_ok=True)
+    for area in area_list:
+        write_danger_xml(danger_folder, area)
+
+    trajectory_paths = []
+    if flights:
+        trajectories_dir = trajectories_dir or os.path.join(output, 'trajectories')
+        os.makedirs(trajectories_dir, exist_ok=True)
+        endpoints = [(airport['lat'], airport['lon']) for airport in airport_list]
+        min_lat, max_lat, min_lon, max_lon = region
+        for index in range(flights):
+            if len(endpoints) >= 2:
+                origin, destination = rng.choice(len(endpoints), 2, replace=False)
+                origin, destination = endpoints[origin], endpoints[destination]
+            else:
+                origin, destination = rng.uniform((min_lat, min_lon), (max_lat, max_lon), (2, 2))
+            callsign = f"SYN{index:05d}"
+            points, times = flight_track(origin, destination, flight_points, rng,
+                                         start_time=EPOCH_START + index * 30.0)
+            if trajectory_format in ('csv', 'both'):
+                path = os.path.join(trajectories_dir, f"{callsign}.csv")
+                write_trajectory_csv(path, callsign, points, times)
+                trajectory_paths.append(path)
+            if trajectory_format in ('kml', 'both'):
+                path = os.path.join(trajectories_dir, f"{callsign}.kml")
+                write_trajectory_kml(path, callsign, points)
+                trajectory_paths.append(path)
+
+    return {'output': output, 'fixes': len(fix_names), 'airports': len(airport_list),
+            'runways': sum(len(airport['runways']) for airport in airport_list),
+            'procedures': len(procedure_list), 'areas': len(area_list), 'trajectory_files': len(trajectory_paths),
+            'trajectories_dir': trajectories_dir}
+
+
+def _parse_region(value):
+    parts = [float(part) for part in value.split(',')]
+    if len(parts) != 4 or parts[0] >= parts[1] or parts[2] >= parts[3]:
+        raise argparse.ArgumentTypeError("Bölge min_lat,max_lat,min_lon,max_lon biçiminde olmalı")
+    return tuple(parts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik hava sahası ve trafik verisi üret")
+    parser.add_argument('output', help="Çıktı hava sahası klasörü (örn. data/Airspace_Synthetic)")
+    parser.add_argument('--fixes', type=int, default=5000, help="Waypoint sayısı")
+    parser.add_argument('--procedures', type=int, default=500, help="SID/STAR sayısı")
+    parser.add_argument('--airports', type=int, default=20, help="Havalimanı sayısı")
+    parser.add_argument('--areas', type=int, default=100, help="Yasaklı/kısıtlı saha sayısı")
+    parser.add_argument('--flights', type=int, default=1000, help="Trajectory sayısı")
+    parser.add_argument('--flight-points', type=int, default=300, help="Trajectory başına nokta")
+    parser.add_argument('--trajectory-format', choices=('csv', 'kml', 'both'), default='csv')
+    parser.add_argument('--trajectories-dir', help="Trajectory klasörü (varsayılan <output>/trajectories)")
+    parser.add_argument('--region', type=_parse_region, default=DEFAULT_REGION,
+                        help="min_lat,max_lat,min_lon,max_lon")
+    parser.add_argument('--seed', type=int, default=0, help="Rastgele tohum")
+    args = parser.parse_args(argv)
+
+    if args.fixes < 1 or args.airports < 1:
+        parser.error("En az bir waypoint ve bir havalimanı gerekli")
+    start_time = time.perf_counter()
+    summary = generate_dataset(args.output, args.fixes, args.procedures, args.airports, args.areas, args.flights,
+                               args.flight_points, args.trajectory_format, args.trajectories_dir, args.region,
+                               args.seed)
+    print(f"{summary['fixes']} waypoint, {summary['procedures']} prosedür, {summary['runways']} pist, "
+          f"{summary['areas']} saha, {summary['trajectory_files']} trajectory dosyası yazıldı: {args.output} "
+          f"({time.perf_counter() - start_time:.1f} sn)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
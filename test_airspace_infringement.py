@@ -0,0 +1,147 @@
+"""
+Yasaklı Saha İhlal Testi
+
+Bu script, bilinen bir kare saha ve TMA sınırı etrafında hatlar üretir ve
+airspace_infringement modülünün nokta-çokgen testini, giriş/çıkış noktalarını,
+köşe kesen bacakları, süreleri ve artımlı (önbellekli) kontrolü doğrular.
+"""
+
+import time
+
+import numpy as np
+from airspace_infringement import (InfringementChecker, InfringementMonitor, points_in_polygon)
+
+SQUARE = {'name': 'LTDTest', 'points': [(41.0, 29.0), (41.0, 29.2), (41.2, 29.2), (41.2, 29.0), (41.0, 29.0)]}
+TMA = [(40.5, 28.5), (40.5, 29.8), (41.7, 29.8), (41.7, 28.5), (40.5, 28.5)]
+
+def reference_inside(lat, lon, polygon):
+    """Tek noktalı, döngülü ışın atma (karşılaştırma için)"""
+    inside = False
+    count = len(polygon)
+    for i in range(count):
+        y0, x0 = polygon[i]
+        y1, x1 = polygon[(i + 1) % count]
+        if (y0 > lat) != (y1 > lat) and lon < x0 + (lat - y0) * (x1 - x0) / (y1 - y0):
+            inside = not inside
+    return inside
+
+def test_airspace_infringement():
+    errors = 0
+    rng = np.random.default_rng(2)
+
+    # Nokta-çokgen: içbükey çokgende döngülü referansla karşılaştır
+    polygon = [(41.0, 29.0), (41.0, 29.4), (41.3, 29.4), (41.15, 29.2), (41.3, 29.0)]
+    lats = rng.uniform(40.9, 41.4, 20000)
+    lons = rng.uniform(28.9, 29.5, 20000)
+    inside = points_in_polygon(lats, lons, [p[0] for p in polygon], [p[1] for p in polygon])
+    expected = np.array([reference_inside(a, b, polygon) for a, b in zip(lats, lons)])
+    if not np.array_equal(inside, expected):
+        print(f"points_in_polygon {np.count_nonzero(inside != expected)} noktada farklı")
+        errors += 1
+
+    checker = InfringementChecker([SQUARE], TMA)
+
+    # Sahayı batıdan doğuya kesen, 1 saniyede bir örneklenen hat
+    track_lons = np.linspace(28.9, 29.3, 401)
+    track_lats = np.full(401, 41.1)
+    times = np.arange(401, dtype=np.float64)
+    results = checker.check(track_lats, track_lons, times)
+    if len(results) != 1:
+        errors += 1
+    else:
+        result = results[0]
+        print(f"Giriş {result['entry']}, çıkış {result['exit']}, {result['duration_s']:.0f} sn, {result['distance_nm']:.2f} NM")
+        if (abs(result['entry'][1] - 29.0) > 1e-9 or abs(result['exit'][1] - 29.2) > 1e-9 or
+                abs(result['duration_s'] - 200.0) > 1e-6):
+            errors += 1
+
+    # İki ucu da dışarıda, sahanın köşesini kesen tek bacak
+    corner_leg = checker.check([41.15, 41.25], [28.95, 29.1])
+    if len(corner_leg) != 1 or corner_leg[0]['entry'] is None or corner_leg[0]['exit'] is None:
+        print("Köşe kesen bacak bulunamadı")
+        errors += 1
+
+    # Sahanın dışında kalan hat ve TMA dışına çıkan hat
+    if checker.check([40.8, 40.9], [29.0, 29.2]):
+        errors += 1
+    tma_exit = [r for r in checker.check([41.5, 41.9], [29.5, 29.5]) if r['kind'] == 'TMA_EXIT']
+    if len(tma_exit) != 1 or tma_exit[0]['exit'] is not None or abs(tma_exit[0]['entry'][0] - 41.7) > 1e-9:
+        errors += 1
+
+    # Artımlı kontrol: yalnızca değişen rota yeniden kontrol edilir
+    monitor = InfringementMonitor(checker)
+    routes = [{'id': f'R{i}', 'points': [(40.8, 28.8 + i * 0.01), (40.9, 28.9 + i * 0.01)]} for i in range(50)]
+    monitor.update(routes, [])
+    before = monitor.checks_run
+    routes[3] = {'id': 'R3', 'points': [(41.1, 28.9), (41.1, 29.3)]}
+    results = monitor.update(routes, [])
+    if monitor.checks_run - before != 1 or not results['routes']['R3']:
+        errors += 1
+
+    # Çok sayıda trajectory noktası
+    trajectories = [{'id': f'T{i}', 'points': np.column_stack([np.linspace(40.6, 41.6, 2000),
+                                                               np.full(2000, 28.901 + i * 0.002),
+                                                               np.full(2000, 5000.0)])} for i in range(500)]
+    start = time.perf_counter()
+    results = monitor.update([], trajectories)
+    infringing = sum(1 for r in results['trajectories'].values() if any(i['kind'] != 'TMA_EXIT' for i in r))
+    print(f"{len(trajectories)} trajectory ({len(trajectories) * 2000} nokta): "
+          f"{(time.perf_counter() - start) * 1000:.0f} ms, {infringing} ihlal eden")
+    if infringing != sum(1 for i in range(500) if 29.0 < 28.901 + i * 0.002 < 29.2):
+        errors += 1
+
+    # Harita: kontrol düzenleme bildiriminde yapılır, çizim sırasında yapılmaz
+    import os
+    import sys
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtGui import QImage
+    from PyQt5.QtWidgets import QApplication
+    from map_widget import MapWidget
+    from models import DataManager
+    app = QApplication.instance() or QApplication(sys.argv)
+    widget = MapWidget()
+    data_manager = DataManager()
+    data_manager.restricted_areas = [SQUARE]
+    data_manager.tma_boundary_points = TMA
+    widget.set_data_manager(data_manager)
+    widget.resize(400, 300)
+    widget.drawn_elements['routes'].append({'type': 'user_route', 'id': 'R1', 'points': [(41.1, 28.9), (41.1, 29.3)]})
+    widget.drawingsChanged.emit()
+    widget.drawingsChanged.emit()
+    app.processEvents()
+    monitor = widget.get_infringement_monitor()
+    checks = monitor.checks_run
+    image = QImage(400, 300, QImage.Format_ARGB32_Premultiplied)
+    for _ in range(3):
+        widget.render(image)
+    if list(widget.route_infringements) != ['R1'] or checks != 1 or monitor.checks_run != checks:
+        print(f"Harita ihlalleri: {widget.route_infringements}, kontrol sayısı {checks} -> {monitor.checks_run}")
+        errors += 1
+
+    # Ctrl+tekerlekle döndürülen PMS yeniden kontrol edilmeli; adımlar tek geri alma kaydında birleşir
+    from PyQt5.QtCore import QPoint, QPointF, Qt
+    from PyQt5.QtGui import QWheelEvent
+    widget.drawn_elements['routes'].append({'type': 'pointmerge', 'id': 'PMS', 'points': [(40.995, 29.3), (40.995, 29.1)]})
+    widget.selected_path_index = 1
+    widget.drawingsChanged.emit()
+    app.processEvents()
+    undo_depth = len(widget._undo_stack)
+    for _ in range(6):
+        widget.wheelEvent(QWheelEvent(QPointF(200, 150), QPointF(200, 150), QPoint(), QPoint(0, -120), Qt.NoButton,
+                                      Qt.ControlModifier, Qt.NoScrollPhase, False))
+    app.processEvents()
+    if sorted(widget.route_infringements) != ['PMS', 'R1'] or len(widget._undo_stack) != undo_depth + 1:
+        print(f"Tekerlek döndürmesi: {sorted(widget.route_infringements)}, geri alma {undo_depth} -> {len(widget._undo_stack)}")
+        errors += 1
+    widget.undo()
+    app.processEvents()
+    if list(widget.route_infringements) != ['R1']:
+        errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: İhlal aralıkları, giriş/çıkış noktaları ve artımlı kontrol doğru")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_airspace_infringement()
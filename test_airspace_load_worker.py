@@ -0,0 +1,113 @@
+"""
+Arka Plan Veri Yükleme Testi
+
+Bu script, AirspaceLoadWorker'ın altlık haritayı, TMA/yasaklı sahaları,
+prosedürleri ve pistleri bu sırayla yayınladığını, sonuçların senkron
+DataManager.load_airspace_data ile aynı olduğunu ve ana pencerenin veri
+yüklenmeden kurulup gösterildiğini, kenar çubuğu ile haritanın veri
+geldikçe dolduğunu ve başlangıçta kapatılan pencerenin iptal edilen
+yüklemeyi hata olarak göstermediğini doğrular.
+"""
+
+import contextlib
+import io
+import os
+import time
+
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+
+from models import DataManager
+from airspace_load_worker import AirspaceLoadWorker
+
+FOLDER = 'Airspace_01.01.2025'
+GEOJSON = 'Clipped_Map.geojson'
+
+def wait_until(app, condition, timeout_s=30.0):
+    deadline = time.perf_counter() + timeout_s
+    while not condition() and time.perf_counter() < deadline:
+        app.processEvents(QEventLoop.AllEvents, 50)
+        time.sleep(0.005)
+    return condition()
+
+def test_airspace_load_worker():
+    app = QApplication.instance() or QApplication([])
+    errors = 0
+
+    expected = DataManager()
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected.load_airspace_data(os.path.join(expected.data_dir, FOLDER))
+
+    # Worker: parçalar sırayla ve senkron yüklemeyle aynı içerikle gelmeli
+    events, received = [], {}
+    worker = AirspaceLoadWorker(os.path.join('data', FOLDER), os.path.join('data', GEOJSON))
+    worker.baseMapLoaded.connect(lambda geo_data, arrays: events.append(('base_map', len(arrays or []))))
+    worker.partLoaded.connect(lambda part, attributes: (events.append((part, None)), received.update(attributes)))
+    worker.loadFinished.connect(lambda success, cancelled, folder: events.append(('finished', success)))
+    with contextlib.redirect_stdout(io.StringIO()):
+        worker.start()
+        finished = wait_until(app, lambda: events and events[-1][0] == 'finished')
+        worker.wait()
+    print(f"Sinyal sırası: {[name for name, _ in events]}")
+    if not finished or [name for name, _ in events] != ['base_map', 'areas', 'procedures', 'runways', 'finished']:
+        errors += 1
+    elif events[0][1] == 0 or events[-1][1] is not True:
+        errors += 1
+    for name in ('tma_boundary_points', 'restricted_areas', 'waypoint_coords', 'runways'):
+        if received.get(name) != getattr(expected, name):
+            print(f"Uyumsuz: {name}")
+            errors += 1
+    if sorted(received.get('procedures', {}).get('SID', {})) != sorted(expected.procedures['SID']):
+        errors += 1
+
+    # Ana pencere: veri beklemeden kurulur, gösterilir; sonra kademeli dolar
+    import airspace_visualizer
+    airspace_visualizer.AirspaceVisualizer.prompt_startup_options = lambda self: (FOLDER, GEOJSON)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        window = airspace_visualizer.AirspaceVisualizer()
+        window.show()
+        app.processEvents()
+        shown = time.perf_counter() - start
+        runways_at_show = len(window.data_manager.runways)
+        done = wait_until(app, lambda: window.airspace_load_worker is None)
+        loaded = time.perf_counter() - start
+    print(f"Pencere gösterildi: {shown * 1000:.0f} ms, veri tamamlandı: {loaded * 1000:.0f} ms, "
+          f"gösterimde pist sayısı: {runways_at_show}")
+    if not done or window.data_manager.runways != expected.runways:
+        errors += 1
+    if not window.map_widget.country_paths or window.map_widget.runways is not window.data_manager.runways:
+        errors += 1
+    if window.map_widget.data_manager is not window.data_manager or window.statusBar().currentMessage() != "Ready":
+        errors += 1
+    window.close()
+
+    # Başlangıçta kapatılan pencere: yükleme iptal edilir, hata gösterilmez
+    cancelled_events, dialogs = [], []
+    worker = AirspaceLoadWorker(os.path.join('data', FOLDER), os.path.join('data', GEOJSON))
+    worker.loadFinished.connect(lambda success, cancelled, folder: cancelled_events.append((success, cancelled)))
+    with contextlib.redirect_stdout(io.StringIO()):
+        worker.start()
+        worker.cancel()
+        worker.wait()
+        wait_until(app, lambda: cancelled_events, timeout_s=5.0)
+    if cancelled_events != [(False, True)]:
+        print(f"İptal sinyali: {cancelled_events}")
+        errors += 1
+    airspace_visualizer.QMessageBox.critical = lambda *args: dialogs.append(args)
+    with contextlib.redirect_stdout(io.StringIO()):
+        window = airspace_visualizer.AirspaceVisualizer()
+        window.show()
+        window.close()
+        app.processEvents()
+    if dialogs or window.statusBar().currentMessage() != "Data loading cancelled.":
+        print(f"Kapanışta iptal: {window.statusBar().currentMessage()!r}, {len(dialogs)} hata penceresi")
+        errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Veri arka planda sırayla yüklendi, pencere veri beklemeden açıldı")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_airspace_load_worker()
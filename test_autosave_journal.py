@@ -0,0 +1,206 @@
+"""
+Otomatik Kayıt Günlüğü Testi
+
+Bu script, AutosaveJournal'ın yalnızca değişen rotaları günlüğe eklediğini,
+trajectory değişiminde ve günlük büyüdüğünde snapshot'a katladığını,
+çöken bir süreçten kalan oturumun bulunup snapshot + günlük oynatmasıyla
+son hale döndürüldüğünü, yarım yazılmış son satırın ve eski kuşak günlüğün
+yok sayıldığını, çalışan oturumların kurtarma listesine girmediğini ve
+AutosaveWorker'a teslimin GUI thread'ini bekletmediğini ve haritada
+tekerlekle yapılan döndürmenin günlüğe ulaştığını doğrular.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+
+from autosave_journal import (AutosaveJournal, JOURNAL_FILE, discard_session, find_recoverable_sessions,
+                              new_session_directory, recover_session)
+from benchmark import make_routes, synthetic_flights
+
+# Alt süreçte çalışır: çizim yapar, günlüğe yazar ve düzgün kapanmadan çıkar
+CRASH_SCRIPT = """
+import os, sys
+sys.path.insert(0, {cwd!r})
+from test_autosave_journal import make_elements, edit_elements
+from autosave_journal import AutosaveJournal, new_session_directory
+journal = AutosaveJournal(new_session_directory({root!r}))
+journal.acquire()
+elements = make_elements()
+journal.record(elements)
+edit_elements(elements)
+journal.record(elements)
+os._exit(1)
+"""
+
+def make_elements():
+    routes = make_routes(300, 15, seed=5)
+    trajectories = [{'id': callsign, 'points': points, 'times': times, 'type': 'trajectory'}
+                    for callsign, points, times in synthetic_flights(20, 100, seed=5)]
+    return {'routes': routes, 'trajectories': trajectories}
+
+def edit_elements(elements):
+    """Bir rotayı değiştir, birini sil, iki rota ekle ve sırayı değiştir"""
+    routes = elements['routes']
+    routes[3]['points'][2] = (41.25, 28.75)
+    routes[3]['name'] = 'Değişti'
+    del routes[7]
+    routes.append({'type': 'user_route', 'id': 'yeni', 'name': 'Yeni', 'points': [(40.0, 28.0), (40.5, 28.5)]})
+    routes.insert(0, {'type': 'user_route', 'name': 'Kimliksiz', 'points': [(41.0, 29.0), (41.1, 29.1)]})
+
+def same_routes(a, b):
+    if len(a) != len(b):
+        return False
+    for first, second in zip(a, b):
+        if ({k: v for k, v in first.items() if k != 'points'} != {k: v for k, v in second.items() if k != 'points'} or
+                not np.allclose(first['points'], second['points'], rtol=0, atol=0)):
+            return False
+    return True
+
+def test_autosave_journal():
+    errors = 0
+    with tempfile.TemporaryDirectory() as root:
+        # Günlük: ilk kayıt snapshot, sonra yalnızca değişiklikler
+        elements = make_elements()
+        journal = AutosaveJournal(new_session_directory(root))
+        journal.acquire()
+        first = journal.record(elements)
+        unchanged = journal.record(elements)
+        edit_elements(elements)
+        edited = journal.record(elements)
+        print(f"İlk kayıt: {first}; değişmeden: {unchanged}; düzenleme: {edited}")
+        if not first['compacted'] or unchanged['records'] or unchanged['compacted']:
+            errors += 1
+        # 3 put (değişen + 2 yeni), 1 delete, 1 order
+        if edited['compacted'] or edited['records'] != 5:
+            errors += 1
+
+        # Çalışan oturum kurtarma listesinde görünmemeli
+        if find_recoverable_sessions(root):
+            print("Çalışan oturum kurtarılabilir sayıldı")
+            errors += 1
+
+        # Trajectory eklemek snapshot'a katlar; günlük yeniden başlar
+        callsign, points, times = next(iter(synthetic_flights(1, 50, seed=9)))
+        elements['trajectories'].append({'id': 'EKLENEN', 'points': points, 'times': times, 'type': 'trajectory'})
+        with_trajectory = journal.record(elements)
+        elements['routes'][1]['name'] = 'Sonra değişti'
+        after = journal.record(elements)
+        if not with_trajectory['compacted'] or after['records'] != 1:
+            errors += 1
+        routes, trajectories = recover_session(journal.directory)
+        if not same_routes(routes, elements['routes']) or len(trajectories) != 21 or trajectories[-1]['id'] != 'EKLENEN':
+            print("Snapshot + günlük oynatma son hali vermedi")
+            errors += 1
+
+        # Yarım kalmış son satır yok sayılmalı
+        with open(os.path.join(journal.directory, JOURNAL_FILE), 'a', encoding='utf-8') as f:
+            f.write('{"op":"put","key":"route_1","route":{"na')
+        routes, _ = recover_session(journal.directory)
+        if not same_routes(routes, elements['routes']):
+            errors += 1
+
+        # Büyüyen günlük snapshot'a katlanmalı
+        small = AutosaveJournal(new_session_directory(os.path.join(root, 'small')), compact_bytes=2000)
+        small.acquire()
+        small_elements = make_elements()
+        small.record(small_elements)
+        compactions = 0
+        for step in range(20):
+            small_elements['routes'][step]['name'] = f'Adım {step}'
+            compactions += small.record(small_elements)['compacted']
+        if not 1 <= compactions < 20 or not same_routes(recover_session(small.directory)[0], small_elements['routes']):
+            errors += 1
+        small.discard()
+        if os.path.exists(small.directory):
+            errors += 1
+        journal.discard()
+
+        # Çöken süreç: oturum bulunmalı ve son hale kurtarılmalı
+        script = CRASH_SCRIPT.format(cwd=os.getcwd(), root=root)
+        subprocess.run([sys.executable, '-c', script], check=False)
+        sessions = find_recoverable_sessions(root)
+        expected = make_elements()
+        edit_elements(expected)
+        if len(sessions) != 1:
+            print(f"Kurtarılabilir oturumlar: {sessions}")
+            errors += 1
+        else:
+            start = time.perf_counter()
+            routes, trajectories = recover_session(sessions[0]['directory'])
+            recover_ms = (time.perf_counter() - start) * 1000
+            print(f"Çöken oturum kurtarıldı: {len(routes)} rota, {len(trajectories)} trajectory, {recover_ms:.0f} ms")
+            if (not same_routes(routes, expected['routes']) or len(trajectories) != 20 or
+                    not np.array_equal(trajectories[4]['points'], expected['trajectories'][4]['points'])):
+                errors += 1
+            discard_session(sessions[0]['directory'])
+        if find_recoverable_sessions(root):
+            errors += 1
+
+        # Worker: teslim GUI thread'ini bekletmemeli, yazma arka planda yapılmalı
+        from PyQt5.QtWidgets import QApplication
+        from autosave_worker import AutosaveWorker
+        app = QApplication.instance() or QApplication(sys.argv)
+        journal = AutosaveJournal(new_session_directory(root))
+        journal.acquire()
+        worker = AutosaveWorker(journal)
+        results = []
+        worker.autosaved.connect(results.append)
+        worker.start()
+        elements = make_elements()
+        start = time.perf_counter()
+        worker.submit(elements)
+        submit_ms = (time.perf_counter() - start) * 1000
+        deadline = time.time() + 30
+        while not results and time.time() < deadline:
+            app.processEvents()
+            time.sleep(0.01)
+        elements['routes'][0]['name'] = 'Worker'
+        worker.submit(elements)
+        while len(results) < 2 and time.time() < deadline:
+            app.processEvents()
+            time.sleep(0.01)
+        worker.cancel()
+        worker.wait()
+        print(f"Worker teslimi {submit_ms:.3f} ms, yazımlar: {results}")
+        if submit_ms > 5 or len(results) != 2 or not results[0]['compacted'] or results[1]['records'] != 1:
+            errors += 1
+        if recover_session(journal.directory)[0][0]['name'] != 'Worker':
+            errors += 1
+        journal.discard()
+
+        # Harita: Ctrl+tekerlek döndürmesi drawingsChanged ile günlüğe ulaşmalı
+        from PyQt5.QtCore import QPoint, QPointF, Qt
+        from PyQt5.QtGui import QWheelEvent
+        from map_widget import MapWidget
+        widget = MapWidget()
+        journal = AutosaveJournal(new_session_directory(root))
+        journal.acquire()
+        widget.drawn_elements['routes'].append({'type': 'pointmerge', 'id': 'PMS', 'name': 'PMS',
+                                                'points': [(41.0, 29.3), (41.0, 29.1)]})
+        journal.record(widget._snapshot_drawn_elements())
+        # AirspaceVisualizer.schedule_autosave gibi: düzenleme bildiriminden sonra kopya yazılır
+        widget.drawingsChanged.connect(lambda: journal.record(widget._snapshot_drawn_elements()))
+        widget.selected_path_index = 0
+        widget.wheelEvent(QWheelEvent(QPointF(10, 10), QPointF(10, 10), QPoint(), QPoint(0, 120), Qt.NoButton,
+                                      Qt.ControlModifier, Qt.NoScrollPhase, False))
+        rotated = widget.drawn_elements['routes'][0]['points']
+        recovered = recover_session(journal.directory)[0]
+        print(f"Tekerlek döndürmesi sonrası kurtarılan ilk nokta: {recovered[0]['points'][0]}")
+        if rotated[0] == (41.0, 29.3) or not same_routes(recovered, widget.drawn_elements['routes']):
+            errors += 1
+        journal.discard()
+
+    if errors == 0:
+        print("BAŞARILI: Otomatik kayıt günlüğü değişiklikleri arka planda yazıyor ve çökme sonrası kurtarıyor")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_autosave_journal()
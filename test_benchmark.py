@@ -0,0 +1,70 @@
+"""
+Performans Ölçüm Takımı Testi
+
+Bu script, benchmark modülünü küçük ölçekle çalıştırıp tüm ölçümlerin
+JSON sonucunu doğru alanlarla yazdığını, sentetik trajectory CSV'lerinin
+içe aktarıcıyla ayrıştırılabildiğini ve karşılaştırmanın yavaşlamayı
+yakalayıp çıkış kodunu 1 yaptığını doğrular.
+"""
+
+import contextlib
+import copy
+import io
+import json
+import os
+import tempfile
+
+from benchmark import BENCHMARKS, compare_results, main, write_trajectory_csvs
+from trajectory_import import parse_trajectory_file
+
+SMALL = ['--repeat', '2', '--routes', '10', '--route-points', '8', '--trajectories', '6',
+         '--trajectory-points', '50', '--queries', '10', '--width', '800', '--height', '500',
+         '--geojson', os.path.join('data', 'Clipped_Map.geojson'), '-q']
+
+def test_benchmark():
+    errors = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_trajectory_csvs(tmp, 2, 30)
+        _, trajectory_id, points, times = parse_trajectory_file(paths[0])
+        if points is None or points.shape != (30, 3) or times is None or trajectory_id != 'BNC0000':
+            print(f"Sentetik CSV ayrıştırılamadı: {trajectory_id} {None if points is None else points.shape}")
+            errors += 1
+
+        output_path = os.path.join(tmp, 'results.json')
+        with contextlib.redirect_stdout(io.StringIO()):
+            code = main(SMALL + ['-o', output_path])
+        with open(output_path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+        print(f"Çıkış kodu {code}, ölçümler: {list(document['results'])}")
+        if code != 0 or list(document['results']) != list(BENCHMARKS):
+            errors += 1
+        for name, result in document['results'].items():
+            if len(result['times_s']) != 2 or not 0 < result['min_s'] <= result['median_s']:
+                print(f"Geçersiz sonuç: {name} {result}")
+                errors += 1
+        if document['meta']['params']['routes'] != 10 or 'python' not in document['meta']:
+            errors += 1
+
+        # Aynı dosyayla karşılaştırma yavaşlama bulmamalı; 2x yavaş sonuç bulunmalı
+        lines, regressed = compare_results(document, document)
+        if regressed:
+            errors += 1
+        slower = copy.deepcopy(document)
+        slower['results']['paint']['median_s'] *= 2
+        lines, regressed = compare_results(slower, document, threshold=1.2)
+        print("\n".join(lines))
+        if regressed != ['paint']:
+            errors += 1
+        with contextlib.redirect_stdout(io.StringIO()):
+            code = main(SMALL + ['--only', 'undo_snapshot', '--compare', output_path, '--threshold', '1000'])
+        if code != 0:
+            errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Ölçüm takımı tüm ölçümleri JSON'a yazıyor, karşılaştırma yavaşlamayı yakalıyor")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_benchmark()
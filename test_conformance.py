@@ -0,0 +1,63 @@
+"""
+Prosedür Uygunluk Analizi Testi
+
+Bu script, bir örnek prosedür hattı etrafında bilinen sabit yanal sapmalarla
+uçuşlar üretir ve conformance modülünün cross-track, ekstra mesafe ve koridor
+sonuçlarını kontrol eder.
+"""
+
+import time
+
+import numpy as np
+from conformance import ProcedurePolyline, analyze_conformance
+
+SAMPLE_PROCEDURE = [
+    {"lat": 41.0, "lon": 28.5, "name": "WPT1"},
+    {"lat": 41.0, "lon": 28.8, "name": "WPT2"},
+    {"lat": 41.0, "lon": 29.1, "name": "WPT3"},
+]
+
+def test_conformance(n_flights=1000, n_points=300):
+    polyline = ProcedurePolyline(SAMPLE_PROCEDURE)
+    print(f"Prosedür uzunluğu: {polyline.length:.2f} NM")
+
+    # Her uçuş hattın sağında/solunda sabit bir mesafede uçar
+    offsets = np.linspace(-2.0, 2.0, n_flights)
+    along = np.linspace(0.0, polyline.length, n_points)
+    trajectories = []
+    for i, offset in enumerate(offsets):
+        lats, lons = polyline.point_at(along, offset)
+        trajectories.append((f"F{i:04d}", np.column_stack([lats, lons, np.full(n_points, 5000.0)])))
+
+    # Ortada 5 NM sola sapan üçgen rota: ekstra mesafe analitik olarak bilinir
+    half = polyline.length / 2.0
+    detour = np.interp(along, [0.0, half, polyline.length], [0.0, -5.0, 0.0])
+    lats, lons = polyline.point_at(along, detour)
+    trajectories.append(("DETOUR", np.column_stack([lats, lons, np.full(n_points, 5000.0)])))
+    expected_extra = 2.0 * np.hypot(half, 5.0) - polyline.length
+
+    start = time.perf_counter()
+    result = analyze_conformance(trajectories, SAMPLE_PROCEDURE, tolerance_nm=1.0)
+    print(f"Analiz: {len(trajectories) * n_points} nokta, {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    errors = 0
+    for offset, flight in zip(offsets, result['flights']):
+        if abs(flight['mean_abs_xte_nm'] - abs(offset)) > 0.01 or abs(flight['extra_track_miles_nm']) > 0.01:
+            errors += 1
+    detour_flight = result['flights'][-1]
+    print(f"Sapma rotası ekstra mesafe: {detour_flight['extra_track_miles_nm']:.3f} NM (beklenen {expected_extra:.3f} NM)")
+    if abs(detour_flight['extra_track_miles_nm'] - expected_extra) > 0.05:
+        errors += 1
+
+    median = result['corridors'][50]['offsets_nm']
+    print(f"Koridor istasyonları: {len(result['stations_nm'])}, en büyük medyan sapma {np.abs(median).max():.3f} NM")
+    if np.abs(median).max() > 0.05:
+        errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Cross-track, ekstra mesafe ve koridor sonuçları doğru")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_conformance()
@@ -0,0 +1,59 @@
+"""
+Trafik Yoğunluk Katmanı Testi
+
+Bu script, rastgele noktaları TrafficDensityGrid'e parça parça (artımlı)
+ekler, sonucu numpy.histogram2d ile karşılaştırır ve on milyonlarca noktalık
+biriktirme ile QImage üretim süresini ölçer.
+"""
+
+import time
+
+import numpy as np
+from PyQt5.QtWidgets import QApplication
+from density_layer import TrafficDensityGrid, DensityColorRamp, density_to_qimage
+
+BOUNDS = (26.0, 36.0, 45.0, 42.0)
+
+def test_density_grid(n_points=20_000_000):
+    app = QApplication.instance() or QApplication([])
+    rng = np.random.default_rng(5)
+    grid = TrafficDensityGrid(BOUNDS, cell_size_deg=0.02)
+    print(f"Izgara: {grid.nx} x {grid.ny} hücre")
+
+    errors = 0
+    # Küçük uçuşlar tek tek eklenir (add.at yolu), sonra karşılaştırılır
+    lats = rng.normal(41.0, 0.4, 50_000)
+    lons = rng.normal(28.8, 0.6, 50_000)
+    for start in range(0, len(lats), 500):
+        grid.add_points(lats[start:start + 500], lons[start:start + 500])
+    expected, _x, _y = np.histogram2d(
+        lats, lons, bins=[grid.ny, grid.nx],
+        range=[[grid.min_lat, grid.max_lat], [grid.min_lon, grid.max_lon]])
+    if not np.array_equal(grid.to_grid(), expected.astype(np.uint32)):
+        print(f"Artımlı ekleme histogram2d ile uyuşmuyor (fark {np.abs(grid.to_grid() - expected).sum():.0f})")
+        errors += 1
+
+    # Büyük tek parça (bincount yolu)
+    grid.clear()
+    big_lats = rng.uniform(36.0, 42.0, n_points)
+    big_lons = rng.uniform(26.0, 45.0, n_points)
+    start = time.perf_counter()
+    grid.add_points(big_lats, big_lons)
+    elapsed = time.perf_counter() - start
+    print(f"Biriktirme: {n_points / 1e6:.0f}M nokta, {elapsed:.2f} sn")
+    if grid.total + grid.dropped != n_points or grid.total != int(grid.counts.sum()):
+        errors += 1
+
+    start = time.perf_counter()
+    image = density_to_qimage(grid, DensityColorRamp())
+    print(f"QImage: {image.width()} x {image.height()}, {(time.perf_counter() - start) * 1000:.0f} ms")
+    if image.width() != grid.nx or image.height() != grid.ny:
+        errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Yoğunluk ızgarası histogram2d ile aynı, görüntü doğru boyutta")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_density_grid()
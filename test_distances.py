@@ -1,5 +1,5 @@
 import math
-from pointmerge import calculate_leg_points, calculate_point_from_bearing
+from procedure_geometry import calculate_leg_points, calculate_point_from_bearing
 
 def calculate_distance(lat1, lon1, lat2, lon2):
     """Calculate great-circle distance between two points in nautical miles"""
@@ -0,0 +1,113 @@
+"""
+Kare Süresi Profilleyici Testi
+
+Bu script, FrameProfiler'ın lap sürelerini katman başına topladığını,
+özet istatistiklerini ve CSV satırlarını doğru ürettiğini, MapWidget
+çiziminin katmanları ve geo_to_screen sayılarını kaydettiğini ve
+profilleyici açıkken çizim süresinin belirgin şekilde artmadığını doğrular.
+"""
+
+import csv
+import os
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from benchmark import BenchmarkContext, build_parser
+from frame_profiler import FrameProfiler
+
+def render_times(widget, image, count):
+    times = []
+    for _ in range(count):
+        start = time.perf_counter()
+        widget.render(image)
+        times.append(time.perf_counter() - start)
+    return times
+
+def test_frame_profiler():
+    errors = 0
+
+    # Aynı katmana birden çok lap süre ve sayıları toplamalı
+    profiler = FrameProfiler(window=3)
+    for frame in range(5):
+        profiler.begin_frame()
+        time.sleep(0.002)
+        profiler.lap('routes', 1)
+        profiler.lap('route_labels', 4)
+        time.sleep(0.001)
+        profiler.lap('routes', 1)
+        profiler.end_frame(projected_calls=10, projected_points=100 + frame)
+    summary = profiler.summary()
+    routes = summary['layers']['routes']
+    print(f"Özet: {summary['frames']} kare, {summary['mean_ms']:.2f} ms, routes {routes}")
+    if (summary['frames'] != 3 or list(summary['layers']) != ['routes', 'route_labels'] or
+            routes['primitives'] != 2 or summary['layers']['route_labels']['primitives'] != 4 or
+            not 3.0 <= routes['mean_ms'] <= summary['mean_ms'] or summary['projected_points'] != 103):
+        errors += 1
+    if profiler.summary() is not summary:
+        errors += 1
+
+    # Kapalıyken kare kaydedilmemeli
+    profiler.set_enabled(False)
+    profiler.begin_frame()
+    profiler.lap('routes', 1)
+    profiler.end_frame()
+    if profiler.frame_index != 5:
+        errors += 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'frames.csv')
+        frame_count = profiler.export_csv(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        if frame_count != 3 or len(rows) != 9 or [row['layer'] for row in rows[:3]] != ['frame', 'routes', 'route_labels']:
+            print(f"CSV satırları: {rows[:3]}")
+            errors += 1
+
+    # Gerçek harita çizimi
+    args = build_parser().parse_args(['--routes', '20', '--route-points', '10', '--trajectories', '30',
+                                      '--trajectory-points', '200', '--width', '1000', '--height', '700',
+                                      '--geojson', os.path.join('data', 'Clipped_Map.geojson')])
+    context = BenchmarkContext(args)
+    widget = context.widget()
+    widget.show_waypoints = True
+    from PyQt5.QtGui import QImage
+    image = QImage(args.width, args.height, QImage.Format_ARGB32_Premultiplied)
+    widget.render(image)
+    widget.frame_profiler.clear()
+    enabled = render_times(widget, image, 8)
+    summary = widget.frame_profiler.summary()
+    print("\n".join(widget.frame_profiler.summary_lines()))
+    expected = {'background', 'countries', 'tma', 'restricted_areas', 'runways', 'routes', 'route_points',
+                'trajectories', 'waypoints', 'waypoint_labels'}
+    if summary['frames'] != 8 or not expected <= set(summary['layers']):
+        print(f"Eksik katmanlar: {expected - set(summary['layers'])}")
+        errors += 1
+    if (summary['layers']['routes']['primitives'] != 20 or summary['layers']['trajectories']['primitives'] <= 0 or
+            summary['geo_to_screen_calls'] <= 0 or
+            summary['projected_points'] < len(widget.data_manager.waypoint_coords)):
+        errors += 1
+
+    # HUD açıkken çizim hatasız sürmeli
+    widget.set_frame_profiler_hud(True)
+    widget.render(image)
+    widget.set_frame_profiler_hud(False)
+
+    widget.frame_profiler.set_enabled(False)
+    disabled = render_times(widget, image, 8)
+    widget.frame_profiler.set_enabled(True)
+    enabled += render_times(widget, image, 8)
+    enabled_ms, disabled_ms = statistics.median(enabled) * 1000, statistics.median(disabled) * 1000
+    print(f"Çizim: profilleyici açık {enabled_ms:.1f} ms, kapalı {disabled_ms:.1f} ms")
+    if enabled_ms > disabled_ms * 1.25 + 2.0:
+        errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Kare profilleyici katman sürelerini, ilkel ve projeksiyon sayılarını düşük maliyetle kaydediyor")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_frame_profiler()
@@ -0,0 +1,77 @@
+"""
+Geodezi Modülü Testi
+
+Bu script, geodesy modülünün vektörel mesafe, yön, hedef nokta ve hat
+sapması fonksiyonlarını skaler sürümlerle ve bilinen değerlerle karşılaştırır
+ve toplu hesaplamanın döngüye göre hızını ölçer.
+"""
+
+import time
+
+import numpy as np
+import geodesy
+from utils import calculate_distance, calculate_bearing, calculate_point_at_distance_and_bearing
+from procedure_geometry import calculate_point_from_bearing, calculate_leg_points
+
+def test_geodesy(n_points=200000):
+    errors = 0
+    rng = np.random.default_rng(7)
+    lat1, lon1 = rng.uniform(35, 43, n_points), rng.uniform(25, 45, n_points)
+    lat2, lon2 = rng.uniform(35, 43, n_points), rng.uniform(25, 45, n_points)
+
+    start = time.perf_counter()
+    distances = geodesy.distance_nm(lat1, lon1, lat2, lon2)
+    bearings = geodesy.bearing_deg(lat1, lon1, lat2, lon2)
+    vector_elapsed = time.perf_counter() - start
+
+    sample = 5000
+    start = time.perf_counter()
+    scalar_distances = np.array([calculate_distance(a, b, c, d) for a, b, c, d
+                                 in zip(lat1[:sample], lon1[:sample], lat2[:sample], lon2[:sample])])
+    scalar_bearings = np.array([calculate_bearing(a, b, c, d) for a, b, c, d
+                                in zip(lat1[:sample], lon1[:sample], lat2[:sample], lon2[:sample])])
+    scalar_elapsed = (time.perf_counter() - start) * n_points / sample
+    print(f"{n_points} çift: vektörel {vector_elapsed * 1000:.1f} ms, "
+          f"skaler döngü ~{scalar_elapsed * 1000:.0f} ms ({scalar_elapsed / vector_elapsed:.0f}x)")
+
+    if np.max(np.abs(distances[:sample] - scalar_distances)) > 1e-9:
+        errors += 1
+    bearing_diff = np.abs((bearings[:sample] - scalar_bearings + 180.0) % 360.0 - 180.0)
+    if np.max(bearing_diff) > 1e-9:
+        errors += 1
+
+    # Bilinen değerler: ekvatorda 1 derece boylam = 60.04 NM, doğu yönü 90 derece
+    if abs(geodesy.distance(0.0, 0.0, 0.0, 1.0) - 60.04) > 0.01 or abs(geodesy.bearing(0.0, 0.0, 0.0, 1.0) - 90.0) > 1e-9:
+        errors += 1
+
+    # Hedef nokta: gidiş-dönüş aynı noktaya ulaşmalı, eski fonksiyonlarla aynı sonuç
+    dest_lats, dest_lons = geodesy.destination(lat1, lon1, distances, bearings)
+    if max(np.max(np.abs(dest_lats - lat2)), np.max(np.abs(dest_lons - lon2))) > 1e-8:
+        print("destination, distance/bearing ile tutarsız")
+        errors += 1
+    if (calculate_point_from_bearing(41.0, 29.0, 20.0, 135.0) != calculate_point_at_distance_and_bearing(41.0, 29.0, 20.0, 135.0)):
+        errors += 1
+
+    # Hat sapması: 10 NM sağa kaydırılmış nokta +10 NM, 30 NM ileride
+    track = geodesy.bearing(41.0, 28.0, 41.0, 30.0)
+    foot_lat, foot_lon = geodesy.destination_point(41.0, 28.0, 30.0, track)
+    off_lat, off_lon = geodesy.destination_point(foot_lat, foot_lon, 10.0, geodesy.bearing(foot_lat, foot_lon, 41.0, 30.0) + 90.0)
+    xtd = float(geodesy.cross_track_nm(off_lat, off_lon, 41.0, 28.0, 41.0, 30.0))
+    atd = float(geodesy.along_track_nm(off_lat, off_lon, 41.0, 28.0, 41.0, 30.0))
+    print(f"Hat sapması {xtd:.4f} NM, hat boyunca {atd:.4f} NM")
+    if abs(xtd - 10.0) > 1e-3 or abs(atd - 30.0) > 1e-3:
+        errors += 1
+
+    # Point merge bacağı: tüm noktalar birleşme noktasından eşit uzaklıkta
+    leg = calculate_leg_points(41.0, 29.0, 0.0, 25.0, [3.0] * 12, clockwise=True)
+    leg_lats, leg_lons = np.array(leg).T
+    if len(leg) != 13 or np.max(np.abs(geodesy.distance_nm(41.0, 29.0, leg_lats, leg_lons) - 25.0)) > 1e-6:
+        errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Vektörel ve skaler geodezi hesapları tutarlı")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_geodesy()
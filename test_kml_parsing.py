@@ -0,0 +1,90 @@
+"""
+KML Trajectory Ayrıştırma Testi
+
+Bu script, DataManager.parse_kml_trajectory'nin namespace'li ve
+namespace'siz dosyalarda 'Trail' klasörünü bulduğunu, MultiGeometry
+içinde Placemark başına ilk LineString'i kullandığını, segmentleri
+birleştiren tekrar noktalarını attığını ve hatalı bir koordinat
+tuple'ında yalnızca o tuple'ı atlayıp dosyanın geri kalanını okuduğunu
+doğrular.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from models import DataManager
+
+NAMESPACED_KML = """<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2"><Document>
+<Folder><name>Route</name>
+<Placemark><LineString><coordinates>10.0,10.0,0</coordinates></LineString></Placemark>
+</Folder>
+<Folder><name>Trail</name>
+<Placemark><LineString><coordinates>29.0,41.0,1000 29.1,41.1,2000</coordinates></LineString></Placemark>
+<Placemark><MultiGeometry>
+<LineString><coordinates>29.1,41.1,2000 29.2,41.2,3000</coordinates></LineString>
+<LineString><coordinates>50.0,50.0,0</coordinates></LineString>
+</MultiGeometry></Placemark>
+</Folder>
+<Folder><name>After</name>
+<Placemark><LineString><coordinates>60.0,60.0,0</coordinates></LineString></Placemark>
+</Folder>
+</Document></kml>
+"""
+
+PLAIN_KML = """<?xml version="1.0" encoding="UTF-8"?>
+<kml><Document><Folder><name>Flight trail</name>
+<Placemark><LineString><coordinates>
+    28.5,40.5
+    28.6,40.6
+</coordinates></LineString></Placemark>
+</Folder></Document></kml>
+"""
+
+MALFORMED_KML = """<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2"><Document><Folder><name>Trail</name>
+<Placemark><LineString><coordinates>29.0,41.0,1000 29.3,abc,1500 29.4,41.4,abc 29.5,41.5,3000</coordinates></LineString></Placemark>
+</Folder></Document></kml>
+"""
+
+NO_TRAIL_KML = """<?xml version="1.0" encoding="UTF-8"?>
+<kml><Document><Folder><name>Route</name>
+<Placemark><LineString><coordinates>29.0,41.0,0</coordinates></LineString></Placemark>
+</Folder></Document></kml>
+"""
+
+def test_kml_parsing():
+    errors = 0
+    data_manager = DataManager()
+    cases = [
+        # (dosya, içerik, beklenen lat/lon/alt dizisi veya None)
+        ('namespaced.kml', NAMESPACED_KML, [[41.0, 29.0, 1000.0], [41.1, 29.1, 2000.0], [41.2, 29.2, 3000.0]]),
+        ('plain.kml', PLAIN_KML, [[40.5, 28.5, 0.0], [40.6, 28.6, 0.0]]),
+        # Enlemi hatalı tuple atlanır, irtifası hatalı tuple irtifa 0 ile tutulur
+        ('malformed.kml', MALFORMED_KML, [[41.0, 29.0, 1000.0], [41.4, 29.4, 0.0], [41.5, 29.5, 3000.0]]),
+        ('no_trail.kml', NO_TRAIL_KML, None),
+    ]
+    with tempfile.TemporaryDirectory() as folder:
+        for filename, content, expected in cases:
+            path = os.path.join(folder, filename)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            trajectory_id, points = data_manager.parse_kml_trajectory(path)
+            print(f"{filename}: {None if points is None else points.tolist()}")
+            if trajectory_id != os.path.splitext(filename)[0]:
+                errors += 1
+            if expected is None:
+                if points is not None:
+                    errors += 1
+            elif points is None or points.shape != (len(expected), 3) or not np.allclose(points, expected):
+                errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: KML trajectory'leri doğru ayrıştırıldı, hatalı tuple yalnızca kendisi atlandı")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_kml_parsing()
@@ -0,0 +1,85 @@
+"""
+Point Merge Tasarım Taraması Testi
+
+Bu script, pointmerge_sweep modülünün ürettiği tasarımları tek tek
+calculate_leg_points ile hesaplanan bacaklarla karşılaştırır, yol uzunluğu
+ve gecikme kapasitesi metriklerini ve bilinen bir yasaklı sahayla çakışma
+tespitini doğrular ve binlerce kombinasyonun tarama süresini ölçer.
+"""
+
+import time
+
+import numpy as np
+import geodesy
+from procedure_geometry import calculate_leg_points
+from pointmerge_sweep import (parse_range_values, merge_point_grid, sweep_point_merge,
+                              rank_designs, design_legs)
+
+# Merge noktasının kuzeydoğusunda, 20 NM yarıçaplı yayın geçtiği kare saha
+AREA = {'name': 'LTDTest', 'points': [(41.25, 29.15), (41.25, 29.35), (41.40, 29.35), (41.40, 29.15), (41.25, 29.15)]}
+
+def test_pointmerge_sweep():
+    errors = 0
+
+    if parse_range_values("0:90:30, 45") != [0.0, 30.0, 45.0, 60.0, 90.0]:
+        errors += 1
+
+    merge_points = merge_point_grid(41.0, 29.0, count=3, spacing_nm=2.0)
+    start = time.perf_counter()
+    designs, stats = sweep_point_merge(
+        merge_points, parse_range_values("0:350:10"), parse_range_values("15:30:2.5"),
+        second_leg_offsets=(0.0, -4.0, 4.0), segment_counts=(4, 6, 8), clockwise=(True, False),
+        restricted_areas=[AREA], speed_kt=220.0)
+    elapsed = time.perf_counter() - start
+    print(f"{stats['designs']} tasarım ({stats['combinations']} kombinasyon): {elapsed * 1000:.0f} ms")
+    if stats['designs'] != 9 * 36 * 7 * 3 * 3 * 2:
+        errors += 1
+
+    # Rastgele tasarımları tekil hesapla karşılaştır
+    rng = np.random.default_rng(3)
+    for index in rng.choice(len(designs), 50, replace=False):
+        design = designs[index]
+        config = design['config']
+        leg = calculate_leg_points(config['merge_lat'], config['merge_lon'], config['track_angle'],
+                                   config['first_point_distance'], config['segments'], config['clockwise'])
+        preview_leg = design_legs(design)[0]
+        lats, lons = np.array(leg).T
+        leg_nm = float(np.sum(geodesy.segment_distances_nm(lats, lons)))
+        if (np.max(np.abs(np.array(leg) - np.array(preview_leg))) > 1e-9 or
+                abs(leg_nm - design['leg_nm']) > 1e-6):
+            errors += 1
+            break
+        expected_capacity = design['max_path_nm'] - design['min_path_nm']
+        if abs(design['delay_capacity_s'] - expected_capacity / 220.0 * 3600.0) > 1e-6:
+            errors += 1
+            break
+        if design['second_leg_offset'] == 0 and abs(design['max_path_nm'] - (design['leg_nm'] + design['first_point_distance'])) > 1e-9:
+            errors += 1
+            break
+
+    # Kuzeydoğuya giden saat yönü bacak sahayı keser, güneybatıya giden kesmez
+    crossing = [d for d in designs if d['merge_lat'] == 41.0 and d['merge_lon'] == 29.0 and d['track_angle'] == 20.0
+                and d['first_point_distance'] == 20.0 and d['second_leg_offset'] == 0 and d['clockwise']]
+    clear = [d for d in designs if d['merge_lat'] == 41.0 and d['merge_lon'] == 29.0 and d['track_angle'] == 200.0
+             and d['first_point_distance'] == 20.0 and d['second_leg_offset'] == 0]
+    if not crossing or crossing[0]['conflict_nm'] <= 0 or crossing[0]['conflict_areas'] != ['LTDTest']:
+        errors += 1
+    else:
+        print(f"Sahayı kesen bacak: {crossing[0]['conflict_nm']:.1f} NM ihlal")
+    if not clear or any(d['conflict_nm'] > 0 for d in clear):
+        errors += 1
+
+    ranked = rank_designs(designs)
+    best = ranked[0]
+    print(f"En iyi: track {best['track_angle']:.0f}°, {best['first_point_distance']:.1f} NM, "
+          f"2. bacak {best['second_leg_offset']:+.0f} NM, kapasite {best['delay_capacity_s']:.0f} sn")
+    if best['conflict_nm'] > 0 or ranked[-1]['conflict_nm'] == 0:
+        errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Tarama tasarımları tekil hesapla aynı, metrikler doğru")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_pointmerge_sweep()
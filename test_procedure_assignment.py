@@ -0,0 +1,104 @@
+"""
+Trajectory - Prosedür Eşleştirme Testi
+
+Bu script, birbirine yakın ama farklı şekilli örnek STAR/SID prosedürleri
+etrafında gürültülü uçuşlar üretir ve procedure_assignment modülünün her
+uçuşu doğru prosedüre eşleştirdiğini, ön filtrelerin karşılaştırılan çift
+sayısını azalttığını kontrol eder. Aynı şekilli iki prosedürün pist
+ön filtresiyle (tespit edilen iniş pisti) ayrıldığını da doğrular.
+"""
+
+import time
+
+import numpy as np
+from conformance import ProcedurePolyline
+from procedure_assignment import assign_procedures, batched_shape_distance
+
+def wp(lat, lon, name):
+    return {"lat": lat, "lon": lon, "name": name}
+
+SAMPLE_PROCEDURES = {
+    "STAR": {"LTXX": {"34": {
+        "NORTH1A": [wp(41.8, 28.9, "N1"), wp(41.5, 28.9, "N2"), wp(41.2, 28.95, "N3"), wp(41.05, 29.0, "FAF")],
+        "WEST1A": [wp(41.1, 28.3, "W1"), wp(41.1, 28.6, "W2"), wp(41.0, 28.85, "W3"), wp(41.05, 29.0, "FAF")],
+        "EAST1A": [wp(41.0, 29.8, "E1"), wp(41.0, 29.4, "E2"), wp(41.05, 29.15, "E3"), wp(41.05, 29.0, "FAF")],
+    }}},
+    "SID": {"LTXX": {"34": {
+        "NORTH1D": [wp(41.1, 29.0, "DER"), wp(41.4, 29.1, "D1"), wp(41.7, 29.2, "D2"), wp(42.0, 29.2, "D3")],
+        "SOUTH1D": [wp(41.1, 29.0, "DER"), wp(40.9, 29.2, "S1"), wp(40.6, 29.3, "S2"), wp(40.3, 29.3, "S3")],
+    }}},
+}
+
+# Kuzey eşiği 16 olan pist; kuzeyden gelen inişler 16'ya iner
+SAMPLE_RUNWAYS = [{"id": "LTXX 16/34", "start_lat": 41.03, "start_lon": 29.0, "end_lat": 41.0, "end_lon": 29.0}]
+
+# Aynı şekilli, yalnızca pisti farklı iki STAR
+TWIN_PROCEDURES = {"STAR": {"LTXX": {
+    "16": {"NORTH1A": SAMPLE_PROCEDURES["STAR"]["LTXX"]["34"]["NORTH1A"]},
+    "34": {"NORTH1B": SAMPLE_PROCEDURES["STAR"]["LTXX"]["34"]["NORTH1A"]},
+}}}
+
+def make_flights(n_per_procedure, n_points=150, seed=11):
+    """Her prosedür için yanal gürültülü uçuşlar üret; (uçuşlar, beklenen prosedür adları)"""
+    rng = np.random.default_rng(seed)
+    flights, expected = [], []
+    for proc_type, airports in SAMPLE_PROCEDURES.items():
+        for name, waypoints in airports["LTXX"]["34"].items():
+            polyline = ProcedurePolyline(waypoints)
+            along = np.linspace(0.0, polyline.length, n_points)
+            alts = np.linspace(12000, 2000, n_points) if proc_type == "STAR" else np.linspace(2000, 12000, n_points)
+            for k in range(n_per_procedure):
+                offsets = rng.normal(0.0, 0.4) + rng.normal(0.0, 0.1, n_points)
+                lats, lons = polyline.point_at(along, offsets)
+                flights.append((f"{name}_{k}", np.column_stack([lats, lons, alts])))
+                expected.append(name)
+    # Hiçbir prosedüre benzemeyen uçuş (uzakta düz hat)
+    lats = np.linspace(43.0, 43.5, n_points)
+    flights.append(("OVERFLIGHT", np.column_stack([lats, np.full(n_points, 33.0), np.full(n_points, 35000.0)])))
+    expected.append(None)
+    return flights, expected
+
+def _check_shape_distance():
+    """Toplu Fréchet mesafesi: paralel kaydırılmış hatlar için mesafe = kaydırma miktarı"""
+    line = np.column_stack([np.linspace(0, 10, 20), np.zeros(20)])
+    shifted = line + np.array([0.0, 2.5])
+    distances = batched_shape_distance(np.stack([line, line]), np.stack([line, shifted]))
+    return abs(distances[0]) < 1e-9 and abs(distances[1] - 2.5) < 1e-9
+
+def test_procedure_assignment(n_per_procedure=40):
+    flights, expected = make_flights(n_per_procedure)
+
+    start = time.perf_counter()
+    assignments, stats = assign_procedures(flights, SAMPLE_PROCEDURES)
+    print(f"Eşleştirme: {len(flights)} uçuş, {(time.perf_counter() - start) * 1000:.0f} ms")
+    print(f"Karşılaştırılan çift: {stats['pairs_compared']}/{stats['pairs_total']}")
+
+    errors = 0
+    if not _check_shape_distance():
+        print("Fréchet mesafesi beklenen değeri vermedi")
+        errors += 1
+    for assignment, name in zip(assignments, expected):
+        if assignment['procedure'] != name:
+            errors += 1
+    if stats['pairs_compared'] >= stats['pairs_total']:
+        errors += 1
+
+    # Pist ön filtresi: inişler 16'ya tespit edilmeli ve 34'ün ikizi elenmeli
+    north_flights = [flight for flight in flights if flight[0].startswith("NORTH1A_")]
+    _, twin_stats = assign_procedures(north_flights, TWIN_PROCEDURES)
+    runway_assignments, runway_stats = assign_procedures(north_flights, TWIN_PROCEDURES, runways=SAMPLE_RUNWAYS)
+    print(f"Pist ön filtresi: karşılaştırılan çift {twin_stats['pairs_compared']} -> {runway_stats['pairs_compared']}")
+    for assignment in runway_assignments:
+        if (assignment['procedure'] != "NORTH1A" or assignment['detected_runway'] != "16" or
+                assignment['airport'] != "LTXX"):
+            errors += 1
+    if runway_stats['pairs_compared'] >= twin_stats['pairs_compared']:
+        errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Tüm uçuşlar doğru prosedüre eşleştirildi")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_procedure_assignment()
@@ -0,0 +1,120 @@
+"""
+Komut Satırı Toplu Çalıştırıcı Testi
+
+Bu script, procedure_batch modülünün Qt yüklemeden başladığını, JSON ve CSV
+tasarım dosyalarındaki trombone, point merge ve double PMS tasarımlarını
+geometri çekirdeğiyle aynı şekilde hesapladığını, CSV çıktılarının
+uygulamaya geri yüklenebildiğini ve paralel işçilerle aynı sonucu
+verdiğini doğrular.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from models import DataManager
+from procedure_batch import load_design_specs, main, run_batch
+from procedure_geometry import calculate_point_merge_waypoints, calculate_trombone_waypoints
+from trombone_sweep import runway_approach
+
+AIRSPACE = os.path.join('data', 'Airspace_01.01.2025')
+
+DESIGNS = [
+    {'name': 'LTBA 23 Trombone', 'pattern_type': 'trombone', 'runway': 'LTBA 05/23', 'threshold': '23',
+     'threshold_distance': 8, 'base_angle': 90, 'base_distance': 6, 'extension_length': 10},
+    {'name': 'PMS Kuzey', 'pattern_type': 'pointmerge', 'merge_lat': 41.2, 'merge_lon': 28.9,
+     'track_angle': 20, 'first_point_distance': 18, 'segments': 6, 'clockwise': True,
+     'second_leg': {'type': 'outer', 'distance': 3}},
+    {'name': 'Double PMS', 'pattern_type': 'pointmerge', 'merge_lat': 41.0, 'merge_lon': 29.2,
+     'track_angle': 200, 'first_point_distance': 20, 'segments': [4, 4, 4, 4], 'clockwise': False,
+     'double_pms_enabled': True, 'base_segment_distance': 5},
+    {'name': 'Eksik Pist', 'pattern_type': 'trombone', 'runway': 'XXXX 01/19',
+     'threshold_distance': 8, 'base_angle': 90, 'base_distance': 6, 'extension_length': 10},
+]
+
+CSV_SPEC = """name,pattern_type,runway,threshold,start_lat,start_lon,end_lat,end_lon,threshold_distance,base_angle,base_distance,extension_length,extension_inverted,merge_lat,merge_lon,track_angle,first_point_distance,segments,clockwise,second_leg_type,second_leg_distance
+T1,trombone,,,41.24,28.72,41.28,28.723,10,-90,8,12,yes,,,,,,,,
+P1,pointmerge,,,,,,,,,,,,41.1,28.8,90,15,5;5;5,false,inner,4
+T05,trombone,LTBA 05/23,05,,,,,8,90,6,10,,,,,,,,,
+"""
+
+def test_procedure_batch():
+    errors = 0
+
+    # Başlangıç: ayrı süreçte içe aktarma Qt yüklememeli ve hızlı olmalı
+    start = time.perf_counter()
+    probe = subprocess.run([sys.executable, '-c', "import sys, procedure_batch; print('PyQt5' in sys.modules)"],
+                           capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    startup = time.perf_counter() - start
+    print(f"procedure_batch başlangıcı: {startup * 1000:.0f} ms, Qt yüklendi: {probe.stdout.strip()}")
+    if probe.stdout.strip() != 'False':
+        errors += 1
+
+    data_manager = DataManager()
+    data_manager.load_airspace_data(AIRSPACE)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        spec_path = os.path.join(tmp, 'designs.json')
+        with open(spec_path, 'w', encoding='utf-8') as f:
+            json.dump({'designs': DESIGNS}, f)
+        out_dir = os.path.join(tmp, 'out')
+        code = main([spec_path, '-o', out_dir, '--airspace', AIRSPACE, '-q'])
+        files = sorted(os.listdir(out_dir))
+        print(f"Çıkış kodu {code}, dosyalar: {files}")
+        # Eksik pist hatası: kod 1, diğer üç tasarım yazılmış olmalı
+        if code != 1 or files != ['Double_PMS.csv', 'LTBA_23_Trombone.csv', 'PMS_Kuzey.csv', 'summary.csv']:
+            errors += 1
+
+        # Çekirdekle aynı waypoint'ler
+        results = run_batch(DESIGNS, data_manager.runways)
+        runway = next(r for r in data_manager.runways if r['id'] == 'LTBA 05/23')
+        expected = [calculate_trombone_waypoints(runway_approach(runway, '23'), DESIGNS[0]),
+                    calculate_point_merge_waypoints(None, DESIGNS[1]),
+                    calculate_point_merge_waypoints(None, DESIGNS[2])]
+        for result, waypoints in zip(results, expected):
+            if result.get('waypoints') != waypoints:
+                print(f"Uyumsuz: {result['name']} {result.get('error', '')}")
+                errors += 1
+        if 'error' not in results[3]:
+            errors += 1
+
+        # CSV çıktısı uygulamaya geri yüklenebilmeli
+        success, message, route = data_manager.load_route_from_csv(os.path.join(out_dir, 'PMS_Kuzey.csv'))
+        if not success or route.get('type') != 'pointmerge' or len(route['points']) != len(expected[1]):
+            print(f"Geri yükleme: {success} {message}")
+            errors += 1
+
+        # CSV tasarım dosyası ve paralel işçiler
+        csv_path = os.path.join(tmp, 'designs.csv')
+        with open(csv_path, 'w', encoding='utf-8') as f:
+            f.write(CSV_SPEC)
+        csv_designs = load_design_specs(csv_path)
+        if (csv_designs[0]['extension_inverted'] is not True or csv_designs[1]['segments'] != [5.0, 5.0, 5.0] or
+                csv_designs[1]['second_leg'] != {'type': 'inner', 'distance': 4.0} or csv_designs[1]['clockwise']):
+            print(f"CSV tasarımları: {csv_designs}")
+            errors += 1
+        # Sıfırla başlayan eşik metin olarak kalmalı
+        csv_results = run_batch(csv_designs, data_manager.runways)
+        if csv_designs[2]['threshold'] != '05' or csv_results[2].get('waypoints') != calculate_trombone_waypoints(
+                runway_approach(runway, '05'), csv_designs[2]):
+            print(f"05 eşiği: {csv_designs[2]} {csv_results[2].get('error', '')}")
+            errors += 1
+        many = (DESIGNS[:3] + csv_designs) * 20
+        serial = run_batch(many, data_manager.runways, workers=1)
+        start = time.perf_counter()
+        parallel = run_batch(many, data_manager.runways, workers=2)
+        print(f"{len(many)} tasarım 2 işçiyle: {(time.perf_counter() - start) * 1000:.0f} ms")
+        if [r.get('waypoints') for r in serial] != [r.get('waypoints') for r in parallel] or \
+                any('error' in r for r in serial):
+            errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Toplu çalıştırıcı Qt'siz başlıyor, çekirdekle aynı waypoint'leri üretiyor")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_procedure_batch()
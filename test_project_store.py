@@ -0,0 +1,120 @@
+"""
+Proje Deposu Testi
+
+Bu script, ProjectStore'un rotaları ve trajectory'leri SQLite dosyasına
+eksiksiz yazıp geri okuduğunu, tekrar kayıtta yalnızca değişen, eklenen
+ve silinen satırları yazdığını, rotaların tek tek yüklenebildiğini,
+yüklenen projenin değişmeden tekrar kaydedildiğinde hiçbir satır
+yazılmadığını ölçer ve JSON kaydıyla süre karşılaştırması yapar.
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+from PyQt5.QtGui import QColor
+
+from benchmark import make_routes, synthetic_flights
+from models import DataManager
+from project_store import ProjectStore, is_project_store
+
+def make_project(route_count, trajectory_count):
+    routes = make_routes(route_count, 20, seed=3)
+    for index, route in enumerate(routes[:route_count // 2]):
+        route.update(type='pointmerge', color='#008080', width=2,
+                     config={'first_point_distance': 20.0 + index % 7, 'track_angle': 90.0, 'segments': 5,
+                             'merge_lat': route['points'][-1][0], 'merge_lon': route['points'][-1][1]})
+    trajectories = []
+    for callsign, points, times in synthetic_flights(trajectory_count, 200, seed=3):
+        trajectories.append({'id': callsign, 'points': points, 'color': QColor(255, 0, 0), 'type': 'trajectory',
+                             'times': times})
+    return routes, trajectories
+
+def same_route(a, b):
+    return (np.allclose(a['points'], b['points'], rtol=0, atol=0) and
+            {k: v for k, v in a.items() if k != 'points'} == {k: v for k, v in b.items() if k != 'points'})
+
+def test_project_store():
+    errors = 0
+    routes, trajectories = make_project(3000, 500)
+    routes.append({'type': 'user_route', 'name': 'Kimliksiz', 'points': [(41.0, 29.0), (41.1, 29.1)]})
+    routes.append(dict(routes[0], name='Aynı kimlik'))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'proje.procdb')
+        with ProjectStore(path) as store:
+            first = store.save(routes, trajectories)
+            unchanged = store.save(routes, trajectories)
+            # Bir rotayı yerinde değiştir, birini sil, bir rota ekle
+            routes[10]['points'][3] = (41.5, 28.5)
+            del routes[20]
+            routes.append({'type': 'user_route', 'id': 'new_route', 'name': 'Yeni', 'points': [(40.0, 28.0), (40.5, 28.5)]})
+            del trajectories[5]
+            changed = store.save(routes, trajectories)
+        print(f"İlk kayıt: {first['routes_written']} rota, {first['trajectories_written']} trajectory, "
+              f"{first['seconds'] * 1000:.0f} ms")
+        print(f"Değişmeden kayıt: {unchanged['seconds'] * 1000:.1f} ms; "
+              f"değişiklikle: {changed} ({changed['seconds'] * 1000:.1f} ms)")
+        if first['routes_written'] != len(routes) or first['trajectories_written'] != 500 or not is_project_store(path):
+            errors += 1
+        if unchanged['routes_written'] or unchanged['trajectories_written'] or unchanged['routes_deleted']:
+            errors += 1
+        if (changed['routes_written'] != 2 or changed['routes_deleted'] != 1 or changed['trajectories_written'] != 0 or
+                changed['trajectories_deleted'] != 1):
+            errors += 1
+
+        # Yeniden aç: sıra, tek rota yükleme ve tam yükleme
+        with ProjectStore(path) as store:
+            summaries = store.route_summaries()
+            lazy = store.load_route(summaries[10]['key'])
+            if (len(summaries) != len(routes) or summaries[-1]['key'] != 'new_route' or
+                    summaries[-2]['key'] != 'route_0#2' or summaries[10]['point_count'] != 20 or
+                    not same_route(lazy, routes[10])):
+                errors += 1
+            start = time.perf_counter()
+            loaded_routes = store.load_routes()
+            loaded_trajectories = store.load_trajectories()
+            load_ms = (time.perf_counter() - start) * 1000
+            if not all(same_route(a, b) for a, b in zip(loaded_routes, routes)) or len(loaded_routes) != len(routes):
+                print("Yüklenen rotalar farklı")
+                errors += 1
+            trajectory = loaded_trajectories[7]
+            original = trajectories[7]
+            if (len(loaded_trajectories) != 499 or trajectory['id'] != original['id'] or
+                    not np.array_equal(trajectory['points'], original['points']) or
+                    not np.array_equal(trajectory['times'], original['times']) or trajectory['color'] != QColor(255, 0, 0)):
+                errors += 1
+            # Yüklenenler değişmeden kaydedilince hiçbir satır yazılmamalı
+            reloaded = store.save(loaded_routes, loaded_trajectories)
+            print(f"Yükleme {load_ms:.0f} ms, yüklenenlerin tekrar kaydı: {reloaded}")
+            if reloaded['routes_written'] or reloaded['trajectories_written']:
+                errors += 1
+
+        # DataManager üzerinden kayıt/yükleme ve JSON ile karşılaştırma
+        data_manager = DataManager()
+        data_manager.drawn_elements = {'routes': routes, 'trajectories': trajectories}
+        store_path = os.path.join(tmp, 'dm.procdb')
+        success, message = data_manager.save_drawings_to_store(store_path)
+        start = time.perf_counter()
+        data_manager.save_drawings_to_store(store_path)
+        store_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        data_manager.save_drawings_to_json(os.path.join(tmp, 'dm.json'))
+        json_ms = (time.perf_counter() - start) * 1000
+        print(f"{message}; değişmeden tekrar kayıt {store_ms:.1f} ms, JSON kaydı (yalnızca rotalar) {json_ms:.0f} ms")
+        data_manager.project_store.close()
+        other = DataManager()
+        success_load, message, loaded = other.load_drawings_from_store(store_path)
+        other.project_store.close()
+        if not success or not success_load or len(other.drawn_elements['routes']) != len(routes) or len(loaded) != 499:
+            print(message)
+            errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Proje deposu yalnızca değişen satırları yazıyor, rotalar tek tek yüklenebiliyor")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_project_store()
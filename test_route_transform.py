@@ -0,0 +1,96 @@
+"""
+Toplu Rota Dönüşümü Testi
+
+Bu script, route_transform modülünün öteleme ve döndürme sonuçlarını eski
+nokta başına döngülerle karşılaştırır, trombone/point merge config
+referanslarının birlikte güncellendiğini, point merge tekerlek
+döndürmesinin merge noktasına olan mesafeleri koruduğunu doğrular ve çok
+sayıda point merge sisteminden oluşan bir tasarımın taşınma süresini ölçer.
+"""
+
+import math
+import time
+
+import numpy as np
+import geodesy
+from route_transform import RouteTransform, rotate_pointmerge
+
+def reference_rotate(points, center_lat, center_lon, delta_angle):
+    """Eski mouseMoveEvent döngüsü"""
+    new_points = []
+    for point_lat, point_lon in points:
+        x_diff = (point_lon - center_lon) * math.cos(math.radians(center_lat))
+        y_diff = point_lat - center_lat
+        angle_rad = math.radians(delta_angle)
+        x_new = x_diff * math.cos(angle_rad) - y_diff * math.sin(angle_rad)
+        y_new = x_diff * math.sin(angle_rad) + y_diff * math.cos(angle_rad)
+        new_points.append((center_lat + y_new, center_lon + x_new / math.cos(math.radians(center_lat))))
+    return new_points
+
+def make_pointmerge(index, n_points=40):
+    merge_lat, merge_lon = 40.9 + 0.05 * (index % 4), 28.8 + 0.08 * (index // 4)
+    track = 20.0 * index
+    points = [geodesy.destination_point(merge_lat, merge_lon, 20.0, track + 3.0 * i) for i in range(n_points)]
+    return {'id': f'PMS{index}', 'type': 'pointmerge', 'points': points + [(merge_lat, merge_lon)],
+            'config': {'merge_lat': merge_lat, 'merge_lon': merge_lon, 'track_angle': track}}
+
+def test_route_transform():
+    errors = 0
+
+    # Döndürme: eski döngüyle aynı noktalar, config referansları tutarlı
+    pms = make_pointmerge(0)
+    trombone = {'id': 'TRB', 'type': 'trombone', 'points': [(41.0, 29.0), (41.1, 29.2), (41.2, 29.1)],
+                'config': {'start_lat': 41.0, 'start_lon': 29.0, 'base_angle': 170.0}}
+    original_pms = list(pms['points'])
+    original_trombone = list(trombone['points'])
+    transform = RouteTransform([pms, trombone])
+    center_lat, center_lon = transform.bounds_center()
+    for angle in (5.0, 12.0, 25.0):  # Sürükleme sırasında toplam açı büyür
+        transform.rotate(center_lat, center_lon, angle)
+    expected = reference_rotate(original_pms, center_lat, center_lon, 25.0)
+    if np.max(np.abs(np.array(pms['points']) - np.array(expected))) > 1e-12:
+        errors += 1
+    if np.max(np.abs(np.array(trombone['points']) - np.array(reference_rotate(original_trombone, center_lat, center_lon, 25.0)))) > 1e-12:
+        errors += 1
+    if (abs(pms['config']['merge_lat'] - pms['points'][-1][0]) > 1e-12 or
+            abs(pms['config']['track_angle'] - 335.0) > 1e-9 or abs(trombone['config']['base_angle'] + 165.0) > 1e-9):
+        print(f"Config: {pms['config']}, {trombone['config']}")
+        errors += 1
+
+    # Öteleme: noktalar ve referans noktaları birlikte (trombone başlangıcı döndürmede sabit kalmıştı)
+    transform = RouteTransform([pms, trombone])
+    transform.translate(0.1, -0.2)
+    transform.translate(0.2, -0.3)
+    merge_lat, merge_lon = pms['points'][-1]
+    if (abs(pms['config']['merge_lat'] - merge_lat) > 1e-12 or abs(pms['config']['merge_lon'] - merge_lon) > 1e-12 or
+            abs(trombone['config']['start_lat'] - 41.2) > 1e-12 or abs(trombone['config']['start_lon'] - 28.7) > 1e-12):
+        errors += 1
+
+    # Ctrl+tekerlek: merge noktası sabit, mesafeler korunur, track_angle döner
+    before = np.array(pms['points'][:-1])
+    track_before = pms['config']['track_angle']
+    rotate_pointmerge(pms, 5.0)
+    after = np.array(pms['points'][:-1])
+    distance_change = (geodesy.distance_nm(merge_lat, merge_lon, after[:, 0], after[:, 1]) -
+                       geodesy.distance_nm(merge_lat, merge_lon, before[:, 0], before[:, 1]))
+    if (pms['points'][-1] != (merge_lat, merge_lon) or np.max(np.abs(distance_change)) > 1e-9 or
+            abs(pms['config']['track_angle'] - (track_before + 5.0) % 360) > 1e-9):
+        errors += 1
+
+    # Çoklu point merge tasarımını tek seferde taşı
+    design = [make_pointmerge(i, n_points=400) for i in range(24)]
+    transform = RouteTransform(design)
+    start = time.perf_counter()
+    for step in range(60):
+        transform.translate(0.001 * step, 0.002 * step)
+    elapsed = (time.perf_counter() - start) / 60
+    total_points = sum(len(route['points']) for route in design)
+    print(f"{len(design)} point merge ({total_points} nokta): taşıma adımı {elapsed * 1000:.1f} ms")
+
+    if errors == 0:
+        print("BAŞARILI: Toplu taşıma/döndürme eski döngülerle aynı ve config referansları tutarlı")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_route_transform()
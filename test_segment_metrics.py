@@ -0,0 +1,133 @@
+"""
+Segment Ölçüleri ve Snap Arama Testi
+
+Bu script, MapWidget.update_segment_metrics'in tek nokta güncellemesinde
+(ilk, orta ve son nokta dahil, çakışan noktalar için -1) tam hesapla aynı
+mesafe ve açıları verdiğini ve SnapManager'ın vektörel uç/orta nokta
+aramasının eski nokta nokta geo_to_screen döngüsüyle aynı SnapPoint'leri
+bulduğunu doğrular.
+"""
+
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+from PyQt5.QtCore import QPointF
+from PyQt5.QtWidgets import QApplication
+
+from map_widget import MapWidget
+from snap_manager import SnapManager, SnapPoint
+
+def reference_route_snap_points(snap_manager, mouse_pos):
+    """Eski döngü: her nokta ve orta nokta geo_to_screen ile tek tek izdüşürülür"""
+    map_widget = snap_manager.map_widget
+    snap_points = []
+    for route in map_widget.drawn_elements['routes']:
+        points = route.get('points')
+        if not points:
+            continue
+        if snap_manager.snap_mode & SnapManager.SNAP_ENDPOINT:
+            for i, (lat, lon) in enumerate(points):
+                screen_pos = map_widget.geo_to_screen(lat, lon)
+                if (screen_pos - mouse_pos).manhattanLength() <= snap_manager.snap_tolerance * 2:
+                    names = route.get('waypoint_names', [])
+                    desc = f"Uç nokta: {names[i] if i < len(names) else f'Nokta {i+1}'}"
+                    snap_points.append(SnapPoint(screen_pos, (lat, lon), desc, "endpoint"))
+        if snap_manager.snap_mode & SnapManager.SNAP_MIDPOINT:
+            for i in range(len(points) - 1):
+                mid_lat = (points[i][0] + points[i + 1][0]) / 2
+                mid_lon = (points[i][1] + points[i + 1][1]) / 2
+                mid_screen = map_widget.geo_to_screen(mid_lat, mid_lon)
+                if (mid_screen - mouse_pos).manhattanLength() <= snap_manager.snap_tolerance * 2:
+                    snap_points.append(SnapPoint(mid_screen, (mid_lat, mid_lon), f"Orta nokta: Segment {i+1}-{i+2}",
+                                                 "midpoint"))
+    return snap_points
+
+def same_snap_points(a, b):
+    if len(a) != len(b):
+        return False
+    for first, second in zip(a, b):
+        if (first.description != second.description or first.point_type != second.point_type or
+                not np.allclose(first.geo_pos, second.geo_pos, rtol=0, atol=1e-12) or
+                abs(first.screen_pos.x() - second.screen_pos.x()) > 1e-6 or
+                abs(first.screen_pos.y() - second.screen_pos.y()) > 1e-6):
+            return False
+    return True
+
+def metrics_match(widget, route):
+    return (np.allclose(route['segment_distances'], widget.calculate_segment_distances(route['points']), rtol=0, atol=1e-9) and
+            np.allclose(route['segment_angles'], widget.calculate_track_angles(route['points']), rtol=0, atol=1e-9))
+
+def test_segment_metrics():
+    errors = 0
+    app = QApplication.instance() or QApplication(sys.argv)
+    widget = MapWidget()
+    widget.resize(800, 600)
+    rng = np.random.default_rng(7)
+
+    # Tek nokta güncellemesi: ilk, orta ve son nokta
+    lats = 41.0 + np.cumsum(rng.normal(0.0, 0.05, 40))
+    lons = 29.0 + np.cumsum(rng.normal(0.0, 0.05, 40))
+    route = {'type': 'user_route', 'points': list(zip(lats.tolist(), lons.tolist()))}
+    widget.update_segment_metrics(route)
+    if not metrics_match(widget, route):
+        errors += 1
+    for index in (0, 17, 39):
+        lat, lon = route['points'][index]
+        route['points'][index] = (lat + 0.03, lon - 0.02)
+        widget.update_segment_metrics(route, index)
+        if not metrics_match(widget, route):
+            print(f"Nokta {index} güncellemesi tam hesaptan farklı")
+            errors += 1
+
+    # Komşusunun üstüne taşınan nokta: yalnızca çakışan segment -1 olur
+    route['points'][10] = route['points'][9]
+    widget.update_segment_metrics(route, 10)
+    if route['segment_distances'][9] != -1 or route['segment_distances'][10] == -1 or not metrics_match(widget, route):
+        print(f"Çakışan nokta: {route['segment_distances'][8:12]}")
+        errors += 1
+    # SEGMENT_MERGE_TOLERANCE (NM) içinde kalan küçük kayma da -1 olmalı
+    route['points'][10] = (route['points'][9][0] + 1e-7, route['points'][9][1])
+    widget.update_segment_metrics(route, 10)
+    if route['segment_distances'][9] != -1 or not metrics_match(widget, route):
+        errors += 1
+
+    # Nokta sayısı değişince önbellek uyumsuz; tam hesap yapılmalı
+    route['points'].append((41.5, 29.5))
+    widget.update_segment_metrics(route, 40)
+    if len(route['segment_distances']) != 40 or not metrics_match(widget, route):
+        errors += 1
+
+    # Snap arama: eski döngüyle aynı SnapPoint'ler (döndürülmüş ve yakınlaştırılmış görünümde de)
+    widget.drawn_elements['routes'] = [
+        route,
+        {'type': 'user_route', 'points': [(41.0, 29.0), (41.01, 29.01), (41.0, 29.02)], 'waypoint_names': ['A', 'B']},
+    ]
+    snap_manager = SnapManager(widget)
+    snap_manager.set_snap_mode(SnapManager.SNAP_ENDPOINT | SnapManager.SNAP_MIDPOINT)
+    snap_manager.set_snap_tolerance(40)
+    compared = 0
+    for zoom, rotation in ((1.0, 0.0), (6.0, 0.0), (12.0, 35.0)):
+        widget.zoom, widget.rotation = zoom, rotation
+        widget.center_lat, widget.center_lon = 41.0, 29.0
+        for lat, lon in [(41.0, 29.0), (41.005, 29.01)] + route['points'][::5]:
+            mouse_pos = widget.geo_to_screen(lat, lon) + QPointF(3.0, -2.0)
+            snap_manager.find_snap_points(mouse_pos)
+            expected = reference_route_snap_points(snap_manager, mouse_pos)
+            compared += len(expected)
+            if not same_snap_points(snap_manager.snap_points, expected):
+                print(f"Snap noktaları farklı: zoom {zoom}, dönüş {rotation}, fare ({lat:.3f}, {lon:.3f})")
+                errors += 1
+    print(f"Karşılaştırılan snap noktası: {compared}")
+    if compared == 0:
+        errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Tek nokta segment güncellemesi ve vektörel snap araması eski hesaplarla aynı")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_segment_metrics()
@@ -0,0 +1,89 @@
+"""
+Ayırma Kaybı Tespiti Testi
+
+Bu script, yoğun saati temsil eden rastgele zamanlı uçuşlar üretir,
+separation modülünün uzay-zaman hash ızgarasıyla bulduğu ihlal örneklerini
+tüm çiftlerin kaba kuvvet karşılaştırmasıyla doğrular ve bilinen bir
+yakınlaşma senaryosunun tek bir conflict olarak raporlandığını kontrol eder.
+"""
+
+import math
+import time
+
+import numpy as np
+from trajectory_playback import TrajectoryPlaybackIndex
+from separation import detect_conflicts
+
+def make_busy_hour(n_flights, seed=4, start=1.7e9):
+    """Bir saate yayılmış, TMA içinde düz hatlı, alçalan/tırmanan uçuşlar"""
+    rng = np.random.default_rng(seed)
+    trajectories = []
+    for i in range(n_flights):
+        n_points = 240
+        times = start + rng.uniform(0, 3600) + np.arange(n_points) * 5.0
+        heading = rng.uniform(0, 2 * np.pi)
+        speed_deg = 0.0035 * rng.uniform(0.8, 1.2)  # ~250 kt, 5 sn'de derece
+        lat0, lon0 = 41.0 + rng.uniform(-0.6, 0.6), 29.0 + rng.uniform(-0.8, 0.8)
+        lats = lat0 + np.cos(heading) * speed_deg * np.arange(n_points)
+        lons = lon0 + np.sin(heading) * speed_deg * np.arange(n_points) / math.cos(math.radians(41.0))
+        alts = np.linspace(rng.uniform(3000, 15000), rng.uniform(3000, 15000), n_points)
+        trajectories.append((f"THY{i:03d}", np.column_stack([lats, lons, alts]), times))
+    return trajectories
+
+def brute_force_count(index, lateral_nm, vertical_ft, step_s):
+    samples = index.resample(step_s)
+    ref_lat, ref_lon = np.mean(samples['lats']), np.mean(samples['lons'])
+    xs = (samples['lons'] - ref_lon) * 60.0 * math.cos(math.radians(ref_lat))
+    ys = (samples['lats'] - ref_lat) * 60.0
+    count = 0
+    for step in np.unique(samples['steps']):
+        members = np.flatnonzero(samples['steps'] == step)
+        if len(members) < 2:
+            continue
+        i, j = np.triu_indices(len(members), k=1)
+        a, b = members[i], members[j]
+        close = ((np.hypot(xs[a] - xs[b], ys[a] - ys[b]) < lateral_nm) &
+                 (np.abs(samples['alts'][a] - samples['alts'][b]) < vertical_ft))
+        count += int(np.count_nonzero(close))
+    return count
+
+def test_separation(n_flights=600):
+    errors = 0
+    index = TrajectoryPlaybackIndex(make_busy_hour(n_flights))
+
+    start = time.perf_counter()
+    conflicts, stats = detect_conflicts(index, lateral_nm=3.0, vertical_ft=1000.0, step_s=5.0)
+    elapsed = time.perf_counter() - start
+    print(f"{stats['flights']} uçuş, {stats['samples']} örnek: {elapsed * 1000:.0f} ms")
+    print(f"Aday çift: {stats['candidate_pairs']} (tüm çiftler {stats['all_pairs']}), "
+          f"{len(conflicts)} conflict, {stats['conflict_samples']} ihlal örneği")
+
+    expected = brute_force_count(index, 3.0, 1000.0, 5.0)
+    if stats['conflict_samples'] != expected:
+        print(f"Kaba kuvvet {expected} ihlal örneği buldu")
+        errors += 1
+    if stats['candidate_pairs'] >= stats['all_pairs']:
+        errors += 1
+
+    # Karşı yönlerden aynı irtifada yaklaşan iki uçak: tek conflict, en yakın nokta ~0 NM
+    times = 1.7e9 + np.arange(121) * 5.0
+    lons = np.linspace(28.5, 29.5, 121)
+    head_on = [
+        ("A", np.column_stack([np.full(121, 41.0), lons, np.full(121, 8000.0)]), times),
+        ("B", np.column_stack([np.full(121, 41.0), lons[::-1], np.full(121, 8400.0)]), times),
+    ]
+    pair_conflicts, _stats = detect_conflicts(TrajectoryPlaybackIndex(head_on), lateral_nm=3.0, vertical_ft=1000.0)
+    if len(pair_conflicts) != 1 or pair_conflicts[0]['min_distance_nm'] > 0.5:
+        errors += 1
+    else:
+        conflict = pair_conflicts[0]
+        print(f"Karşılaşma: {conflict['duration_s']:.0f} sn, en yakın {conflict['min_distance_nm']:.2f} NM / "
+              f"{conflict['vertical_ft']:.0f} ft")
+
+    if errors == 0:
+        print("BAŞARILI: Hash ızgarası kaba kuvvetle aynı ihlalleri buldu")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_separation()
@@ -0,0 +1,88 @@
+"""
+Başlangıç Süresi Raporu Testi
+
+Bu script, startup_timer modülünün adımları yalnızca ilk kez
+işaretlediğini, seçim penceresinde geçen süreyi ilk pencere / ilk harita
+çizimi sürelerinden düştüğünü, raporu bir kez yazdığını ve
+PROCEDURE_STARTUP_REPORT ile JSON çıktısı verdiğini doğrular. Ayrıca
+ana pencere modülünün nadir kullanılan dialogları başlangıçta
+yüklemediğini kontrol eder.
+"""
+
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import startup_timer
+
+LAZY_MODULES = ('separation_dialog', 'conformance_dialog', 'infringement_dialog', 'pointmerge_sweep_dialog',
+                'gradient_calculator', 'procedure_assignment_dialog', 'trajectory_playback', 'trombone_popup',
+                'pointmerge_popup', 'route_popup', 'airspace_load_worker')
+
+def test_startup_timer():
+    errors = 0
+
+    # Rapor işaret yokken yazılmamalı (testler, tek başına MapWidget)
+    startup_timer.reset()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        startup_timer.finish()
+    if output.getvalue() or startup_timer.marks():
+        errors += 1
+
+    startup_timer.reset()
+    startup_timer.mark('imports')
+    startup_timer.mark('options_shown')
+    time.sleep(0.05)
+    startup_timer.mark('options_closed')
+    first = startup_timer.mark('data_loaded')
+    if startup_timer.mark('data_loaded') != first:
+        errors += 1
+    startup_timer.mark('first_window')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'startup.json')
+        os.environ['PROCEDURE_STARTUP_REPORT'] = path
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                startup_timer.finish()
+                startup_timer.finish()
+        finally:
+            del os.environ['PROCEDURE_STARTUP_REPORT']
+        print(output.getvalue().rstrip())
+        with open(path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+
+    marks = saved['marks']
+    wait = saved['user_wait_s']
+    if output.getvalue().count("Başlangıç Süresi Raporu") != 1 or 'first_map_paint' not in marks:
+        errors += 1
+    if wait < 0.045 or abs(saved['time_to_first_map_paint_s'] - (marks['first_map_paint'] - wait)) > 1e-9:
+        errors += 1
+    if abs(saved['time_to_first_window_s'] - (marks['first_window'] - wait)) > 1e-9:
+        errors += 1
+
+    # Nadir kullanılan dialoglar ana pencere içe aktarılırken yüklenmemeli
+    code = ("import sys, airspace_visualizer; "
+            f"print([m for m in {LAZY_MODULES!r} if m in sys.modules])")
+    probe = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                           cwd=os.path.dirname(os.path.abspath(__file__)),
+                           env=dict(os.environ, QT_QPA_PLATFORM='offscreen'))
+    print(f"Başlangıçta yüklenen nadir modüller: {probe.stdout.strip()}")
+    if probe.stdout.strip() != '[]':
+        print(probe.stderr[-300:])
+        errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Başlangıç raporu bekleme hariç süreleri veriyor, dialoglar ilk kullanımda yükleniyor")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_startup_timer()
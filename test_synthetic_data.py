@@ -0,0 +1,108 @@
+"""
+Sentetik Veri Üreticisi Testi
+
+Bu script, synthetic_data modülüyle küçük bir hava sahası klasörü ve
+trajectory dosyaları üretir; DataManager'ın tüm waypoint, prosedür, pist,
+saha ve TMA verisini uyarısız yüklediğini, koordinatların DMS
+yuvarlamasıyla korunduğunu, CSV ve KML trajectory'lerin aynı noktaları
+verdiğini ve aynı tohumun aynı dosyaları ürettiğini doğrular.
+"""
+
+import contextlib
+import filecmp
+import io
+import os
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from models import DataManager
+from synthetic_data import format_compact_dms, format_dms, generate_dataset
+from trajectory_import import find_trajectory_files, parse_trajectory_file
+from utils import parse_dms
+
+def parse_compact_dms(text):
+    degree_digits = 2 if text[-1] in 'NS' else 3
+    value = int(text[:degree_digits]) + int(text[degree_digits:degree_digits + 2]) / 60 + int(text[-3:-1]) / 3600
+    return -value if text[-1] in 'SW' else value
+
+def test_synthetic_data():
+    errors = 0
+
+    # DMS biçimleri: yuvarlama 60 saniyeye taşmamalı
+    for value in (41.999999999, -28.5, 0.0, 40.25):
+        if abs(parse_dms(format_dms(value)) - value) > 1e-5 or abs(parse_compact_dms(format_compact_dms(value, False)) - value) > 1e-3:
+            print(f"DMS hatası: {value} {format_dms(value)} {format_compact_dms(value, False)}")
+            errors += 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = os.path.join(tmp, 'Airspace_Synthetic')
+        start = time.perf_counter()
+        summary = generate_dataset(folder, fixes=3000, procedures=300, airports=12, areas=40, flights=20,
+                                   flight_points=120, trajectory_format='both', seed=7)
+        print(f"Üretim: {summary} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+        data_manager = DataManager()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            success = data_manager.load_airspace_data(folder)
+        warnings = [line for line in output.getvalue().splitlines() if 'Warning' in line or 'rror' in line]
+        procedure_count = sum(len(procedures) for airports in data_manager.procedures.values()
+                              for runways in airports.values() for procedures in runways.values())
+        print(f"Yüklenen: {len(data_manager.waypoint_coords)} waypoint, {procedure_count} prosedür, "
+              f"{len(data_manager.runways)} pist, {len(data_manager.restricted_areas)} saha, "
+              f"{len(data_manager.tma_boundary_points)} TMA noktası, {len(warnings)} uyarı")
+        if not success or warnings:
+            print(warnings[:5])
+            errors += 1
+        if (len(data_manager.waypoint_coords) != 3000 or procedure_count != 300 or
+                len(data_manager.runways) != summary['runways'] or len(data_manager.restricted_areas) != 40 or
+                len(data_manager.tma_boundary_points) < 4):
+            errors += 1
+
+        # Prosedür noktaları waypoints.xml koordinatlarıyla aynı olmalı
+        for airport, runways in data_manager.procedures['SID'].items():
+            for procedures in runways.values():
+                for waypoints in procedures.values():
+                    for waypoint in waypoints:
+                        if data_manager.waypoint_coords[waypoint['name']] != (waypoint['lat'], waypoint['lon']):
+                            errors += 1
+        # Danger_ dosyaları LTD_P_R ile aynı sahaları içermeli
+        danger_files = sorted(os.listdir(os.path.join(folder, 'Danger_')))
+        area = data_manager.restricted_areas[0]
+        root = ET.parse(os.path.join(folder, 'Danger_', f"{area['name']}.xml")).getroot()
+        danger_points = [(parse_compact_dms(point.find('Latitude').text), parse_compact_dms(point.find('Longitude').text))
+                         for point in root.findall("Point[@Type='Boundary']")]
+        if len(danger_files) != 40 or not np.allclose(danger_points, area['points'][:-1], atol=1e-3):
+            errors += 1
+
+        # CSV ve KML trajectory'leri aynı izi vermeli
+        files = find_trajectory_files(summary['trajectories_dir'])
+        parsed = {os.path.basename(path): parse_trajectory_file(path) for path in files}
+        csv_result, kml_result = parsed['SYN00003.csv'], parsed['SYN00003.kml']
+        if len(files) != 40 or any(result[2] is None for result in parsed.values()):
+            errors += 1
+        elif (csv_result[1] != 'SYN00003' or csv_result[2].shape != (120, 3) or csv_result[3] is None or
+              not np.allclose(csv_result[2][:, :2], kml_result[2][:, :2], atol=1e-5) or
+              np.any(np.diff(csv_result[3]) <= 0)):
+            errors += 1
+
+        # Aynı tohum aynı dosyaları üretmeli
+        again = os.path.join(tmp, 'Airspace_Again')
+        generate_dataset(again, fixes=3000, procedures=300, airports=12, areas=40, flights=2, flight_points=120,
+                         seed=7)
+        names = ['waypoints.xml', 'STAR_SID.xml', 'Runways.xml', 'LTD_P_R.xml', 'Istanbul_TMA.xml']
+        match, mismatch, _ = filecmp.cmpfiles(folder, again, names, shallow=False)
+        if mismatch:
+            print(f"Farklı dosyalar: {mismatch}")
+            errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Sentetik veri DataManager şemalarıyla uyarısız yükleniyor, trajectory'ler tutarlı")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_synthetic_data()
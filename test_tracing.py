@@ -0,0 +1,137 @@
+"""
+İzleme ve Metrik Katmanı Testi
+
+Bu script, tracing modülünün seviye kapısının kapalı mesajları
+biçimlendirmeden attığını, varsayılan seviyede yükleyicilerin yalnızca
+uyarı ve hataları yazdığını, sayaçların tutulduğunu, yükleyici ve geometri
+span'lerinin Chrome trace-event JSON olarak dışa aktarıldığını ve kayıt
+kapalıyken çağrı başına maliyetin ihmal edilebilir olduğunu doğrular.
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+
+import tracing
+from models import DataManager
+from procedure_geometry import calculate_trombone_waypoints
+from trombone_sweep import runway_approach
+
+RUNWAY = {'id': 'LTFM 36/18', 'start_lat': 41.2400, 'start_lon': 28.7200, 'end_lat': 41.2800, 'end_lon': 28.7230}
+CONFIG = {'threshold_distance': 8.0, 'base_angle': 90.0, 'base_distance': 6.0, 'extension_length': 10.0}
+AIRSPACE = os.path.join('data', 'Airspace_01.01.2025')
+
+class CountingArgument:
+    """Biçimlendirilirse sayan argüman"""
+    def __init__(self):
+        self.formatted = 0
+    def __str__(self):
+        self.formatted += 1
+        return 'arg'
+
+def per_call_ns(function, calls=200000):
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls * 1e9
+
+def test_tracing():
+    errors = 0
+    tracing.set_level('warning')
+    tracing.stop_recording()
+    tracing.clear()
+
+    # Kapalı seviye biçimlendirme yapmamalı ve yazmamalı
+    argument = CountingArgument()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        tracing.debug("debug %s", argument)
+        tracing.info("info %s", argument)
+        tracing.warning("Warning: %s %d%%", argument, 5)
+        tracing.error("Error: 100% sabit mesaj")
+    if argument.formatted != 1 or output.getvalue() != "Warning: arg 5%\nError: 100% sabit mesaj\n":
+        print(f"Seviye kapısı hatalı: {output.getvalue()!r}")
+        errors += 1
+    if tracing.counters() != {'log.warning': 1, 'log.error': 1}:
+        errors += 1
+    try:
+        tracing.set_level('verbose')
+        errors += 1
+    except ValueError:
+        pass
+
+    # Varsayılan seviyede yükleyici bilgi satırları yazılmamalı
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        DataManager().load_airspace_data(AIRSPACE)
+    info_lines = [line for line in output.getvalue().splitlines() if line.startswith('Loaded')]
+    if info_lines or tracing.counters().get('models.waypoints_loaded', 0) <= 0:
+        print(f"Bilgi satırları yazıldı: {info_lines[:2]}")
+        errors += 1
+    tracing.set_level('info')
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        DataManager().load_airspace_data(AIRSPACE)
+    if not any(line.startswith('Loaded') for line in output.getvalue().splitlines()):
+        errors += 1
+    tracing.set_level('warning')
+
+    # Kayıt açıkken span'ler ve log olayları trace'e yazılmalı
+    tracing.clear()
+    tracing.start_recording()
+    with contextlib.redirect_stdout(io.StringIO()):
+        DataManager().load_airspace_data(AIRSPACE)
+        for _ in range(5):
+            calculate_trombone_waypoints(runway_approach(RUNWAY, '36'), CONFIG)
+        with tracing.span('test.block', size=3, label=('a', 1)):
+            tracing.warning("Warning: trace içi uyarı")
+    tracing.stop_recording()
+    timings = tracing.timings()
+    print("\n".join(tracing.summary_lines(6)))
+    if (timings.get('procedure_geometry.calculate_trombone_waypoints', {}).get('count') != 5 or
+            timings.get('models.DataManager.load_airspace_data', {}).get('count') != 1 or
+            timings['models.DataManager._load_waypoints_xml']['total_ms'] >
+            timings['models.DataManager.load_airspace_data']['total_ms']):
+        errors += 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'trace.json')
+        event_count = tracing.export_chrome_trace(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+    events = document['traceEvents']
+    complete = [event for event in events if event['ph'] == 'X']
+    instants = [event for event in events if event['ph'] == 'i']
+    block = next((event for event in complete if event['name'] == 'test.block'), None)
+    print(f"Trace: {event_count} olay, {len(complete)} span, {len(instants)} log olayı")
+    if (len(complete) + len(instants) != event_count or any(event['dur'] < 0 for event in complete) or
+            block is None or block['args'] != {'size': 3, 'label': "('a', 1)"} or block['cat'] != 'test'):
+        errors += 1
+    if not any(event['name'] == 'Warning: trace içi uyarı' and event['args']['level'] == 'warning' for event in instants):
+        errors += 1
+    if document['otherData']['counters'].get('log.warning', 0) < 1:
+        errors += 1
+
+    # Kayıt kapalıyken maliyet: boş fonksiyon çağrısına göre birkaç yüz ns
+    def plain():
+        return None
+    traced_plain = tracing.traced()(plain)
+    baseline = per_call_ns(plain)
+    costs = {'debug': per_call_ns(lambda: tracing.debug("x %s", 1)) - baseline,
+             'traced': per_call_ns(traced_plain) - baseline,
+             'span': per_call_ns(lambda: tracing.span('x').__enter__()) - baseline}
+    print("Kapalıyken ek maliyet: " + ", ".join(f"{name} {cost:.0f} ns" for name, cost in costs.items()))
+    if any(cost > 2000 for cost in costs.values()):
+        errors += 1
+    tracing.clear()
+
+    if errors == 0:
+        print("BAŞARILI: Seviye kapısı, sayaçlar ve Chrome trace dışa aktarımı doğru, kapalıyken maliyet ihmal edilebilir")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_tracing()
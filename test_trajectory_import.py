@@ -0,0 +1,49 @@
+"""
+Toplu Trajectory İçe Aktarma Testi
+
+Bu script, geçici bir klasöre örnek CSV trajectory dosyaları yazar ve
+trajectory_import modülüyle paralel olarak ayrıştırılıp ayrıştırılamadığını test eder.
+"""
+
+import os
+import sys
+import tempfile
+from trajectory_import import find_trajectory_files, iter_parsed_trajectories
+
+def write_sample_csv(path, callsign, n_points):
+    """Örnek bir trajectory CSV dosyası yaz"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write("Timestamp,UTC,Callsign,Position,Altitude,Speed,Direction\n")
+        for i in range(n_points):
+            lat = 41.0 + i * 0.001
+            lon = 29.0 + i * 0.001
+            f.write(f'{i},2025-01-01 10:00:{i % 60:02d},{callsign},"{lat},{lon}",{5000 + i * 10},250,45\n')
+
+def test_bulk_import(folder=None, n_files=8, n_points=500):
+    """Klasördeki trajectory dosyalarını toplu içe aktar"""
+    temp_dir = None
+    if folder is None:
+        temp_dir = tempfile.TemporaryDirectory()
+        folder = temp_dir.name
+        for i in range(n_files):
+            write_sample_csv(os.path.join(folder, f"flight_{i}.csv"), f"THY{i:03d}", n_points)
+
+    filepaths = find_trajectory_files(folder)
+    print(f"Bulunan dosya sayısı: {len(filepaths)}")
+
+    results = list(iter_parsed_trajectories(filepaths))
+    ok = [r for r in results if r[2] is not None]
+    print(f"Ayrıştırılan: {len(ok)} / {len(results)}")
+    for filepath, trajectory_id, points, times in ok[:3]:
+        print(f"  {trajectory_id}: {points.shape[0]} nokta, dtype={points.dtype}, ilk nokta={points[0].tolist()}, ilk zaman={times[0]}")
+
+    if temp_dir is not None:
+        if len(ok) == n_files and all(r[2].shape == (n_points, 3) and r[3].shape == (n_points,) for r in ok):
+            print("BAŞARILI: Tüm dosyalar doğru boyutta ayrıştırıldı")
+        else:
+            print("HATA: Beklenen sonuçlar alınamadı")
+        temp_dir.cleanup()
+
+if __name__ == "__main__":
+    # Argüman olarak bir klasör veya glob deseni verilebilir
+    test_bulk_import(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,178 @@
+"""
+Trajectory Çizim Katmanı Testi
+
+Bu script, trajectory_layer yardımcılarını doğrular: QDataStream ile
+tek seferde kurulan QPainterPath'in eleman tipleri ve koordinatlarının
+moveTo/lineTo ile kurulan yolla aynı olduğunu, irtifa renk skalası
+kovalarını, ızgara ve Douglas-Peucker sadeleştirmesinin uç noktaları
+koruyup artan indeksler döndürdüğünü, görünüm kırpmasını ve toplu
+çizimin pen başına tek yol çizdiğini.
+"""
+
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+from PyQt5.QtGui import QColor, QPainterPath
+from PyQt5.QtWidgets import QApplication
+
+from trajectory_layer import (AltitudeColorRamp, TrajectoryPathBatch, TrajectoryRenderData, array_to_qpainterpath,
+                              array_to_qpolygonf, douglas_peucker_indices, grid_decimate_indices,
+                              visible_segments)
+
+class RecordingPainter:
+    """drawPath çağrılarını pen rengiyle kaydeden painter"""
+    def __init__(self):
+        self.pen = None
+        self.paths = []
+    def setBrush(self, brush):
+        pass
+    def setPen(self, pen):
+        self.pen = pen
+    def drawPath(self, path):
+        self.paths.append((self.pen, QPainterPath(path)))
+
+def path_elements(path):
+    return [(path.elementAt(i).type, path.elementAt(i).x, path.elementAt(i).y) for i in range(path.elementCount())]
+
+def segment_distance(px, py, x1, y1, x2, y2):
+    dx, dy = x2 - x1, y2 - y1
+    length_sq = dx * dx + dy * dy
+    t = np.clip(((px - x1) * dx + (py - y1) * dy) / length_sq, 0.0, 1.0) if length_sq > 0 else 0.0
+    return np.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
+
+def valid_lod(indices, count):
+    return (len(indices) >= 2 and indices[0] == 0 and indices[-1] == count - 1 and
+            bool(np.all(np.diff(indices) > 0)))
+
+def test_trajectory_layer():
+    errors = 0
+    app = QApplication.instance() or QApplication(sys.argv)
+    rng = np.random.default_rng(4)
+
+    # QPainterPath: eleman tipleri ve koordinatlar girdiyle birebir aynı olmalı
+    xs = rng.uniform(-500.0, 1500.0, 1000)
+    ys = rng.uniform(-500.0, 1500.0, 1000)
+    connect = (rng.random(1000) > 0.1).astype(np.int32)
+    connect[0] = 1  # İlk nokta her zaman moveTo olmalı
+    path = array_to_qpainterpath(xs, ys, connect)
+    expected_types = [QPainterPath.MoveToElement if index == 0 or not connect[index] else QPainterPath.LineToElement
+                      for index in range(1000)]
+    if path_elements(path) != list(zip(expected_types, xs.tolist(), ys.tolist())):
+        print("QPainterPath elemanları girdiden farklı")
+        errors += 1
+    # Ardışık moveTo'lar olmadan moveTo/lineTo ile kurulan yolla aynı olmalı
+    connect[1:][connect[:-1] == 0] = 1
+    path = array_to_qpainterpath(xs, ys, connect)
+    reference = QPainterPath()
+    for index, (x, y) in enumerate(zip(xs, ys)):
+        if index == 0 or not connect[index]:
+            reference.moveTo(x, y)
+        else:
+            reference.lineTo(x, y)
+    if path_elements(path) != path_elements(reference):
+        print("QPainterPath elemanları farklı")
+        errors += 1
+    if path.elementAt(0).type != QPainterPath.MoveToElement or not array_to_qpainterpath([], [], []).isEmpty():
+        errors += 1
+    polygon = array_to_qpolygonf(xs[:50], ys[:50])
+    if [(p.x(), p.y()) for p in polygon] != list(zip(xs[:50].tolist(), ys[:50].tolist())):
+        errors += 1
+
+    # İrtifa renk skalası
+    ramp = AltitudeColorRamp(num_buckets=5)
+    buckets = ramp.bucket_indices([-100.0, 0.0, 5000.0, 10000.0, 20000.0], 0.0, 10000.0)
+    if buckets.tolist() != [0, 0, 2, 4, 4] or ramp.bucket_indices([3000.0, 3000.0], 3000.0, 3000.0).tolist() != [2, 2]:
+        print(f"Kovalar: {buckets.tolist()}")
+        errors += 1
+    ramp.set_altitude_range(0.0, 40000.0)
+    if ramp.bucket_indices([10000.0], 0.0, 10000.0).tolist() != [1]:
+        errors += 1
+    if (ramp.color_at(0.0) != QColor(0, 0, 255) or ramp.color_at(1.0) != QColor(255, 0, 0) or
+            ramp.color_at(0.5) != QColor(128, 0, 128)):
+        errors += 1
+    pens = ramp.pens()
+    version = ramp.version
+    if len(pens) != 5 or ramp.pens() is not pens:
+        errors += 1
+    ramp.set_num_buckets(8)
+    if ramp.version == version or len(ramp.pens()) != 8:
+        errors += 1
+
+    # Izgara sadeleştirme: uç noktalar korunur, her tutulan nokta yeni hücreye girer
+    walk_x = np.cumsum(rng.normal(0.0, 0.3, 5000))
+    walk_y = np.cumsum(rng.normal(0.0, 0.3, 5000))
+    cell = 1.0
+    grid = grid_decimate_indices(walk_x, walk_y, cell)
+    cells = np.column_stack([np.floor(walk_x / cell), np.floor(walk_y / cell)])
+    reference_grid = [0] + [i for i in range(1, 4999) if not np.array_equal(cells[i], cells[i - 1])] + [4999]
+    if not valid_lod(grid, 5000) or grid.tolist() != reference_grid:
+        errors += 1
+
+    # Douglas-Peucker: atlanan her nokta kapsayan sadeleştirilmiş segmente tolerans içinde
+    tolerance = 0.5
+    kept = douglas_peucker_indices(walk_x, walk_y, tolerance)
+    worst = 0.0
+    for first, last in zip(kept[:-1], kept[1:]):
+        if last - first > 1:
+            inner = np.arange(first + 1, last)
+            worst = max(worst, float(segment_distance(walk_x[inner], walk_y[inner], walk_x[first], walk_y[first],
+                                                      walk_x[last], walk_y[last]).max()))
+    print(f"Douglas-Peucker: 5000 -> {len(kept)} nokta, en büyük sapma {worst:.3f} (tolerans {tolerance})")
+    if not valid_lod(kept, 5000) or worst > tolerance or len(kept) >= 5000:
+        errors += 1
+    line = np.linspace(0.0, 10.0, 100)
+    if douglas_peucker_indices(line, line * 2.0, 1e-9).tolist() != [0, 99]:
+        errors += 1
+    if douglas_peucker_indices(line[:2], line[:2], 1.0).tolist() != [0, 1]:
+        errors += 1
+
+    # LOD seviyeleri: tam çözünürlük, artan indeksler, önbellek
+    points = np.column_stack([41.0 + walk_y * 1e-3, 29.0 + walk_x * 1e-3, np.linspace(0.0, 30000.0, 5000)])
+    render = TrajectoryRenderData(points)
+    level, indices = render.lod_indices(1e-7)
+    coarse_level, coarse = render.lod_indices(1e-2)
+    if level != -1 or not valid_lod(coarse, 5000) or render.lod_indices(1e-2)[1] is not coarse:
+        errors += 1
+    lats, lons, segment_buckets = render.level_arrays(1e-2, ramp)
+    if (len(lats) != len(coarse) or len(segment_buckets) != len(coarse) - 1 or
+            not np.array_equal(lons, points[coarse, 1])):
+        errors += 1
+
+    # Görünüm kırpması (800 x 600)
+    seg_x = np.array([-50.0, -10.0, 100.0, 900.0, 1000.0, 1000.0, -100.0])
+    seg_y = np.array([100.0, 200.0, 300.0, 300.0, 300.0, -50.0, 700.0])
+    mask = visible_segments(seg_x, seg_y, 800, 600)
+    # Sol dışta, soldan giren, karşıdan karşıya geçen, sağdan çıkan, sağ dışta, köşegen geçen
+    if mask.tolist() != [False, True, True, False, False, True]:
+        print(f"Görünür segmentler: {mask.tolist()}")
+        errors += 1
+
+    # Toplu çizim: anahtar başına tek drawPath, negatif anahtarlar çizilmez
+    batch = TrajectoryPathBatch()
+    batch.add(np.arange(6.0), np.zeros(6), np.array([0, 0, -1, 1, 1]))
+    batch.add(np.arange(4.0), np.ones(4), np.array([1, 0, 0]))
+    batch.add(np.arange(3.0), np.full(3, 2.0), np.array([-1, -1]))
+    batch.add(np.array([5.0]), np.array([5.0]), np.array([], dtype=np.int64))
+    pens = {0: 'pen0', 1: 'pen1'}
+    painter = RecordingPainter()
+    count = batch.count
+    batch.draw(painter, pens)
+    drawn = {pen: path_elements(path) for pen, path in painter.paths}
+    line_to = sum(1 for elements in drawn.values() for element in elements if element[0] == QPainterPath.LineToElement)
+    expected_pen0 = [(0, 0.0, 0.0), (1, 1.0, 0.0), (1, 2.0, 0.0), (0, 1.0, 1.0), (1, 2.0, 1.0), (1, 3.0, 1.0)]
+    if count != 2 or len(painter.paths) != 2 or line_to != 7 or drawn.get('pen0') != expected_pen0:
+        print(f"Toplu çizim: {drawn}")
+        errors += 1
+    if batch.count != 0:
+        errors += 1
+
+    if errors == 0:
+        print("BAŞARILI: Yol kurulumu, renk kovaları, LOD indeksleri ve görünüm kırpması doğru")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_trajectory_layer()
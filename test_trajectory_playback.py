@@ -0,0 +1,64 @@
+"""
+Trajectory Oynatma İndeksi Testi
+
+Bu script, zamanlı örnek trajectory'lerden TrajectoryPlaybackIndex oluşturur
+ve aktif uçuş / enterpolasyonlu konum sonuçlarını doğrudan hesaplamayla
+karşılaştırır.
+"""
+
+import time
+
+import numpy as np
+from trajectory_playback import TrajectoryPlaybackIndex
+
+def make_timed_trajectories(n_flights, n_points, start=1.7e9, span=3600.0):
+    """Bir saat içinde başlayan, 4 saniye aralıklı örnek uçuşlar üret"""
+    rng = np.random.default_rng(7)
+    trajectories = []
+    for i in range(n_flights):
+        times = start + rng.uniform(0, span) + np.arange(n_points) * 4.0
+        lats = 41.0 + np.cumsum(rng.normal(0, 0.002, n_points))
+        lons = 29.0 + np.cumsum(rng.normal(0, 0.002, n_points))
+        alts = np.linspace(15000, 2000, n_points)
+        trajectories.append((f"THY{i:03d}", np.column_stack([lats, lons, alts]), times))
+    return trajectories
+
+def test_playback_index(n_flights=500, n_points=400):
+    trajectories = make_timed_trajectories(n_flights, n_points)
+
+    start = time.perf_counter()
+    index = TrajectoryPlaybackIndex(trajectories)
+    print(f"İndeks: {len(index)} uçuş, {index.point_count} nokta, {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    errors = 0
+    for query_time in np.linspace(index.start_time, index.end_time, 25):
+        positions = index.positions_at(query_time)
+        expected = [i for i, (_id, _points, times) in enumerate(trajectories)
+                    if times[0] <= query_time <= times[-1]]
+        if sorted(positions['flight_indices'].tolist()) != expected:
+            errors += 1
+            continue
+        for k, flight in enumerate(positions['flight_indices']):
+            _id, points, times = trajectories[flight]
+            if abs(np.interp(query_time, times, points[:, 0]) - positions['lats'][k]) > 1e-9:
+                errors += 1
+                break
+
+    middle = (index.start_time + index.end_time) / 2.0
+    window = index.samples_in_window(middle, middle + 60.0)
+    if len(window['times']) and (window['times'].min() < middle or window['times'].max() > middle + 60.0):
+        errors += 1
+    print(f"60 sn penceredeki nokta sayısı: {len(window['times'])}")
+
+    start = time.perf_counter()
+    for _ in range(100):
+        index.positions_at(middle)
+    print(f"positions_at: {(time.perf_counter() - start) * 10:.3f} ms/kare")
+
+    if errors == 0:
+        print("BAŞARILI: Aktif uçuşlar ve enterpolasyonlu konumlar doğru")
+    else:
+        print(f"HATA: {errors} sorgu beklenen sonucu vermedi")
+
+if __name__ == "__main__":
+    test_playback_index()
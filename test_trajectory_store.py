@@ -0,0 +1,61 @@
+"""
+Trajectory Deposu Testi
+
+Bu script, örnek trajectory'leri sütun tabanlı depoya yazar, bellek eşlemeli
+olarak yeniden açar ve görünümlerin orijinal noktalarla aynı olup olmadığını
+test eder.
+"""
+
+import copy
+import tempfile
+import time
+
+import numpy as np
+from trajectory_store import TrajectoryStore, write_trajectory_store
+
+def make_sample_trajectories(n_flights, n_points):
+    """Rastgele yürüyüşle örnek trajectory dizileri üret"""
+    rng = np.random.default_rng(42)
+    trajectories = []
+    for i in range(n_flights):
+        lats = 41.0 + np.cumsum(rng.normal(0, 0.001, n_points))
+        lons = 29.0 + np.cumsum(rng.normal(0, 0.001, n_points))
+        alts = np.linspace(1000, 20000, n_points)
+        trajectories.append((f"THY{i:03d}", np.column_stack([lats, lons, alts])))
+    return trajectories
+
+def test_trajectory_store(n_flights=200, n_points=1000):
+    trajectories = make_sample_trajectories(n_flights, n_points)
+    with tempfile.TemporaryDirectory() as folder:
+        errors = 0
+        start = time.perf_counter()
+        # Boş uçuş depoya yazılmaz ve sayılmaz
+        written = write_trajectory_store(folder, trajectories + [("BOS", np.empty((0, 3)))])
+        print(f"Yazma: {(time.perf_counter() - start) * 1000:.1f} ms, {written} uçuş")
+
+        start = time.perf_counter()
+        store = TrajectoryStore.open(folder)
+        print(f"Açılış: {(time.perf_counter() - start) * 1000:.2f} ms, {len(store)} uçuş, {store.point_count} nokta")
+        if written != n_flights or len(store) != n_flights:
+            errors += 1
+
+        for (trajectory_id, points), view in zip(trajectories, store):
+            if view.trajectory_id != trajectory_id or len(view) != len(points):
+                errors += 1
+            elif not (np.array_equal(view.lats, points[:, 0]) and np.array_equal(view.lons, points[:, 1])
+                      and np.allclose(view.alts, points[:, 2])):
+                errors += 1
+
+        view = store.find("THY007")
+        print(f"  {view}: ilk nokta={view[0]}, sınırlar={view.bounds}")
+        if copy.deepcopy(view) is not view:
+            errors += 1
+
+        if errors == 0:
+            print("BAŞARILI: Depodaki tüm uçuşlar orijinal noktalarla eşleşiyor")
+        else:
+            print(f"HATA: {errors} uçuş eşleşmedi")
+        del store, view
+
+if __name__ == "__main__":
+    test_trajectory_store()
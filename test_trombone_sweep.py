@@ -0,0 +1,96 @@
+"""
+Trombone Gecikme Emme Taraması Testi
+
+Bu script, trombone_sweep modülünün ürettiği A-B-C noktalarını tek tek
+calculate_trombone_waypoints ile hesaplananlarla karşılaştırır, yol
+uzunluğu/gecikme metriklerini, yasaklı saha ihlali ve açıklık hesabını,
+kapasite tablosu seçimini doğrular ve on binlerce varyantın tarama
+süresini ölçer.
+"""
+
+import contextlib
+import io
+import time
+
+import numpy as np
+import geodesy
+from procedure_geometry import calculate_trombone_waypoints
+from trombone_sweep import runway_approach, sweep_trombone, capacity_table, format_capacity_table
+
+RUNWAY = {'id': 'LTFM 36/18', 'start_lat': 41.2400, 'start_lon': 28.7200, 'end_lat': 41.2800, 'end_lon': 28.7230}
+# 36 yaklaşmasının güneybatısında kare saha
+AREA = {'name': 'LTDTest', 'points': [(40.95, 28.40), (40.95, 28.55), (41.02, 28.55), (41.02, 28.40), (40.95, 28.40)]}
+
+def test_trombone_sweep():
+    errors = 0
+
+    approach = runway_approach(RUNWAY, '36')
+    reverse = runway_approach(RUNWAY, '18')
+    if approach['start_lat'] != RUNWAY['start_lat'] or reverse['start_lat'] != RUNWAY['end_lat'] or reverse['id'] != 'LTFM 18':
+        errors += 1
+
+    start = time.perf_counter()
+    designs, stats = sweep_trombone(
+        approach, np.arange(5.0, 15.1, 1.0), np.r_[-120.0:-59.0:10.0, 60.0:121.0:10.0], np.arange(3.0, 12.1, 1.0),
+        np.arange(0.0, 30.1, 2.0), extension_inverted=(False, True), speeds_kt=(180, 220),
+        restricted_areas=[AREA])
+    elapsed = time.perf_counter() - start
+    print(f"{stats['designs']} varyant ({stats['combinations']} kombinasyon): {elapsed * 1000:.0f} ms")
+    if stats['designs'] != 11 * 14 * 10 * 16 * 2:
+        errors += 1
+
+    # Rastgele varyantları tekil hesapla karşılaştır; tekil hesap debug çıktısı basmamalı
+    rng = np.random.default_rng(5)
+    output = io.StringIO()
+    for index in rng.choice(len(designs), 60, replace=False):
+        design = designs[index]
+        with contextlib.redirect_stdout(output):
+            waypoints = calculate_trombone_waypoints(dict(approach), design['config'])
+        a, b, c = [(w['lat'], w['lon']) for w in waypoints]
+        path = [c, b, a, (approach['start_lat'], approach['start_lon'])]
+        lats, lons = np.array(path).T
+        track_nm = float(np.sum(geodesy.segment_distances_nm(lats, lons)))
+        shortcut_nm = geodesy.distance(c[0], c[1], a[0], a[1]) + design['threshold_distance']
+        if (abs(track_nm - design['track_nm']) > 1e-6 or abs(shortcut_nm - design['shortcut_nm']) > 1e-6 or
+                abs(design['extra_time_s'][220] - design['extra_nm'] / 220 * 3600) > 1e-9):
+            print(f"Uyumsuz varyant: {design['config']}")
+            errors += 1
+            break
+    if output.getvalue():
+        print(f"calculate_trombone_waypoints çıktı bastı: {output.getvalue()[:80]}")
+        errors += 1
+
+    # Sola (-90) dönen base sahaya yaklaşır, sağa (+90) dönen uzak kalır
+    def find(base_angle, base_distance, extension, inverted=False):
+        return next(d for d in designs if d['threshold_distance'] == 10.0 and d['base_angle'] == base_angle and
+                    d['base_distance'] == base_distance and d['extension_length'] == extension and
+                    d['extension_inverted'] == inverted)
+    left, right = find(-90.0, 12.0, 30.0, True), find(90.0, 12.0, 30.0, True)
+    print(f"Sol base: {left['conflict_nm']:.1f} NM ihlal, açıklık {left['clearance_nm']:.1f} NM; "
+          f"sağ base açıklık {right['clearance_nm']:.1f} NM")
+    if left['conflict_nm'] <= 0 or left['conflict_areas'] != ['LTDTest'] or left['clearance_nm'] != 0:
+        errors += 1
+    if right['conflict_nm'] != 0 or right['clearance_nm'] <= left['clearance_nm'] or right['nearest_area'] != 'LTDTest':
+        errors += 1
+
+    # Kapasite tablosu: her hedef için yeterli kapasiteli en kısa ihlalsiz varyant
+    rows = capacity_table(designs, (60, 120, 180, 100000), 220, min_clearance_nm=2.0)
+    for target, design in rows[:3]:
+        if design is None or design['extra_time_s'][220] < target or design['conflict_nm'] > 0:
+            errors += 1
+            continue
+        shorter = [d for d in designs if d['track_nm'] < design['track_nm'] and d['extra_time_s'][220] >= target
+                   and d['conflict_nm'] == 0 and d['clearance_nm'] >= 2.0]
+        if shorter:
+            errors += 1
+    if rows[3][1] is not None:
+        errors += 1
+    print("\n".join(format_capacity_table(rows, 220)))
+
+    if errors == 0:
+        print("BAŞARILI: Tarama varyantları tekil hesapla aynı, metrikler ve kapasite tablosu doğru")
+    else:
+        print(f"HATA: {errors} kontrol başarısız")
+
+if __name__ == "__main__":
+    test_trombone_sweep()
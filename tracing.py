@@ -0,0 +1,266 @@
+"""
+Seviye kapılı loglama, sayaçlar ve zamanlama aralıkları (span)
+
+Seviye PROCEDURE_LOG_LEVEL ile seçilir (debug, info, warning, error, off;
+varsayılan warning). PROCEDURE_TRACE=<dosya.json> verilirse span'ler
+kaydedilir ve çıkışta Chrome trace-event JSON olarak yazılır.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {'debug': DEBUG, 'info': INFO, 'warning': WARNING, 'error': ERROR, 'off': OFF}
+
+MAX_EVENTS = 500000  # Uzun kayıtlarda bellek sınırı; fazlası sayaçta sayılır
+
+_origin = time.perf_counter()
+_level = WARNING
+_recording = False
+_events = []
+_thread_names = {}
+_counters = {}
+_timings = {}
+
+
+def parse_level(level):
+    """Level name ('debug', ...) or number -> numeric level"""
+    if isinstance(level, int):
+        return level
+    try:
+        return LEVEL_NAMES[str(level).strip().lower()]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen log seviyesi: {level}") from None
+
+
+def set_level(level):
+    global _level
+    _level = parse_level(level)
+
+
+def get_level():
+    return _level
+
+
+def is_enabled(level):
+    """True if messages of this level are written (pahalı mesaj hazırlığından önce kontrol için)"""
+    return level >= _level
+
+
+def _emit(level, message, args):
+    if args:
+        message = message % args
+    print(message)
+    if _recording:
+        _record_instant(message, level)
+
+
+def debug(message, *args):
+    if _level <= DEBUG:
+        _emit(DEBUG, message, args)
+
+
+def info(message, *args):
+    if _level <= INFO:
+        _emit(INFO, message, args)
+
+
+def warning(message, *args):
+    _counters['log.warning'] = _counters.get('log.warning', 0) + 1
+    if _level <= WARNING:
+        _emit(WARNING, message, args)
+
+
+def error(message, *args):
+    _counters['log.error'] = _counters.get('log.error', 0) + 1
+    if _level <= ERROR:
+        _emit(ERROR, message, args)
+
+
+def count(name, value=1):
+    """Add value to a named counter (sayaçlar ve uyarı/hata sayıları seviyeden bağımsız tutulur)"""
+    _counters[name] = _counters.get(name, 0) + value
+
+
+def counters():
+    return dict(_counters)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('name', 'args', 'start')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        _record(self.name, self.start, time.perf_counter(), self.args)
+        return False
+
+
+def span(name, **args):
+    """Context manager timing a block; args are attached to the trace event"""
+    if not _recording:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name=None):
+    """Decorator recording each call as a span (varsayılan ad: modül.fonksiyon)"""
+    def decorate(func):
+        label = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _recording:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(label, start, time.perf_counter(), None)
+        return wrapper
+    return decorate
+
+
+def _thread_id():
+    ident = threading.get_ident()
+    if ident not in _thread_names:
+        _thread_names[ident] = threading.current_thread().name
+    return ident
+
+
+def _record(name, start, end, args):
+    duration = end - start
+    stats = _timings.get(name)
+    if stats is None:
+        _timings[name] = [1, duration, duration]
+    else:
+        stats[0] += 1
+        stats[1] += duration
+        if duration > stats[2]:
+            stats[2] = duration
+    if len(_events) < MAX_EVENTS:
+        _events.append(('X', name, start, duration, _thread_id(), args))
+    else:
+        count('tracing.dropped_events')
+
+
+def _record_instant(message, level):
+    if len(_events) < MAX_EVENTS:
+        name = next(key for key, value in LEVEL_NAMES.items() if value == level)
+        _events.append(('i', message, time.perf_counter(), 0.0, _thread_id(), {'level': name}))
+
+
+def start_recording():
+    global _recording
+    _recording = True
+
+
+def stop_recording():
+    global _recording
+    _recording = False
+
+
+def is_recording():
+    return _recording
+
+
+def clear():
+    """Drop recorded spans, timing statistics and counters"""
+    _events.clear()
+    _timings.clear()
+    _counters.clear()
+
+
+def timings():
+    """Span statistics: {name: {'count', 'total_ms', 'mean_ms', 'max_ms'}}"""
+    return {name: {'count': calls, 'total_ms': total * 1000.0, 'mean_ms': total * 1000.0 / calls,
+                   'max_ms': longest * 1000.0}
+            for name, (calls, total, longest) in _timings.items()}
+
+
+def summary_lines(limit=None):
+    """Spans by total time, then counters"""
+    lines = []
+    for name, stats in sorted(timings().items(), key=lambda item: -item[1]['total_ms'])[:limit]:
+        lines.append(f"{name:<50} {stats['count']:7d} çağrı  toplam {stats['total_ms']:9.1f} ms  "
+                     f"ort {stats['mean_ms']:8.3f} ms  max {stats['max_ms']:8.3f} ms")
+    for name, value in sorted(_counters.items()):
+        lines.append(f"{name:<50} {value}")
+    return lines
+
+
+def chrome_trace():
+    """Recorded spans as a Chrome trace-event document (dict)"""
+    pid = os.getpid()
+    trace_events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': 'Procedure'}}]
+    trace_events.extend({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': thread_name}}
+                        for tid, thread_name in _thread_names.items())
+    for phase, name, start, duration, tid, args in list(_events):
+        event = {'name': name, 'cat': name.split('.', 1)[0] if phase == 'X' else 'log', 'ph': phase,
+                 'ts': round((start - _origin) * 1e6, 3), 'pid': pid, 'tid': tid}
+        if phase == 'X':
+            event['dur'] = round(duration * 1e6, 3)
+        else:
+            event['s'] = 't'
+        if args:
+            event['args'] = {key: value if isinstance(value, (int, float, bool, type(None))) else str(value)
+                             for key, value in args.items()}
+        trace_events.append(event)
+    if _counters:
+        trace_events.append({'name': 'counters', 'ph': 'C', 'pid': pid, 'tid': 0,
+                             'ts': round((time.perf_counter() - _origin) * 1e6, 3), 'args': dict(_counters)})
+    return {'traceEvents': trace_events, 'displayTimeUnit': 'ms',
+            'otherData': {'counters': dict(_counters), 'timings': timings()}}
+
+
+def export_chrome_trace(filepath):
+    """Write recorded spans to filepath as Chrome trace-event JSON; returns the event count"""
+    document = chrome_trace()
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(document, f)
+    return len(_events)
+
+
+def _configure_from_environment():
+    level = os.environ.get('PROCEDURE_LOG_LEVEL')
+    if level:
+        try:
+            set_level(level)
+        except ValueError as e:
+            print(e)
+    trace_path = os.environ.get('PROCEDURE_TRACE')
+    if trace_path:
+        start_recording()
+        atexit.register(export_chrome_trace, trace_path)
+
+
+_configure_from_environment()
@@ -0,0 +1,128 @@
+"""
+Toplu trajectory içe aktarma (bulk trajectory import)
+
+Bir klasördeki veya glob desenine uyan CSV/KML trajectory dosyalarını bir
+process havuzunda paralel ayrıştırır; GUI tarafı için bkz.
+trajectory_import_worker.py
+"""
+
+import glob
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import tracing
+
+TRAJECTORY_EXTENSIONS = ('.csv', '.kml')
+
+# Her worker süreci kendi DataManager örneğini bir kez oluşturur
+_worker_data_manager = None
+
+
+def find_trajectory_files(source):
+    """Return a sorted list of trajectory files for a directory, glob pattern or single file.
+
+    Directories are scanned recursively for *.csv and *.kml files.
+    """
+    if not source:
+        return []
+
+    if os.path.isdir(source):
+        matches = []
+        for root, _dirs, files in os.walk(source):
+            for filename in files:
+                if filename.lower().endswith(TRAJECTORY_EXTENSIONS):
+                    matches.append(os.path.join(root, filename))
+        return sorted(matches)
+
+    if os.path.isfile(source):
+        return [source] if source.lower().endswith(TRAJECTORY_EXTENSIONS) else []
+
+    # Glob deseni olarak değerlendir (ör. "tracks/RWY35*/*.csv")
+    return sorted(path for path in glob.glob(source, recursive=True)
+                  if os.path.isfile(path) and path.lower().endswith(TRAJECTORY_EXTENSIONS))
+
+
+def _get_worker_data_manager():
+    global _worker_data_manager
+    if _worker_data_manager is None:
+        from models import DataManager
+        _worker_data_manager = DataManager()
+    return _worker_data_manager
+
+
+def parse_trajectory_file(filepath):
+    """Parse one CSV/KML trajectory file into a compact array.
+
+    Module-level so it can be pickled into a process pool.
+
+    Returns:
+        (filepath, trajectory_id, points, times) where points is a float64
+        array of shape (N, 3) holding lat, lon, alt, or None if parsing failed,
+        and times is a float64 array of N epoch seconds, or None if the file
+        carries no timestamps (KML trail'leri zaman içermez).
+    """
+    data_manager = _get_worker_data_manager()
+    lower = filepath.lower()
+    times = None
+    if lower.endswith('.csv'):
+        trajectory_id, points, times = data_manager.parse_csv_trajectory_with_times(filepath)
+    elif lower.endswith('.kml'):
+        trajectory_id, points = data_manager.parse_kml_trajectory(filepath)
+    else:
+        return filepath, os.path.splitext(os.path.basename(filepath))[0], None, None
+
+    if points is None or len(points) == 0:
+        return filepath, trajectory_id, None, None
+    if times is not None:
+        times = np.asarray(times, dtype=np.float64)
+    return filepath, trajectory_id, np.asarray(points, dtype=np.float64).reshape(-1, 3), times
+
+
+def iter_parsed_trajectories(filepaths, max_workers=None, cancel_check=None):
+    """Parse trajectory files across a process pool, yielding results as they complete.
+
+    Args:
+        filepaths: Ayrıştırılacak dosya yolları
+        max_workers: Process sayısı (None = CPU sayısı)
+        cancel_check: İsteğe bağlı, True dönerse bekleyen işler iptal edilir
+
+    Yields:
+        (filepath, trajectory_id, points, times) tuples, see parse_trajectory_file.
+        Failed files yield points=None.
+    """
+    if not filepaths:
+        return
+
+    # Tek dosya için havuz kurma maliyetine girme
+    if len(filepaths) == 1:
+        if cancel_check is None or not cancel_check():
+            yield _safe_parse(filepaths[0])
+        return
+
+    # Çok thread'li (Qt) süreçten fork güvenli değildir; worker'lar spawn ile başlatılır
+    executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+    try:
+        futures = {executor.submit(parse_trajectory_file, path): path for path in filepaths}
+        for future in as_completed(futures):
+            if cancel_check is not None and cancel_check():
+                break
+            path = futures[future]
+            try:
+                yield future.result()
+            except Exception as e:
+                tracing.error("Error parsing trajectory file %s: %s", path, e)
+                yield path, os.path.splitext(os.path.basename(path))[0], None, None
+    finally:
+        # İptal durumunda henüz başlamamış işleri at, çalışanları bekleme
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _safe_parse(filepath):
+    try:
+        return parse_trajectory_file(filepath)
+    except Exception as e:
+        tracing.error("Error parsing trajectory file %s: %s", filepath, e)
+        return filepath, os.path.splitext(os.path.basename(filepath))[0], None, None
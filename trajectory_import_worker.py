@@ -0,0 +1,56 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+import tracing
+from trajectory_import import iter_parsed_trajectories
+
+
+class TrajectoryImportWorker(QThread):
+    """Toplu trajectory içe aktarmayı GUI thread'i dışında yürüten worker.
+
+    Dosyalar trajectory_import.iter_parsed_trajectories ile process havuzunda
+    ayrıştırılır; sonuçlar sinyallerle GUI thread'ine iletilir.
+    """
+
+    # (tamamlanan, toplam, dosya adı)
+    progressChanged = pyqtSignal(int, int, str)
+    # (trajectory_id, numpy dizisi N x 3, zaman dizisi N veya None)
+    trajectoryParsed = pyqtSignal(str, object, object)
+    # (dosya yolu)
+    fileFailed = pyqtSignal(str)
+    # (başarılı, başarısız, iptal edildi mi)
+    importFinished = pyqtSignal(int, int, bool)
+
+    def __init__(self, filepaths, max_workers=None, parent=None):
+        super().__init__(parent)
+        self.filepaths = list(filepaths)
+        self.max_workers = max_workers
+        self._cancelled = False
+
+    def cancel(self):
+        """İçe aktarmayı iptal et (bekleyen dosyalar atlanır)"""
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        total = len(self.filepaths)
+        done = 0
+        imported = 0
+        failed = 0
+        try:
+            for filepath, trajectory_id, points, times in iter_parsed_trajectories(
+                    self.filepaths, self.max_workers, cancel_check=self.is_cancelled):
+                done += 1
+                if points is not None:
+                    imported += 1
+                    self.trajectoryParsed.emit(str(trajectory_id), points, times)
+                else:
+                    failed += 1
+                    self.fileFailed.emit(filepath)
+                self.progressChanged.emit(done, total, filepath)
+        except Exception as e:
+            tracing.error("Error during bulk trajectory import: %s", e)
+            import traceback
+            traceback.print_exc()
+        self.importFinished.emit(imported, failed, self._cancelled)
@@ -0,0 +1,350 @@
+"""
+Trajectory çizim katmanı yardımcıları
+
+- AltitudeColorRamp: irtifa renklendirmesi için paylaşılan, sabit sayıda
+  renk kovasına (bucket) kuantize edilmiş renk skalası
+- TrajectoryRenderData: her trajectory için numpy dizileri, önbelleklenmiş
+  irtifa istatistikleri ve zoom seviyesine göre seçilen sadeleştirme (LOD)
+  seviyeleri
+- TrajectoryPathBatch: bir karedeki tüm trajectory segmentlerini pen (renk
+  kovası veya trajectory rengi) başına tek bir QPainterPath'te toplayıp çizer
+"""
+
+import struct
+
+import numpy as np
+from PyQt5.QtCore import Qt, QByteArray, QDataStream
+from PyQt5.QtGui import QColor, QPen, QPolygonF, QPainterPath
+
+
+def array_to_qpolygonf(xs, ys):
+    """Build a QPolygonF directly from x/y arrays without creating QPointF objects."""
+    count = len(xs)
+    polygon = QPolygonF(count)
+    if count == 0:
+        return polygon
+    # QPolygonF belleği ardışık (x, y) double çiftleridir; numpy ile doğrudan doldur
+    pointer = polygon.data()
+    pointer.setsize(count * 2 * 8)
+    buffer = np.frombuffer(pointer, dtype=np.float64).reshape(count, 2)
+    buffer[:, 0] = xs
+    buffer[:, 1] = ys
+    return polygon
+
+
+# QDataStream içindeki QPainterPath elemanı: tip (0 = moveTo, 1 = lineTo), x, y
+_PATH_ELEMENT_DTYPE = np.dtype([('type', '>i4'), ('x', '>f8'), ('y', '>f8')])
+
+
+def array_to_qpainterpath(xs, ys, connect):
+    """Build a QPainterPath with many subpaths from arrays in one step.
+
+    connect[i] 0 ise i. nokta yeni bir alt yol başlatır (moveTo), 1 ise
+    önceki noktaya bağlanır (lineTo). Yol, QPainterPath'in QDataStream
+    serileştirme biçiminde numpy ile hazırlanıp tek seferde okunur; böylece
+    nokta başına Python çağrısı yapılmaz.
+    """
+    count = len(xs)
+    path = QPainterPath()
+    if count == 0:
+        return path
+    elements = np.empty(count, dtype=_PATH_ELEMENT_DTYPE)
+    elements['type'] = connect
+    elements['type'][0] = 0
+    elements['x'] = xs
+    elements['y'] = ys
+    # Biçim: eleman sayısı, elemanlar, cStart, fill rule
+    data = struct.pack('>i', count) + elements.tobytes() + struct.pack('>ii', 0, 0)
+    stream = QDataStream(QByteArray(data))
+    stream >> path
+    return path
+
+
+class AltitudeColorRamp:
+    """Shared, quantized colour ramp for altitude-coloured trajectories.
+
+    Renk durakları (stops) 0-1 aralığında konum ve QColor çiftleridir.
+    min_alt/max_alt verilirse tüm trajectory'ler aynı irtifa aralığına göre
+    renklendirilir; verilmezse her trajectory kendi min/max değerini kullanır.
+    """
+
+    DEFAULT_STOPS = [
+        (0.0, QColor(0, 0, 255)),   # Alçak: mavi
+        (1.0, QColor(255, 0, 0)),   # Yüksek: kırmızı
+    ]
+
+    def __init__(self, stops=None, num_buckets=32, line_width=1.5, min_alt=None, max_alt=None):
+        self.stops = list(stops) if stops else list(self.DEFAULT_STOPS)
+        self.num_buckets = max(2, int(num_buckets))
+        self.line_width = line_width
+        self.min_alt = min_alt
+        self.max_alt = max_alt
+        # Ayar her değiştiğinde artar; trajectory kova önbellekleri bununla doğrulanır
+        self.version = 0
+        self._pens = None
+
+    def _changed(self):
+        self.version += 1
+        self._pens = None
+
+    def set_stops(self, stops):
+        self.stops = sorted(stops, key=lambda stop: stop[0])
+        self._changed()
+
+    def set_num_buckets(self, num_buckets):
+        self.num_buckets = max(2, int(num_buckets))
+        self._changed()
+
+    def set_line_width(self, line_width):
+        self.line_width = line_width
+        self._changed()
+
+    def set_altitude_range(self, min_alt=None, max_alt=None):
+        """Sabit irtifa aralığı ayarla (None = trajectory başına otomatik)"""
+        self.min_alt = min_alt
+        self.max_alt = max_alt
+        self._changed()
+
+    def color_at(self, fraction):
+        """Interpolate the ramp colour at a 0-1 fraction."""
+        fraction = min(1.0, max(0.0, fraction))
+        stops = self.stops
+        if fraction <= stops[0][0]:
+            return QColor(stops[0][1])
+        for (pos1, color1), (pos2, color2) in zip(stops, stops[1:]):
+            if fraction <= pos2:
+                t = (fraction - pos1) / (pos2 - pos1) if pos2 > pos1 else 0.0
+                return QColor(
+                    int(round(color1.red() + (color2.red() - color1.red()) * t)),
+                    int(round(color1.green() + (color2.green() - color1.green()) * t)),
+                    int(round(color1.blue() + (color2.blue() - color1.blue()) * t)),
+                    int(round(color1.alpha() + (color2.alpha() - color1.alpha()) * t)))
+        return QColor(stops[-1][1])
+
+    def pens(self, line_width=None):
+        """One pen per bucket, built once per line width and reused every frame."""
+        if line_width is None:
+            line_width = self.line_width
+        if self._pens is None:
+            self._pens = {}
+        pens = self._pens.get(line_width)
+        if pens is None:
+            pens = [QPen(self.color_at(i / (self.num_buckets - 1)), line_width)
+                    for i in range(self.num_buckets)]
+            self._pens[line_width] = pens
+        return pens
+
+    def bucket_indices(self, altitudes, min_alt, max_alt):
+        """Map altitudes to bucket indices (vectorized)."""
+        if self.min_alt is not None and self.max_alt is not None:
+            min_alt, max_alt = self.min_alt, self.max_alt
+        alt_range = max_alt - min_alt
+        if alt_range > 0:
+            fractions = (np.asarray(altitudes, dtype=np.float64) - min_alt) / alt_range
+        else:
+            fractions = np.full(len(altitudes), 0.5)
+        buckets = np.rint(np.clip(fractions, 0.0, 1.0) * (self.num_buckets - 1))
+        return buckets.astype(np.int64)
+
+
+# Tüm MapWidget örneklerinin varsayılan olarak paylaştığı skala
+DEFAULT_ALTITUDE_RAMP = AltitudeColorRamp()
+
+
+# LOD seviyeleri için coğrafi toleranslar (derece). Ekran projeksiyonu
+# eşdikdörtgen olduğundan 1 derece = get_scale() piksel; bu aralık zoom 1'den
+# yaklaşık zoom 12'ye kadar piksel altı toleransı kapsar.
+LOD_TOLERANCES_DEG = tuple(1e-5 * 2 ** level for level in range(12))
+
+
+def grid_decimate_indices(xs, ys, cell_size):
+    """Indices of points that enter a new cell of a square grid (vectorized).
+
+    Aynı hücreye (ekranda ~aynı piksele) düşen ardışık noktalardan yalnızca
+    ilki tutulur; ilk ve son nokta her zaman korunur.
+    """
+    count = len(xs)
+    if count <= 2:
+        return np.arange(count)
+    cell_x = np.floor(xs / cell_size)
+    cell_y = np.floor(ys / cell_size)
+    keep = np.empty(count, dtype=bool)
+    keep[0] = True
+    keep[1:] = (cell_x[1:] != cell_x[:-1]) | (cell_y[1:] != cell_y[:-1])
+    keep[-1] = True
+    return np.flatnonzero(keep)
+
+
+def douglas_peucker_indices(xs, ys, tolerance):
+    """Douglas-Peucker simplification; returns the indices of kept points.
+
+    Her bölme adımında aradaki tüm noktaların uzaklığı numpy ile tek seferde
+    hesaplanır; döngü sayısı tutulan nokta sayısıyla orantılıdır.
+    """
+    count = len(xs)
+    if count <= 2:
+        return np.arange(count)
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        x1, y1, x2, y2 = xs[first], ys[first], xs[last], ys[last]
+        px = xs[first + 1:last]
+        py = ys[first + 1:last]
+        dx, dy = x2 - x1, y2 - y1
+        length_sq = dx * dx + dy * dy
+        if length_sq > 0:
+            t = np.clip(((px - x1) * dx + (py - y1) * dy) / length_sq, 0.0, 1.0)
+            distances = np.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
+        else:
+            distances = np.hypot(px - x1, py - y1)
+        split = int(np.argmax(distances))
+        if distances[split] > tolerance:
+            split_index = first + 1 + split
+            keep[split_index] = True
+            stack.append((first, split_index))
+            stack.append((split_index, last))
+    return np.flatnonzero(keep)
+
+
+class TrajectoryRenderData:
+    """Per-trajectory arrays, cached altitude statistics and LOD levels for painting."""
+
+    def __init__(self, points):
+        self.source = points
+        if hasattr(points, 'stats'):
+            # TrajectoryStore görünümü: sütunlar memmap dilimleri, istatistikler depo indeksinden
+            # okunur; noktalar ancak çizim için gerçekten gerektiğinde diskten sayfalanır
+            self.lats, self.lons, self.alts = points.lats, points.lons, points.alts
+            min_lon, min_lat, max_lon, max_lat, min_alt, max_alt = (float(v) for v in points.stats)
+            self.min_alt, self.max_alt = min_alt, max_alt
+            self.bounds = (min_lon, min_lat, max_lon, max_lat) if len(self.lats) else None
+        else:
+            array = np.asarray(points, dtype=np.float64)
+            if array.ndim != 2 or array.shape[1] < 3:
+                # Altitude olmayan (lat, lon) noktaları için sıfır irtifa ekle
+                array = np.column_stack([array.reshape(-1, 2), np.zeros(len(array))]) if array.size else np.zeros((0, 3))
+            self.lats = np.ascontiguousarray(array[:, 0])
+            self.lons = np.ascontiguousarray(array[:, 1])
+            self.alts = np.ascontiguousarray(array[:, 2])
+            self.min_alt = float(self.alts.min()) if len(self.alts) else 0.0
+            self.max_alt = float(self.alts.max()) if len(self.alts) else 0.0
+            # Coğrafi sınır kutusu (görünüm dışı trajectory'leri hızlıca elemek için)
+            if len(self.lats):
+                self.bounds = (float(self.lons.min()), float(self.lats.min()),
+                               float(self.lons.max()), float(self.lats.max()))
+            else:
+                self.bounds = None
+        # Tam çözünürlük dilim ile seçilir; memmap sütunları kopyalanmaz
+        self._full_indices = slice(None)
+        # Seviye -> tutulan nokta indeksleri; ilk kullanımda hesaplanıp saklanır
+        self._lod_levels = {}
+        self._level_cache = {}
+
+    def lod_indices(self, tolerance_deg):
+        """Point indices for the coarsest LOD level whose tolerance does not exceed tolerance_deg.
+
+        Seviye önce ızgara ile (hücre başına bir nokta), sonra Douglas-Peucker
+        ile sadeleştirilir. Returns (level, indices); level -1 = tam çözünürlük.
+        """
+        level = int(np.searchsorted(LOD_TOLERANCES_DEG, tolerance_deg, side='right')) - 1
+        if level < 0:
+            return -1, self._full_indices
+        indices = self._lod_levels.get(level)
+        if indices is None:
+            tolerance = LOD_TOLERANCES_DEG[level]
+            grid = grid_decimate_indices(self.lons, self.lats, tolerance)
+            indices = grid[douglas_peucker_indices(self.lons[grid], self.lats[grid], tolerance)]
+            self._lod_levels[level] = indices
+        return level, indices
+
+    def level_arrays(self, tolerance_deg, ramp):
+        """Return (lats, lons, segment buckets) for the LOD level matching tolerance_deg.
+
+        Kova dizileri seviye ve renk skalası sürümüne göre önbelleklenir.
+        """
+        level, indices = self.lod_indices(tolerance_deg)
+        key = (id(ramp), ramp.version)
+        cached = self._level_cache.get(level)
+        if cached is None or cached[3] != key:
+            alts = self.alts[indices]
+            # Segment rengi için ortalama irtifa
+            segment_alts = (alts[:-1] + alts[1:]) / 2.0
+            buckets = ramp.bucket_indices(segment_alts, self.min_alt, self.max_alt)
+            cached = (self.lats[indices], self.lons[indices], buckets, key)
+            self._level_cache[level] = cached
+        return cached[0], cached[1], cached[2]
+
+
+def visible_segments(xs, ys, width, height, margin=2.0):
+    """Boolean mask of segments whose screen bounding box touches the viewport."""
+    x1, x2 = xs[:-1], xs[1:]
+    y1, y2 = ys[:-1], ys[1:]
+    low_x, high_x = -margin, width + margin
+    low_y, high_y = -margin, height + margin
+    outside = (((x1 < low_x) & (x2 < low_x)) | ((x1 > high_x) & (x2 > high_x)) |
+               ((y1 < low_y) & (y2 < low_y)) | ((y1 > high_y) & (y2 > high_y)))
+    return ~outside
+
+
+class TrajectoryPathBatch:
+    """Collects trajectory segments of a frame and draws one path per pen.
+
+    Her segmente bir pen anahtarı verilir (irtifa kovası veya trajectory
+    rengi; negatif = çizme). Aynı anahtarlı ardışık segmentler alt yollar
+    olarak birleştirilir ve draw() her anahtar için tek bir drawPath yapar;
+    çizim çağrısı sayısı trajectory sayısından bağımsızdır.
+    """
+
+    def __init__(self):
+        self._parts = []
+
+    @property
+    def count(self):
+        """Number of trajectories with drawable segments added so far."""
+        return len(self._parts)
+
+    def add(self, xs, ys, segment_keys):
+        """Add a projected trajectory with one pen key per segment."""
+        if len(xs) < 2:
+            return
+        # Anahtarın değiştiği yerlerden ardışık segment parçalarını (run) bul
+        changes = np.flatnonzero(np.diff(segment_keys)) + 1
+        run_starts = np.concatenate(([0], changes))
+        run_ends = np.concatenate((changes, [len(segment_keys)]))
+        run_keys = segment_keys[run_starts]
+        drawn = run_keys >= 0
+        if not drawn.any():
+            return
+        run_starts, run_ends, run_keys = run_starts[drawn], run_ends[drawn], run_keys[drawn]
+
+        # Her parça: başlangıç segmentinin ilk noktasından son segmentin bitişine kadar
+        lengths = run_ends - run_starts + 1
+        offsets = np.cumsum(lengths) - lengths
+        point_indices = (np.arange(lengths.sum()) - np.repeat(offsets, lengths) +
+                         np.repeat(run_starts, lengths))
+        connect = np.ones(len(point_indices), dtype=np.int32)
+        connect[offsets] = 0
+        self._parts.append((xs[point_indices], ys[point_indices], connect,
+                            np.repeat(run_keys, lengths)))
+
+    def draw(self, painter, pens):
+        """Draw collected segments; pens maps each key to a QPen."""
+        if not self._parts:
+            return
+        xs, ys, connect, keys = (np.concatenate(column) for column in zip(*self._parts))
+        self._parts = []
+
+        # Kararlı sıralama parçaların nokta sırasını korur
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        boundaries = np.flatnonzero(np.diff(sorted_keys)) + 1
+        painter.setBrush(Qt.NoBrush)
+        for first, last in zip(np.concatenate(([0], boundaries)),
+                               np.concatenate((boundaries, [len(order)]))):
+            points = order[first:last]
+            painter.setPen(pens[sorted_keys[first]])
+            painter.drawPath(array_to_qpainterpath(xs[points], ys[points], connect[points]))
@@ -0,0 +1,201 @@
+"""
+Zaman indeksli trajectory oynatma (playback) motoru
+
+Tüm zamanlı noktalar uçuş ve zaman sırasıyla tek sütun dizisinde tutulur;
+sorgular np.searchsorted ile yapılır. Arayüz için bkz. playback_widget.py
+"""
+
+import numpy as np
+
+
+class TrajectoryPlaybackIndex:
+    """Sorted time index over every timed trajectory.
+
+    Her uçuşun noktaları kendi içinde zamana göre sıralanır. Uçuş i'nin
+    anahtarı (zaman - ilk zaman) + i * adım olarak tanımlanır; adım tüm
+    zaman aralığından büyük olduğundan anahtar dizisi global olarak sıralıdır
+    ve tüm aktif uçuşlardaki konum araması tek bir searchsorted çağrısıdır.
+
+    En az iki geçerli zamanlı noktası olmayan uçuşlar indekse alınmaz.
+    """
+
+    def __init__(self, trajectories):
+        """trajectories: iterable of (trajectory_id, points, times) tuples.
+
+        points bir (N, 3) lat/lon/alt dizisi, demet listesi veya TrajectoryView
+        olabilir; times N adet Unix epoch saniyesidir (NaN olanlar atlanır).
+        """
+        ids = []
+        lat_chunks, lon_chunks, alt_chunks, time_chunks = [], [], [], []
+        for trajectory_id, points, times in trajectories:
+            if times is None or len(times) < 2:
+                continue
+            if hasattr(points, 'lats'):
+                lats, lons, alts = points.lats, points.lons, points.alts
+            else:
+                array = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+                lats, lons, alts = array[:, 0], array[:, 1], array[:, 2]
+            times = np.asarray(times, dtype=np.float64)
+            valid = np.flatnonzero(~np.isnan(times))
+            if len(valid) < 2:
+                continue
+            order = valid[np.argsort(times[valid], kind='stable')]
+            ids.append(trajectory_id)
+            lat_chunks.append(np.asarray(lats, dtype=np.float64)[order])
+            lon_chunks.append(np.asarray(lons, dtype=np.float64)[order])
+            alt_chunks.append(np.asarray(alts, dtype=np.float64)[order])
+            time_chunks.append(times[order])
+
+        self.ids = ids
+        counts = np.array([len(chunk) for chunk in time_chunks], dtype=np.int64)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        if not ids:
+            empty = np.zeros(0)
+            self.lats = self.lons = self.alts = self.times = empty
+            self.starts = self.ends = empty
+            self.start_time = self.end_time = 0.0
+            self._keys = self._sorted_starts = self._sorted_sample_times = empty
+            self._start_order = self._sample_order = np.zeros(0, dtype=np.int64)
+            self._flight_of_sample = np.zeros(0, dtype=np.int64)
+            self._max_duration = 0.0
+            self._key_stride = 1.0
+            return
+
+        self.lats = np.concatenate(lat_chunks)
+        self.lons = np.concatenate(lon_chunks)
+        self.alts = np.concatenate(alt_chunks)
+        self.times = np.concatenate(time_chunks)
+        self.starts = self.times[self.offsets[:-1]]
+        self.ends = self.times[self.offsets[1:] - 1]
+        self.start_time = float(self.starts.min())
+        self.end_time = float(self.ends.max())
+
+        # Uçuş-zaman bileşik anahtarı (global olarak sıralı)
+        self._flight_of_sample = np.repeat(np.arange(len(ids), dtype=np.int64), counts)
+        self._key_stride = (self.end_time - self.start_time) + 1.0
+        self._keys = (self.times - self.start_time) + self._flight_of_sample * self._key_stride
+
+        # Başlangıç zamanına göre sıralı uçuşlar; en uzun uçuş süresiyle birlikte
+        # aralık sorgularını [t0 - süre, t1] başlangıç aralığına indirger
+        self._start_order = np.argsort(self.starts, kind='stable')
+        self._sorted_starts = self.starts[self._start_order]
+        self._max_duration = float((self.ends - self.starts).max())
+
+        # Pencere sorguları için tüm noktaların zamana göre sıralı dizini
+        self._sample_order = np.argsort(self.times, kind='stable')
+        self._sorted_sample_times = self.times[self._sample_order]
+
+    @classmethod
+    def from_drawn_trajectories(cls, trajectories):
+        """Build an index from MapWidget drawn_elements['trajectories'] entries."""
+        return cls((t.get('id'), t.get('points'), t.get('times')) for t in trajectories)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def point_count(self):
+        return len(self.times)
+
+    def flights_in_window(self, t0, t1):
+        """Indices of flights whose time span overlaps [t0, t1]."""
+        if not self.ids:
+            return np.zeros(0, dtype=np.int64)
+        low = np.searchsorted(self._sorted_starts, t0 - self._max_duration, side='left')
+        high = np.searchsorted(self._sorted_starts, t1, side='right')
+        candidates = self._start_order[low:high]
+        return np.sort(candidates[self.ends[candidates] >= t0])
+
+    def active_flights(self, t):
+        """Indices of flights airborne (between first and last sample) at time t."""
+        return self.flights_in_window(t, t)
+
+    def samples_in_window(self, t0, t1):
+        """Raw samples with t0 <= time <= t1, ordered by time.
+
+        Returns a dict of parallel arrays: flight_indices, lats, lons, alts, times.
+        """
+        low = np.searchsorted(self._sorted_sample_times, t0, side='left')
+        high = np.searchsorted(self._sorted_sample_times, t1, side='right')
+        sample_indices = self._sample_order[low:high]
+        return {
+            'flight_indices': self._flight_of_sample[sample_indices],
+            'lats': self.lats[sample_indices],
+            'lons': self.lons[sample_indices],
+            'alts': self.alts[sample_indices],
+            'times': self.times[sample_indices],
+        }
+
+    def positions_at(self, t, flight_indices=None):
+        """Interpolated aircraft positions at time t.
+
+        Args:
+            t: Unix epoch saniye
+            flight_indices: İsteğe bağlı uçuş indeksleri (None = t anında aktif uçuşlar)
+
+        Returns a dict of parallel arrays: flight_indices, ids (list), lats,
+        lons, alts and headings (degrees true, 0 = north).
+        """
+        if flight_indices is None:
+            flight_indices = self.active_flights(t)
+        flight_indices = np.asarray(flight_indices, dtype=np.int64)
+        if len(flight_indices) == 0:
+            empty = np.zeros(0)
+            return {'flight_indices': flight_indices, 'ids': [], 'lats': empty,
+                    'lons': empty, 'alts': empty, 'headings': empty}
+
+        lats, lons, alts, headings = self.interpolate(flight_indices, t)
+        return {
+            'flight_indices': flight_indices,
+            'ids': [self.ids[i] for i in flight_indices],
+            'lats': lats,
+            'lons': lons,
+            'alts': alts,
+            'headings': headings,
+        }
+
+    def resample(self, step_s):
+        """Sample every flight on a common time grid (start_time + k * step_s).
+
+        Her uçuş yalnızca kendi zaman aralığındaki ızgara anlarında
+        örneklenir. Returns a dict of parallel arrays: flight_indices, steps
+        (k), times, lats, lons, alts.
+        """
+        if not self.ids:
+            empty = np.zeros(0)
+            return {'flight_indices': np.zeros(0, dtype=np.int64), 'steps': np.zeros(0, dtype=np.int64),
+                    'times': empty, 'lats': empty, 'lons': empty, 'alts': empty}
+        first = np.ceil((self.starts - self.start_time) / step_s).astype(np.int64)
+        last = np.floor((self.ends - self.start_time) / step_s).astype(np.int64)
+        counts = np.maximum(last - first + 1, 0)
+        flight_indices = np.repeat(np.arange(len(self.ids), dtype=np.int64), counts)
+        sample_starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        steps = first[flight_indices] + (np.arange(len(flight_indices)) - sample_starts[flight_indices])
+        times = self.start_time + steps * step_s
+        lats, lons, alts, _headings = self.interpolate(flight_indices, times)
+        return {'flight_indices': flight_indices, 'steps': steps, 'times': times,
+                'lats': lats, 'lons': lons, 'alts': alts}
+
+    def interpolate(self, flight_indices, t):
+        """Linearly interpolated (lats, lons, alts, headings) of flights at time(s) t.
+
+        t tek bir zaman ya da flight_indices ile aynı uzunlukta bir dizi olabilir.
+        """
+        # Her uçuşta t'den sonraki ilk nokta; uç noktalarda ilk/son segmente sabitlenir
+        keys = (t - self.start_time) + flight_indices * self._key_stride
+        after = np.searchsorted(self._keys, keys, side='right')
+        after = np.clip(after, self.offsets[flight_indices] + 1, self.offsets[flight_indices + 1] - 1)
+        before = after - 1
+
+        dt = self.times[after] - self.times[before]
+        fraction = np.divide(t - self.times[before], dt, out=np.zeros(len(dt)), where=dt > 0)
+        fraction = np.clip(fraction, 0.0, 1.0)
+
+        lat0, lat1 = self.lats[before], self.lats[after]
+        lon0, lon1 = self.lons[before], self.lons[after]
+        lats = lat0 + (lat1 - lat0) * fraction
+        lons = lon0 + (lon1 - lon0) * fraction
+        alts = self.alts[before] + (self.alts[after] - self.alts[before]) * fraction
+        # Segment yönü (kısa segmentlerde düzlemsel yaklaşım yeterli)
+        headings = np.degrees(np.arctan2((lon1 - lon0) * np.cos(np.radians(lats)), lat1 - lat0)) % 360.0
+        return lats, lons, alts, headings
@@ -0,0 +1,243 @@
+"""
+Sütun tabanlı (columnar), bellek eşlemeli trajectory deposu
+
+Bir depo bir klasördür:
+  meta.json    -> biçim sürümü, uçuş kimlikleri, toplam nokta sayısı
+  offsets.i64  -> uçuş başına başlangıç indeksi (uçuş sayısı + 1 eleman)
+  stats.f64    -> uçuş başına min_lon, min_lat, max_lon, max_lat, min_alt, max_alt
+  lat.f64, lon.f64, alt.f32 -> tüm uçuşların noktaları, sütun sütun
+  time.f64     -> noktaların Unix epoch zamanı (zamansız uçuşlarda NaN)
+  time_range.f64 -> uçuş başına ilk ve son zaman (zamansız uçuşlarda NaN)
+
+Okuma tarafı dosyaları np.memmap ile açar; açılış anlık olup yalnızca
+gerçekten okunan (ör. ekranda görünen) uçuşların sayfaları belleğe alınır.
+TrajectoryView nesneleri bu sütunlara kopyasız görünümlerdir.
+"""
+
+import json
+import os
+
+import numpy as np
+
+STORE_FORMAT_VERSION = 1
+
+# Sütun adı -> (dosya adı, dtype)
+COLUMNS = {
+    'lat': ('lat.f64', np.float64),
+    'lon': ('lon.f64', np.float64),
+    'alt': ('alt.f32', np.float32),
+}
+OFFSETS_FILE = 'offsets.i64'
+STATS_FILE = 'stats.f64'
+# Zaman sütunu isteğe bağlıdır; eski depolarda bulunmayabilir
+TIME_FILE = 'time.f64'
+TIME_RANGE_FILE = 'time_range.f64'
+META_FILE = 'meta.json'
+
+
+class TrajectoryStoreWriter:
+    """Appends trajectories to a new store, one flight at a time.
+
+    Kullanım:
+        with TrajectoryStoreWriter(path) as writer:
+            writer.append('THY123', points)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._files = {name: open(os.path.join(path, filename), 'wb')
+                       for name, (filename, _dtype) in COLUMNS.items()}
+        self._files['time'] = open(os.path.join(path, TIME_FILE), 'wb')
+        self._ids = []
+        self._offsets = [0]
+        self._stats = []
+        self._time_ranges = []
+
+    def append(self, trajectory_id, points, times=None):
+        """Append one flight.
+
+        points is an (N, 3) lat/lon/alt array, list or TrajectoryView; times is
+        an optional sequence of N epoch seconds (a TrajectoryView brings its own).
+        Returns False without writing anything when the flight has no points.
+        """
+        if isinstance(points, TrajectoryView):
+            lats, lons, alts = points.lats, points.lons, points.alts
+            if times is None:
+                times = points.times
+        else:
+            array = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+            lats, lons, alts = array[:, 0], array[:, 1], array[:, 2]
+        if len(lats) == 0:
+            return False
+        if times is None:
+            times = np.full(len(lats), np.nan)
+        else:
+            times = np.asarray(times, dtype=np.float64)
+            if len(times) != len(lats):
+                raise ValueError(f"Trajectory '{trajectory_id}' has {len(lats)} points but {len(times)} times")
+        for name, column in (('lat', lats), ('lon', lons), ('alt', alts)):
+            np.asarray(column, dtype=COLUMNS[name][1]).tofile(self._files[name])
+        times.tofile(self._files['time'])
+        self._ids.append(str(trajectory_id))
+        self._offsets.append(self._offsets[-1] + len(lats))
+        self._stats.append((lons.min(), lats.min(), lons.max(), lats.max(), alts.min(), alts.max()))
+        if np.isnan(times).all():
+            self._time_ranges.append((np.nan, np.nan))
+        else:
+            self._time_ranges.append((np.nanmin(times), np.nanmax(times)))
+        return True
+
+    def close(self):
+        if self._files is None:
+            return
+        for f in self._files.values():
+            f.close()
+        self._files = None
+        np.asarray(self._offsets, dtype=np.int64).tofile(os.path.join(self.path, OFFSETS_FILE))
+        np.asarray(self._stats, dtype=np.float64).reshape(-1, 6).tofile(os.path.join(self.path, STATS_FILE))
+        np.asarray(self._time_ranges, dtype=np.float64).reshape(-1, 2).tofile(os.path.join(self.path, TIME_RANGE_FILE))
+        meta = {
+            'version': STORE_FORMAT_VERSION,
+            'ids': self._ids,
+            'point_count': self._offsets[-1],
+            'columns': {name: [filename, np.dtype(dtype).str] for name, (filename, dtype) in COLUMNS.items()},
+        }
+        # meta.json en son yazılır; yarım kalmış bir depo açılamaz
+        with open(os.path.join(self.path, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def write_trajectory_store(path, trajectories):
+    """Write (trajectory_id, points) or (trajectory_id, points, times) tuples to a new store.
+
+    Returns the number of flights written (boş uçuşlar atlanır).
+    """
+    count = 0
+    with TrajectoryStoreWriter(path) as writer:
+        for trajectory in trajectories:
+            if writer.append(*trajectory):
+                count += 1
+    return count
+
+
+def is_trajectory_store(path):
+    return os.path.isdir(path) and os.path.isfile(os.path.join(path, META_FILE))
+
+
+class TrajectoryView:
+    """Read-only, zero-copy view of one flight in a TrajectoryStore.
+
+    Eski kodla uyum için (lat, lon, alt) demetleri üzerinden iterasyon ve
+    indeksleme destekler. Değişmez olduğundan copy/deepcopy aynı nesneyi
+    döndürür; undo yığını trajectory noktalarını kopyalamaz.
+    """
+
+    __slots__ = ('store', 'index', 'trajectory_id', 'lats', 'lons', 'alts', 'times', 'stats')
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+        self.trajectory_id = store.ids[index]
+        start, end = store.offsets[index], store.offsets[index + 1]
+        self.lats = store.lat[start:end]
+        self.lons = store.lon[start:end]
+        self.alts = store.alt[start:end]
+        # Zamansız uçuşlarda None
+        if store.time is not None and not np.isnan(store.time_ranges[index, 0]):
+            self.times = store.time[start:end]
+        else:
+            self.times = None
+        self.stats = store.stats[index]
+
+    @property
+    def bounds(self):
+        """(min_lon, min_lat, max_lon, max_lat) from the store index, without reading points."""
+        return tuple(float(value) for value in self.stats[:4])
+
+    def __len__(self):
+        return len(self.lats)
+
+    def __getitem__(self, i):
+        return (float(self.lats[i]), float(self.lons[i]), float(self.alts[i]))
+
+    def __iter__(self):
+        return zip(self.lats.tolist(), self.lons.tolist(), self.alts.tolist())
+
+    def to_array(self):
+        """Copy the flight into an (N, 3) float64 array."""
+        return np.column_stack([self.lats, self.lons, self.alts.astype(np.float64)])
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.to_array()
+        return array if dtype is None else array.astype(dtype)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return f"TrajectoryView({self.trajectory_id!r}, {len(self)} points)"
+
+
+class TrajectoryStore:
+    """Memory-mapped reader for a trajectory store directory."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, META_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != STORE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported trajectory store version: {meta.get('version')}")
+        self.ids = meta['ids']
+        self.point_count = meta['point_count']
+
+        # Sayısı küçük olan indeks dosyaları doğrudan okunur, nokta sütunları eşlenir
+        self.offsets = np.fromfile(os.path.join(path, OFFSETS_FILE), dtype=np.int64)
+        self.stats = np.fromfile(os.path.join(path, STATS_FILE), dtype=np.float64).reshape(-1, 6)
+        for name, (filename, dtype) in COLUMNS.items():
+            column_path = os.path.join(path, filename)
+            if self.point_count:
+                column = np.memmap(column_path, dtype=dtype, mode='r', shape=(self.point_count,))
+            else:
+                column = np.zeros(0, dtype=dtype)
+            setattr(self, name, column)
+        self.time = None
+        self.time_ranges = np.full((len(self.ids), 2), np.nan)
+        if os.path.isfile(os.path.join(path, TIME_FILE)) and os.path.isfile(os.path.join(path, TIME_RANGE_FILE)):
+            if self.point_count:
+                self.time = np.memmap(os.path.join(path, TIME_FILE), dtype=np.float64, mode='r',
+                                      shape=(self.point_count,))
+            self.time_ranges = np.fromfile(os.path.join(path, TIME_RANGE_FILE), dtype=np.float64).reshape(-1, 2)
+        self._index_by_id = None
+
+    @classmethod
+    def open(cls, path):
+        return cls(path)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        return TrajectoryView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.ids)):
+            yield TrajectoryView(self, index)
+
+    def find(self, trajectory_id):
+        """Return the first view with the given id, or None."""
+        if self._index_by_id is None:
+            self._index_by_id = {}
+            for index, stored_id in enumerate(self.ids):
+                self._index_by_id.setdefault(stored_id, index)
+        index = self._index_by_id.get(str(trajectory_id))
+        return None if index is None else TrajectoryView(self, index)
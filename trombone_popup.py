@@ -4,6 +4,8 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdi
 from PyQt5.QtCore import Qt, pyqtSignal, QPoint
 from PyQt5.QtGui import QPalette, QColor, QDoubleValidator, QFont
 
+import tracing
+
 class TrombonePopupDialog(QDialog):
     """Trombone özelliklerini düzenlemek için açılan hızlı menü"""
     
@@ -471,7 +473,7 @@ class TrombonePopupDialog(QDialog):
         """Renk değiştiğinde çağrılır"""
         if not self.moved_or_rotated:
             current_color = self.trombone_config.get('color', self.get_default_color())
-            print(f"Trombone color dialog opening with current color: {current_color}")
+            tracing.debug("Trombone color dialog opening with current color: %s", current_color)
             
             # QColorDialog'u modal olarak aç
             color_dialog = QColorDialog(QColor(current_color), self)
@@ -484,7 +486,7 @@ class TrombonePopupDialog(QDialog):
                 color = color_dialog.selectedColor()
                 if color.isValid():
                     color_hex = color.name()
-                    print(f"Trombone color changed to: {color_hex}")
+                    tracing.debug("Trombone color changed to: %s", color_hex)
                     self.trombone_config['color'] = color_hex
                     self.color_button.setStyleSheet(f"background-color: {color_hex}; border: 1px solid #444444;")
                     self.update_details_content()
@@ -495,9 +497,9 @@ class TrombonePopupDialog(QDialog):
                     self.raise_()
                     self.activateWindow()
                 else:
-                    print("Trombone color dialog cancelled")
+                    tracing.debug("Trombone color dialog cancelled")
             else:
-                print("Trombone color dialog cancelled")
+                tracing.debug("Trombone color dialog cancelled")
                 # Popup'ı öne getir
                 self.raise_()
                 self.activateWindow()
@@ -505,7 +507,7 @@ class TrombonePopupDialog(QDialog):
     def on_width_changed(self, value):
         """Kalınlık değiştiğinde çağrılır"""
         if not self.moved_or_rotated:
-            print(f"Trombone width changed to: {value}")
+            tracing.debug("Trombone width changed to: %s", value)
             self.trombone_config['width'] = value
             self.width_label.setText(f"{value}px")
             self.update_details_content()
@@ -522,7 +524,7 @@ class TrombonePopupDialog(QDialog):
             'visual_only_update': True  # Bu bir sadece görsel güncelleme olduğunu belirten flag
         })
         
-        print(f"Trombone visual settings updated: {visual_cfg}")
+        tracing.debug("Trombone visual settings updated: %s", visual_cfg)
         self.tromboneSettingsChanged.emit(visual_cfg)
         
     def on_update(self):
@@ -534,11 +536,11 @@ class TrombonePopupDialog(QDialog):
         extension_length = self.extension_length.value()
         
         # Değerleri logla ve config'i güncelle
-        print(f"Trombone güncellemesi:")
-        print(f" - threshold_distance: {threshold_distance} NM (A noktası pistten bu kadar uzakta)")
-        print(f" - base_angle: {base_angle}° (A'dan B'ye olan açı)")
-        print(f" - base_distance: {base_distance} NM (A'dan B'ye olan mesafe)")
-        print(f" - extension_length: {extension_length} NM (B'den C'ye olan mesafe)")
+        tracing.debug("Trombone güncellemesi:")
+        tracing.debug(" - threshold_distance: %s NM (A noktası pistten bu kadar uzakta)", threshold_distance)
+        tracing.debug(" - base_angle: %s° (A'dan B'ye olan açı)", base_angle)
+        tracing.debug(" - base_distance: %s NM (A'dan B'ye olan mesafe)", base_distance)
+        tracing.debug(" - extension_length: %s NM (B'den C'ye olan mesafe)", extension_length)
         
         # Güncel config'i oluştur 
         updated_config = {
@@ -570,12 +572,12 @@ class TrombonePopupDialog(QDialog):
                 # Threshold verilerini start için kullan
                 runway_data['start_lat'] = runway_data['threshold_lat']
                 runway_data['start_lon'] = runway_data['threshold_lon']
-                print("Trombone güncellemesi: Eksik start koordinatları threshold'dan alındı")
+                tracing.debug("Trombone güncellemesi: Eksik start koordinatları threshold'dan alındı")
         else:
             # Runway verisi hiç yoksa, güvenli bir basit yapı oluştur
             from PyQt5.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Warning", "No runway data found. Update may not work correctly.")
-            print("Trombone güncellemesi: Runway verisi eksik!")
+            tracing.warning("Trombone güncellemesi: Runway verisi eksik!")
             
         # Trombone ID'sini ve tipini mutlaka ekleyelim
         updated_config['id'] = self.trombone_config.get('id', '')
@@ -586,12 +588,12 @@ class TrombonePopupDialog(QDialog):
             try:
                 # Sinyali emit et
                 self.tromboneSettingsChanged.emit(updated_config)
-                print("Trombone update signal sent successfully")
+                tracing.debug("Trombone update signal sent successfully")
             except Exception as e:
                 from PyQt5.QtWidgets import QMessageBox
                 error_msg = f"Error updating trombone: {str(e)}"
                 QMessageBox.warning(self, "Update Error", error_msg)
-                print(f"Error during trombone update: {e}")
+                tracing.error("Error during trombone update: %s", e)
                 import traceback
                 traceback.print_exc()
         else:
@@ -644,17 +646,17 @@ class TrombonePopupDialog(QDialog):
             
             # ID uyumluluğunu kontrol et ve düzelt
             if not route_id.startswith("trombone_") and "_" in route_id:
-                print(f"UYARI: Trombone ID'si ({route_id}) 'trombone_' önekiyle başlamıyor.")
+                tracing.warning("UYARI: Trombone ID'si (%s) 'trombone_' önekiyle başlamıyor.", route_id)
                 # ID'yi koruyalım ama daha açıklayıcı debug mesajı yazalım
             
             # Trombone ID'si ve konfigürasyonu hakkında daha fazla bilgi yazdır
-            print(f"Trombone taşıma modu başlatılıyor, ID: {route_id}")
-            print(f"Trombone config: {self.trombone_config}")
+            tracing.debug("Trombone taşıma modu başlatılıyor, ID: %s", route_id)
+            tracing.debug("Trombone config: %s", self.trombone_config)
             
             self.tromboneMoveRequested.emit(route_id)
             self.accept()  # İşlem sonrası popup'ı kapat
         else:
-            print("Hata: Trombone taşıma için geçerli bir ID bulunamadı")
+            tracing.error("Hata: Trombone taşıma için geçerli bir ID bulunamadı")
             
     def on_rotate(self):
         """Trombone'u döndürme modunu etkinleştir"""
@@ -665,17 +667,17 @@ class TrombonePopupDialog(QDialog):
             
             # ID uyumluluğunu kontrol et ve düzelt
             if not route_id.startswith("trombone_") and "_" in route_id:
-                print(f"UYARI: Trombone ID'si ({route_id}) 'trombone_' önekiyle başlamıyor.")
+                tracing.warning("UYARI: Trombone ID'si (%s) 'trombone_' önekiyle başlamıyor.", route_id)
                 # ID'yi koruyalım ama daha açıklayıcı debug mesajı yazalım
             
             # Trombone ID'si ve konfigürasyonu hakkında daha fazla bilgi yazdır
-            print(f"Trombone döndürme modu başlatılıyor, ID: {route_id}")
-            print(f"Trombone config: {self.trombone_config}")
+            tracing.debug("Trombone döndürme modu başlatılıyor, ID: %s", route_id)
+            tracing.debug("Trombone config: %s", self.trombone_config)
             
             self.tromboneRotateRequested.emit(route_id)
             self.accept()  # İşlem sonrası popup'ı kapat
         else:
-            print("Hata: Trombone döndürme için geçerli bir ID bulunamadı")
+            tracing.error("Hata: Trombone döndürme için geçerli bir ID bulunamadı")
     
     def mousePressEvent(self, event):
         """Fare tıklama olayını yakala - sadece başlık çubuğundan sürüklenmeye izin ver"""
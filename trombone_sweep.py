@@ -0,0 +1,267 @@
+"""
+Trombone gecikme emme (delay absorption) taraması
+
+Bir pist yaklaşması için trombone parametre aralıklarının tüm
+kombinasyonları geodesy ile vektörel olarak değerlendirilir.
+"""
+
+import math
+import time
+
+import numpy as np
+
+import geodesy
+from airspace_infringement import area_polygons, points_in_areas
+
+# Tek seferde işlenen en fazla tasarım sayısı (bellek sınırı)
+_DESIGN_CHUNK = 4096
+
+
+def runway_approach(runway, threshold_name=None):
+    """Approach dict (threshold = start) for calculate_trombone_waypoints and sweep_trombone.
+
+    runway: DataManager.runways öğesi ('LTFM 36/18' gibi id ile)
+    threshold_name: '36' gibi eşik adı; None ise ilk eşik
+    """
+    parts = runway['id'].split()
+    thresholds = parts[1].split('/') if len(parts) > 1 else ['']
+    threshold_name = threshold_name or thresholds[0]
+    if threshold_name == thresholds[0]:
+        start, end = ('start_lat', 'start_lon'), ('end_lat', 'end_lon')
+    elif threshold_name in thresholds[1:]:
+        start, end = ('end_lat', 'end_lon'), ('start_lat', 'start_lon')
+    else:
+        raise ValueError(f"'{runway['id']}' pistinde '{threshold_name}' eşiği yok")
+    return {
+        'id': f"{parts[0]} {threshold_name}",
+        'start_lat': runway[start[0]],
+        'start_lon': runway[start[1]],
+        'end_lat': runway[end[0]],
+        'end_lon': runway[end[1]],
+    }
+
+
+def _runway_heading_deg(approach):
+    """Pist yönü (eşikten uzağa), calculate_trombone_waypoints ile aynı düzlemsel hesap"""
+    d_lat = approach['end_lat'] - approach['start_lat']
+    d_lon = approach['end_lon'] - approach['start_lon']
+    if abs(d_lat) < 0.00001 and abs(d_lon) < 0.00001:
+        return 0.0
+    return (math.degrees(math.atan2(d_lon, d_lat)) + 360) % 360
+
+
+def trombone_points(approach, threshold_distances, base_angles, base_distances, extension_lengths,
+                    extension_inverted):
+    """Vectorized A, B, C points for arrays of trombone parameters.
+
+    Returns (lats, lons) arrays of shape (N, 3) in A, B, C order.
+    """
+    runway_heading = _runway_heading_deg(approach)
+    approach_heading = runway_heading + 180.0
+    a_lats, a_lons = geodesy.destination(approach['start_lat'], approach['start_lon'],
+                                         threshold_distances, approach_heading)
+    # Base açısı yaklaşma yönüne göre saat yönünün tersine ölçülür (90 = sağa dönüş)
+    b_lats, b_lons = geodesy.destination(a_lats, a_lons, base_distances, approach_heading - base_angles)
+    extension_headings = runway_heading + np.where(extension_inverted, 180.0, 0.0)
+    c_lats, c_lons = geodesy.destination(b_lats, b_lons, extension_lengths, extension_headings)
+    return np.stack([a_lats, b_lats, c_lats], axis=1), np.stack([a_lons, b_lons, c_lons], axis=1)
+
+
+def _segment_distance(px, py, ax, ay, bx, by):
+    """Planar distance from points (px, py) to segments (a, b); arrays broadcast."""
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    t = np.clip(((px - ax) * dx + (py - ay) * dy) / np.where(length_sq > 0, length_sq, 1.0), 0.0, 1.0)
+    return np.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+def _polyline_area_distance(path_x, path_y, area_x, area_y):
+    """Minimum distance between N open polylines (N, P) and one closed polygon (V,)"""
+    edge_x0, edge_y0 = area_x, area_y
+    edge_x1, edge_y1 = np.roll(area_x, -1), np.roll(area_y, -1)
+    # Yol köşeleri -> saha kenarları ve saha köşeleri -> yol segmentleri
+    to_edges = _segment_distance(path_x[:, :, None], path_y[:, :, None],
+                                 edge_x0[None, None, :], edge_y0[None, None, :],
+                                 edge_x1[None, None, :], edge_y1[None, None, :]).min(axis=(1, 2))
+    to_vertices = _segment_distance(area_x[None, None, :], area_y[None, None, :],
+                                    path_x[:, :-1, None], path_y[:, :-1, None],
+                                    path_x[:, 1:, None], path_y[:, 1:, None]).min(axis=(1, 2))
+    return np.minimum(to_edges, to_vertices)
+
+
+def sweep_trombone(approach, threshold_distances, base_angles, base_distances, extension_lengths,
+                   extension_inverted=(False,), speeds_kt=(180.0, 220.0, 250.0), restricted_areas=None,
+                   sample_spacing_nm=0.5):
+    """Evaluate every combination of the given trombone parameters for one runway approach.
+
+    Args:
+        approach: calculate_trombone_waypoints biçiminde yaklaşma (start = eşik);
+            bkz. runway_approach
+        threshold_distances: Eşikten A noktasına mesafeler (NM)
+        base_angles: Base kolu açıları (derece, yaklaşma yönüne göre)
+        base_distances: Base kolu uzunlukları (NM)
+        extension_lengths: Uzatma kolu uzunlukları (NM)
+        extension_inverted: Denenecek uzatma yönleri (True = ters çevrilmiş)
+        speeds_kt: Süre ve gecikme kapasitesi hesaplanacak hızlar (kt)
+        restricted_areas: DataManager.restricted_areas biçiminde sahalar
+        sample_spacing_nm: Saha ihlali için yol örnekleme aralığı (NM)
+
+    Returns (designs, stats). designs is a list of dicts with the parameters,
+    a drawable 'config' and:
+        track_nm           C -> B -> A -> eşik toplam mesafesi
+        shortcut_nm        C'den doğrudan A'ya dönüp eşiğe inen en kısa yol
+        extra_nm           track_nm - shortcut_nm; trombone'un emebileceği uzama
+        track_time_s       Her hız için track_nm uçuş süresi
+        extra_time_s       Her hız için extra_nm gecikme kapasitesi
+        conflict_nm        Yolun yasaklı sahalar içinde kalan uzunluğu
+        clearance_nm       Yolun en yakın yasaklı sahaya uzaklığı (ihlalde 0)
+        nearest_area       En yakın sahanın ismi
+    """
+    start_time = time.perf_counter()
+    areas = area_polygons(restricted_areas)
+    grids = np.meshgrid(np.asarray(threshold_distances, dtype=np.float64),
+                        np.asarray(base_angles, dtype=np.float64),
+                        np.asarray(base_distances, dtype=np.float64),
+                        np.asarray(extension_lengths, dtype=np.float64),
+                        np.asarray(extension_inverted, dtype=bool), indexing='ij')
+    columns = [grid.ravel() for grid in grids]
+    stats = {'combinations': len(columns[0]), 'designs': 0, 'rejected': 0, 'areas': len(areas), 'elapsed_s': 0.0}
+
+    valid = (columns[0] > 0) & (columns[2] > 0) & (columns[3] >= 0)
+    stats['rejected'] = int(np.count_nonzero(~valid))
+    columns = [column[valid] for column in columns]
+
+    designs = []
+    for chunk_start in range(0, len(columns[0]), _DESIGN_CHUNK):
+        designs.extend(_evaluate_chunk(approach, *(column[chunk_start:chunk_start + _DESIGN_CHUNK]
+                                                   for column in columns),
+                                       tuple(float(speed) for speed in speeds_kt), areas, sample_spacing_nm))
+
+    stats['designs'] = len(designs)
+    stats['elapsed_s'] = time.perf_counter() - start_time
+    return designs, stats
+
+
+def _path_conflicts(path_lats, path_lons, leg_lengths, areas, sample_spacing_nm):
+    """Conflict length (N,) and area mask (N, areas) from densely sampled legs"""
+    n_designs = len(path_lats)
+    conflict_nm = np.zeros(n_designs)
+    conflict_mask = np.zeros((n_designs, len(areas)), dtype=bool)
+    for leg in range(path_lats.shape[1] - 1):
+        lengths = leg_lengths[:, leg]
+        samples = max(int(math.ceil(float(lengths.max(initial=0.0)) / sample_spacing_nm)) + 1, 2)
+        fractions = np.linspace(0.0, 1.0, samples)
+        # Kısa bacaklarda doğrusal enterpolasyon yeterli
+        lats = path_lats[:, leg, None] + (path_lats[:, leg + 1] - path_lats[:, leg])[:, None] * fractions
+        lons = path_lons[:, leg, None] + (path_lons[:, leg + 1] - path_lons[:, leg])[:, None] * fractions
+        hits = points_in_areas(lats.ravel(), lons.ravel(), areas).reshape(n_designs, samples, len(areas))
+        conflict_nm += hits.any(axis=2).sum(axis=1) * lengths / (samples - 1)
+        conflict_mask |= hits.any(axis=1)
+    return conflict_nm, conflict_mask
+
+
+def _evaluate_chunk(approach, threshold_distances, base_angles, base_distances, extension_lengths,
+                    extension_inverted, speeds_kt, areas, sample_spacing_nm):
+    """Metrics for a chunk of designs (arrays of length N)"""
+    n_designs = len(threshold_distances)
+    lats, lons = trombone_points(approach, threshold_distances, base_angles, base_distances,
+                                 extension_lengths, extension_inverted)
+    track_nm = extension_lengths + base_distances + threshold_distances
+    shortcut_nm = geodesy.distance_nm(lats[:, 2], lons[:, 2], lats[:, 0], lons[:, 0]) + threshold_distances
+    extra_nm = np.maximum(track_nm - shortcut_nm, 0.0)
+
+    # Uçuş sırası: C, B, A, eşik
+    path_lats = np.column_stack([lats[:, 2], lats[:, 1], lats[:, 0], np.full(n_designs, approach['start_lat'])])
+    path_lons = np.column_stack([lons[:, 2], lons[:, 1], lons[:, 0], np.full(n_designs, approach['start_lon'])])
+    conflict_nm = np.zeros(n_designs)
+    conflict_mask = np.zeros((n_designs, len(areas)), dtype=bool)
+    clearance = np.full(n_designs, np.inf)
+    nearest = np.full(n_designs, -1)
+    if areas:
+        leg_lengths = np.column_stack([extension_lengths, base_distances, threshold_distances])
+        conflict_nm, conflict_mask = _path_conflicts(path_lats, path_lons, leg_lengths, areas, sample_spacing_nm)
+        origin_lat, origin_lon = approach['start_lat'], approach['start_lon']
+        lon_scale = geodesy.NM_PER_DEG_LAT * math.cos(math.radians(origin_lat))
+        path_x, path_y = (path_lons - origin_lon) * lon_scale, (path_lats - origin_lat) * geodesy.NM_PER_DEG_LAT
+        for index, area in enumerate(areas):
+            distance = _polyline_area_distance(path_x, path_y, (area.lons - origin_lon) * lon_scale,
+                                               (area.lats - origin_lat) * geodesy.NM_PER_DEG_LAT)
+            distance[conflict_mask[:, index]] = 0.0
+            closer = distance < clearance
+            clearance[closer] = distance[closer]
+            nearest[closer] = index
+
+    area_names = [area.name for area in areas]
+    columns = [array.tolist() for array in (threshold_distances, base_angles, base_distances, extension_lengths,
+                                            extension_inverted, track_nm, shortcut_nm, extra_nm, conflict_nm,
+                                            clearance, nearest)]
+    hit_lists = conflict_mask.tolist()
+    approach_id = approach.get('id', '')
+    designs = []
+    for (threshold_distance, base_angle, base_distance, extension_length, inverted, track, shortcut, extra,
+         conflict, clear, nearest_index), hit_row in zip(zip(*columns), hit_lists):
+        designs.append({
+            'threshold_distance': threshold_distance,
+            'base_angle': base_angle,
+            'base_distance': base_distance,
+            'extension_length': extension_length,
+            'extension_inverted': inverted,
+            'track_nm': track,
+            'shortcut_nm': shortcut,
+            'extra_nm': extra,
+            'track_time_s': {speed: track / speed * 3600.0 for speed in speeds_kt},
+            'extra_time_s': {speed: extra / speed * 3600.0 for speed in speeds_kt},
+            'conflict_nm': conflict,
+            'conflict_areas': [name for name, hit in zip(area_names, hit_row) if hit],
+            'clearance_nm': clear if nearest_index >= 0 else None,
+            'nearest_area': area_names[nearest_index] if nearest_index >= 0 else None,
+            'config': {
+                'pattern_type': 'trombone',
+                'runway_id': approach_id,
+                'threshold_distance': threshold_distance,
+                'base_angle': base_angle,
+                'base_distance': base_distance,
+                'extension_length': extension_length,
+                'extension_inverted': inverted,
+            },
+        })
+    return designs
+
+
+def capacity_table(designs, target_delays_s, speed_kt, min_clearance_nm=0.0):
+    """Shortest conflict-free trombone absorbing each target delay at speed_kt.
+
+    Returns a list of (target_delay_s, design or None) rows; the chosen design
+    has the smallest track_nm among those with enough extra_time_s and at
+    least min_clearance_nm from every restricted area.
+    """
+    speed_kt = float(speed_kt)
+    usable = [design for design in designs
+              if design['conflict_nm'] == 0 and
+              (design['clearance_nm'] is None or design['clearance_nm'] >= min_clearance_nm)]
+    capacities = np.array([design['extra_nm'] / speed_kt * 3600.0 for design in usable])
+    track = np.array([design['track_nm'] for design in usable])
+    rows = []
+    for target in target_delays_s:
+        candidates = np.flatnonzero(capacities >= target) if len(usable) else []
+        if len(candidates):
+            rows.append((target, usable[int(candidates[np.argmin(track[candidates])])]))
+        else:
+            rows.append((target, None))
+    return rows
+
+
+def format_capacity_table(rows, speed_kt):
+    """Text lines for capacity_table rows"""
+    lines = [f"{'Gecikme (s)':>11} {'THR':>5} {'Açı':>5} {'Base':>5} {'Ext':>5} {'Ters':>4} "
+             f"{'Track (NM)':>10} {'Kapasite (s)':>12} {'Açıklık (NM)':>12}"]
+    for target, design in rows:
+        if design is None:
+            lines.append(f"{target:>11.0f}  -- uygun trombone yok --")
+            continue
+        clearance = '-' if design['clearance_nm'] is None else f"{design['clearance_nm']:.1f}"
+        lines.append(f"{target:>11.0f} {design['threshold_distance']:>5.1f} {design['base_angle']:>5.0f} "
+                     f"{design['base_distance']:>5.1f} {design['extension_length']:>5.1f} "
+                     f"{'E' if design['extension_inverted'] else 'H':>4} {design['track_nm']:>10.1f} "
+                     f"{design['extra_nm'] / float(speed_kt) * 3600.0:>12.0f} {clearance:>12}")
+    return lines
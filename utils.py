@@ -1,4 +1,4 @@
-import math
+import geodesy
 
 def dms_to_decimal(dms_str):
     """Convert DMS coordinate string to decimal degrees"""
@@ -65,43 +65,11 @@ def decimal_to_dms_str(decimal, is_latitude=True):
 
 def calculate_bearing(lat1, lon1, lat2, lon2):
     """Calculate bearing between two points in degrees"""
-    # Convert to radians
-    lat1 = math.radians(lat1)
-    lon1 = math.radians(lon1)
-    lat2 = math.radians(lat2)
-    lon2 = math.radians(lon2)
-    
-    # Calculate bearing
-    y = math.sin(lon2 - lon1) * math.cos(lat2)
-    x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(lon2 - lon1)
-    bearing = math.atan2(y, x)
-    
-    # Convert to degrees
-    bearing = math.degrees(bearing)
-    bearing = (bearing + 360) % 360
-    
-    return bearing 
+    return geodesy.bearing(lat1, lon1, lat2, lon2)
 
 def calculate_distance(lat1, lon1, lat2, lon2):
     """Calculate great circle distance between two points in nautical miles"""
-    # Earth radius in nautical miles
-    EARTH_RADIUS_NM = 3440.07
-    
-    # Convert to radians
-    lat1 = math.radians(lat1)
-    lon1 = math.radians(lon1)
-    lat2 = math.radians(lat2)
-    lon2 = math.radians(lon2)
-    
-    # Haversine formula
-    d_lat = lat2 - lat1
-    d_lon = lon2 - lon1
-    
-    a = math.sin(d_lat/2) * math.sin(d_lat/2) + math.cos(lat1) * math.cos(lat2) * math.sin(d_lon/2) * math.sin(d_lon/2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-    distance = EARTH_RADIUS_NM * c
-    
-    return distance 
+    return geodesy.distance(lat1, lon1, lat2, lon2)
 
 def decimal_to_dms(decimal, is_latitude=True):
     """Convert decimal degrees to DMS format"""
@@ -132,26 +100,4 @@ def calculate_point_at_distance_and_bearing(lat1, lon1, distance_nm, bearing_deg
     Returns:
         (lat2, lon2): Hesaplanan noktanın koordinatları (ondalık derece)
     """
-    # Dünya yarıçapı (deniz mili)
-    R = 3440.07  # Deniz mili cinsinden dünya yarıçapı
-    
-    # Derece -> radyan dönüşümü
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    bearing_rad = math.radians(bearing_deg)
-    
-    # Mesafeyi açısal mesafeye çevirme (radyan)
-    angular_distance = distance_nm / R
-    
-    # Yeni noktanın koordinatlarını hesaplama (radyan)
-    lat2_rad = math.asin(math.sin(lat1_rad) * math.cos(angular_distance) + 
-                         math.cos(lat1_rad) * math.sin(angular_distance) * math.cos(bearing_rad))
-                         
-    lon2_rad = lon1_rad + math.atan2(math.sin(bearing_rad) * math.sin(angular_distance) * math.cos(lat1_rad),
-                                    math.cos(angular_distance) - math.sin(lat1_rad) * math.sin(lat2_rad))
-    
-    # Radyan -> derece dönüşümü
-    lat2 = math.degrees(lat2_rad)
-    lon2 = math.degrees(lon2_rad)
-    
-    return lat2, lon2
\ No newline at end of file
+    return geodesy.destination_point(lat1, lon1, distance_nm, bearing_deg)
\ No newline at end of file